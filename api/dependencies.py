@@ -8,20 +8,24 @@ service factory helpers so routers can remain thin.
 from __future__ import annotations
 
 import os
-from typing import Callable, Generator
+from typing import AsyncGenerator, Callable, Generator
 
 from dotenv import load_dotenv
 from fastapi import Depends, HTTPException, status
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from .auth import TokenData, get_current_user
 from .services.configuration_service import ConfigurationService
 from .services.graphics_service import GraphicsService
+from .services.player_search import PlayerSearchIndex, SearchIndexedSession
 from .services.standings_aggregator import StandingsAggregator
 from .services.standings_service import StandingsService
 from .services.tournament_service import TournamentService
 from .services.user_service import UserService
+from .utils.service_runner import AsyncServiceRunner
 
 # Ensure environment variables are loaded with correct precedence
 # Load .env first, then .env.local overrides from parent directory
@@ -32,7 +36,30 @@ load_dotenv(os.path.join(parent_dir, ".env.local"), override=True)
 # Database configuration
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./dashboard/dashboard.db")
 engine = create_engine(DATABASE_URL, pool_pre_ping=True)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, class_=SearchIndexedSession)
+
+# Async drivers for the same database, used by request handlers so queries
+# do not block the event loop shared with the WebSocket fan-out.
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+def _async_database_url(url: str) -> str:
+    """Map a sync DATABASE_URL onto the matching async driver."""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend in _ASYNC_DRIVERS:
+        parsed = parsed.set(drivername=_ASYNC_DRIVERS[backend])
+    return parsed.render_as_string(hide_password=False)
+
+
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or _async_database_url(DATABASE_URL)
+async_engine = create_async_engine(ASYNC_DATABASE_URL, pool_pre_ping=True)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False, sync_session_class=SearchIndexedSession
+)
 
 # Import models to ensure they're created exactly once at startup.
 from .models import Base  # noqa: E402
@@ -58,6 +85,22 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Yield an async database session with rollback on failure.
+
+    Async counterpart of `get_db` for handlers that should not block the
+    event loop while waiting on the database.
+    """
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+            await db.flush()
+        except Exception:
+            await db.rollback()
+            raise
+
+
 def get_database_session() -> Generator[Session, None, None]:
     """
     Backwards-compatible alias for `get_db`.
@@ -111,11 +154,21 @@ def _service_factory(service_cls):
     return factory
 
 
+def _async_service_factory(service_cls):
+    def factory(db: AsyncSession = Depends(get_async_db)):
+        return AsyncServiceRunner(db, service_cls)
+
+    return factory
+
+
 get_configuration_service = _service_factory(ConfigurationService)
 get_graphics_service = _service_factory(GraphicsService)
+get_player_search_index = _service_factory(PlayerSearchIndex)
 get_standings_service = _service_factory(StandingsService)
 get_tournament_service = _service_factory(TournamentService)
 get_user_service = _service_factory(UserService)
+get_async_graphics_service = _async_service_factory(GraphicsService)
+get_async_player_search_index = _async_service_factory(PlayerSearchIndex)
 
 
 def get_standings_aggregator(
@@ -129,12 +182,16 @@ def get_standings_aggregator(
 
 __all__ = [
     "get_db",
+    "get_async_db",
     "get_database_session",
     "get_active_user",
     "require_write_access",
     "require_roles",
     "get_configuration_service",
     "get_graphics_service",
+    "get_async_graphics_service",
+    "get_player_search_index",
+    "get_async_player_search_index",
     "get_tournament_service",
     "get_user_service",
     "get_standings_service",
@@ -13,7 +13,7 @@ from urllib.parse import urljoin
 import httpx
 import logging
 import uvicorn
-from fastapi import Depends, FastAPI, HTTPException, Request, Response, status
+from fastapi import Depends, FastAPI, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
@@ -153,7 +153,21 @@ async def startup_event():
             logger.warning("⚠️ Failed to initialize IGN verification service")
     else:
         logger.info("IGN verification service disabled (no RIOT_API_KEY)")
-    
+
+    # Index player names recorded before the search index existed
+    from api.dependencies import SessionLocal
+    from api.services.player_search import PlayerSearchIndex
+
+    db = SessionLocal()
+    try:
+        indexed = PlayerSearchIndex(db).backfill()
+        if indexed:
+            logger.info(f"Backfilled player search index with {indexed} terms")
+    finally:
+        db.close()
+
+    get_frontend_client()
+
     logger.info("API startup completed")
 
 
@@ -171,7 +185,15 @@ async def shutdown_event():
     if service:
         await service.cleanup()
         logger.info("✅ IGN verification service cleaned up")
-    
+
+    from api.dependencies import async_engine
+
+    await async_engine.dispose()
+
+    client = getattr(app.state, "frontend_client", None)
+    if client is not None:
+        await client.aclose()
+
     logger.info("API shutdown completed")
 
 
@@ -205,14 +227,53 @@ app.include_router(placements.router, prefix="/api/v1", tags=["placements"])
 
 # Reverse proxy for Next.js frontend
 # All non-API routes will be proxied to Next.js running on port 8080
+FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:8080")
+
 API_PATHS = {
     "/api/", "/auth/", "/health", "/docs", "/redoc", "/openapi.json"
 }
 
+# Hop-by-hop headers belong to a single connection and must not be forwarded
+HOP_BY_HOP_HEADERS = {
+    "connection", "keep-alive", "proxy-authenticate", "proxy-authorization",
+    "te", "trailer", "transfer-encoding", "upgrade",
+}
+
+
+def get_frontend_client() -> httpx.AsyncClient:
+    """
+    Return the shared keep-alive client used to reach the frontend.
+
+    Created once at startup and closed on shutdown; created lazily here if a
+    request arrives without the startup hook having run (e.g. a bare TestClient).
+    """
+    client = getattr(app.state, "frontend_client", None)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            base_url=FRONTEND_URL,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+        app.state.frontend_client = client
+    return client
+
+
+async def _relay_body(response: httpx.Response):
+    """Yield upstream bytes as they arrive and hand the connection back to the pool."""
+    try:
+        async for chunk in response.aiter_raw():
+            yield chunk
+    finally:
+        await response.aclose()
+
+
 @app.api_route("/{path:path}", methods=["GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS"])
 async def proxy_to_frontend(request: Request, path: str):
     """
     Proxy non-API requests to Next.js frontend
+
+    Request and response bodies are streamed through the shared pooled client
+    rather than buffered, so large bundles never sit in memory whole.
     """
     # Check if this is an API route that should not be proxied
     if any(path.startswith(api_path.rstrip('/')) for api_path in API_PATHS):
@@ -221,50 +282,43 @@ async def proxy_to_frontend(request: Request, path: str):
             detail=f"API endpoint not found: /{path}"
         )
     
-    # Build the target URL for Next.js
-    target_url = f"http://localhost:8080/{path}"
-    
-    # Handle query parameters
-    if request.query_params:
-        target_url += f"?{request.url.query}"
-    
-    # Get request body if present
-    body = await request.body()
-    
     # Create headers for the proxied request
-    headers = dict(request.headers)
-    # Remove host header as it will conflict
-    headers.pop("host", None)
-    
-    async with httpx.AsyncClient() as client:
-        try:
-            # Proxy the request to Next.js
-            response = await client.request(
-                method=request.method,
-                url=target_url,
-                headers=headers,
-                content=body if body else None
-            )
-            
-            # Return the response from Next.js
-            # Filter out headers that cause encoding issues
-            excluded_headers = {'content-encoding', 'content-length', 'transfer-encoding'}
-            filtered_headers = {
-                k: v for k, v in response.headers.items() 
-                if k.lower() not in excluded_headers
-            }
-            
-            return Response(
-                content=response.content,
-                status_code=response.status_code,
-                headers=filtered_headers
-            )
-        except httpx.RequestError as e:
-            logger.error(f"Error proxying request to Next.js: {e}")
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Frontend service unavailable"
-            )
+    headers = {
+        k: v for k, v in request.headers.items()
+        if k.lower() not in HOP_BY_HOP_HEADERS and k.lower() != "host"
+    }
+    has_body = "content-length" in request.headers or "transfer-encoding" in request.headers
+
+    client = get_frontend_client()
+    upstream_request = client.build_request(
+        method=request.method,
+        url=f"/{path}",
+        params=request.url.query or None,
+        headers=headers,
+        content=request.stream() if has_body else None,
+    )
+
+    try:
+        # Proxy the request to Next.js
+        response = await client.send(upstream_request, stream=True)
+    except httpx.RequestError as e:
+        logger.error(f"Error proxying request to Next.js: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Frontend service unavailable"
+        )
+
+    # Raw bytes are relayed untouched, so content-encoding/length stay valid
+    filtered_headers = {
+        k: v for k, v in response.headers.items()
+        if k.lower() not in HOP_BY_HOP_HEADERS
+    }
+
+    return StreamingResponse(
+        _relay_body(response),
+        status_code=response.status_code,
+        headers=filtered_headers,
+    )
 
 if __name__ == "__main__":
     uvicorn.run(
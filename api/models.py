@@ -2,20 +2,53 @@
 SQLAlchemy models for graphics management
 """
 
+import base64
+import os
+import zlib
 from datetime import UTC, datetime
 
 from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, JSON, String, Text
 from sqlalchemy.orm import declarative_base, relationship
 from sqlalchemy.ext.mutable import MutableDict, MutableList
+from sqlalchemy.types import TypeDecorator
 
 Base = declarative_base()
 
+# Graphic payloads larger than this are zlib-compressed when compression is enabled
+GRAPHICS_COMPRESS_DATA = os.getenv("GRAPHICS_COMPRESS_DATA", "false").lower() in ("1", "true", "yes")
+GRAPHICS_COMPRESS_MIN_BYTES = 1024
+_COMPRESSED_PREFIX = "zlib:"
+
 
 def utc_now() -> datetime:
     """Return a timezone-aware UTC datetime compatible with SQLAlchemy defaults."""
     return datetime.now(UTC)
 
 
+class CompressibleText(TypeDecorator):
+    """
+    Text column that can store large values zlib-compressed (base64, prefixed).
+
+    Reads always accept both forms, so compression can be switched on or off
+    without migrating existing rows.
+    """
+
+    impl = Text
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None or not GRAPHICS_COMPRESS_DATA or len(value) < GRAPHICS_COMPRESS_MIN_BYTES:
+            return value
+        packed = base64.b64encode(zlib.compress(value.encode("utf-8"))).decode("ascii")
+        return _COMPRESSED_PREFIX + packed
+
+    def process_result_value(self, value, dialect):
+        if value is None or not value.startswith(_COMPRESSED_PREFIX):
+            return value
+        packed = base64.b64decode(value[len(_COMPRESSED_PREFIX):])
+        return zlib.decompress(packed).decode("utf-8")
+
+
 class Graphic(Base):
     """Model for graphics/canvas data"""
 
@@ -24,7 +57,7 @@ class Graphic(Base):
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(255), nullable=False, index=True)
     event_name = Column(String(255), nullable=True, index=True)
-    data_json = Column(Text, default="{}")
+    data_json = Column(CompressibleText, default="{}")
     created_by = Column(String(255), nullable=False, index=True)
     created_at = Column(DateTime(timezone=True), default=utc_now, nullable=False)
     updated_at = Column(DateTime(timezone=True), default=utc_now, onupdate=utc_now, nullable=False)
@@ -34,6 +67,11 @@ class Graphic(Base):
     locks = relationship("CanvasLock", back_populates="graphic", cascade="all, delete-orphan")
     archives = relationship("Archive", back_populates="graphic", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # Keyset pagination order for the graphics/archive lists
+        Index("idx_graphics_archived_updated", "archived", "updated_at", "id"),
+    )
+
     def __repr__(self):
         return (
             f"<Graphic(id={self.id}, title='{self.title}', event_name='{self.event_name}', "
@@ -369,6 +407,34 @@ class RoundPlacement(Base):
         )
 
 
+class PlacementContribution(Base):
+    """Points a validated placement adds to the latest placement-sourced scoreboard."""
+
+    __tablename__ = "placement_contributions"
+
+    placement_id = Column(Integer, primary_key=True)  # round_placements.id
+    tournament_id = Column(String(255), nullable=False)
+    submission_id = Column(Integer, nullable=False, index=True)
+    player_id = Column(String(255), nullable=False)
+    round_name = Column(String(255), nullable=False)
+    points = Column(Integer, nullable=False)
+
+    # Identity as of this placement; an entry shows its newest placement's
+    player_name = Column(String(255), nullable=False)
+    discord_id = Column(String(64), nullable=True)
+    riot_id = Column(String(255), nullable=True)
+
+    __table_args__ = (
+        Index("idx_contribution_tournament_player", "tournament_id", "player_id"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<PlacementContribution(placement_id={self.placement_id}, "
+            f"player='{self.player_id}', round={self.round_name}, points={self.points})>"
+        )
+
+
 class PlayerAlias(Base):
     """Model for player alias mappings to improve OCR matching."""
 
@@ -395,6 +461,53 @@ class PlayerAlias(Base):
         )
 
 
+class PlayerSearchTerm(Base):
+    """Model for normalized player names and aliases used by player search."""
+
+    __tablename__ = "player_search_terms"
+
+    id = Column(Integer, primary_key=True, index=True)
+    player_id = Column(String(255), nullable=False, index=True)
+    tournament_id = Column(String(255), nullable=True)  # NULL for aliases (not tournament scoped)
+    kind = Column(String(16), nullable=False)  # "name" or "alias"
+    term = Column(String(255), nullable=False)
+    normalized = Column(String(255), nullable=False, index=True)
+    created_at = Column(DateTime(timezone=True), default=utc_now, nullable=False)
+
+    # Relationships
+    trigrams = relationship("PlayerSearchTrigram", back_populates="search_term", cascade="all, delete-orphan")
+
+    __table_args__ = (
+        Index("idx_search_term_player_scope", "player_id", "tournament_id", "kind"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<PlayerSearchTerm(id={self.id}, player_id='{self.player_id}', "
+            f"term='{self.term}', kind={self.kind})>"
+        )
+
+
+class PlayerSearchTrigram(Base):
+    """Model for the trigram postings of a player search term."""
+
+    __tablename__ = "player_search_trigrams"
+
+    trigram = Column(String(3), primary_key=True)
+    term_id = Column(
+        Integer,
+        ForeignKey("player_search_terms.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
+    )
+
+    # Relationships
+    search_term = relationship("PlayerSearchTerm", back_populates="trigrams")
+
+    def __repr__(self) -> str:
+        return f"<PlayerSearchTrigram(trigram='{self.trigram}', term_id={self.term_id})>"
+
+
 class OCRCorrection(Base):
     """Model for tracking OCR corrections for future learning."""
 
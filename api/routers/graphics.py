@@ -2,6 +2,9 @@
 Graphics API endpoints.
 
 Routers delegate to the graphics service and keep controller logic minimal.
+The service runs on an async session so its queries do not block the event loop.
+List endpoints return summaries without ``data_json``; fetch a single graphic
+for its canvas payload.
 """
 
 from __future__ import annotations
@@ -15,12 +18,11 @@ from sqlalchemy.exc import NoResultFound
 from api.auth import TokenData
 from api.dependencies import (
     get_active_user,
-    get_graphics_service,
+    get_async_graphics_service,
     require_roles,
     require_write_access,
 )
-from api.services.graphics_service import GraphicsService
-from api.utils.service_runner import execute_service
+from api.utils.service_runner import AsyncServiceRunner, execute_service
 from ..schemas.graphics import (
     ArchiveActionRequest,
     ArchiveListResponse,
@@ -30,6 +32,7 @@ from ..schemas.graphics import (
     GraphicCreate,
     GraphicListResponse,
     GraphicResponse,
+    GraphicSummary,
     GraphicUpdate,
     LockStatusResponse,
 )
@@ -44,7 +47,7 @@ router = APIRouter()
 async def create_graphic(
     graphic: GraphicCreate,
     current_user: TokenData = Depends(require_write_access),
-    service: GraphicsService = Depends(get_graphics_service),
+    service: AsyncServiceRunner = Depends(get_async_graphics_service),
 ) -> GraphicResponse:
     payload = await execute_service(service.create_graphic, graphic, current_user.username)
     return GraphicResponse(**payload)
@@ -53,19 +56,26 @@ async def create_graphic(
 @router.get("/graphics", response_model=GraphicListResponse)
 async def get_graphics(
     include_archived: bool = Query(False, description="Include archived graphics"),
+    limit: Optional[int] = Query(None, ge=1, le=500, description="Page size (all graphics when omitted)"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     _user: TokenData = Depends(get_active_user),
-    service: GraphicsService = Depends(get_graphics_service),
+    service: AsyncServiceRunner = Depends(get_async_graphics_service),
 ) -> GraphicListResponse:
-    payload = await execute_service(service.get_graphics, include_archived=include_archived)
-    graphics = [GraphicResponse(**graphic) for graphic in payload]
-    return GraphicListResponse(graphics=graphics, total=len(graphics))
+    payload = await execute_service(
+        service.get_graphics, include_archived=include_archived, limit=limit, cursor=cursor
+    )
+    return GraphicListResponse(
+        graphics=[GraphicSummary(**graphic) for graphic in payload["graphics"]],
+        total=payload["total"],
+        next_cursor=payload["next_cursor"],
+    )
 
 
 @router.get("/graphics/{graphic_id}", response_model=GraphicResponse)
 async def get_graphic(
     graphic_id: int,
     _user: TokenData = Depends(get_active_user),
-    service: GraphicsService = Depends(get_graphics_service),
+    service: AsyncServiceRunner = Depends(get_async_graphics_service),
 ) -> GraphicResponse:
     payload = await execute_service(service.get_graphic_by_id, graphic_id)
     return GraphicResponse(**payload)
@@ -76,7 +86,7 @@ async def update_graphic(
     graphic_id: int,
     graphic_update: GraphicUpdate,
     current_user: TokenData = Depends(require_write_access),
-    service: GraphicsService = Depends(get_graphics_service),
+    service: AsyncServiceRunner = Depends(get_async_graphics_service),
 ) -> GraphicResponse:
     payload = await execute_service(
         service.update_graphic,
@@ -94,7 +104,7 @@ async def duplicate_graphic(
     new_title: Optional[str] = None,
     new_event_name: Optional[str] = None,
     current_user: TokenData = Depends(require_write_access),
-    service: GraphicsService = Depends(get_graphics_service),
+    service: AsyncServiceRunner = Depends(get_async_graphics_service),
 ) -> GraphicResponse:
     title = new_title
     event_name = new_event_name
@@ -116,7 +126,7 @@ async def duplicate_graphic(
 async def delete_graphic(
     graphic_id: int,
     current_user: TokenData = Depends(require_write_access),
-    service: GraphicsService = Depends(get_graphics_service),
+    service: AsyncServiceRunner = Depends(get_async_graphics_service),
 ) -> dict:
     await execute_service(
         service.delete_graphic,
@@ -130,7 +140,7 @@ async def delete_graphic(
 @router.get("/events")
 async def get_event_names(
     _user: TokenData = Depends(get_active_user),
-    service: GraphicsService = Depends(get_graphics_service),
+    service: AsyncServiceRunner = Depends(get_async_graphics_service),
 ) -> list[str]:
     """Get list of unique event names from all graphics."""
     payload = await execute_service(service.get_event_names)
@@ -141,7 +151,7 @@ async def get_event_names(
 async def permanent_delete_graphic(
     graphic_id: int,
     _admin: TokenData = Depends(require_roles("Administrator")),
-    service: GraphicsService = Depends(get_graphics_service),
+    service: AsyncServiceRunner = Depends(get_async_graphics_service),
 ) -> dict:
     await execute_service(service.permanent_delete_graphic, graphic_id, _admin.username)
     return {"message": "Graphic permanently deleted successfully"}
@@ -155,7 +165,7 @@ async def acquire_lock(
     graphic_id: int,
     lock_request: CanvasLockCreate,
     current_user: TokenData = Depends(require_write_access),
-    service: GraphicsService = Depends(get_graphics_service),
+    service: AsyncServiceRunner = Depends(get_async_graphics_service),
 ) -> CanvasLockResponse:
     # Ensure the graphic_id in the URL matches the one in the request body
     lock_request.graphic_id = graphic_id
@@ -168,7 +178,7 @@ async def release_lock(
     graphic_id: int,
     session_request: dict = Body(...),
     current_user: TokenData = Depends(require_write_access),
-    service: GraphicsService = Depends(get_graphics_service),
+    service: AsyncServiceRunner = Depends(get_async_graphics_service),
 ) -> dict:
     session_id = session_request.get("session_id")
     if not session_id:
@@ -183,7 +193,7 @@ async def get_lock_status(
     graphic_id: int,
     session_id: Optional[str] = Query(None, description="Session ID for lock ownership check"),
     current_user: TokenData = Depends(get_active_user),
-    service: GraphicsService = Depends(get_graphics_service),
+    service: AsyncServiceRunner = Depends(get_async_graphics_service),
 ) -> LockStatusResponse:
     return await execute_service(service.get_lock_status, graphic_id, session_id, current_user.username)
 
@@ -193,7 +203,7 @@ async def refresh_lock(
     graphic_id: int,
     session_request: dict = Body(...),
     current_user: TokenData = Depends(require_write_access),
-    service: GraphicsService = Depends(get_graphics_service),
+    service: AsyncServiceRunner = Depends(get_async_graphics_service),
 ) -> CanvasLockResponse:
     session_id = session_request.get("session_id")
     if not session_id:
@@ -219,7 +229,7 @@ async def archive_graphic(
     graphic_id: int,
     archive_request: Optional[ArchiveActionRequest] = Body(None),
     current_user: TokenData = Depends(require_write_access),
-    service: GraphicsService = Depends(get_graphics_service),
+    service: AsyncServiceRunner = Depends(get_async_graphics_service),
 ) -> ArchiveResponse:
     reason = archive_request.reason if archive_request else None
     payload = await execute_service(
@@ -235,7 +245,7 @@ async def archive_graphic(
 async def restore_graphic(
     graphic_id: int,
     current_user: TokenData = Depends(require_write_access),
-    service: GraphicsService = Depends(get_graphics_service),
+    service: AsyncServiceRunner = Depends(get_async_graphics_service),
 ) -> ArchiveResponse:
     payload = await execute_service(service.restore_graphic, graphic_id, current_user.username)
     return ArchiveResponse(**payload)
@@ -243,15 +253,17 @@ async def restore_graphic(
 
 @router.get("/archive", response_model=ArchiveListResponse)
 async def get_archived_graphics(
+    limit: Optional[int] = Query(None, ge=1, le=500, description="Page size (all archives when omitted)"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     current_user: TokenData = Depends(get_active_user),
-    service: GraphicsService = Depends(get_graphics_service),
+    service: AsyncServiceRunner = Depends(get_async_graphics_service),
 ) -> ArchiveListResponse:
-    payload = await execute_service(service.get_graphics, include_archived=True)
-    archived = [GraphicResponse(**graphic) for graphic in payload if graphic["archived"]]
+    payload = await execute_service(service.get_graphics, archived_only=True, limit=limit, cursor=cursor)
     return ArchiveListResponse(
-        archives=archived,
-        total=len(archived),
+        archives=[GraphicSummary(**graphic) for graphic in payload["graphics"]],
+        total=payload["total"],
         can_delete=current_user.is_admin,
+        next_cursor=payload["next_cursor"],
     )
 
 
@@ -259,7 +271,7 @@ async def get_archived_graphics(
 async def permanent_delete_archive(
     graphic_id: int,
     _admin: TokenData = Depends(require_roles("Administrator")),
-    service: GraphicsService = Depends(get_graphics_service),
+    service: AsyncServiceRunner = Depends(get_async_graphics_service),
 ) -> dict:
     await execute_service(service.permanent_delete_graphic, graphic_id, _admin.username)
     return {"message": "Graphic permanently deleted successfully"}
@@ -268,7 +280,7 @@ async def permanent_delete_archive(
 @router.post("/maintenance/cleanup-locks")
 async def cleanup_expired_locks(
     _admin: TokenData = Depends(require_roles("Administrator")),
-    service: GraphicsService = Depends(get_graphics_service),
+    service: AsyncServiceRunner = Depends(get_async_graphics_service),
 ) -> dict:
     cleaned_count = await execute_service(service.cleanup_expired_locks)
     return {
@@ -287,7 +299,7 @@ async def get_ranked_players(
     sort_by: str = Query("total_points", description="Sort field: total_points, player_name, standing_rank"),
     sort_order: str = Query("desc", description="Sort order: asc, desc"),
     limit: int = Query(50, description="Maximum number of players to return"),
-    service: GraphicsService = Depends(get_graphics_service),
+    service: AsyncServiceRunner = Depends(get_async_graphics_service),
 ) -> dict:
     """Get ranked player data for simplified element system."""
     return await execute_service(
@@ -306,6 +318,6 @@ async def get_ranked_players(
 @router.get("/graphics/{graphic_id}/view")
 async def view_graphic(
     graphic_id: int,
-    service: GraphicsService = Depends(get_graphics_service),
+    service: AsyncServiceRunner = Depends(get_async_graphics_service),
 ) -> dict:
     return await execute_service(service.public_view, graphic_id)
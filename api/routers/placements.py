@@ -4,20 +4,28 @@ Placements/Screenshot Processing API endpoints.
 
 from __future__ import annotations
 
-from typing import List, Optional, Dict, Any
-from datetime import datetime
 import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status, Body
-from sqlalchemy.orm import Session
 import aiohttp
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
+from sqlalchemy import and_, case, delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
 
 from api.auth import TokenData
-from api.dependencies import get_db, get_active_user
-from api.models import (
-    PlacementSubmission, RoundPlacement,
-    ProcessingBatch, ScoreboardSnapshot
+from api.dependencies import (
+    get_active_user,
+    get_async_db,
+    get_async_player_search_index,
 )
+from api.models import PlacementSubmission, ProcessingBatch, RoundPlacement, ScoreboardSnapshot
+from api.routers.websocket import send_scoreboard_delta
+from api.services.player_search import queue_player_resync
+from api.services.standings_aggregator import PLACEMENT_SOURCE, StandingsAggregator
+from api.services.standings_service import SCOREBOARD_DELTA_KEY, StandingsService
+from api.utils.service_runner import AsyncServiceRunner
 from integrations.batch_processor import get_batch_processor
 
 log = logging.getLogger(__name__)
@@ -119,32 +127,32 @@ async def list_submissions(
     confidence_min: Optional[int] = Query(None),
     limit: int = Query(50, le=100),
     offset: int = Query(0),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     _user: TokenData = Depends(get_active_user),
 ) -> List[Dict[str, Any]]:
     """
     List placement submissions with optional filtering.
     """
-    query = db.query(PlacementSubmission)
+    query = select(PlacementSubmission)
 
     # Apply filters
     if status_filter:
-        query = query.filter(PlacementSubmission.status == status_filter)
+        query = query.where(PlacementSubmission.status == status_filter)
 
     if tournament_id:
-        query = query.filter(PlacementSubmission.tournament_id == tournament_id)
+        query = query.where(PlacementSubmission.tournament_id == tournament_id)
 
     if round_name:
-        query = query.filter(PlacementSubmission.round_name == round_name)
+        query = query.where(PlacementSubmission.round_name == round_name)
 
     if confidence_min:
-        query = query.filter(PlacementSubmission.overall_confidence >= confidence_min)
+        query = query.where(PlacementSubmission.overall_confidence >= confidence_min)
 
     # Order and paginate
     query = query.order_by(PlacementSubmission.created_at.desc())
     query = query.offset(offset).limit(limit)
 
-    submissions = query.all()
+    submissions = (await db.scalars(query)).all()
 
     return [
         {
@@ -169,15 +177,13 @@ async def list_submissions(
 )
 async def get_submission(
     submission_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     _user: TokenData = Depends(get_active_user),
 ) -> Dict[str, Any]:
     """
     Get detailed information about a specific submission.
     """
-    submission = db.query(PlacementSubmission).filter(
-        PlacementSubmission.id == submission_id
-    ).first()
+    submission = await db.get(PlacementSubmission, submission_id)
 
     if not submission:
         raise HTTPException(
@@ -186,9 +192,9 @@ async def get_submission(
         )
 
     # Get placements
-    placements = db.query(RoundPlacement).filter(
-        RoundPlacement.submission_id == submission_id
-    ).all()
+    placements = (await db.scalars(
+        select(RoundPlacement).where(RoundPlacement.submission_id == submission_id)
+    )).all()
 
     return {
         "id": submission.id,
@@ -231,24 +237,24 @@ async def list_batches(
     status_filter: Optional[str] = Query(None, alias="status"),
     limit: int = Query(20, le=50),
     offset: int = Query(0),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     _user: TokenData = Depends(get_active_user),
 ) -> List[Dict[str, Any]]:
     """
     List processing batches.
     """
-    query = db.query(ProcessingBatch)
+    query = select(ProcessingBatch)
 
     if tournament_id:
-        query = query.filter(ProcessingBatch.tournament_id == tournament_id)
+        query = query.where(ProcessingBatch.tournament_id == tournament_id)
 
     if status_filter:
-        query = query.filter(ProcessingBatch.status == status_filter)
+        query = query.where(ProcessingBatch.status == status_filter)
 
     query = query.order_by(ProcessingBatch.started_at.desc())
     query = query.offset(offset).limit(limit)
 
-    batches = query.all()
+    batches = (await db.scalars(query)).all()
 
     return [
         {
@@ -275,15 +281,13 @@ async def list_batches(
 )
 async def get_batch(
     batch_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     _user: TokenData = Depends(get_active_user),
 ) -> Dict[str, Any]:
     """
     Get detailed information about a processing batch.
     """
-    batch = db.query(ProcessingBatch).filter(
-        ProcessingBatch.id == batch_id
-    ).first()
+    batch = await db.get(ProcessingBatch, batch_id)
 
     if not batch:
         raise HTTPException(
@@ -292,9 +296,9 @@ async def get_batch(
         )
 
     # Get submissions in this batch
-    submissions = db.query(PlacementSubmission).filter(
-        PlacementSubmission.batch_id == batch_id
-    ).all()
+    submissions = (await db.scalars(
+        select(PlacementSubmission).where(PlacementSubmission.batch_id == batch_id)
+    )).all()
 
     return {
         "id": batch.id,
@@ -331,7 +335,7 @@ async def validate_submission(
     approved: bool = Body(...),
     edited_placements: Optional[List[Dict[str, Any]]] = Body(None),
     notes: Optional[str] = Body(None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     _user: TokenData = Depends(get_active_user),
 ) -> Dict[str, Any]:
     """
@@ -339,9 +343,7 @@ async def validate_submission(
 
     Requires admin access.
     """
-    submission = db.query(PlacementSubmission).filter(
-        PlacementSubmission.id == submission_id
-    ).first()
+    submission = await db.get(PlacementSubmission, submission_id)
 
     if not submission:
         raise HTTPException(
@@ -360,10 +362,14 @@ async def validate_submission(
 
         # If placements provided, update them
         if edited_placements:
-            # Delete existing placements
-            db.query(RoundPlacement).filter(
-                RoundPlacement.submission_id == submission_id
-            ).delete()
+            # Delete existing placements; the bulk delete bypasses the search index hooks
+            replaced_players = await db.scalars(
+                select(RoundPlacement.player_id).where(RoundPlacement.submission_id == submission_id)
+            )
+            queue_player_resync(db.sync_session, replaced_players)
+            await db.execute(
+                delete(RoundPlacement).where(RoundPlacement.submission_id == submission_id)
+            )
 
             # Create new placements
             for placement_data in edited_placements:
@@ -383,7 +389,7 @@ async def validate_submission(
                 )
                 db.add(placement)
 
-        db.commit()
+        await db.commit()
         log.info(f"Submission {submission_id} validated by user {_user.username}")  # Fix: username, not user_id
 
         return {
@@ -398,7 +404,7 @@ async def validate_submission(
         submission.validation_notes = notes
         submission.validated_by_discord_id = str(_user.username)  # Fix: TokenData has username, not user_id
 
-        db.commit()
+        await db.commit()
         log.info(f"Submission {submission_id} rejected by user {_user.username}")  # Fix: username, not user_id
 
         return {
@@ -416,24 +422,24 @@ async def validate_submission(
 async def get_round_placements(
     tournament_id: str,
     round_name: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     _user: TokenData = Depends(get_active_user),
 ) -> Dict[str, Any]:
     """
     Get all validated placements for a specific round.
     """
-    submissions = db.query(PlacementSubmission).filter(
-        PlacementSubmission.tournament_id == tournament_id,
-        PlacementSubmission.round_name == round_name,
-        PlacementSubmission.status == "validated"
-    ).all()
-
-    all_placements = []
-    for submission in submissions:
-        placements = db.query(RoundPlacement).filter(
-            RoundPlacement.submission_id == submission.id
-        ).all()
-        all_placements.extend(placements)
+    # Single joined query; ordered by submission then row so lobbies stay grouped
+    all_placements = (await db.scalars(
+        select(RoundPlacement).join(
+            RoundPlacement.submission
+        ).where(
+            PlacementSubmission.tournament_id == tournament_id,
+            PlacementSubmission.round_name == round_name,
+            PlacementSubmission.status == "validated"
+        ).order_by(
+            PlacementSubmission.id, RoundPlacement.id
+        )
+    )).all()
 
     return {
         "tournament_id": tournament_id,
@@ -460,24 +466,42 @@ async def get_round_placements(
 async def refresh_scoreboard(
     tournament_id: str = Body(...),
     round_name: Optional[str] = Body(None),
-    db: Session = Depends(get_db),
+    full: bool = Body(False),
     _user: TokenData = Depends(get_active_user),
+    db: AsyncSession = Depends(get_async_db),
 ) -> Dict[str, Any]:
     """
     Trigger scoreboard refresh based on validated placements.
 
-    This will aggregate all round placements into a scoreboard snapshot.
+    Applies placements changed since the last placement snapshot to its
+    running totals; pass ``full`` to rebuild from every validated placement.
+    When a new snapshot is written, its standings delta is pushed to
+    dashboards over the WebSocket.
     """
-    # In a full implementation, this would call StandingsAggregator
-    # For now, return success message
-
     log.info(f"Scoreboard refresh requested for {tournament_id} (round: {round_name})")
 
+    def refresh(session: Session) -> Dict[str, Any]:
+        service = StandingsService(session)
+        before = service.get_latest_snapshot_version(tournament_id=tournament_id, source=PLACEMENT_SOURCE)
+        snapshot = StandingsAggregator(service).refresh_from_placements(tournament_id=tournament_id, full=full)
+        delta = (snapshot.extras or {}).get(SCOREBOARD_DELTA_KEY)
+        return {
+            "snapshot_id": snapshot.id,
+            "total_players": len(snapshot.entries),
+            "round_names": list(snapshot.round_names or []),
+            "scoreboard_version": delta["version"] if delta else None,
+            "delta": delta if (snapshot.id, snapshot.updated_at) != before else None,
+        }
+
+    summary = await db.run_sync(refresh)
+    await send_scoreboard_delta(summary.pop("delta"))
+
     return {
         "success": True,
-        "message": "Scoreboard refresh triggered",
+        "message": "Scoreboard refreshed",
         "tournament_id": tournament_id,
-        "round_name": round_name
+        "round_name": round_name,
+        **summary,
     }
 
 
@@ -488,49 +512,102 @@ async def refresh_scoreboard(
 )
 async def confidence_report(
     tournament_id: Optional[str] = Query(None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     _user: TokenData = Depends(get_active_user),
 ) -> Dict[str, Any]:
     """
     Get confidence statistics and accuracy metrics.
+
+    Counts, averages and buckets are aggregated in SQL per round, so only
+    one summary row per round comes back from each table.
     """
-    query = db.query(PlacementSubmission)
+    confidence = PlacementSubmission.overall_confidence
+
+    def count_where(condition):
+        return func.sum(case((condition, 1), else_=0))
+
+    submission_query = select(
+        PlacementSubmission.round_name,
+        func.count(PlacementSubmission.id),
+        func.sum(confidence),
+        count_where(PlacementSubmission.validation_method == "auto"),
+        count_where(PlacementSubmission.validation_method == "manual"),
+        count_where(confidence >= 90),
+        count_where(and_(confidence >= 70, confidence < 90)),
+        count_where(confidence < 70),
+    )
+    placement_query = select(
+        RoundPlacement.round_name,
+        func.count(RoundPlacement.id),
+        func.avg(RoundPlacement.player_match_confidence),
+        count_where(RoundPlacement.manually_corrected.is_(True)),
+    )
 
     if tournament_id:
-        query = query.filter(PlacementSubmission.tournament_id == tournament_id)
+        submission_query = submission_query.where(PlacementSubmission.tournament_id == tournament_id)
+        placement_query = placement_query.where(RoundPlacement.tournament_id == tournament_id)
 
-    submissions = query.all()
+    submission_rows = (await db.execute(
+        submission_query.group_by(
+            PlacementSubmission.round_name
+        ).order_by(PlacementSubmission.round_name)
+    )).all()
 
-    if not submissions:
+    if not submission_rows:
         return {
             "total_submissions": 0,
             "average_confidence": 0,
             "auto_validated": 0,
             "manually_validated": 0,
-            "distribution": {}
+            "distribution": {},
+            "rounds": []
         }
 
-    # Calculate metrics
-    confidences = [s.overall_confidence for s in submissions]
-    avg_confidence = sum(confidences) / len(confidences)
+    placement_rows = {
+        row[0]: row[1:]
+        for row in await db.execute(placement_query.group_by(RoundPlacement.round_name))
+    }
 
-    auto_validated = sum(1 for s in submissions if s.validation_method == "auto")
-    manually_validated = sum(1 for s in submissions if s.validation_method == "manual")
+    # Totals are sums of the per-round rows
+    total_submissions = sum(row[1] for row in submission_rows)
+    confidence_sum = sum(row[2] or 0 for row in submission_rows)
+    auto_validated = sum(row[3] or 0 for row in submission_rows)
+    manually_validated = sum(row[4] or 0 for row in submission_rows)
 
-    # Confidence distribution
-    distribution = {
-        "high (90-100%)": sum(1 for c in confidences if c >= 90),
-        "medium (70-89%)": sum(1 for c in confidences if 70 <= c < 90),
-        "low (0-69%)": sum(1 for c in confidences if c < 70),
-    }
+    def distribution(high: int, medium: int, low: int) -> Dict[str, int]:
+        return {
+            "high (90-100%)": high or 0,
+            "medium (70-89%)": medium or 0,
+            "low (0-69%)": low or 0,
+        }
+
+    rounds = []
+    for round_name, count, round_sum, auto, manual, high, medium, low in submission_rows:
+        placement_count, match_avg, corrected = placement_rows.get(round_name, (0, None, 0))
+        rounds.append({
+            "round_name": round_name,
+            "total_submissions": count,
+            "average_confidence": (round_sum or 0) / count / 100,
+            "auto_validated": auto or 0,
+            "manually_validated": manual or 0,
+            "distribution": distribution(high, medium, low),
+            "total_placements": placement_count,
+            "average_player_match_confidence": float(match_avg) / 100 if match_avg is not None else None,
+            "manually_corrected_placements": corrected or 0,
+        })
 
     return {
-        "total_submissions": len(submissions),
-        "average_confidence": avg_confidence / 100,
+        "total_submissions": total_submissions,
+        "average_confidence": confidence_sum / total_submissions / 100,
         "auto_validated": auto_validated,
         "manually_validated": manually_validated,
-        "auto_validation_rate": auto_validated / len(submissions) if submissions else 0,
-        "distribution": distribution
+        "auto_validation_rate": auto_validated / total_submissions,
+        "distribution": distribution(
+            sum(row[5] or 0 for row in submission_rows),
+            sum(row[6] or 0 for row in submission_rows),
+            sum(row[7] or 0 for row in submission_rows),
+        ),
+        "rounds": rounds
     }
 
 
@@ -544,22 +621,22 @@ async def get_pending_review(
     round_name: Optional[str] = Query(None),
     limit: int = Query(50, le=100),
     offset: int = Query(0),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     _user: TokenData = Depends(get_active_user),
 ) -> Dict[str, Any]:
     """
     Get submissions that need manual review.
     Returns submissions with status 'pending_review' or low confidence.
     """
-    query = db.query(PlacementSubmission).filter(
+    query = select(PlacementSubmission).where(
         PlacementSubmission.status.in_(["pending", "pending_review"])  # Show pending too
     )
 
     if tournament_id:
-        query = query.filter(PlacementSubmission.tournament_id == tournament_id)
+        query = query.where(PlacementSubmission.tournament_id == tournament_id)
 
     if round_name:
-        query = query.filter(PlacementSubmission.round_name == round_name)
+        query = query.where(PlacementSubmission.round_name == round_name)
 
     # Order by confidence (lowest first) and creation time
     query = query.order_by(
@@ -567,15 +644,17 @@ async def get_pending_review(
         PlacementSubmission.created_at.desc()
     )
 
-    total_count = query.count()
-    submissions = query.offset(offset).limit(limit).all()
+    total_count = await db.scalar(select(func.count()).select_from(query.subquery()))
+    submissions = (await db.scalars(
+        query.options(
+            selectinload(PlacementSubmission.placements)
+        ).offset(offset).limit(limit)
+    )).all()
 
-    # Get placements and issues for each submission
+    # Build issues for each submission (placements were loaded above)
     result_submissions = []
     for submission in submissions:
-        placements = db.query(RoundPlacement).filter(
-            RoundPlacement.submission_id == submission.id
-        ).all()
+        placements = submission.placements
 
         # Identify issues
         issues = []
@@ -627,7 +706,7 @@ async def batch_validate_submissions(
     submission_ids: List[int] = Body(...),
     approved: bool = Body(...),
     notes: Optional[str] = Body(None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     _user: TokenData = Depends(get_active_user),
 ) -> Dict[str, Any]:
     """
@@ -644,9 +723,7 @@ async def batch_validate_submissions(
 
     for submission_id in submission_ids:
         try:
-            submission = db.query(PlacementSubmission).filter(
-                PlacementSubmission.id == submission_id
-            ).first()
+            submission = await db.get(PlacementSubmission, submission_id)
 
             if not submission:
                 results["failed"].append({
@@ -663,12 +740,14 @@ async def batch_validate_submissions(
                 submission.validated_at = datetime.utcnow()
 
                 # Mark all placements as validated
-                db.query(RoundPlacement).filter(
-                    RoundPlacement.submission_id == submission_id
-                ).update({
-                    "validated": True,
-                    "validated_by_discord_id": str(_user.user_id)
-                })
+                await db.execute(
+                    update(RoundPlacement).where(
+                        RoundPlacement.submission_id == submission_id
+                    ).values(
+                        validated=True,
+                        validated_by_discord_id=str(_user.user_id)
+                    )
+                )
 
                 results["success"].append(submission_id)
             else:
@@ -686,7 +765,7 @@ async def batch_validate_submissions(
                 "error": str(e)
             })
 
-    db.commit()
+    await db.commit()
 
     log.info(
         f"Batch validation by user {_user.user_id}: "
@@ -705,73 +784,17 @@ async def search_players(
     q: str = Query(..., min_length=1),
     tournament_id: Optional[str] = Query(None),
     limit: int = Query(20, le=50),
-    db: Session = Depends(get_db),
+    search_index: AsyncServiceRunner = Depends(get_async_player_search_index),
     _user: TokenData = Depends(get_active_user),
 ) -> Dict[str, Any]:
     """
     Search for players by name for autocomplete in review UI.
     Returns players with aliases and fuzzy matching.
     """
-    from api.models import PlayerAlias
-    from difflib import SequenceMatcher
-
-    # Search query (case-insensitive)
-    search_term = q.lower()
-
-    # Get all players (in real implementation, this would query tournament registrations)
-    # For now, we'll get players from recent placements
-    placements_query = db.query(RoundPlacement).filter(
-        RoundPlacement.player_name.isnot(None)
-    )
-
-    if tournament_id:
-        placements_query = placements_query.filter(
-            RoundPlacement.tournament_id == tournament_id
-        )
-
-    # Get unique player names
-    unique_players = {}
-    for placement in placements_query.all():
-        if placement.player_id and placement.player_id not in unique_players:
-            unique_players[placement.player_id] = placement.player_name
-
-    # Get aliases
-    aliases_map = {}
-    aliases = db.query(PlayerAlias).all()
-    for alias in aliases:
-        if alias.player_id not in aliases_map:
-            aliases_map[alias.player_id] = []
-        aliases_map[alias.player_id].append(alias.alias)
-
-    # Fuzzy match players
-    matches = []
-    for player_id, player_name in unique_players.items():
-        # Calculate match confidence
-        name_similarity = SequenceMatcher(None, search_term, player_name.lower()).ratio()
-
-        # Check aliases
-        alias_matches = []
-        if player_id in aliases_map:
-            for alias in aliases_map[player_id]:
-                alias_similarity = SequenceMatcher(None, search_term, alias.lower()).ratio()
-                if alias_similarity > 0.5:
-                    alias_matches.append(alias)
-                    name_similarity = max(name_similarity, alias_similarity)
-
-        # Include if confidence > 0.3
-        if name_similarity > 0.3 or search_term in player_name.lower():
-            matches.append({
-                "id": player_id,
-                "name": player_name,
-                "aliases": aliases_map.get(player_id, []),
-                "match_confidence": name_similarity
-            })
-
-    # Sort by confidence
-    matches.sort(key=lambda x: x["match_confidence"], reverse=True)
+    players, total = await search_index.search(q, tournament_id=tournament_id, limit=limit)
 
     return {
-        "players": matches[:limit],
+        "players": players,
         "query": q,
-        "total": len(matches)
+        "total": total
     }
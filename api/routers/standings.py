@@ -1,37 +1,104 @@
 """
 Standings/scoreboard API endpoints.
+
+Reads run on an async session; snapshot loading and pydantic validation
+happen together inside ``run_sync`` so lazy entry loads use the async driver.
+
+``/latest`` answers conditional requests from a one-row version lookup and
+serves the serialized snapshot from an in-process cache when it is current.
 """
 
 from __future__ import annotations
 
-from typing import List, Optional
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 from api.auth import TokenData
 from api.dependencies import (
     get_active_user,
+    get_async_db,
     get_standings_aggregator,
-    get_standings_service,
     require_write_access,
 )
+from api.routers.websocket import send_scoreboard_delta
 from api.schemas.scoreboard import (
     ScoreboardRefreshRequest,
     ScoreboardSnapshot,
     ScoreboardSnapshotSummary,
 )
 from api.services.standings_aggregator import StandingsAggregator
-from api.services.standings_service import StandingsService
+from api.services.standings_service import (
+    SCOREBOARD_DELTA_KEY,
+    SnapshotVersion,
+    StandingsService,
+    latest_snapshot_cache,
+)
+from api.utils.service_runner import execute_service
 from integrations.sheets import refresh_sheet_cache
 
 router = APIRouter(prefix="/scoreboard", tags=["scoreboard"])
 
 
+def _as_utc(value: datetime) -> datetime:
+    # SQLite hands back naive datetimes for timezone-aware columns
+    return value if value.tzinfo else value.replace(tzinfo=UTC)
+
+
+def _snapshot_headers(snapshot_id: int, updated_at: Optional[datetime]) -> Dict[str, str]:
+    if not updated_at:
+        return {}
+    updated_at = _as_utc(updated_at)
+    return {
+        "ETag": f'W/"{snapshot_id}-{updated_at.timestamp()}"',
+        "Last-Modified": format_datetime(updated_at, usegmt=True),
+    }
+
+
 def _set_snapshot_headers(response: Response, snapshot: ScoreboardSnapshot) -> None:
     """Attach caching headers (ETag/Last-Modified) for clients."""
-    if snapshot.updated_at:
-        response.headers["ETag"] = f'W/"{snapshot.updated_at.timestamp()}"'
-        response.headers["Last-Modified"] = snapshot.updated_at.isoformat()
+    response.headers.update(_snapshot_headers(snapshot.id, snapshot.updated_at))
+
+
+def _not_modified(request: Request, etag: str, updated_at: datetime) -> bool:
+    """Evaluate If-None-Match (preferred) or If-Modified-Since against a snapshot."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = {tag.strip() for tag in if_none_match.split(",")}
+        return "*" in tags or etag in tags or etag.removeprefix("W/") in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        # HTTP dates carry whole seconds only
+        return _as_utc(updated_at).replace(microsecond=0) <= _as_utc(since)
+    return False
+
+
+def _latest_version(
+    db: Session,
+    tournament_id: Optional[str],
+    guild_id: Optional[str],
+) -> Optional[SnapshotVersion]:
+    return StandingsService(db).get_latest_snapshot_version(
+        tournament_id=tournament_id,
+        guild_id=guild_id,
+    )
+
+
+def _load_snapshot(db: Session, snapshot_id: int) -> ScoreboardSnapshot:
+    return ScoreboardSnapshot.model_validate(StandingsService(db).get_snapshot(snapshot_id))
+
+
+def _list_snapshots(db: Session, **filters) -> List[ScoreboardSnapshotSummary]:
+    return StandingsService(db).list_snapshots(**filters)
 
 
 @router.get(
@@ -40,24 +107,30 @@ def _set_snapshot_headers(response: Response, snapshot: ScoreboardSnapshot) -> N
     summary="Get the latest scoreboard snapshot.",
 )
 async def get_latest_scoreboard(
-    response: Response,
+    request: Request,
     tournament_id: Optional[str] = Query(None),
     guild_id: Optional[str] = Query(None),
     _user: TokenData = Depends(get_active_user),
-    service: StandingsService = Depends(get_standings_service),
-) -> ScoreboardSnapshot:
-    snapshot = service.get_latest_snapshot(
-        tournament_id=tournament_id,
-        guild_id=guild_id,
-    )
-    if not snapshot:
+    db: AsyncSession = Depends(get_async_db),
+) -> Response:
+    version = await db.run_sync(_latest_version, tournament_id, guild_id)
+    if not version:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No scoreboard snapshot found.",
         )
-    schema = ScoreboardSnapshot.model_validate(snapshot)
-    _set_snapshot_headers(response, schema)
-    return schema
+
+    snapshot_id, updated_at = version
+    headers = _snapshot_headers(snapshot_id, updated_at)
+    if headers and _not_modified(request, headers["ETag"], updated_at):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    body = latest_snapshot_cache.get(tournament_id, guild_id, version)
+    if body is None:
+        schema = await execute_service(db.run_sync, _load_snapshot, snapshot_id)
+        body = schema.model_dump_json().encode()
+        latest_snapshot_cache.store(tournament_id, guild_id, version, body)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.get(
@@ -70,9 +143,10 @@ async def list_scoreboard_snapshots(
     guild_id: Optional[str] = Query(None),
     limit: int = Query(50, ge=1, le=200),
     _user: TokenData = Depends(get_active_user),
-    service: StandingsService = Depends(get_standings_service),
+    db: AsyncSession = Depends(get_async_db),
 ) -> List[ScoreboardSnapshotSummary]:
-    return service.list_snapshots(
+    return await db.run_sync(
+        _list_snapshots,
         tournament_id=tournament_id,
         guild_id=guild_id,
         limit=limit,
@@ -88,10 +162,9 @@ async def get_scoreboard_snapshot(
     snapshot_id: int,
     response: Response,
     _user: TokenData = Depends(get_active_user),
-    service: StandingsService = Depends(get_standings_service),
+    db: AsyncSession = Depends(get_async_db),
 ) -> ScoreboardSnapshot:
-    snapshot = service.get_snapshot(snapshot_id)
-    schema = ScoreboardSnapshot.model_validate(snapshot)
+    schema = await execute_service(db.run_sync, _load_snapshot, snapshot_id)
     _set_snapshot_headers(response, schema)
     return schema
 
@@ -128,6 +201,7 @@ async def refresh_scoreboard_snapshot(
     )
 
     schema = ScoreboardSnapshot.model_validate(snapshot_model)
+    await send_scoreboard_delta((schema.extras or {}).get(SCOREBOARD_DELTA_KEY))
     _set_snapshot_headers(response, schema)
     return schema
 
@@ -1,5 +1,9 @@
 """
 WebSocket endpoints for real-time updates with backpressure handling.
+
+Broadcasts are encoded once and the same text frame is queued for every
+recipient. Event types in ``SUBSCRIBABLE_TOPICS`` are only delivered to
+connections that subscribed to them; everything else reaches every client.
 """
 
 from __future__ import annotations
@@ -24,6 +28,14 @@ logger = logging.getLogger(__name__)
 MAX_QUEUE_SIZE = 50
 CLIENT_TIMEOUT = timedelta(seconds=45)
 
+SUBSCRIBABLE_TOPICS = frozenset({
+    "tournament_update",
+    "user_update",
+    "configuration_update",
+    "placement_update",
+    "scoreboard_delta",
+})
+
 
 def utcnow() -> datetime:
     """Timezone-aware wrapper used throughout the WebSocket manager."""
@@ -36,6 +48,7 @@ class ConnectionContext:
     connection_id: str
     user_id: str
     queue: asyncio.Queue[str] = field(default_factory=lambda: asyncio.Queue(MAX_QUEUE_SIZE))
+    topics: Set[str] = field(default_factory=set)
     sender_task: Optional[asyncio.Task] = None
     created_at: datetime = field(default_factory=utcnow)
     last_seen: datetime = field(default_factory=utcnow)
@@ -101,7 +114,9 @@ class ConnectionManager:
             await self.close(context, "sender loop terminated")
 
     async def enqueue(self, context: ConnectionContext, message: Dict[str, Any]) -> None:
-        payload = json.dumps(message)
+        await self._enqueue_payload(context, json.dumps(message))
+
+    async def _enqueue_payload(self, context: ConnectionContext, payload: str) -> None:
         try:
             context.queue.put_nowait(payload)
         except asyncio.QueueFull:
@@ -114,13 +129,41 @@ class ConnectionManager:
 
     async def send_personal_message(self, message: Dict[str, Any], user_id: str) -> None:
         contexts = await self._get_user_contexts(user_id)
+        payload = json.dumps(message)
         for context in contexts:
-            await self.enqueue(context, message)
+            await self._enqueue_payload(context, payload)
+
+    async def broadcast(self, message: Dict[str, Any]) -> int:
+        """
+        Queue ``message`` for every connection subscribed to its type.
+
+        The message is serialized once and shared across queues. Returns the
+        number of connections it was queued for.
+        """
+        topic = message.get("type")
+        contexts = [
+            context
+            for context in await self._get_all_contexts()
+            if topic not in SUBSCRIBABLE_TOPICS or topic in context.topics
+        ]
+        if not contexts:
+            return 0
 
-    async def broadcast(self, message: Dict[str, Any]) -> None:
-        contexts = await self._get_all_contexts()
+        payload = json.dumps(message)
         for context in contexts:
-            await self.enqueue(context, message)
+            await self._enqueue_payload(context, payload)
+        return len(contexts)
+
+    @staticmethod
+    def subscribe(context: ConnectionContext, topics: List[str]) -> List[str]:
+        """Add known topics to a connection; returns the ones that were rejected."""
+        unknown = [topic for topic in topics if topic not in SUBSCRIBABLE_TOPICS]
+        context.topics.update(topic for topic in topics if topic in SUBSCRIBABLE_TOPICS)
+        return unknown
+
+    @staticmethod
+    def unsubscribe(context: ConnectionContext, topics: List[str]) -> None:
+        context.topics.difference_update(topics)
 
     async def _get_user_contexts(self, user_id: str) -> List[ConnectionContext]:
         async with self._lock:
@@ -173,6 +216,14 @@ def _decode_token(token: str) -> Optional[TokenData]:
     )
 
 
+def _requested_topics(message: Dict[str, Any]) -> List[str]:
+    """Accept either ``event_type`` or an ``event_types`` list in (un)subscribe messages."""
+    topics = message.get("event_types")
+    if not isinstance(topics, list):
+        topics = [message.get("event_type")]
+    return [str(topic) for topic in topics if topic]
+
+
 @router.websocket("/ws/{token}")
 async def websocket_endpoint(websocket: WebSocket, token: str):
     """
@@ -235,13 +286,30 @@ async def websocket_endpoint(websocket: WebSocket, token: str):
                     {"type": "pong", "timestamp": utcnow().isoformat()},
                 )
 
-            elif message_type == "subscribe":
-                event_type = message.get("event_type")
+            elif message_type in ("subscribe", "unsubscribe"):
+                topics = _requested_topics(message)
+                if message_type == "subscribe":
+                    unknown = manager.subscribe(context, topics)
+                else:
+                    unknown = []
+                    manager.unsubscribe(context, topics)
+
+                if unknown:
+                    await manager.enqueue(
+                        context,
+                        {
+                            "type": "error",
+                            "message": f"Unknown event type: {', '.join(unknown)}",
+                            "available": sorted(SUBSCRIBABLE_TOPICS),
+                            "timestamp": utcnow().isoformat(),
+                        },
+                    )
                 await manager.enqueue(
                     context,
                     {
                         "type": "subscription_confirmed",
-                        "event_type": event_type,
+                        "event_type": message.get("event_type"),
+                        "subscriptions": sorted(context.topics),
                         "timestamp": utcnow().isoformat(),
                     },
                 )
@@ -318,30 +386,60 @@ async def send_system_notification(notification: dict):
     )
 
 
-async def send_placement_update(round_name: str, lobby_updates: List[dict]):
+async def send_placement_update(
+    round_name: str,
+    lobby_updates: List[dict],
+    scoreboard_version: Optional[int] = None,
+):
     """
     Notify dashboard clients that placements were updated.
-    Dashboard should refresh standings data.
+
+    When the new standings were already pushed as a ``scoreboard_delta``,
+    ``scoreboard_version`` names it and the action tells clients to apply
+    that delta; otherwise they are asked to refresh standings data.
     
     Args:
         round_name: Name of the round that was updated
         lobby_updates: List of placement updates with lobby, player, placement info
+        scoreboard_version: Version of the scoreboard delta sent for this update
     """
     await manager.broadcast({
         "type": "placement_update",
         "data": {
             "round": round_name,
             "lobby_updates": lobby_updates,
-            "action": "refresh",
+            "action": "refresh" if scoreboard_version is None else "apply_delta",
+            "scoreboard_version": scoreboard_version,
             "timestamp": utcnow().isoformat(),
         }
     })
 
 
+async def send_scoreboard_delta(delta: Optional[dict]) -> None:
+    """
+    Push the standings entries that changed in a new scoreboard snapshot.
+
+    Versions count per tournament and ``source`` (sheet and placement
+    snapshots are separate chains), so clients track them per pair. They
+    apply the delta when ``base_version`` equals the version they hold for
+    that pair, ignore it when ``version`` is not newer, and refetch
+    ``/scoreboard/latest`` on any other gap.
+    """
+    if not delta:
+        return
+    await manager.broadcast({
+        "type": "scoreboard_delta",
+        "data": delta,
+        "timestamp": utcnow().isoformat(),
+    })
+
+
 __all__ = [
     "send_tournament_update",
     "send_user_update",
     "send_configuration_update",
     "send_system_notification",
+    "send_placement_update",
+    "send_scoreboard_delta",
     "manager",
 ]
@@ -41,10 +41,24 @@ class GraphicResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class GraphicSummary(BaseModel):
+    """Schema for graphic list entries (no canvas payload)"""
+    id: int
+    title: str
+    event_name: Optional[str]
+    created_by: str
+    created_at: datetime
+    updated_at: datetime
+    archived: bool
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class GraphicListResponse(BaseModel):
     """Schema for graphics list response"""
-    graphics: list[GraphicResponse]
+    graphics: list[GraphicSummary]
     total: int
+    next_cursor: Optional[str] = None
 
 
 class CanvasLockBase(BaseModel):
@@ -91,6 +105,7 @@ class ArchiveResponse(BaseModel):
 
 class ArchiveListResponse(BaseModel):
     """Schema for archive list response"""
-    archives: list[GraphicResponse]
+    archives: list[GraphicSummary]
     total: int
     can_delete: bool  # Admin permission flag
+    next_cursor: Optional[str] = None
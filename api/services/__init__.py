@@ -8,6 +8,7 @@ from .user_service import UserService
 from .configuration_service import ConfigurationService
 from .standings_service import StandingsService
 from .standings_aggregator import StandingsAggregator
+from .player_search import PlayerSearchIndex
 
 __all__ = [
     "GraphicsService",
@@ -16,4 +17,5 @@ __all__ = [
     "ConfigurationService",
     "StandingsService",
     "StandingsAggregator",
+    "PlayerSearchIndex",
 ]
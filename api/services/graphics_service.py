@@ -8,15 +8,17 @@ domain-specific `ServiceError`s when something goes wrong.
 
 from __future__ import annotations
 
+import base64
+import binascii
 import json
 import logging
 from datetime import UTC, datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from sqlalchemy import and_, or_
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, defer
 
-from api.services.errors import ConflictError, NotFoundError
+from api.services.errors import ConflictError, NotFoundError, ValidationError
 
 logger = logging.getLogger(__name__)
 from ..models import Archive, CanvasLock, Graphic
@@ -27,6 +29,17 @@ from ..schemas.graphics import (
     LockStatusResponse,
 )
 
+# Columns returned by list views; the data_json payload is only loaded per graphic
+_SUMMARY_COLUMNS = (
+    Graphic.id,
+    Graphic.title,
+    Graphic.event_name,
+    Graphic.created_by,
+    Graphic.created_at,
+    Graphic.updated_at,
+    Graphic.archived,
+)
+
 
 class GraphicsService:
     """Service for managing graphics and canvas locks."""
@@ -54,6 +67,19 @@ class GraphicsService:
             "archived": graphic.archived,
         }
 
+    @staticmethod
+    def _encode_cursor(updated_at: datetime, graphic_id: int) -> str:
+        raw = f"{updated_at.isoformat()}|{graphic_id}".encode()
+        return base64.urlsafe_b64encode(raw).decode("ascii")
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+        try:
+            updated_at, graphic_id = base64.urlsafe_b64decode(cursor.encode("ascii")).decode().split("|")
+            return datetime.fromisoformat(updated_at), int(graphic_id)
+        except (binascii.Error, UnicodeError, ValueError) as exc:
+            raise ValidationError("Invalid pagination cursor.") from exc
+
     def _serialize_lock(self, lock: CanvasLock) -> Dict[str, Any]:
         return {
             "id": lock.id,
@@ -64,12 +90,11 @@ class GraphicsService:
             "expires_at": lock.expires_at,
         }
 
-    def _get_graphic_or_error(self, graphic_id: int) -> Graphic:
-        graphic = (
-            self.db.query(Graphic)
-            .filter(Graphic.id == graphic_id)
-            .first()
-        )
+    def _get_graphic_or_error(self, graphic_id: int, *, with_data: bool = True) -> Graphic:
+        query = self.db.query(Graphic)
+        if not with_data:
+            query = query.options(defer(Graphic.data_json))
+        graphic = query.filter(Graphic.id == graphic_id).first()
         if not graphic:
             raise NotFoundError(f"Graphic {graphic_id} was not found.")
         return graphic
@@ -105,14 +130,52 @@ class GraphicsService:
         self.db.refresh(db_graphic)
         return self._serialize_graphic(db_graphic)
 
-    def get_graphics(self, include_archived: bool = False) -> List[Dict[str, Any]]:
-        """Return all graphics, optionally including archived ones."""
-        query = self.db.query(Graphic)
-        if not include_archived:
+    def get_graphics(
+        self,
+        include_archived: bool = False,
+        *,
+        archived_only: bool = False,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        List graphic summaries (no ``data_json``), newest first.
+
+        Pages are keyed on ``(updated_at, id)``: pass the returned
+        ``next_cursor`` back to continue after the last row of a page.
+
+        Returns:
+            Dict with ``graphics``, ``total`` matching rows and ``next_cursor``.
+        """
+        query = self.db.query(*_SUMMARY_COLUMNS)
+        if archived_only:
+            query = query.filter(Graphic.archived.is_(True))
+        elif not include_archived:
             query = query.filter(Graphic.archived.is_(False))
+        total = query.count()
+
+        if cursor:
+            updated_at, graphic_id = self._decode_cursor(cursor)
+            query = query.filter(
+                or_(
+                    Graphic.updated_at < updated_at,
+                    and_(Graphic.updated_at == updated_at, Graphic.id < graphic_id),
+                )
+            )
+
+        query = query.order_by(Graphic.updated_at.desc(), Graphic.id.desc())
+        rows = query.limit(limit + 1).all() if limit else query.all()
 
-        graphics = query.order_by(Graphic.updated_at.desc()).all()
-        return [self._serialize_graphic(graphic) for graphic in graphics]
+        next_cursor = None
+        if limit and len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = self._encode_cursor(rows[-1].updated_at, rows[-1].id)
+
+        return {
+            "graphics": [dict(row._mapping) for row in rows],
+            "total": total,
+            "next_cursor": next_cursor,
+        }
 
     def get_event_names(self) -> List[str]:
         """Get list of distinct event names from all graphics."""
@@ -184,7 +247,7 @@ class GraphicsService:
             NotFoundError: if the graphic does not exist.
             ConflictError: if the graphic is currently locked.
         """
-        graphic = self._get_graphic_or_error(graphic_id)
+        graphic = self._get_graphic_or_error(graphic_id, with_data=False)
         lock = self._get_active_lock_model(graphic_id)
         if lock and not is_admin:
             raise ConflictError("Cannot delete while graphic is being edited.")
@@ -341,7 +404,7 @@ class GraphicsService:
     # --------------------------------------------------------------------- #
     def archive_graphic(self, graphic_id: int, user_name: str, reason: Optional[str] = None) -> Dict[str, Any]:
         """Archive a graphic with an optional reason."""
-        graphic = self._get_graphic_or_error(graphic_id)
+        graphic = self._get_graphic_or_error(graphic_id, with_data=False)
         lock = self._get_active_lock_model(graphic_id)
         if lock:
             raise ConflictError("Cannot archive while graphic is being edited.")
@@ -363,7 +426,7 @@ class GraphicsService:
 
     def restore_graphic(self, graphic_id: int, user_name: str) -> Dict[str, Any]:
         """Restore a previously archived graphic."""
-        graphic = self._get_graphic_or_error(graphic_id)
+        graphic = self._get_graphic_or_error(graphic_id, with_data=False)
         if not graphic.archived:
             raise ConflictError("Graphic is not archived.")
 
@@ -395,7 +458,7 @@ class GraphicsService:
             NotFoundError: if the graphic does not exist.
             ConflictError: if the graphic is locked by another user.
         """
-        graphic = self._get_graphic_or_error(graphic_id)
+        graphic = self._get_graphic_or_error(graphic_id, with_data=False)
 
         lock = self._get_active_lock_model(graphic_id)
         if lock:
@@ -0,0 +1,314 @@
+"""
+Service layer for player name search.
+
+Player names (from round placements) and aliases are normalized and split
+into trigrams as they are written, so search only scores the terms that
+share trigrams with the query instead of every placement in history.
+
+Sessions created as ``SearchIndexedSession`` re-sync the terms of every
+player whose placements or aliases a flush touched, so deleted and renamed
+names drop out of the index.
+"""
+
+from __future__ import annotations
+
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from rapidfuzz import fuzz
+from sqlalchemy import event, func, inspect, or_, true
+from sqlalchemy.orm import Session
+
+from api.models import PlayerAlias, PlayerSearchTerm, PlayerSearchTrigram, RoundPlacement
+
+# (player_id, tournament_id, kind, term)
+SearchEntry = Tuple[str, Optional[str], str, str]
+
+# Candidate terms scored per result slot requested
+CANDIDATES_PER_RESULT = 10
+MIN_CANDIDATES = 200
+
+# Scoring thresholds (same as the original SequenceMatcher search)
+NAME_MATCH_THRESHOLD = 0.3
+ALIAS_MATCH_THRESHOLD = 0.5
+
+
+def normalize_search_text(text: str) -> str:
+    """Casefold and drop everything except letters and digits."""
+    return "".join(ch for ch in text.casefold() if ch.isalnum())
+
+
+def search_trigrams(normalized: str) -> Set[str]:
+    """
+    Return the trigrams of a normalized term.
+
+    The term is padded like pg_trgm (two leading spaces, one trailing) so
+    one and two character queries still produce prefix trigrams.
+    """
+    if not normalized:
+        return set()
+    padded = f"  {normalized} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class PlayerSearchIndex:
+    """Service responsible for maintaining and querying the player search index."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    # ------------------------------------------------------------------ #
+    # Mutations
+    # ------------------------------------------------------------------ #
+    def add_terms(self, entries: Iterable[SearchEntry], *, check_existing: bool = True) -> int:
+        """
+        Add search terms that are not indexed yet.
+
+        Does not flush or commit; terms are written with the caller's next flush.
+
+        Returns:
+            Number of new terms added
+        """
+        pending: Dict[Tuple[str, Optional[str], str, str], str] = {}
+        for player_id, tournament_id, kind, term in entries:
+            normalized = normalize_search_text(term or "")
+            if player_id and normalized:
+                pending.setdefault((player_id, tournament_id, kind, normalized), term)
+
+        if pending and check_existing:
+            player_ids = {key[0] for key in pending}
+            with self.db.no_autoflush:
+                existing = self.db.query(
+                    PlayerSearchTerm.player_id,
+                    PlayerSearchTerm.tournament_id,
+                    PlayerSearchTerm.kind,
+                    PlayerSearchTerm.normalized,
+                ).filter(PlayerSearchTerm.player_id.in_(player_ids)).all()
+            for row in existing:
+                pending.pop(tuple(row), None)
+
+        for (player_id, tournament_id, kind, normalized), term in pending.items():
+            self.db.add(
+                PlayerSearchTerm(
+                    player_id=player_id,
+                    tournament_id=tournament_id,
+                    kind=kind,
+                    term=term,
+                    normalized=normalized,
+                    trigrams=[PlayerSearchTrigram(trigram=t) for t in search_trigrams(normalized)],
+                )
+            )
+        return len(pending)
+
+    def sync_players(self, player_ids: Iterable[str]) -> int:
+        """
+        Make the players' terms match their current placement names and aliases.
+
+        Stale terms are deleted and missing ones added; nothing is flushed.
+
+        Returns:
+            Number of terms added or removed
+        """
+        player_ids = set(player_ids)
+        if not player_ids:
+            return 0
+
+        with self.db.no_autoflush:
+            current: Dict[Tuple[str, Optional[str], str, str], str] = {}
+            for player_id, tournament_id, kind, term in self._current_entries(player_ids):
+                normalized = normalize_search_text(term or "")
+                if normalized:
+                    current.setdefault((player_id, tournament_id, kind, normalized), term)
+
+            removed = 0
+            for term in self.db.query(PlayerSearchTerm).filter(PlayerSearchTerm.player_id.in_(player_ids)):
+                key = (term.player_id, term.tournament_id, term.kind, term.normalized)
+                if current.pop(key, None) is None:
+                    self.db.delete(term)
+                    removed += 1
+
+        added = self.add_terms(
+            ((player_id, tournament_id, kind, term) for (player_id, tournament_id, kind, _), term in current.items()),
+            check_existing=False,
+        )
+        return added + removed
+
+    def rebuild(self) -> int:
+        """
+        Rebuild the index from round placements and aliases and commit.
+
+        Returns:
+            Number of indexed terms
+        """
+        self.db.query(PlayerSearchTrigram).delete(synchronize_session=False)
+        self.db.query(PlayerSearchTerm).delete(synchronize_session=False)
+
+        count = self.add_terms(self._current_entries(), check_existing=False)
+        self.db.commit()
+        return count
+
+    def backfill(self) -> int:
+        """Rebuild the index only if it is empty while placements exist."""
+        if self.db.query(PlayerSearchTerm.id).first() is not None:
+            return 0
+        if self.db.query(RoundPlacement.id).first() is None:
+            return 0
+        return self.rebuild()
+
+    # ------------------------------------------------------------------ #
+    # Reads
+    # ------------------------------------------------------------------ #
+    def search(
+        self,
+        query: str,
+        *,
+        tournament_id: Optional[str] = None,
+        limit: int = 20,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Search players by name or alias.
+
+        Only terms sharing trigrams with the query are loaded and scored,
+        then players are ranked the same way the original full scan did.
+
+        Returns:
+            Tuple of (top ``limit`` matches, total matching players)
+        """
+        grams = search_trigrams(normalize_search_text(query))
+        if not grams:
+            return [], 0
+
+        shared = func.count(PlayerSearchTrigram.trigram)
+        candidates = self.db.query(PlayerSearchTerm.player_id).join(
+            PlayerSearchTrigram, PlayerSearchTrigram.term_id == PlayerSearchTerm.id
+        ).filter(
+            PlayerSearchTrigram.trigram.in_(grams),
+            self._scope_filter(tournament_id),
+        ).group_by(
+            PlayerSearchTerm.id, PlayerSearchTerm.player_id
+        ).order_by(
+            shared.desc(), PlayerSearchTerm.id
+        ).limit(max(limit * CANDIDATES_PER_RESULT, MIN_CANDIDATES))
+
+        player_ids = {player_id for (player_id,) in candidates}
+        if not player_ids:
+            return [], 0
+
+        terms = self.db.query(
+            PlayerSearchTerm.player_id, PlayerSearchTerm.kind, PlayerSearchTerm.term
+        ).filter(
+            PlayerSearchTerm.player_id.in_(player_ids),
+            self._scope_filter(tournament_id),
+        ).order_by(PlayerSearchTerm.id)
+
+        names: Dict[str, str] = {}
+        aliases_map: Dict[str, List[str]] = {}
+        for player_id, kind, term in terms:
+            if kind == "alias":
+                aliases_map.setdefault(player_id, []).append(term)
+            else:
+                # Terms are indexed oldest name first; show the newest
+                names[player_id] = term
+
+        search_term = query.lower()
+        matches = []
+        for player_id, player_name in names.items():
+            name_similarity = fuzz.ratio(search_term, player_name.lower()) / 100
+
+            for alias in aliases_map.get(player_id, []):
+                alias_similarity = fuzz.ratio(search_term, alias.lower()) / 100
+                if alias_similarity > ALIAS_MATCH_THRESHOLD:
+                    name_similarity = max(name_similarity, alias_similarity)
+
+            if name_similarity > NAME_MATCH_THRESHOLD or search_term in player_name.lower():
+                matches.append({
+                    "id": player_id,
+                    "name": player_name,
+                    "aliases": aliases_map.get(player_id, []),
+                    "match_confidence": name_similarity,
+                })
+
+        matches.sort(key=lambda x: x["match_confidence"], reverse=True)
+        return matches[:limit], len(matches)
+
+    # ------------------------------------------------------------------ #
+    # Internal helpers
+    # ------------------------------------------------------------------ #
+    def _current_entries(self, player_ids: Optional[Set[str]] = None) -> Iterable[SearchEntry]:
+        """Search entries for the current placement names (oldest first) and aliases."""
+        names = self.db.query(
+            RoundPlacement.player_id,
+            RoundPlacement.tournament_id,
+            RoundPlacement.player_name,
+        ).filter(RoundPlacement.player_name.isnot(None))
+        aliases = self.db.query(PlayerAlias.player_id, PlayerAlias.alias_name)
+        if player_ids is not None:
+            names = names.filter(RoundPlacement.player_id.in_(player_ids))
+            aliases = aliases.filter(PlayerAlias.player_id.in_(player_ids))
+        names = names.group_by(
+            RoundPlacement.player_id, RoundPlacement.tournament_id, RoundPlacement.player_name
+        ).order_by(func.max(RoundPlacement.id))
+        aliases = aliases.order_by(PlayerAlias.id)
+
+        return chain(
+            ((player_id, tournament_id, "name", name) for player_id, tournament_id, name in names),
+            ((player_id, None, "alias", alias) for player_id, alias in aliases),
+        )
+
+    @staticmethod
+    def _scope_filter(tournament_id: Optional[str]):
+        """Aliases apply everywhere; names only within the requested tournament."""
+        if not tournament_id:
+            return true()
+        return or_(
+            PlayerSearchTerm.kind == "alias",
+            PlayerSearchTerm.tournament_id == tournament_id,
+        )
+
+
+class SearchIndexedSession(Session):
+    """Session that keeps the player search index in step with what it flushes."""
+
+
+_PENDING_PLAYERS = "player_search_pending"
+
+
+def queue_player_resync(session: Session, player_ids: Iterable[str]) -> None:
+    """
+    Re-sync these players' search terms after the session's next flush.
+
+    Needed for bulk statements (e.g. ``delete(RoundPlacement)``), which the
+    flush hooks cannot see.
+    """
+    session.info.setdefault(_PENDING_PLAYERS, set()).update(pid for pid in player_ids if pid)
+
+
+def _queue_flushed_players(session: Session, flush_context, instances) -> None:
+    """Queue players whose placements or aliases are written, renamed or deleted in this flush."""
+    player_ids: Set[str] = set()
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, RoundPlacement):
+            watched = ("player_id", "player_name", "tournament_id")
+        elif isinstance(obj, PlayerAlias):
+            watched = ("player_id", "alias_name")
+        else:
+            continue
+        if obj in session.dirty:
+            attrs = inspect(obj).attrs
+            if not any(attrs[name].history.has_changes() for name in watched):
+                continue
+            # A row moved to another player leaves a stale term under the old one
+            player_ids.update(attrs.player_id.history.deleted or ())
+        player_ids.add(obj.player_id)
+    queue_player_resync(session, player_ids)
+
+
+def _sync_queued_players(session: Session, flush_context) -> None:
+    """Apply queued re-syncs; the changes go out with the commit's follow-up flush."""
+    player_ids = session.info.pop(_PENDING_PLAYERS, None)
+    if player_ids:
+        PlayerSearchIndex(session).sync_players(player_ids)
+
+
+event.listen(SearchIndexedSession, "before_flush", _queue_flushed_players)
+event.listen(SearchIndexedSession, "after_flush_postexec", _sync_queued_players)
@@ -3,6 +3,8 @@ Standings aggregation pipeline.
 
 Transforms Google Sheet snapshots and (optionally) Riot API data into a
 normalized scoreboard payload that can be persisted via `StandingsService`.
+Validated screenshot placements can also be folded incrementally into a
+placement-sourced snapshot.
 """
 
 from __future__ import annotations
@@ -10,9 +12,18 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
-from datetime import UTC, datetime
-from typing import Any, Dict, List, Optional, Tuple
+import re
+from datetime import UTC, datetime, timedelta
+from typing import Any, Dict, List, Optional, Set, Tuple
 
+from sqlalchemy import exists, or_
+
+from api.models import (
+    PlacementContribution,
+    PlacementSubmission,
+    RoundPlacement,
+    ScoreboardSnapshot as ScoreboardSnapshotModel,
+)
 from api.schemas.scoreboard import (
     ScoreboardEntryCreate,
     ScoreboardSnapshot,
@@ -32,6 +43,10 @@ log = logging.getLogger(__name__)
 
 _POINT_MAP = {placement: points for placement, points in zip(range(1, 9), range(8, 0, -1))}
 
+PLACEMENT_SOURCE = "placements"
+# Submissions written this long before the last watermark are re-read, so
+# transactions that commit slightly out of timestamp order are not missed.
+PLACEMENT_WATERMARK_OVERLAP = timedelta(seconds=60)
 
 class StandingsAggregator:
     """Aggregate standings data into scoreboard snapshots."""
@@ -114,6 +129,61 @@ class StandingsAggregator:
         )
         return snapshot
 
+    def refresh_from_placements(
+        self,
+        *,
+        tournament_id: str,
+        guild_id: Optional[str] = None,
+        tournament_name: Optional[str] = None,
+        full: bool = False,
+    ) -> ScoreboardSnapshotModel:
+        """
+        Build a scoreboard from validated round placements.
+
+        Each counted placement is kept as a ``PlacementContribution`` row. Only
+        submissions changed since the previous placement snapshot are re-read
+        and their contributions replaced, and only the players those touch are
+        re-scored; every other entry is carried over from the previous snapshot.
+        Ranking and writing the snapshot still cover every player, so a refresh
+        costs O(changed placements + players) rather than O(all placements).
+
+        Args:
+            tournament_id: Identifier for the tournament/event.
+            guild_id: Discord guild identifier (defaults to the previous snapshot's).
+            tournament_name: Human-readable tournament name.
+            full: Ignore the previous snapshot and rebuild from every placement.
+        """
+        previous = None
+        if not full:
+            previous = self._standings_service.get_latest_snapshot(
+                tournament_id=tournament_id,
+                source=PLACEMENT_SOURCE,
+            )
+
+        watermark = datetime.now(UTC)
+        affected = self._apply_placement_changes(tournament_id, previous)
+        if previous is not None and not affected:
+            return previous
+
+        round_names, entries_payload = self._build_placement_entries(tournament_id, affected, previous)
+
+        snapshot_payload = ScoreboardSnapshotCreate(
+            tournament_id=tournament_id,
+            tournament_name=tournament_name or (previous.tournament_name if previous else None),
+            guild_id=guild_id or (previous.guild_id if previous else None),
+            source=PLACEMENT_SOURCE,
+            source_timestamp=watermark,
+            round_names=round_names,
+            extras={"placement_watermark": watermark.isoformat()},
+            entries=entries_payload,
+        )
+
+        # Commits the contribution changes together with the snapshot
+        return self._standings_service.create_snapshot(
+            snapshot_payload,
+            replace_existing=True,
+        )
+
     # ------------------------------------------------------------------ #
     # Snapshot processing
     # ------------------------------------------------------------------ #
@@ -208,15 +278,18 @@ class StandingsAggregator:
                 )
             )
 
-        # Sort descending by total points, tie-breaking by player name
+        self._rank_entries(entries_payload)
+        return round_names, entries_payload
+
+    @staticmethod
+    def _rank_entries(entries_payload: List[ScoreboardEntryCreate]) -> None:
+        """Sort descending by total points, tie-breaking by player name, and assign ranks."""
         entries_payload.sort(
             key=lambda entry: (-entry.total_points, entry.player_name.lower())
         )
         for idx, entry in enumerate(entries_payload, start=1):
             entry.standing_rank = idx
 
-        return round_names, entries_payload
-
     @staticmethod
     def _normalize_round_scores(
         round_scores: Dict[str, int], round_names: List[str]
@@ -230,6 +303,178 @@ class StandingsAggregator:
             normalized[name] = int(value) if value is not None else 0
         return normalized
 
+    # ------------------------------------------------------------------ #
+    # Placement processing
+    # ------------------------------------------------------------------ #
+    @staticmethod
+    def _contribution(tournament_id: str, placement: RoundPlacement) -> PlacementContribution:
+        """The scoreboard contribution of one validated placement."""
+        return PlacementContribution(
+            placement_id=placement.id,
+            tournament_id=tournament_id,
+            submission_id=placement.submission_id,
+            player_id=placement.player_id,
+            round_name=placement.round_name,
+            points=_POINT_MAP.get(placement.placement, 0),
+            player_name=placement.player_name,
+            discord_id=placement.discord_id,
+            riot_id=placement.riot_id,
+        )
+
+    @staticmethod
+    def _contribution_fields(row: PlacementContribution) -> Tuple[Any, ...]:
+        return (
+            row.submission_id, row.player_id, row.round_name, row.points,
+            row.player_name, row.discord_id, row.riot_id,
+        )
+
+    def _apply_placement_changes(
+        self,
+        tournament_id: str,
+        previous: Optional[ScoreboardSnapshotModel],
+    ) -> Set[str]:
+        """
+        Replace the contributions of submissions changed since ``previous``.
+
+        Without a previous snapshot every contribution of the tournament is
+        rebuilt. Changes are flushed but not committed.
+
+        Returns:
+            Player ids whose contributions changed (empty when nothing did)
+        """
+        db = self._standings_service.db
+        contributions = db.query(PlacementContribution).filter(
+            PlacementContribution.tournament_id == tournament_id
+        )
+        submissions = db.query(
+            PlacementSubmission.id, PlacementSubmission.status
+        ).filter(PlacementSubmission.tournament_id == tournament_id)
+
+        previous_mark = (previous.extras or {}).get("placement_watermark") if previous else None
+        if previous_mark:
+            since = datetime.fromisoformat(previous_mark) - PLACEMENT_WATERMARK_OVERLAP
+            changed_placements = db.query(RoundPlacement.submission_id).filter(
+                RoundPlacement.tournament_id == tournament_id,
+                RoundPlacement.updated_at >= since,
+            )
+            statuses = dict(submissions.filter(
+                or_(
+                    PlacementSubmission.updated_at >= since,
+                    PlacementSubmission.id.in_(changed_placements),
+                )
+            ).all())
+
+            # Submissions deleted since their placements were counted
+            dirty = set(statuses)
+            dirty.update(
+                submission_id
+                for (submission_id,) in contributions.with_entities(PlacementContribution.submission_id)
+                .filter(~exists().where(PlacementSubmission.id == PlacementContribution.submission_id))
+                .distinct()
+            )
+            old_rows = contributions.filter(PlacementContribution.submission_id.in_(dirty)).all() if dirty else []
+        else:
+            statuses = dict(submissions.all())
+            old_rows = contributions.all()
+
+        validated = [sid for sid, status in statuses.items() if status == "validated"]
+        new_rows = []
+        if validated:
+            placements = db.query(RoundPlacement).filter(
+                RoundPlacement.submission_id.in_(validated)
+            )
+            new_rows = [self._contribution(tournament_id, placement) for placement in placements]
+
+        old = {row.placement_id: self._contribution_fields(row) for row in old_rows}
+        new = {row.placement_id: self._contribution_fields(row) for row in new_rows}
+        if old == new:
+            return set()
+
+        for row in old_rows:
+            db.delete(row)
+        db.flush()
+        db.add_all(new_rows)
+        db.flush()
+        return {row.player_id for row in old_rows} | {row.player_id for row in new_rows}
+
+    def _build_placement_entries(
+        self,
+        tournament_id: str,
+        affected: Set[str],
+        previous: Optional[ScoreboardSnapshotModel],
+    ) -> Tuple[List[str], List[ScoreboardEntryCreate]]:
+        """
+        Score the affected players from their contributions and carry the
+        other players' entries over from ``previous``.
+        """
+        db = self._standings_service.db
+        contributions = db.query(PlacementContribution).filter(
+            PlacementContribution.tournament_id == tournament_id
+        )
+        round_names = sorted(
+            (name for (name,) in contributions.with_entities(PlacementContribution.round_name).distinct()),
+            key=_round_sort_key,
+        )
+
+        if previous is None:
+            rows = contributions.all()
+        elif affected:
+            rows = contributions.filter(PlacementContribution.player_id.in_(affected)).all()
+        else:
+            rows = []
+        entries_payload = self._score_contributions(rows, round_names)
+
+        for entry in previous.entries if previous is not None else ():
+            if entry.player_id in affected:
+                continue
+            # Untouched players scored nothing in any round that appeared or vanished
+            normalized_scores = self._normalize_round_scores(dict(entry.round_scores or {}), round_names)
+            entries_payload.append(
+                ScoreboardEntryCreate(
+                    player_name=entry.player_name,
+                    player_id=entry.player_id,
+                    discord_id=entry.discord_id,
+                    riot_id=entry.riot_id,
+                    total_points=entry.total_points,
+                    round_scores=normalized_scores,
+                )
+            )
+
+        self._rank_entries(entries_payload)
+        return round_names, entries_payload
+
+    def _score_contributions(
+        self,
+        rows: List[PlacementContribution],
+        round_names: List[str],
+    ) -> List[ScoreboardEntryCreate]:
+        """Sum contributions into one unranked entry per player."""
+        by_player: Dict[str, List[PlacementContribution]] = {}
+        for row in rows:
+            by_player.setdefault(row.player_id, []).append(row)
+
+        entries_payload: List[ScoreboardEntryCreate] = []
+        for player_id, player_rows in by_player.items():
+            round_scores: Dict[str, int] = {}
+            for row in player_rows:
+                round_scores[row.round_name] = round_scores.get(row.round_name, 0) + row.points
+
+            # Identity fields come from the most recent placement
+            latest = max(player_rows, key=lambda row: row.placement_id)
+            normalized_scores = self._normalize_round_scores(round_scores, round_names)
+
+            entries_payload.append(
+                ScoreboardEntryCreate(
+                    player_name=latest.player_name,
+                    player_id=player_id,
+                    discord_id=latest.discord_id,
+                    riot_id=latest.riot_id,
+                    total_points=sum(normalized_scores.values()),
+                    round_scores=normalized_scores,
+                )
+            )
+        return entries_payload
+
     # ------------------------------------------------------------------ #
     # Riot API integration
     # ------------------------------------------------------------------ #
@@ -304,4 +549,10 @@ class StandingsAggregator:
         return player_key, {"round_1": points}
 
 
-__all__ = ["StandingsAggregator"]
+def _round_sort_key(round_name: str) -> Tuple[int, str]:
+    """Order rounds by their number (ROUND_2 before ROUND_10), then by name."""
+    match = re.search(r"\d+", round_name)
+    return (int(match.group()) if match else 0, round_name)
+
+
+__all__ = ["StandingsAggregator", "PLACEMENT_SOURCE"]
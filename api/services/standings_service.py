@@ -8,8 +8,9 @@ without re-processing Google Sheet or Riot API data in request scope.
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from sqlalchemy import desc
 from sqlalchemy.orm import Session
@@ -22,6 +23,65 @@ from api.schemas.scoreboard import (
 )
 from api.services.errors import NotFoundError
 
+SnapshotVersion = Tuple[int, datetime]
+
+# Snapshot extras keys for the versioned standings delta pushed to dashboards
+SCOREBOARD_VERSION_KEY = "scoreboard_version"
+SCOREBOARD_DELTA_KEY = "scoreboard_delta"
+
+
+@dataclass(frozen=True)
+class _CachedSnapshot:
+    snapshot_id: int
+    updated_at: datetime
+    body: bytes
+
+
+class LatestSnapshotCache:
+    """
+    In-process cache of serialized "latest snapshot" responses.
+
+    Keyed by the (tournament_id, guild_id) scope of the lookup. Entries are
+    only served while they match the current snapshot version, so writes
+    from other processes are picked up; local writes also invalidate eagerly.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[Tuple[Optional[str], Optional[str]], _CachedSnapshot] = {}
+
+    def get(
+        self,
+        tournament_id: Optional[str],
+        guild_id: Optional[str],
+        version: SnapshotVersion,
+    ) -> Optional[bytes]:
+        cached = self._entries.get((tournament_id, guild_id))
+        if cached and (cached.snapshot_id, cached.updated_at) == version:
+            return cached.body
+        return None
+
+    def store(
+        self,
+        tournament_id: Optional[str],
+        guild_id: Optional[str],
+        version: SnapshotVersion,
+        body: bytes,
+    ) -> None:
+        self._entries[(tournament_id, guild_id)] = _CachedSnapshot(*version, body)
+
+    def invalidate(self, tournament_id: Optional[str], guild_id: Optional[str]) -> None:
+        """Drop every cached scope a snapshot for tournament/guild could appear in."""
+        for key in list(self._entries):
+            cached_tournament, cached_guild = key
+            if cached_tournament in (None, tournament_id) and cached_guild in (None, guild_id):
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+latest_snapshot_cache = LatestSnapshotCache()
+
 
 class StandingsService:
     """Service responsible for scoreboard snapshot persistence and retrieval."""
@@ -52,11 +112,24 @@ class StandingsService:
         """
         Persist a new scoreboard snapshot.
 
+        The snapshot is versioned one past the latest snapshot for the same
+        tournament and source, and the entries that changed against it are
+        stored under ``extras["scoreboard_delta"]`` for live dashboards.
+
         Args:
             payload: Scoreboard data produced by the aggregation pipeline.
             replace_existing: When True, delete any existing snapshot matching
                 the tournament_id and source before inserting the new payload.
         """
+        previous = None
+        if payload.tournament_id:
+            previous = self.get_latest_snapshot(
+                tournament_id=payload.tournament_id,
+                source=payload.source,
+            )
+        base_version = (previous.extras or {}).get(SCOREBOARD_VERSION_KEY, 0) if previous else None
+        previous_entries = self._delta_view(previous.entries) if previous else {}
+
         if replace_existing and payload.tournament_id:
             self._delete_existing_snapshot(
                 tournament_id=payload.tournament_id,
@@ -84,8 +157,25 @@ class StandingsService:
 
         snapshot.entries = entries
         self.db.add_all(entries)
+
+        version = (base_version or 0) + 1
+        snapshot.extras = {
+            **(payload.extras or {}),
+            SCOREBOARD_VERSION_KEY: version,
+            SCOREBOARD_DELTA_KEY: {
+                "tournament_id": snapshot.tournament_id,
+                "guild_id": snapshot.guild_id,
+                "source": snapshot.source,
+                "snapshot_id": snapshot.id,
+                "version": version,
+                "base_version": base_version,
+                "round_names": list(snapshot.round_names or []),
+                **self._diff_entries(previous_entries, self._delta_view(entries)),
+            },
+        }
         snapshot.updated_at = self._utcnow()
         self.db.commit()
+        latest_snapshot_cache.invalidate(snapshot.tournament_id, snapshot.guild_id)
         self.db.refresh(snapshot)
         return snapshot
 
@@ -101,6 +191,7 @@ class StandingsService:
 
         self.db.delete(snapshot)
         self.db.commit()
+        latest_snapshot_cache.invalidate(snapshot.tournament_id, snapshot.guild_id)
 
     # ------------------------------------------------------------------ #
     # Reads
@@ -121,17 +212,34 @@ class StandingsService:
         *,
         tournament_id: Optional[str] = None,
         guild_id: Optional[str] = None,
+        source: Optional[str] = None,
     ) -> Optional[ScoreboardSnapshotModel]:
         """
-        Retrieve the most recent snapshot, optionally scoped by tournament or guild.
+        Retrieve the most recent snapshot, optionally scoped by tournament, guild or source.
         """
-        query = self.db.query(ScoreboardSnapshotModel)
-        if tournament_id:
-            query = query.filter(ScoreboardSnapshotModel.tournament_id == tournament_id)
-        if guild_id:
-            query = query.filter(ScoreboardSnapshotModel.guild_id == guild_id)
+        return self._latest_query(
+            self.db.query(ScoreboardSnapshotModel), tournament_id, guild_id, source
+        ).first()
+
+    def get_latest_snapshot_version(
+        self,
+        *,
+        tournament_id: Optional[str] = None,
+        guild_id: Optional[str] = None,
+        source: Optional[str] = None,
+    ) -> Optional[SnapshotVersion]:
+        """
+        Return ``(id, updated_at)`` of the most recent snapshot without loading it.
 
-        return query.order_by(desc(ScoreboardSnapshotModel.created_at)).first()
+        Used to answer conditional requests before any entries are read.
+        """
+        row = self._latest_query(
+            self.db.query(ScoreboardSnapshotModel.id, ScoreboardSnapshotModel.updated_at),
+            tournament_id,
+            guild_id,
+            source,
+        ).first()
+        return (row.id, row.updated_at) if row else None
 
     def list_snapshots(
         self,
@@ -174,6 +282,58 @@ class StandingsService:
     # ------------------------------------------------------------------ #
     # Internal helpers
     # ------------------------------------------------------------------ #
+    @staticmethod
+    def _delta_view(entries: Iterable[ScoreboardEntry]) -> Dict[str, Dict[str, Any]]:
+        """Key entries by player for diffing, keeping only the fields dashboards render."""
+        return {
+            str(entry.player_id or entry.player_name): {
+                "player_id": entry.player_id,
+                "player_name": entry.player_name,
+                "standing_rank": entry.standing_rank,
+                "total_points": entry.total_points,
+                "round_scores": dict(entry.round_scores or {}),
+            }
+            for entry in entries
+        }
+
+    @staticmethod
+    def _diff_entries(
+        previous: Dict[str, Dict[str, Any]],
+        current: Dict[str, Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Return the entries whose rank, points or scores moved, plus removed players."""
+        changed = []
+        for key, entry in current.items():
+            before = previous.get(key)
+            if before == entry:
+                continue
+            changed.append({
+                "key": key,
+                **entry,
+                "previous_rank": before["standing_rank"] if before else None,
+                "points_delta": entry["total_points"] - (before["total_points"] if before else 0),
+            })
+        changed.sort(key=lambda item: item["standing_rank"])
+        return {
+            "changed": changed,
+            "removed": sorted(key for key in previous if key not in current),
+        }
+
+    @staticmethod
+    def _latest_query(
+        query,
+        tournament_id: Optional[str],
+        guild_id: Optional[str],
+        source: Optional[str] = None,
+    ):
+        if tournament_id:
+            query = query.filter(ScoreboardSnapshotModel.tournament_id == tournament_id)
+        if guild_id:
+            query = query.filter(ScoreboardSnapshotModel.guild_id == guild_id)
+        if source:
+            query = query.filter(ScoreboardSnapshotModel.source == source)
+        return query.order_by(desc(ScoreboardSnapshotModel.created_at))
+
     def _delete_existing_snapshot(
         self,
         *,
@@ -216,4 +376,10 @@ class StandingsService:
         )
 
 
-__all__ = ["StandingsService"]
+__all__ = [
+    "LatestSnapshotCache",
+    "SCOREBOARD_DELTA_KEY",
+    "SCOREBOARD_VERSION_KEY",
+    "StandingsService",
+    "latest_snapshot_cache",
+]
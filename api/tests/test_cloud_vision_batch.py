@@ -0,0 +1,164 @@
+"""Tests for batched Cloud Vision OCR and its use in BatchProcessor."""
+
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict, List
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from integrations.batch_processor import BatchProcessor
+from integrations.cloud_vision_ocr import MAX_BATCH_IMAGES, CloudVisionOCR
+
+
+def _word(text: str, x: int, y: int) -> SimpleNamespace:
+    vertices = [
+        SimpleNamespace(x=x, y=y),
+        SimpleNamespace(x=x + 12 * len(text), y=y),
+        SimpleNamespace(x=x + 12 * len(text), y=y + 22),
+        SimpleNamespace(x=x, y=y + 22),
+    ]
+    return SimpleNamespace(description=text, bounding_poly=SimpleNamespace(vertices=vertices))
+
+
+def _standings_annotations(names: List[str]) -> List[SimpleNamespace]:
+    annotations = [_word("FULL PAGE TEXT", 0, 0)]
+    for placement, name in enumerate(names, start=1):
+        y = 200 + (placement - 1) * 80
+        annotations.append(_word(str(placement), 110, y))
+        annotations.append(_word(name, 210, y))
+    return annotations
+
+
+class FakeVisionClient:
+    """Stands in for ``vision.ImageAnnotatorClient`` with canned annotations.
+
+    Images are keyed by their file content; content listed in ``errors``
+    gets a per-image Vision error instead of annotations.
+    """
+
+    def __init__(self, annotations: Dict[bytes, List], errors: Dict[bytes, str] = None):
+        self.annotations = annotations
+        self.errors = errors or {}
+        self.batch_sizes: List[int] = []
+
+    def batch_annotate_images(self, requests, timeout=None):
+        self.batch_sizes.append(len(requests))
+        responses = []
+        for request in requests:
+            content = request.image.content
+            responses.append(
+                SimpleNamespace(
+                    error=SimpleNamespace(message=self.errors.get(content, "")),
+                    text_annotations=self.annotations.get(content, []),
+                )
+            )
+        return SimpleNamespace(responses=responses)
+
+    def text_detection(self, image):
+        raise AssertionError("per-image text_detection should not be used for batches")
+
+
+def _make_ocr(client: FakeVisionClient) -> CloudVisionOCR:
+    ocr = CloudVisionOCR.__new__(CloudVisionOCR)
+    ocr.client = client
+    ocr.timeout_seconds = 30
+    return ocr
+
+
+def _write_images(tmp_path: Path, count: int) -> List[str]:
+    paths = []
+    for index in range(count):
+        path = tmp_path / f"lobby_{index}.png"
+        path.write_bytes(f"image-{index}".encode())
+        paths.append(str(path))
+    return paths
+
+
+def _lobby_names(index: int) -> List[str]:
+    return [f"Kumquat{index}v{slot}" for slot in range(8)]
+
+
+@pytest.mark.asyncio
+async def test_batch_api_chunks_and_preserves_order(tmp_path: Path) -> None:
+    paths = _write_images(tmp_path, 20)
+    client = FakeVisionClient(
+        {f"image-{i}".encode(): _standings_annotations(_lobby_names(i)) for i in range(20)}
+    )
+
+    results = await _make_ocr(client).extract_from_images_async(paths)
+
+    assert sorted(client.batch_sizes) == [4, MAX_BATCH_IMAGES]
+    assert len(results) == 20
+    for index, result in enumerate(results):
+        assert result["success"]
+        players = result["structured_data"]["players"]
+        assert [p["name"] for p in players] == _lobby_names(index)
+
+
+def test_batch_api_maps_per_image_errors(tmp_path: Path) -> None:
+    paths = _write_images(tmp_path, 3)
+    paths.insert(1, str(tmp_path / "missing.png"))
+    client = FakeVisionClient(
+        {f"image-{i}".encode(): _standings_annotations(_lobby_names(i)) for i in range(3)},
+        errors={b"image-2": "Bad image data"},
+    )
+
+    results = _make_ocr(client).extract_from_images(paths)
+
+    assert client.batch_sizes == [3]
+    assert [r["success"] for r in results] == [True, False, True, False]
+    assert "Image not found" in results[1]["error"]
+    assert "Bad image data" in results[3]["error"]
+    assert [p["name"] for p in results[2]["structured_data"]["players"]] == _lobby_names(1)
+
+
+@pytest.mark.asyncio
+async def test_process_batch_maps_ocr_results_to_submissions(tmp_path: Path) -> None:
+    paths = _write_images(tmp_path, 4)
+    client = FakeVisionClient(
+        {f"image-{i}".encode(): _standings_annotations(_lobby_names(i)) for i in range(4)},
+        errors={b"image-3": "Bad image data"},
+    )
+    images = [
+        {"url": path, "discord_message_id": index, "discord_channel_id": 1}
+        for index, path in enumerate(paths)
+    ]
+
+    async def fake_prepare(image_data):
+        if image_data["discord_message_id"] == 1:
+            return {"success": False, "reason": "not_standings", "message_id": 1}
+        return {
+            "success": True,
+            "temp_path": Path(image_data["url"]),
+            "classification_confidence": 0.9,
+        }
+
+    async def fake_complete(image_data, classification_confidence, ocr_result, *args):
+        if not ocr_result["success"]:
+            return {"success": False, "reason": "ocr_failed", "message_id": image_data["discord_message_id"]}
+        players = ocr_result["structured_data"]["players"]
+        return {"success": True, "message_id": image_data["discord_message_id"], "first": players[0]["name"]}
+
+    processor = BatchProcessor()
+    with patch.object(processor, "_create_batch", AsyncMock(return_value={"batch_id": 1})), \
+            patch.object(processor, "_update_batch", AsyncMock()), \
+            patch.object(processor, "_cross_lobby_validate", AsyncMock()), \
+            patch.object(processor, "_calculate_batch_confidence", AsyncMock(return_value=0.9)), \
+            patch.object(processor, "_prepare_image", side_effect=fake_prepare), \
+            patch.object(processor, "_complete_image", side_effect=fake_complete), \
+            patch("integrations.batch_processor.get_cloud_vision_ocr", return_value=_make_ocr(client)):
+        result = await processor.process_batch(images, "t1", "g1", "ROUND_1")
+
+    assert client.batch_sizes == [3]
+    assert result["completed"] == 2
+    assert result["errors"] == 2
+    outcomes = result["results"]
+    assert outcomes[0]["first"] == "Kumquat0v0"
+    assert outcomes[1]["reason"] == "not_standings"
+    assert outcomes[2]["first"] == "Kumquat2v0"
+    assert outcomes[3]["reason"] == "ocr_failed"
+    # Temporary files are cleaned up once the batch finishes
+    leftovers = await asyncio.to_thread(lambda: [Path(paths[i]).exists() for i in (0, 2, 3)])
+    assert not any(leftovers)
@@ -0,0 +1,103 @@
+"""Regression tests for CloudVisionOCR text merging and placement matching."""
+
+import hashlib
+import json
+import random
+from types import SimpleNamespace
+from typing import Dict, List
+
+import pytest
+
+from integrations.cloud_vision_ocr import CloudVisionOCR
+
+NAME_WORDS = [
+    "Ffoxface", "deepestregrets", "MoldyKumquat", "CoffinCutie", "Kalimier", "mayxd",
+    "Alithyst", "Coralie", "Mudkip", "Enjoyer", "Lauren", "TheCorgi", "Matt", "Green",
+    "Duchess", "of", "Deer", "btwblue", "hint", "the", "with", "Vee", "Sky",
+]
+NOISE_WORDS = [
+    "gg", "wp", "lol", "STUDIO", "GAME", "TIME", "36:26", "0/3", "6-5", "P2", "E", "U",
+    "nice", "round", "chat", "ACM", "PTS", "12", "9", "STAT", "hello", "xd",
+]
+
+# Digest of the merge + structuring output for ``_build_corpus()``. Recorded
+# from the original all-pairs implementation; any change in behaviour on the
+# corpus changes the digest.
+EXPECTED_CORPUS_DIGEST = "49a1c8360317ffc7c38a062eb65b74dba3924e3b816936d2fb2aa2e41bc7e014"
+
+
+def _annotation(text: str, x: int, y: int, width: int, height: int = 22) -> SimpleNamespace:
+    vertices = [
+        SimpleNamespace(x=x, y=y),
+        SimpleNamespace(x=x + width, y=y),
+        SimpleNamespace(x=x + width, y=y + height),
+        SimpleNamespace(x=x, y=y + height),
+    ]
+    return SimpleNamespace(description=text, bounding_poly=SimpleNamespace(vertices=vertices))
+
+
+def _build_screen(rng: random.Random, noise: int) -> List[SimpleNamespace]:
+    """Build word annotations resembling a TFT end screen plus chat/sidebar noise."""
+    annotations = [_annotation("FULL PAGE TEXT", 0, 0, 2560, 1440)]
+    top = rng.randint(180, 260)
+    row_height = rng.randint(70, 95)
+
+    for placement in range(1, 9):
+        y = top + (placement - 1) * row_height + rng.randint(-3, 3)
+        annotations.append(_annotation(str(placement), 110 + rng.randint(-4, 4), y, 18))
+        x = 210 + rng.randint(-10, 10)
+        for word in rng.sample(NAME_WORDS, rng.choice([1, 1, 2, 2, 3])):
+            width = 12 * len(word)
+            annotations.append(_annotation(word, x, y + rng.randint(-4, 4), width))
+            x += width + rng.randint(6, 30)
+
+    for _ in range(noise):
+        annotations.append(
+            _annotation(
+                rng.choice(NOISE_WORDS + NAME_WORDS),
+                rng.randint(0, 2500),
+                rng.randint(0, 1400),
+                rng.randint(15, 140),
+            )
+        )
+
+    rng.shuffle(annotations[1:])
+    return annotations
+
+
+def _build_corpus() -> List[List[SimpleNamespace]]:
+    rng = random.Random(20251231)
+    return [_build_screen(rng, noise) for noise in (0, 10, 40, 80, 150, 220, 300) for _ in range(3)]
+
+
+def _run_pipeline(ocr: CloudVisionOCR, annotations: List[SimpleNamespace]) -> Dict:
+    detections = ocr._parse_annotations(annotations)
+    detections = ocr._merge_adjacent_text(detections)
+    structured = ocr._structure_tft_data(detections, "fixture.png")
+    return {"detections": detections, "players": structured["players"]}
+
+
+@pytest.fixture
+def ocr() -> CloudVisionOCR:
+    # The text-processing helpers never touch the Vision client.
+    return CloudVisionOCR.__new__(CloudVisionOCR)
+
+
+def test_merge_and_match_output_unchanged_on_corpus(ocr: CloudVisionOCR) -> None:
+    outputs = [_run_pipeline(ocr, screen) for screen in _build_corpus()]
+    digest = hashlib.sha256(json.dumps(outputs, sort_keys=True).encode()).hexdigest()
+    assert digest == EXPECTED_CORPUS_DIGEST
+
+
+def test_clean_screen_matches_all_placements(ocr: CloudVisionOCR) -> None:
+    names = ["Ffoxface", "Kalimier", "CoffinCutie", "mayxd", "Alithyst", "Coralie", "hint", "btwblue"]
+    annotations = [_annotation("FULL PAGE TEXT", 0, 0, 2560, 1440)]
+    for placement, name in enumerate(names, start=1):
+        y = 200 + (placement - 1) * 80
+        annotations.append(_annotation(str(placement), 110, y, 18))
+        annotations.append(_annotation(name, 210, y, 12 * len(name)))
+
+    players = _run_pipeline(ocr, annotations)["players"]
+
+    assert [(p["placement"], p["name"]) for p in players] == list(enumerate(names, start=1))
+    assert [p["points"] for p in players] == [8, 7, 6, 5, 4, 3, 2, 1]
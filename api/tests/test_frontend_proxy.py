@@ -0,0 +1,69 @@
+"""Tests for the streaming reverse proxy to the Next.js frontend."""
+
+import gzip
+from typing import Iterator, List
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from api.main import app, get_frontend_client
+
+
+@pytest.fixture
+def upstream(monkeypatch) -> Iterator[List[httpx.Request]]:
+    seen: List[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        body = await request.aread()
+        seen.append(request)
+        if request.url.path == "/down":
+            raise httpx.ConnectError("refused", request=request)
+        if request.url.path == "/bundle.js":
+            return httpx.Response(
+                200,
+                stream=httpx.ByteStream(gzip.compress(b"console.log(1);" * 1000)),
+                headers={"content-encoding": "gzip", "content-type": "application/javascript"},
+            )
+        return httpx.Response(201, stream=httpx.ByteStream(b"echo:" + body), headers={"x-upstream": "next"})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url="http://frontend")
+    monkeypatch.setattr(app.state, "frontend_client", client, raising=False)
+    yield seen
+
+
+def test_proxy_forwards_request_and_streams_response(upstream) -> None:
+    with TestClient(app) as client:
+        response = client.post("/dashboard/save?tab=2", content=b"payload", headers={"x-custom": "1"})
+
+    assert response.status_code == 201
+    assert response.content == b"echo:payload"
+    assert response.headers["x-upstream"] == "next"
+
+    request = upstream[0]
+    assert request.url.path == "/dashboard/save"
+    assert request.url.query == b"tab=2"
+    assert request.headers["x-custom"] == "1"
+    assert request.headers["host"] == "frontend"
+
+
+def test_proxy_relays_encoded_bytes_untouched(upstream) -> None:
+    client = TestClient(app)
+    response = client.get("/bundle.js")
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.content == b"console.log(1);" * 1000
+
+
+def test_proxy_reuses_one_client(upstream) -> None:
+    shared = get_frontend_client()
+    client = TestClient(app)
+    for _ in range(3):
+        assert client.get("/").status_code == 201
+    assert get_frontend_client() is shared
+    assert len(upstream) == 3
+
+
+def test_proxy_reports_unavailable_frontend(upstream) -> None:
+    client = TestClient(app)
+    assert client.get("/down").status_code == 503
@@ -0,0 +1,99 @@
+"""Tests for graphics listing projections, pagination and payload compression."""
+
+import json
+from datetime import UTC, datetime, timedelta
+from typing import Iterator
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import Session, sessionmaker
+
+import api.models as models
+from api.models import Base, Graphic
+from api.schemas.graphics import GraphicCreate
+from api.services.errors import ValidationError
+from api.services.graphics_service import GraphicsService
+
+
+@pytest.fixture
+def session() -> Iterator[Session]:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def _seed(session: Session, count: int) -> None:
+    base = datetime(2026, 1, 1, tzinfo=UTC)
+    for index in range(count):
+        session.add(Graphic(
+            title=f"Graphic {index}",
+            event_name="Event",
+            data_json=json.dumps({"elements": ["x" * 200] * 20}),
+            created_by="tester",
+            # Pairs share a timestamp so the id tie-breaker is exercised
+            updated_at=base + timedelta(minutes=index // 2),
+            archived=index % 5 == 0,
+        ))
+    session.commit()
+
+
+def test_listing_skips_payload_column(session: Session) -> None:
+    _seed(session, 6)
+    statements = []
+    event.listen(session.bind, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    result = GraphicsService(session).get_graphics(include_archived=True)
+
+    assert result["total"] == 6
+    assert all("data_json" not in graphic for graphic in result["graphics"])
+    assert statements and not any("data_json" in statement for statement in statements)
+
+
+@pytest.mark.parametrize("archived_only", [False, True])
+def test_keyset_pages_cover_full_listing(session: Session, archived_only: bool) -> None:
+    _seed(session, 25)
+    service = GraphicsService(session)
+    full = service.get_graphics(include_archived=True, archived_only=archived_only)
+
+    ids, cursor = [], None
+    while True:
+        page = service.get_graphics(include_archived=True, archived_only=archived_only, limit=4, cursor=cursor)
+        assert page["total"] == full["total"]
+        ids.extend(graphic["id"] for graphic in page["graphics"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert ids == [graphic["id"] for graphic in full["graphics"]]
+    assert all(graphic["archived"] for graphic in full["graphics"]) == archived_only
+
+
+def test_invalid_cursor_is_rejected(session: Session) -> None:
+    with pytest.raises(ValidationError):
+        GraphicsService(session).get_graphics(limit=5, cursor="not-a-cursor")
+
+
+def test_payload_compressed_at_rest(session: Session, monkeypatch) -> None:
+    monkeypatch.setattr(models, "GRAPHICS_COMPRESS_DATA", True)
+    service = GraphicsService(session)
+    data = {"elements": [{"type": "text", "value": "Standings"}] * 100}
+    created = service.create_graphic(GraphicCreate(title="Big", event_name="Event", data_json=data), "tester")
+
+    stored = session.execute(text("SELECT data_json FROM graphics WHERE id = :id"), {"id": created["id"]}).scalar()
+    assert stored.startswith("zlib:")
+    assert len(stored) < len(json.dumps(data))
+
+    session.expire_all()
+    assert json.loads(service.get_graphic_by_id(created["id"])["data_json"]) == data
+    assert json.loads(service.public_view(created["id"])["data_json"]) == data
+
+    # Rows written before compression was enabled stay readable
+    monkeypatch.setattr(models, "GRAPHICS_COMPRESS_DATA", False)
+    plain = service.create_graphic(GraphicCreate(title="Plain", event_name="Event", data_json=data), "tester")
+    session.expire_all()
+    assert json.loads(service.get_graphic_by_id(plain["id"])["data_json"]) == data
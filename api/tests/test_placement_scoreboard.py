@@ -0,0 +1,253 @@
+"""Property test: incremental placement scoreboard refresh equals a full rebuild."""
+
+import random
+from datetime import timedelta
+from typing import Dict, Iterator, List
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+
+import api.services.standings_aggregator as standings_aggregator
+from api.models import Base, PlacementContribution, PlacementSubmission, RoundPlacement
+from api.schemas.scoreboard import ScoreboardSnapshotCreate
+from api.services.standings_aggregator import (
+    _POINT_MAP,
+    PLACEMENT_SOURCE,
+    StandingsAggregator,
+    _round_sort_key,
+)
+from api.services.standings_service import StandingsService
+
+ROUNDS = ["ROUND_1", "ROUND_2", "ROUND_10"]
+PLAYERS = [(f"p{i}", f"Player{i}") for i in range(20)]
+
+
+@pytest.fixture
+def session() -> Iterator[Session]:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def no_watermark_overlap(monkeypatch) -> None:
+    # Everything here commits in order, so only changed rows need re-reading
+    monkeypatch.setattr(standings_aggregator, "PLACEMENT_WATERMARK_OVERLAP", timedelta(0))
+
+
+def _lobby(rng: random.Random, round_name: str, lobby: int) -> List[RoundPlacement]:
+    players = rng.sample(PLAYERS, 8)
+    return [
+        RoundPlacement(
+            player_id=player_id,
+            player_name=name,
+            tournament_id="t1",
+            round_name=round_name,
+            round_number=1,
+            lobby_number=lobby,
+            placement=placement,
+            points=0,
+        )
+        for placement, (player_id, name) in enumerate(players, start=1)
+    ]
+
+
+def _random_change(session: Session, rng: random.Random, counter: List[int]) -> None:
+    submissions = session.query(PlacementSubmission).all()
+    action = rng.choice(["add", "add", "status", "edit", "rename", "delete"]) if submissions else "add"
+
+    if action == "add":
+        counter[0] += 1
+        submission = PlacementSubmission(
+            guild_id="1",
+            tournament_id="t1",
+            round_name=rng.choice(ROUNDS),
+            lobby_number=counter[0],
+            discord_message_id=str(counter[0]),
+            discord_channel_id="1",
+            image_url="https://example.com/lobby.png",
+            overall_confidence=90,
+            extracted_data_consensus={},
+            status=rng.choice(["validated", "validated", "pending"]),
+        )
+        submission.placements = _lobby(rng, submission.round_name, counter[0])
+        session.add(submission)
+    elif action == "status":
+        submission = rng.choice(submissions)
+        submission.status = rng.choice(["validated", "rejected", "pending"])
+    elif action == "edit":
+        # Same shape as validate_submission with edited placements
+        submission = rng.choice(submissions)
+        for placement in list(submission.placements):
+            session.delete(placement)
+        submission.placements = _lobby(rng, submission.round_name, submission.lobby_number)
+        submission.status = "validated"
+        submission.edited = True
+    elif action == "rename":
+        placement = rng.choice(session.query(RoundPlacement).all())
+        placement.player_name = f"{placement.player_name}x"
+    else:
+        session.delete(rng.choice(submissions))
+
+    session.commit()
+
+
+def _reference_totals(session: Session) -> Dict[str, Dict[str, int]]:
+    totals: Dict[str, Dict[str, int]] = {}
+    placements = session.query(RoundPlacement).join(RoundPlacement.submission).filter(
+        PlacementSubmission.status == "validated"
+    )
+    for p in placements:
+        scores = totals.setdefault(p.player_id, dict.fromkeys(ROUNDS, 0))
+        scores[p.round_name] += _POINT_MAP[p.placement]
+    return totals
+
+
+def _entries(snapshot) -> List[tuple]:
+    return [
+        (e.standing_rank, e.player_id, e.player_name, e.total_points, dict(e.round_scores))
+        for e in snapshot.entries
+    ]
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_incremental_refresh_matches_full_rebuild(session: Session, seed: int) -> None:
+    rng = random.Random(seed)
+    aggregator = StandingsAggregator(StandingsService(session))
+    counter = [0]
+
+    for _ in range(30):
+        _random_change(session, rng, counter)
+        incremental = _entries(aggregator.refresh_from_placements(tournament_id="t1"))
+
+        placements = session.query(RoundPlacement).join(RoundPlacement.submission).filter(
+            PlacementSubmission.status == "validated"
+        )
+        rows = [aggregator._contribution("t1", p) for p in placements]
+        round_names = sorted({row.round_name for row in rows}, key=_round_sort_key)
+        full_payload = aggregator._score_contributions(rows, round_names)
+        aggregator._rank_entries(full_payload)
+        full = [
+            (e.standing_rank, e.player_id, e.player_name, e.total_points, e.round_scores)
+            for e in full_payload
+        ]
+        assert incremental == full
+
+        reference = _reference_totals(session)
+        assert {pid: {r: s.get(r, 0) for r in ROUNDS} for _, pid, _, _, s in incremental} == reference
+        assert set(round_names) <= set(ROUNDS)
+        assert round_names == sorted(round_names, key=lambda name: int(name.split("_")[1]))
+
+
+def test_refresh_reads_only_changed_placements(session: Session) -> None:
+    rng = random.Random(1)
+    aggregator = StandingsAggregator(StandingsService(session))
+    counter = [0]
+    for _ in range(10):
+        _random_change(session, rng, counter)
+    aggregator.refresh_from_placements(tournament_id="t1")
+
+    loaded = []
+    scored = []
+
+    def record(target, context):
+        loaded.append(target.id)
+
+    def record_contribution(target, context):
+        scored.append(target.player_id)
+
+    event.listen(RoundPlacement, "load", record)
+    event.listen(PlacementContribution, "load", record_contribution)
+    try:
+        first = aggregator.refresh_from_placements(tournament_id="t1")
+        first_total = sum(e.total_points for e in first.entries)
+        assert loaded == []
+
+        counter[0] += 1
+        submission = PlacementSubmission(
+            guild_id="1",
+            tournament_id="t1",
+            round_name="ROUND_2",
+            lobby_number=counter[0],
+            discord_message_id=str(counter[0]),
+            discord_channel_id="1",
+            image_url="https://example.com/lobby.png",
+            overall_confidence=90,
+            extracted_data_consensus={},
+            status="validated",
+            placements=_lobby(rng, "ROUND_2", counter[0]),
+        )
+        session.add(submission)
+        session.commit()
+        session.expire_all()
+
+        snapshot = aggregator.refresh_from_placements(tournament_id="t1")
+    finally:
+        event.remove(RoundPlacement, "load", record)
+        event.remove(PlacementContribution, "load", record_contribution)
+
+    assert sum(e.total_points for e in snapshot.entries) == first_total + sum(_POINT_MAP.values())
+    assert sorted(set(loaded)) == sorted(p.id for p in submission.placements)
+    # Only the lobby's players were re-scored; everyone else was carried over
+    assert set(scored) == {p.player_id for p in submission.placements}
+    assert len(snapshot.entries) > len(set(scored))
+    assert all(entry.extras is None for entry in snapshot.entries)
+
+
+def test_snapshot_delta_replays_to_current_standings(session: Session) -> None:
+    rng = random.Random(7)
+    aggregator = StandingsAggregator(StandingsService(session))
+    counter = [0]
+    standings: Dict[str, tuple] = {}
+    version = None
+
+    for _ in range(20):
+        _random_change(session, rng, counter)
+        snapshot = aggregator.refresh_from_placements(tournament_id="t1")
+        delta = snapshot.extras["scoreboard_delta"]
+        if delta["version"] == version:
+            continue  # nothing changed, previous snapshot returned
+
+        assert delta["base_version"] == version
+        assert delta["source"] == PLACEMENT_SOURCE
+        assert snapshot.extras["scoreboard_version"] == delta["version"] == (version or 0) + 1
+        version = delta["version"]
+
+        for key in delta["removed"]:
+            del standings[key]
+        for item in delta["changed"]:
+            previous = standings.get(item["key"])
+            assert item["previous_rank"] == (previous[0] if previous else None)
+            assert item["points_delta"] == item["total_points"] - (previous[1] if previous else 0)
+            standings[item["key"]] = (item["standing_rank"], item["total_points"], item["round_scores"])
+
+        assert standings == {
+            e.player_id: (e.standing_rank, e.total_points, dict(e.round_scores)) for e in snapshot.entries
+        }
+
+
+def test_sheet_snapshot_keeps_its_own_version_chain(session: Session) -> None:
+    rng = random.Random(3)
+    service = StandingsService(session)
+    aggregator = StandingsAggregator(service)
+    _random_change(session, rng, [0])
+    placement = aggregator.refresh_from_placements(tournament_id="t1")
+
+    sheet = service.create_snapshot(
+        ScoreboardSnapshotCreate(tournament_id="t1", guild_id="1", source="sheets", entries=[])
+    )
+    sheet_delta = sheet.extras["scoreboard_delta"]
+    assert (sheet_delta["source"], sheet_delta["version"], sheet_delta["base_version"]) == ("sheets", 1, None)
+
+    # An unchanged placement refresh returns the same snapshot, so no delta goes out
+    before = service.get_latest_snapshot_version(tournament_id="t1", source=PLACEMENT_SOURCE)
+    assert before == (placement.id, placement.updated_at)
+    assert service.get_latest_snapshot_version(tournament_id="t1") == (sheet.id, sheet.updated_at)
+    unchanged = aggregator.refresh_from_placements(tournament_id="t1")
+    assert (unchanged.id, unchanged.updated_at) == before
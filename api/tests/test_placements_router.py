@@ -0,0 +1,187 @@
+"""Tests for placement router queries against an in-memory database."""
+
+import random
+from contextlib import contextmanager
+from typing import AsyncIterator, Iterator, List
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from api.models import Base, PlacementSubmission, RoundPlacement
+from api.routers.placements import confidence_report, get_pending_review, get_round_placements
+
+
+@pytest.fixture
+async def session() -> AsyncIterator[AsyncSession]:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+@contextmanager
+def _count_queries(session: AsyncSession) -> Iterator[List[str]]:
+    statements: List[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+
+def _seed_round(session: Session, lobbies: int, status: str = "validated") -> None:
+    for lobby in range(1, lobbies + 1):
+        submission = PlacementSubmission(
+            guild_id="1",
+            tournament_id="t1",
+            round_name="ROUND_1",
+            lobby_number=lobby,
+            discord_message_id=f"{status}_{lobby}",
+            discord_channel_id="1",
+            image_url=f"https://example.com/{lobby}.png",
+            overall_confidence=75,
+            extracted_data_consensus={},
+            status=status,
+        )
+        for placement in range(1, 9):
+            submission.placements.append(
+                RoundPlacement(
+                    player_id=f"p{lobby}_{placement}",
+                    player_name=f"Player {lobby}-{placement}",
+                    tournament_id="t1",
+                    round_name="ROUND_1",
+                    round_number=1,
+                    lobby_number=lobby,
+                    placement=placement,
+                    points=9 - placement,
+                )
+            )
+        session.add(submission)
+    session.commit()
+    session.expire_all()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("lobbies", [1, 8])
+async def test_round_placements_query_count_is_fixed(session: AsyncSession, lobbies: int) -> None:
+    await session.run_sync(_seed_round, lobbies)
+    await session.run_sync(_seed_round, 2, status="rejected")
+
+    with _count_queries(session) as statements:
+        result = await get_round_placements("t1", "ROUND_1", db=session, _user=None)
+
+    assert len(statements) == 1
+    assert result["total_players"] == lobbies * 8
+    assert [(p["lobby_number"], p["placement"]) for p in result["placements"]] == [
+        (lobby, placement) for lobby in range(1, lobbies + 1) for placement in range(1, 9)
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("lobbies", [1, 8])
+async def test_pending_review_query_count_is_fixed(session: AsyncSession, lobbies: int) -> None:
+    await session.run_sync(_seed_round, lobbies, status="pending_review")
+
+    with _count_queries(session) as statements:
+        result = await get_pending_review(
+            tournament_id="t1", round_name=None, limit=50, offset=0, db=session, _user=None
+        )
+
+    # COUNT, the page of submissions, and one select-in for their placements
+    assert len(statements) == 3
+    assert result["total"] == lobbies
+    assert all(len(s["placements"]) == 8 for s in result["submissions"])
+
+
+def _seed_confidence_mix(session: Session) -> None:
+    rng = random.Random(5)
+    for index in range(60):
+        tournament_id = "t1" if index % 4 else "t2"
+        round_name = f"ROUND_{index % 3 + 1}"
+        submission = PlacementSubmission(
+            guild_id="1",
+            tournament_id=tournament_id,
+            round_name=round_name,
+            lobby_number=index,
+            discord_message_id=f"mix_{index}",
+            discord_channel_id="1",
+            image_url="https://example.com/lobby.png",
+            overall_confidence=rng.choice([45, 69, 70, 85, 89, 90, 100]),
+            validation_method=rng.choice(["auto", "manual", None]),
+            extracted_data_consensus={},
+        )
+        for placement in range(1, 4):
+            submission.placements.append(
+                RoundPlacement(
+                    player_id=f"p{placement}",
+                    player_name=f"Player {placement}",
+                    tournament_id=tournament_id,
+                    round_name=round_name,
+                    round_number=1,
+                    lobby_number=index,
+                    placement=placement,
+                    points=9 - placement,
+                    player_match_confidence=rng.randint(60, 100),
+                    manually_corrected=rng.random() < 0.2,
+                )
+            )
+        session.add(submission)
+    session.commit()
+
+
+def _load_rows(session: Session, tournament_id):
+    submissions = session.query(PlacementSubmission)
+    placements = session.query(RoundPlacement)
+    if tournament_id:
+        submissions = submissions.filter(PlacementSubmission.tournament_id == tournament_id)
+        placements = placements.filter(RoundPlacement.tournament_id == tournament_id)
+    return submissions.all(), placements.all()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("tournament_id", [None, "t1"])
+async def test_confidence_report_matches_row_scan(session: AsyncSession, tournament_id) -> None:
+    await session.run_sync(_seed_confidence_mix)
+    submissions, placements = await session.run_sync(_load_rows, tournament_id)
+
+    with _count_queries(session) as statements:
+        report = await confidence_report(tournament_id=tournament_id, db=session, _user=None)
+
+    assert len(statements) == 2
+    confidences = [s.overall_confidence for s in submissions]
+    assert report["total_submissions"] == len(submissions)
+    assert report["average_confidence"] == pytest.approx(sum(confidences) / len(confidences) / 100)
+    assert report["auto_validated"] == sum(s.validation_method == "auto" for s in submissions)
+    assert report["manually_validated"] == sum(s.validation_method == "manual" for s in submissions)
+    assert report["distribution"] == {
+        "high (90-100%)": sum(c >= 90 for c in confidences),
+        "medium (70-89%)": sum(70 <= c < 90 for c in confidences),
+        "low (0-69%)": sum(c < 70 for c in confidences),
+    }
+
+    assert [r["round_name"] for r in report["rounds"]] == ["ROUND_1", "ROUND_2", "ROUND_3"]
+    for row in report["rounds"]:
+        round_placements = [p for p in placements if p.round_name == row["round_name"]]
+        match = [p.player_match_confidence for p in round_placements]
+        assert row["total_submissions"] == sum(s.round_name == row["round_name"] for s in submissions)
+        assert row["total_placements"] == len(round_placements)
+        assert row["average_player_match_confidence"] == pytest.approx(sum(match) / len(match) / 100)
+        assert row["manually_corrected_placements"] == sum(p.manually_corrected for p in round_placements)
+
+
+@pytest.mark.asyncio
+async def test_confidence_report_empty(session: AsyncSession) -> None:
+    report = await confidence_report(tournament_id="missing", db=session, _user=None)
+    assert report["total_submissions"] == 0
+    assert report["distribution"] == {}
+    assert report["rounds"] == []
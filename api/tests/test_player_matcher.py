@@ -0,0 +1,115 @@
+"""Tests for PlayerMatcher normalization, fuzzy index and one-to-one matching."""
+
+import itertools
+import random
+import re
+
+import numpy as np
+import pytest
+
+from integrations.player_matcher import (
+    CHARACTER_CONFUSIONS,
+    PlayerMatcher,
+    _assign_one_to_one,
+)
+
+
+def _legacy_normalize(text: str) -> str:
+    text = re.sub(r'[^a-zA-Z0-9]', '', text).lower()
+    for correct_char, confused_chars in CHARACTER_CONFUSIONS.items():
+        for confused in confused_chars:
+            text = text.replace(confused, correct_char)
+    return text
+
+
+ROSTER = [
+    {"player_id": "1", "player_name": "MoldyKumquat", "aliases": ["Kumquat"]},
+    {"player_id": "2", "player_name": "CoffinCutie"},
+    {"player_id": "3", "player_name": "Kalimier", "riot_id": "Kalimier#NA1"},
+    {"player_id": "4", "player_name": "Ffoxface", "discord_name": "foxy"},
+    {"player_id": "5", "player_name": "deepestregrets"},
+    {"player_id": "6", "player_name": "deepestregret"},
+]
+
+
+@pytest.fixture
+def matcher() -> PlayerMatcher:
+    matcher = PlayerMatcher([dict(player) for player in ROSTER])
+    matcher.threshold = 0.85
+    return matcher
+
+
+def test_normalize_matches_sequential_replacements(matcher: PlayerMatcher) -> None:
+    rng = random.Random(7)
+    alphabet = "abcdefghijklmnorsuvwxyzABILOSM0123456789 |_#-rnmrn"
+    for _ in range(2000):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 16)))
+        assert matcher._normalize(text) == _legacy_normalize(text), text
+
+
+def test_assignment_is_optimal() -> None:
+    rng = np.random.default_rng(3)
+    for rows, cols in [(3, 3), (4, 6), (6, 4), (5, 5)]:
+        for _ in range(20):
+            scores = np.where(rng.random((rows, cols)) > 0.3, rng.random((rows, cols)), 0.0)
+            assignment = _assign_one_to_one(scores)
+
+            chosen = [c for c in assignment if c is not None]
+            assert len(chosen) == len(set(chosen))
+            total = sum(scores[r, c] for r, c in enumerate(assignment) if c is not None)
+
+            best = 0.0
+            if rows <= cols:
+                for perm in itertools.permutations(range(cols), rows):
+                    best = max(best, sum(scores[r, c] for r, c in enumerate(perm)))
+            else:
+                for perm in itertools.permutations(range(rows), cols):
+                    best = max(best, sum(scores[r, c] for c, r in enumerate(perm)))
+            assert total == pytest.approx(best)
+
+
+def test_single_names_match_like_match_player(matcher: PlayerMatcher) -> None:
+    for name in ["MoldyKumquat", "Kumquat", "foxy", "C0ffinCutie", "Ka1imier", "Nobody", "Ffoxfase"]:
+        expected = matcher.match_player(name)
+        [combined] = matcher.match_players([{"name": name, "placement": 1}])
+        result = combined["match_result"]
+        assert result["success"] == expected["success"], name
+        assert result["player_id"] == expected["player_id"], name
+        assert result["match_method"] == expected["match_method"], name
+        assert result["confidence"] == pytest.approx(expected["confidence"]), name
+
+
+def test_two_names_cannot_claim_same_player(matcher: PlayerMatcher) -> None:
+    players = [
+        {"name": "deepestregretss", "placement": 1},
+        {"name": "deepestregrets", "placement": 2},
+        {"name": "deepestregret", "placement": 3},
+    ]
+
+    results = matcher.match_players(players)
+
+    claimed = [r["matched_player_id"] for r in results if r["matched_player_id"]]
+    assert len(claimed) == len(set(claimed))
+    assert results[1]["match_result"]["match_method"] == "exact"
+    assert results[2]["match_result"]["match_method"] == "exact"
+    assert results[0]["match_result"]["success"] is False
+    assert results[0]["match_result"]["match_method"] == "fuzzy_conflict"
+
+
+def test_assignment_prefers_globally_best_pairing() -> None:
+    matcher = PlayerMatcher([
+        {"player_id": "a", "player_name": "deepregrets"},
+        {"player_id": "b", "player_name": "deepestregrets"},
+    ])
+    matcher.threshold = 0.85
+
+    # Matched greedily in order, the first name would take "deepestregrets"
+    # (its best score) and leave the second name below threshold for
+    # "deepregrets". The optimal assignment keeps both matches.
+    results = matcher.match_players([
+        {"name": "deepstregrets", "placement": 1},
+        {"name": "deepestrgrets", "placement": 2},
+    ])
+
+    assert [r["matched_player_id"] for r in results] == ["a", "b"]
+    assert all(r["match_method"] == "fuzzy" for r in results)
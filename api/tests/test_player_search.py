@@ -0,0 +1,208 @@
+"""Tests for the trigram-backed player search index."""
+
+import random
+import string
+from typing import Iterator
+
+import pytest
+from rapidfuzz import fuzz
+from sqlalchemy import create_engine, delete
+from sqlalchemy.orm import Session, sessionmaker
+
+from api.models import (
+    Base,
+    PlacementSubmission,
+    PlayerAlias,
+    PlayerSearchTerm,
+    RoundPlacement,
+)
+from api.services.player_search import (
+    PlayerSearchIndex,
+    SearchIndexedSession,
+    queue_player_resync,
+    search_trigrams,
+)
+
+
+@pytest.fixture
+def session() -> Iterator[Session]:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine, class_=SearchIndexedSession)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def _add_lobby(session: Session, tournament_id: str, names, lobby: int = 1) -> None:
+    submission = PlacementSubmission(
+        guild_id="1",
+        tournament_id=tournament_id,
+        round_name="ROUND_1",
+        lobby_number=lobby,
+        discord_message_id=f"{tournament_id}_{lobby}",
+        discord_channel_id="1",
+        image_url="https://example.com/lobby.png",
+        overall_confidence=95,
+        extracted_data_consensus={},
+    )
+    for placement, (player_id, name) in enumerate(names, start=1):
+        submission.placements.append(
+            RoundPlacement(
+                player_id=player_id,
+                player_name=name,
+                tournament_id=tournament_id,
+                round_name="ROUND_1",
+                round_number=1,
+                lobby_number=lobby,
+                placement=placement,
+                points=9 - placement,
+            )
+        )
+    session.add(submission)
+    session.commit()
+
+
+def _full_scan(session: Session, query: str, tournament_id=None):
+    """Reference: score every placement name like the original endpoint."""
+    placements = session.query(RoundPlacement)
+    if tournament_id:
+        placements = placements.filter(RoundPlacement.tournament_id == tournament_id)
+    players = {}
+    for p in placements.order_by(RoundPlacement.id):
+        players.setdefault(p.player_id, p.player_name)
+    aliases = {}
+    for alias in session.query(PlayerAlias).order_by(PlayerAlias.id):
+        aliases.setdefault(alias.player_id, []).append(alias.alias_name)
+
+    term = query.lower()
+    matches = {}
+    for player_id, name in players.items():
+        score = fuzz.ratio(term, name.lower()) / 100
+        for alias in aliases.get(player_id, []):
+            alias_score = fuzz.ratio(term, alias.lower()) / 100
+            if alias_score > 0.5:
+                score = max(score, alias_score)
+        if score > 0.3 or term in name.lower():
+            matches[player_id] = score
+    return matches
+
+
+def test_trigrams_pad_short_terms() -> None:
+    assert search_trigrams("ab") == {"  a", " ab", "ab "}
+    assert search_trigrams("") == set()
+
+
+def test_writes_are_indexed_and_searchable(session: Session) -> None:
+    _add_lobby(session, "t1", [("1", "Ffoxface"), ("2", "Kalimier"), ("3", "CoffinCutie")])
+    _add_lobby(session, "t2", [("4", "MoldyKumquat")])
+    session.add(PlayerAlias(player_id="1", discord_id="11", alias_name="foxy", alias_type="discord"))
+    session.commit()
+
+    players, total = PlayerSearchIndex(session).search("ffox face")
+    assert total == 1
+    assert players[0]["id"] == "1"
+    assert players[0]["aliases"] == ["foxy"]
+
+    players, _ = PlayerSearchIndex(session).search("foxy")
+    assert players[0]["id"] == "1"
+    assert players[0]["match_confidence"] == pytest.approx(1.0)
+
+    assert PlayerSearchIndex(session).search("Kumquat", tournament_id="t1") == ([], 0)
+    players, _ = PlayerSearchIndex(session).search("Kumquat", tournament_id="t2")
+    assert [p["id"] for p in players] == ["4"]
+
+
+def test_repeat_and_renamed_placements(session: Session) -> None:
+    _add_lobby(session, "t1", [("1", "Ffoxface")], lobby=1)
+    _add_lobby(session, "t1", [("1", "Ffoxface")], lobby=2)
+    assert session.query(PlayerSearchTerm).count() == 1
+
+    placement = session.query(RoundPlacement).first()
+    placement.player_name = "Coralie"
+    session.commit()
+
+    players, _ = PlayerSearchIndex(session).search("coralie")
+    assert [p["id"] for p in players] == ["1"]
+
+
+def test_matches_full_scan(session: Session) -> None:
+    rng = random.Random(11)
+    names = ["".join(rng.choice(string.ascii_letters) for _ in range(rng.randint(4, 12))) for _ in range(150)]
+    for lobby in range(15):
+        tournament_id = f"t{lobby % 3}"
+        chunk = [(f"p{i}", names[i]) for i in range(lobby * 10, lobby * 10 + 10)]
+        _add_lobby(session, tournament_id, chunk, lobby=lobby)
+
+    index = PlayerSearchIndex(session)
+    for name in rng.sample(names, 30):
+        query = name[1:-1] if len(name) > 6 else name
+        for tournament_id in (None, "t1"):
+            expected = _full_scan(session, query, tournament_id)
+            players, _ = index.search(query, tournament_id=tournament_id, limit=5)
+            # Weak matches that share no trigram with the query may be skipped,
+            # but every strong match must come back with the full-scan score.
+            strong = sorted((s for s in expected.values() if s >= 0.75), reverse=True)[:5]
+            scores = [p["match_confidence"] for p in players]
+            assert scores[:len(strong)] == pytest.approx(strong), query
+            assert all(expected[p["id"]] == pytest.approx(p["match_confidence"]) for p in players)
+
+
+def test_rebuild_matches_incremental_index(session: Session) -> None:
+    _add_lobby(session, "t1", [("1", "Ffoxface"), ("2", "Kalimier")])
+    session.add(PlayerAlias(player_id="2", discord_id="22", alias_name="Kali", alias_type="discord"))
+    session.commit()
+
+    def snapshot():
+        return sorted(
+            (t.player_id, t.tournament_id or "", t.kind, t.normalized, sorted(g.trigram for g in t.trigrams))
+            for t in session.query(PlayerSearchTerm)
+        )
+
+    incremental = snapshot()
+    assert PlayerSearchIndex(session).rebuild() == 3
+    assert snapshot() == incremental
+    assert PlayerSearchIndex(session).backfill() == 0
+
+
+def test_corrected_names_replace_stale_terms(session: Session) -> None:
+    _add_lobby(session, "t1", [("1", "Ffoxfac3 OCRjunk"), ("2", "Kalimier")])
+
+    # Manual correction: bulk-delete the lobby's placements and re-add them
+    submission = session.query(PlacementSubmission).one()
+    queue_player_resync(session, [p.player_id for p in submission.placements])
+    session.execute(delete(RoundPlacement).where(RoundPlacement.submission_id == submission.id))
+    session.add(RoundPlacement(
+        submission_id=submission.id, player_id="1", player_name="Ffoxface", tournament_id="t1",
+        round_name="ROUND_1", round_number=1, lobby_number=1, placement=1, points=8,
+    ))
+    session.commit()
+
+    players, _ = PlayerSearchIndex(session).search("Ffoxface")
+    assert [(p["id"], p["name"]) for p in players] == [("1", "Ffoxface")]
+    assert PlayerSearchIndex(session).search("OCRjunk") == ([], 0)
+    assert PlayerSearchIndex(session).search("Kalimier") == ([], 0)
+
+
+def test_newest_name_is_shown(session: Session) -> None:
+    _add_lobby(session, "t1", [("1", "Ffoxfac3")], lobby=1)
+    _add_lobby(session, "t1", [("1", "Ffoxface")], lobby=2)
+
+    players, _ = PlayerSearchIndex(session).search("Ffoxface")
+    assert players[0]["name"] == "Ffoxface"
+
+    session.delete(session.query(RoundPlacement).filter_by(lobby_number=2).one())
+    session.commit()
+    players, _ = PlayerSearchIndex(session).search("Ffoxfac")
+    assert players[0]["name"] == "Ffoxfac3"
+
+
+def test_plain_sessions_are_not_hooked(session: Session) -> None:
+    plain = sessionmaker(bind=session.get_bind())()
+    try:
+        _add_lobby(plain, "t1", [("1", "Ffoxface")])
+        assert plain.query(PlayerSearchTerm).count() == 0
+    finally:
+        plain.close()
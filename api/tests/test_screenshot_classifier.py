@@ -0,0 +1,76 @@
+"""Tests for ScreenshotClassifier downscaled feature extraction."""
+
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+from integrations.screenshot_classifier import ScreenshotClassifier
+
+ASSETS = Path(__file__).resolve().parents[2] / "assets"
+STANDINGS_FIXTURES = sorted((ASSETS / "templates" / "tft_standings").glob("*.png"))
+NON_STANDINGS_FIXTURES = sorted(ASSETS.glob("GA_Logo_*"))
+
+
+@pytest.fixture
+def classifier() -> ScreenshotClassifier:
+    classifier = ScreenshotClassifier()
+    classifier.threshold = 0.60
+    classifier.skip_classification = False
+    classifier.early_exit = True
+    classifier.min_basic_score = 0.0
+    return classifier
+
+
+@pytest.mark.parametrize("path", STANDINGS_FIXTURES, ids=lambda p: p.name)
+def test_standings_fixtures_accepted(classifier: ScreenshotClassifier, path: Path) -> None:
+    is_standings, confidence, metadata = classifier.classify(str(path))
+    assert is_standings, metadata
+    assert confidence >= classifier.threshold
+
+
+@pytest.mark.parametrize("path", NON_STANDINGS_FIXTURES, ids=lambda p: p.name)
+def test_non_standings_fixtures_rejected(classifier: ScreenshotClassifier, path: Path) -> None:
+    is_standings, _, _ = classifier.classify(str(path))
+    assert not is_standings
+
+
+@pytest.mark.parametrize("size", [(1920, 1080), (2560, 1440), (3840, 2160)])
+def test_upscaled_fixtures_accepted(classifier: ScreenshotClassifier, tmp_path: Path, size) -> None:
+    for path in STANDINGS_FIXTURES:
+        upscaled = cv2.resize(cv2.imread(str(path)), size, interpolation=cv2.INTER_CUBIC)
+        target = tmp_path / f"{path.stem}_{size[0]}.png"
+        cv2.imwrite(str(target), upscaled)
+
+        is_standings, _, metadata = classifier.classify(str(target))
+        assert is_standings, (path.name, metadata)
+        assert metadata["image_size"] == (size[1], size[0])
+
+
+def test_downscale_caps_height_and_never_upscales(classifier: ScreenshotClassifier) -> None:
+    large = np.zeros((1440, 2560, 3), dtype=np.uint8)
+    small = np.zeros((300, 400, 3), dtype=np.uint8)
+
+    assert classifier._downscale(large).shape[:2] == (480, 853)
+    assert classifier._downscale(small) is small
+
+
+def test_otsu_matches_opencv(classifier: ScreenshotClassifier) -> None:
+    gray = cv2.cvtColor(cv2.imread(str(STANDINGS_FIXTURES[0])), cv2.COLOR_BGR2GRAY)
+    expected, _ = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+
+    hist = np.bincount(gray.ravel(), minlength=256).astype(np.float64)
+    assert classifier._otsu_threshold(hist, np.cumsum(hist)) == int(expected)
+
+
+def test_early_exit_skips_pixel_analysis(classifier: ScreenshotClassifier, tmp_path: Path) -> None:
+    target = tmp_path / "banner.png"
+    cv2.imwrite(str(target), np.zeros((100, 1000, 3), dtype=np.uint8))
+    classifier.min_basic_score = 0.7
+
+    is_standings, _, metadata = classifier.classify(str(target))
+
+    assert not is_standings
+    assert metadata["method"] == "early_exit"
+    assert "layout" not in metadata["scores"]
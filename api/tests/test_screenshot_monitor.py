@@ -0,0 +1,84 @@
+"""Tests for per-guild/round screenshot batching in ScreenshotMonitor."""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Dict, List, Tuple
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.events.handlers.screenshot_monitor import ScreenshotMonitor
+
+
+def _make_monitor(**settings) -> Tuple[ScreenshotMonitor, List[Tuple[int, str, List[Dict]]]]:
+    monitor = ScreenshotMonitor(MagicMock())
+    monitor.batch_window = settings.get("window", 0.05)
+    monitor.batch_max_wait = settings.get("max_wait", 0.2)
+    monitor.batch_max_size = settings.get("max_size", 8)
+    monitor.max_concurrent_batches = settings.get("workers", 2)
+    processed: List[Tuple[int, str, List[Dict]]] = []
+
+    async def fake_process(guild, images, round_name):
+        processed.append((guild.id, round_name, list(images)))
+
+    monitor._process_batch = fake_process
+    return monitor, processed
+
+
+def _image(message_id: int) -> Dict:
+    return {"url": f"https://cdn/{message_id}.png", "discord_message_id": message_id}
+
+
+async def _drain(monitor: ScreenshotMonitor) -> None:
+    await monitor.batch_work_queue.join()
+    for task in monitor.batch_workers:
+        task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_batches_are_split_by_guild_and_round() -> None:
+    monitor, processed = _make_monitor()
+    guild_a, guild_b = SimpleNamespace(id=1), SimpleNamespace(id=2)
+
+    await monitor._enqueue_images(guild_a, "ROUND_1", [_image(1)])
+    await monitor._enqueue_images(guild_a, "ROUND_2", [_image(2)])
+    await monitor._enqueue_images(guild_b, "ROUND_1", [_image(3)])
+
+    await asyncio.sleep(0.15)
+    await _drain(monitor)
+
+    batches = sorted((guild_id, round_name, len(imgs)) for guild_id, round_name, imgs in processed)
+    assert batches == [(1, "ROUND_1", 1), (1, "ROUND_2", 1), (2, "ROUND_1", 1)]
+    assert monitor.pending_batches == {}
+
+
+@pytest.mark.asyncio
+async def test_max_size_flushes_immediately() -> None:
+    monitor, processed = _make_monitor(window=10, max_wait=10, max_size=3)
+    guild = SimpleNamespace(id=1)
+
+    await monitor._enqueue_images(guild, "ROUND_1", [_image(1), _image(2)])
+    assert processed == []
+
+    await monitor._enqueue_images(guild, "ROUND_1", [_image(3)])
+    await _drain(monitor)
+
+    assert len(processed) == 1
+    assert [img["discord_message_id"] for img in processed[0][2]] == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_steady_trickle_is_capped_by_max_wait() -> None:
+    monitor, processed = _make_monitor(window=0.1, max_wait=0.25)
+    guild = SimpleNamespace(id=1)
+
+    # A new screenshot every 50ms would keep a sliding window open forever.
+    for message_id in range(8):
+        await monitor._enqueue_images(guild, "ROUND_1", [_image(message_id)])
+        await asyncio.sleep(0.05)
+
+    await asyncio.sleep(0.15)
+    await _drain(monitor)
+
+    assert len(processed) >= 2
+    assert sum(len(imgs) for _, _, imgs in processed) == 8
@@ -104,3 +104,52 @@ def test_get_snapshot_by_id(seeded_snapshot: int) -> None:
     assert payload["id"] == seeded_snapshot
     assert payload["entries"][1]["player_name"] == "Bob"
 
+
+
+def test_latest_scoreboard_honors_conditional_requests(seeded_snapshot: int) -> None:
+    headers = _auth_headers()
+    params = {"tournament_id": "router_test"}
+    first = client.get("/api/v1/scoreboard/latest", params=params, headers=headers)
+    etag = first.headers["ETag"]
+
+    response = client.get(
+        "/api/v1/scoreboard/latest", params=params, headers={**headers, "If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+
+    response = client.get(
+        "/api/v1/scoreboard/latest",
+        params=params,
+        headers={**headers, "If-Modified-Since": first.headers["Last-Modified"]},
+    )
+    assert response.status_code == 304
+
+    response = client.get(
+        "/api/v1/scoreboard/latest", params=params, headers={**headers, "If-None-Match": 'W/"0-0"'}
+    )
+    assert response.status_code == 200
+    assert response.json() == first.json()
+
+
+def test_latest_scoreboard_cache_invalidated_by_new_snapshot(seeded_snapshot: int) -> None:
+    headers = _auth_headers()
+    params = {"tournament_id": "router_test"}
+    first = client.get("/api/v1/scoreboard/latest", params=params, headers=headers)
+    assert first.json()["id"] == seeded_snapshot
+
+    session = SessionLocal()
+    try:
+        payload = _build_snapshot_payload()
+        payload.entries[0].total_points = 99
+        StandingsService(session).create_snapshot(payload)
+    finally:
+        session.close()
+
+    response = client.get(
+        "/api/v1/scoreboard/latest", params=params, headers={**headers, "If-None-Match": first.headers["ETag"]}
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] != first.headers["ETag"]
+    assert response.json()["entries"][0]["total_points"] == 99
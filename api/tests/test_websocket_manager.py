@@ -0,0 +1,76 @@
+"""Tests for WebSocket broadcast fan-out and topic subscriptions."""
+
+import asyncio
+import json
+from typing import List
+
+import pytest
+from fastapi.testclient import TestClient
+
+import api.routers.websocket as websocket_router
+from api.auth import create_access_token
+from api.main import app
+from api.routers.websocket import ConnectionManager
+
+
+class FakeWebSocket:
+    def __init__(self) -> None:
+        self.sent: List[str] = []
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, payload: str) -> None:
+        self.sent.append(payload)
+
+    async def close(self, code: int = 1000, reason: str = "") -> None:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_broadcast_serializes_once_and_filters_topics(monkeypatch) -> None:
+    manager = ConnectionManager()
+    sockets = [FakeWebSocket() for _ in range(6)]
+    contexts = [await manager.connect(ws, f"user{i}") for i, ws in enumerate(sockets)]
+    manager.subscribe(contexts[0], ["placement_update"])
+    manager.subscribe(contexts[1], ["placement_update", "tournament_update"])
+    manager.subscribe(contexts[2], ["tournament_update"])
+
+    calls = []
+    real_dumps = json.dumps
+    monkeypatch.setattr(websocket_router.json, "dumps", lambda obj: calls.append(obj) or real_dumps(obj))
+
+    assert await manager.broadcast({"type": "placement_update", "data": {"round": "ROUND_1"}}) == 2
+    assert await manager.broadcast({"type": "system_notification", "data": {}}) == 6
+    assert len(calls) == 2
+
+    manager.unsubscribe(contexts[1], ["placement_update"])
+    assert await manager.broadcast({"type": "placement_update", "data": {}}) == 1
+
+    await asyncio.sleep(0)
+    received = [[json.loads(p)["type"] for p in ws.sent] for ws in sockets]
+    assert received[0] == ["placement_update", "system_notification", "placement_update"]
+    assert received[1] == ["placement_update", "system_notification"]
+    assert received[2] == received[5] == ["system_notification"]
+
+    for context in contexts:
+        await manager.close(context, "test")
+
+
+def test_subscribe_message_updates_connection_topics() -> None:
+    token = create_access_token(data={"sub": "ws-user", "roles": [], "scopes": []})
+    client = TestClient(app)
+    with client.websocket_connect(f"/api/v1/ws/{token}") as ws:
+        assert ws.receive_json()["type"] == "connection_established"
+
+        ws.send_json({"type": "subscribe", "event_types": ["placement_update", "bogus"]})
+        error = ws.receive_json()
+        assert error["type"] == "error"
+        assert "bogus" in error["message"]
+        assert ws.receive_json()["subscriptions"] == ["placement_update"]
+
+        ws.send_json({"type": "subscribe", "event_type": "tournament_update"})
+        assert ws.receive_json()["subscriptions"] == ["placement_update", "tournament_update"]
+
+        ws.send_json({"type": "unsubscribe", "event_type": "placement_update"})
+        assert ws.receive_json()["subscriptions"] == ["tournament_update"]
@@ -2,7 +2,8 @@
 Helpers for executing service layer functions inside FastAPI endpoints.
 
 Ensures consistent translation of domain-level `ServiceError`s into HTTP
-responses while supporting both synchronous and asynchronous service calls.
+responses while supporting both synchronous and asynchronous service calls,
+and lets synchronous services run on an async database session.
 """
 
 from __future__ import annotations
@@ -11,6 +12,8 @@ import inspect
 from typing import Any, Awaitable, Callable, TypeVar
 
 from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 from api.services.errors import ServiceError
 
@@ -43,3 +46,27 @@ async def execute_service(
         return await _ensure_awaitable(result)
     except ServiceError as exc:
         raise HTTPException(status_code=exc.status_code, detail=exc.detail) from exc
+
+
+class AsyncServiceRunner:
+    """
+    Run a synchronous service against an `AsyncSession`.
+
+    Attribute access returns a coroutine function that builds the service on
+    the session's underlying sync `Session` and calls the method through
+    `AsyncSession.run_sync`, so the service's queries go through the async
+    driver instead of blocking the event loop.
+    """
+
+    def __init__(self, db: AsyncSession, service_cls: Callable[[Session], Any]) -> None:
+        self._db = db
+        self._service_cls = service_cls
+
+    def __getattr__(self, name: str) -> Callable[..., Awaitable[Any]]:
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            def run(session: Session) -> Any:
+                return getattr(self._service_cls(session), name)(*args, **kwargs)
+
+            return await self._db.run_sync(run)
+
+        return call
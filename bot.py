@@ -514,6 +514,13 @@ class GALBot(commands.Bot):
             except Exception as e:
                 logging.error(f"Error stopping event bus: {e}")
 
+            # Write DM IDs still waiting on the save delay
+            try:
+                from utils.dm_tracker import dm_tracker
+                dm_tracker.flush()
+            except Exception as e:
+                logging.error(f"Error saving tracked DM IDs: {e}")
+
             # Close any additional resources here
             logging.info("All resources cleaned up successfully")
 
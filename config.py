@@ -591,9 +591,9 @@ def get_poll_config() -> Dict[str, Any]:
             }
         },
         "target_role": "Angels",
-        "batch_size": 10,
-        "batch_delay": 1.0,
-        "progress_update_interval": 5
+        "dm_concurrency": 8,
+        "dm_rate_per_second": 20.0,
+        "progress_update_interval": 2.0
     }
     
     poll_config = _FULL_CFG.get("poll", {})
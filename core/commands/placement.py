@@ -3,6 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+import logging
+from datetime import timedelta
+from typing import Optional
+
 import discord
 from discord import app_commands
 from discord.ext import commands
@@ -16,6 +20,11 @@ from .common import (
     handle_command_exception,
 )
 
+logger = logging.getLogger(__name__)
+
+# The API refresh may fetch every player's latest Riot placement
+SCOREBOARD_REFRESH_TIMEOUT = 60
+
 
 def register(gal: app_commands.Group) -> None:
     """Register placement commands with the GAL command group."""
@@ -372,9 +381,16 @@ async def _trigger_dashboard_update(guild_id: str, round_name: str, successful_p
                     "placement": placement
                 })
         
+        # Push the changed standings first so clients don't refetch the scoreboard
+        scoreboard_version = None
+        try:
+            scoreboard_version = await _push_scoreboard_delta(guild_id)
+        except Exception as e:
+            logger.warning(f"Failed to push scoreboard delta, dashboards will refresh: {e}")
+
         # Send WebSocket broadcast to dashboard
         from api.routers.websocket import send_placement_update
-        await send_placement_update(round_name, lobby_updates)
+        await send_placement_update(round_name, lobby_updates, scoreboard_version=scoreboard_version)
         
         logger.info(f"Dashboard update triggered for {round_name}: {len(lobby_updates)} placements")
         
@@ -383,4 +399,41 @@ async def _trigger_dashboard_update(guild_id: str, round_name: str, successful_p
         # Don't fail the command if dashboard update fails
 
 
+async def _push_scoreboard_delta(guild_id: str) -> Optional[int]:
+    """
+    Ask the dashboard API to refresh the scoreboard, which broadcasts the delta.
+
+    The dashboard websockets live in the API process, so the refresh runs there
+    through ``/scoreboard/refresh`` with its usual source and Riot settings,
+    keeping one version chain. Returns the new scoreboard version, or None if
+    the API did not answer.
+    """
+    import aiohttp
+
+    from api.auth import create_access_token
+    from api.services.standings_service import SCOREBOARD_VERSION_KEY
+    from services.dashboard_manager import get_dashboard_manager
+
+    token = create_access_token(
+        data={"sub": "gal_bot", "roles": ["Administrator"], "read_only": False},
+        expires_delta=timedelta(minutes=5),
+    )
+    url = f"http://localhost:{get_dashboard_manager().api_port}/scoreboard/refresh"
+    payload = {"guild_id": int(guild_id), "tournament_id": str(guild_id)}
+
+    async with aiohttp.ClientSession() as session:
+        async with session.post(
+            url,
+            json=payload,
+            headers={"Authorization": f"Bearer {token}"},
+            timeout=aiohttp.ClientTimeout(total=SCOREBOARD_REFRESH_TIMEOUT),
+        ) as response:
+            if response.status != 200:
+                logger.warning(f"Scoreboard refresh returned HTTP {response.status} for guild {guild_id}")
+                return None
+            snapshot = await response.json()
+
+    return (snapshot.get("extras") or {}).get(SCOREBOARD_VERSION_KEY)
+
+
 __all__ = ["register"]
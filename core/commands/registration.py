@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import time
-from typing import List, Optional, Sequence, Tuple
+from typing import List, Optional
 
 import discord
 from discord import app_commands
@@ -17,9 +17,9 @@ from config import (
     get_registered_role,
     get_unified_channel_name,
 )
-from core.components_traditional import update_unified_channel
+from core.components_traditional import PlayerListView, update_unified_channel
 from core.persistence import get_event_mode_for_guild, persisted, save_persisted
-from helpers import EmbedHelper
+from helpers.player_list_cache import player_list_cache
 from integrations.sheets import refresh_sheet_cache
 from utils.utils import send_reminder_dms
 from .common import (
@@ -186,14 +186,25 @@ def register(gal: app_commands.Group) -> None:
             from integrations.sheets import cache_lock, sheet_cache
 
             async with cache_lock:
-                registered_rows = [
-                    (tag, data)
-                    for tag, data in sheet_cache["users"].items()
-                    if str(data[2]).upper() == "TRUE"
-                ]
+                player_list = player_list_cache.get(guild_id, mode, sheet_cache["users"])
 
-            embed = _build_registered_embed(registered_rows, mode)
-            await interaction.followup.send(embed=embed, ephemeral=True)
+            if not player_list.total_registered:
+                await interaction.followup.send(
+                    embed=discord.Embed(
+                        title="🗂️ Registered Players List",
+                        description="*No registered players found.*",
+                        color=discord.Color.blurple(),
+                    ),
+                    ephemeral=True,
+                )
+                return
+
+            view = PlayerListView(player_list, mode, "🗂️ Registered Players List")
+            await interaction.followup.send(
+                embed=view.current_embed(),
+                view=view,
+                ephemeral=True,
+            )
 
         except Exception as exc:
             await handle_command_exception(
@@ -411,49 +422,6 @@ def register(gal: app_commands.Group) -> None:
             await handle_command_exception(interaction, exc, "Cache Command")
 
 
-def _build_registered_embed(
-    registered_rows: Sequence[Tuple[str, Sequence]],
-    mode: str,
-) -> discord.Embed:
-    """Create the registered players embed view."""
-    if not registered_rows:
-        return discord.Embed(
-            title="🗂️ Registered Players List",
-            description="*No registered players found.*",
-            color=discord.Color.blurple(),
-        )
-
-    lines = EmbedHelper.build_checkin_list_lines(registered_rows, mode)
-    total_registered = len(registered_rows)
-    total_checked_in = sum(
-        1 for _, tpl in registered_rows if str(tpl[3]).upper() == "TRUE"
-    )
-
-    footer_parts: List[str] = [f"👥 Players: {total_registered}"]
-    if mode == "doubleup":
-        teams = {
-            tpl[4]
-            for _, tpl in registered_rows
-            if len(tpl) > 4 and tpl[4]
-        }
-        if teams:
-            footer_parts.append(f"🧪 Teams: {len(teams)}")
-
-    footer_parts.append(f"✅ Checked-In: {total_checked_in}")
-    if total_registered:
-        footer_parts.append(
-            f"📊 {total_checked_in / total_registered * 100:.1f}% checked in"
-        )
-
-    embed = discord.Embed(
-        title="🗂️ Registered Players List",
-        description="\n".join(lines) if lines else "No registered players found.",
-        color=discord.Color.blurple(),
-    )
-    embed.set_footer(text=" | ".join(footer_parts))
-    return embed
-
-
 async def _handle_toggle_pings(
     guild: discord.Guild,
     system_value: str,
@@ -790,70 +790,71 @@ class ViewListButton(discord.ui.Button):
         guild_id = str(interaction.guild.id)
         mode = get_event_mode_for_guild(guild_id)
 
-        # Get all registered users from cache
+        # Serve cached pages; only rows changed since the last render are re-rendered
         from integrations.sheets import sheet_cache, cache_lock
+        from helpers.player_list_cache import player_list_cache
 
         async with cache_lock:
-            all_registered = [(tag, tpl) for tag, tpl in sheet_cache["users"].items()
-                              if str(tpl[2]).upper() == "TRUE"]
+            player_list = player_list_cache.get(guild_id, mode, sheet_cache["users"])
 
-        if not all_registered:
+        if not player_list.total_registered:
             await interaction.followup.send(
                 "No registered players yet.",
                 ephemeral=True
             )
             return
 
-        # Use the same helper as registeredlist command
-        from helpers import EmbedHelper
-        lines = EmbedHelper.build_checkin_list_lines(all_registered, mode)
-
-        # Calculate statistics
-        total_registered = len(all_registered)
-        total_checked_in = sum(1 for _, tpl in all_registered
-                               if str(tpl[3]).upper() == "TRUE")
-
-        # Build embed
-        embed = discord.Embed(
-            title=f"📋 Registered Players ({total_registered})",
-            description="\n".join(lines) if lines else "No registered players found.",
-            color=discord.Color.blurple()
+        # Add the reminder button if user has allowed roles
+        view = PlayerListView(
+            player_list, mode, "📋 Registered Players",
+            show_reminder=RoleManager.has_allowed_role_from_interaction(interaction)
         )
+        await interaction.followup.send(embed=view.current_embed(), view=view, ephemeral=True)
 
-        # Build footer with statistics
-        footer_parts = [f"👤 Players: {total_registered}"]
-
-        if mode == "doubleup":
-            # Count teams
-            teams = set()
-            for _, user_data in all_registered:
-                # Cache format: (row, ign, reg_status, ci_status, team, alt_ign, pronouns)
-                team_name = user_data[4] if len(user_data) > 4 and user_data[4] else "No Team"
-                teams.add(team_name)
-            footer_parts.append(f"👥 Teams: {len(teams)}")
 
-        footer_parts.append(f"✅ Checked-In: {total_checked_in}")
+class PlayerListPageButton(discord.ui.Button):
+    """Previous/next page button for the player list."""
 
-        if total_registered > 0:
-            percentage = (total_checked_in / total_registered) * 100
-            footer_parts.append(f"📊 {percentage:.0f}%")
-
-        embed.set_footer(text=" | ".join(footer_parts))
+    def __init__(self, step: int):
+        super().__init__(
+            label="Previous" if step < 0 else "Next",
+            style=discord.ButtonStyle.secondary,
+            emoji="◀️" if step < 0 else "▶️"
+        )
+        self.step = step
 
-        # Create view with reminder button if user has allowed roles
-        if RoleManager.has_allowed_role_from_interaction(interaction):
-            view = PlayerListView()
-            await interaction.followup.send(embed=embed, view=view, ephemeral=True)
-        else:
-            await interaction.followup.send(embed=embed, ephemeral=True)
+    async def callback(self, interaction: discord.Interaction):
+        view: PlayerListView = self.view
+        view.page = max(0, min(view.page + self.step, len(view.player_list.pages) - 1))
+        view.update_buttons()
+        await interaction.response.edit_message(embed=view.current_embed(), view=view)
 
 
 class PlayerListView(discord.ui.View):
-    """View for player list with reminder button for staff."""
+    """Paginated player list with a reminder button for staff."""
 
-    def __init__(self):
+    def __init__(self, player_list, mode: str, title: str, show_reminder: bool = False):
         super().__init__(timeout=300)  # 5 minutes
-        self.add_item(ReminderButton())
+        self.player_list = player_list
+        self.mode = mode
+        self.title = title
+        self.page = 0
+
+        self.prev_button = PlayerListPageButton(-1)
+        self.next_button = PlayerListPageButton(1)
+        if len(player_list.pages) > 1:
+            self.add_item(self.prev_button)
+            self.add_item(self.next_button)
+        if show_reminder:
+            self.add_item(ReminderButton())
+        self.update_buttons()
+
+    def update_buttons(self) -> None:
+        self.prev_button.disabled = self.page == 0
+        self.next_button.disabled = self.page >= len(self.player_list.pages) - 1
+
+    def current_embed(self) -> discord.Embed:
+        return self.player_list.embed(self.title, self.mode, self.page)
 
 
 class AdminPanelButton(discord.ui.Button):
@@ -1803,6 +1804,13 @@ class ResetConfirmationView(discord.ui.View):
         if guild_id not in persisted:
             persisted[guild_id] = {}
 
+        async def report_progress(done: int, total: int) -> None:
+            await interaction.edit_original_response(embed=discord.Embed(
+                title="⏳ Resetting...",
+                description=f"Removing roles: **{done}/{total}** members",
+                color=discord.Color.orange()
+            ))
+
         try:
             if self.reset_type == "registration":
                 # Close registration and reset all data using existing function
@@ -1810,7 +1818,7 @@ class ResetConfirmationView(discord.ui.View):
                 save_persisted(persisted)
 
                 from integrations.sheets import reset_registered_roles_and_sheet
-                cleared_count = await reset_registered_roles_and_sheet(self.guild, None)
+                cleared_count = await reset_registered_roles_and_sheet(self.guild, None, report_progress)
 
                 embed = discord.Embed(
                     title="✅ Registration Reset Complete",
@@ -1823,7 +1831,7 @@ class ResetConfirmationView(discord.ui.View):
                 save_persisted(persisted)
 
                 from integrations.sheets import reset_checked_in_roles_and_sheet
-                cleared_count = await reset_checked_in_roles_and_sheet(self.guild, None)
+                cleared_count = await reset_checked_in_roles_and_sheet(self.guild, None, report_progress)
 
                 embed = discord.Embed(
                     title="✅ Check-In Reset Complete",
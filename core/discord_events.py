@@ -2,8 +2,12 @@
 
 import asyncio
 import logging
+import time
 import traceback
-from datetime import datetime  # Only needed for fromisoformat parsing
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
 from zoneinfo import ZoneInfo
 
 import discord
@@ -14,17 +18,24 @@ from config import (
     embed_from_cfg, update_gal_command_ids, get_log_channel_name, get_unified_channel_name, _FULL_CFG
 )
 from core.persistence import set_schedule, persisted, save_persisted
+from core.transition_scheduler import transition_scheduler
 from helpers.schedule_helpers import ScheduleHelper
 from core.events.handlers.screenshot_monitor import get_screenshot_monitor
 
 # In-memory caches for events
 scheduled_event_cache: dict = {}
-open_tasks: dict = {}
-close_tasks: dict = {}
+
+# Transitions firing later than this after their due time are treated as missed (e.g. during downtime)
+LATE_TRANSITION_SECONDS = 60
 
 # Track recent pings to prevent spam
 recent_pings: dict = {}  # guild_id -> timestamp
 
+# Deferred open/close work (re-render, log embed, ping cleanup) and its timings
+background_tasks: set = set()
+transition_timings: deque = deque(maxlen=50)
+PING_CLEANUP_DELAY = 5
+
 
 def match_event_type(name: str) -> str | None:
     """Match Discord event name to system type."""
@@ -38,19 +49,164 @@ def match_event_type(name: str) -> str | None:
     return None
 
 
+@dataclass
+class TransitionTiming:
+    """Milestones of one open/close transition, in seconds since it started."""
+
+    guild_id: int
+    system_type: str
+    action: str
+    due_lag: float  # how late the transition started relative to its scheduled time
+    started: float = field(default_factory=time.perf_counter)
+    state_saved: Optional[float] = None
+    ping_sent: Optional[float] = None
+    background_done: Optional[float] = None
+
+    def mark(self, milestone: str) -> None:
+        setattr(self, milestone, time.perf_counter() - self.started)
+
+    def to_dict(self) -> dict:
+        def ms(value):
+            return round(value * 1000, 1) if value is not None else None
+
+        return {
+            "guild_id": self.guild_id,
+            "transition": f"{self.system_type}_{self.action}",
+            "due_lag_ms": ms(self.due_lag),
+            "state_saved_ms": ms(self.state_saved),
+            "ping_sent_ms": ms(self.ping_sent),
+            "background_done_ms": ms(self.background_done),
+        }
+
+
+def _spawn_background(coro, timing: TransitionTiming) -> asyncio.Task:
+    """Run deferred transition work without holding up the caller."""
+
+    async def runner():
+        try:
+            await coro
+        except Exception as e:
+            logging.error(f"Deferred {timing.system_type} {timing.action} work failed for guild {timing.guild_id}: {e}")
+        finally:
+            timing.mark("background_done")
+            logging.info(f"Transition timing: {timing.to_dict()}")
+
+    task = asyncio.create_task(runner())
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+    return task
+
+
+async def _send_open_ping(guild: discord.Guild, system_type: str) -> Optional[discord.Message]:
+    """Ping the role that cares about this opening (if enabled), with spam prevention."""
+    unified_channel = discord.utils.get(guild.text_channels, name=get_unified_channel_name())
+    if not unified_channel:
+        return None
+
+    roles_config = _FULL_CFG.get("roles", {})
+    now_timestamp = discord.utils.utcnow().timestamp()
+
+    # Check if we recently pinged for this guild (within 30 seconds)
+    last_ping = recent_pings.get(guild.id, 0)
+    if now_timestamp - last_ping < 30:
+        logging.info(f"Skipping ping for {system_type} in {guild.name} - recently pinged")
+        return None
+
+    ping_msg = None
+    if system_type == "registration" and roles_config.get("ping_on_registration_open", True):
+        # Ping Angels role when registration opens
+        angel_role_name = roles_config.get("angel_role", "Angels")
+        angel_role = discord.utils.get(guild.roles, name=angel_role_name)
+        if angel_role:
+            ping_msg = await unified_channel.send(f"🎫 **Registration is now OPEN!** {angel_role.mention}")
+        else:
+            logging.warning(f"Angel role '{angel_role_name}' not found in guild {guild.name}")
+
+    elif system_type == "checkin" and roles_config.get("ping_on_checkin_open", True):
+        # Ping Registered role when check-in opens
+        registered_role_name = roles_config.get("registered_role", "Registered")
+        registered_role = discord.utils.get(guild.roles, name=registered_role_name)
+        if registered_role:
+            ping_msg = await unified_channel.send(f"✅ **Check-in is now OPEN!** {registered_role.mention}")
+        else:
+            logging.warning(f"Registered role '{registered_role_name}' not found in guild {guild.name}")
+
+    if ping_msg:
+        # Only the latest ping matters for spam prevention
+        recent_pings.clear()
+        recent_pings[guild.id] = now_timestamp
+    return ping_msg
+
+
+async def _log_transition(guild: discord.Guild, key: str, **kwargs) -> None:
+    log_channel = discord.utils.get(guild.text_channels, name=get_log_channel_name())
+    if log_channel:
+        await log_channel.send(embed=embed_from_cfg(key, **kwargs))
+
+
+async def _finish_open(guild: discord.Guild, system_type: str, open_time: datetime, is_scheduled_event: bool,
+                       ping_msg: Optional[discord.Message]) -> None:
+    """Deferred part of an opening: re-render, log embed, then ping cleanup."""
+    from core.components_traditional import update_unified_channel
+    try:
+        await update_unified_channel(guild)
+
+        if is_scheduled_event:
+            await _log_transition(
+                guild, "schedule_open",
+                type=system_type.capitalize(),
+                event=f"{system_type.capitalize()} Event",
+                open_ts=int(open_time.timestamp()),
+                close_str=""
+            )
+    finally:
+        if ping_msg:
+            # Delete ping message after a few seconds to avoid clutter, even if the steps above failed
+            await asyncio.sleep(PING_CLEANUP_DELAY)
+            try:
+                await ping_msg.delete()
+            except discord.NotFound:
+                pass
+
+
+async def _finish_close(guild: discord.Guild, system_type: str, close_time: datetime,
+                        is_scheduled_event: bool) -> None:
+    """Deferred part of a closing: re-render and log embed."""
+    from core.components_traditional import update_unified_channel
+    await update_unified_channel(guild)
+
+    if is_scheduled_event:
+        await _log_transition(
+            guild, "schedule_close",
+            type=system_type.capitalize(),
+            event=f"{system_type.capitalize()} Event",
+            close_ts=int(close_time.timestamp())
+        )
+
+
 async def schedule_system_open(
         bot,
         guild: discord.Guild,
         system_type: str,  # "registration" or "checkin"
         open_time: datetime,
-        is_scheduled_event: bool = True
-):
-    """Schedule a system to open at a specific time."""
+        is_scheduled_event: bool = True,
+        ping: bool = True
+) -> TransitionTiming:
+    """
+    Open a system at a specific time.
+    Returns once the state is saved and the ping is out; the channel
+    re-render, log embed and ping cleanup continue in the background.
+    With ping=False the role ping is skipped (used for overdue opens).
+    """
     now = discord.utils.utcnow()
     wait = (open_time - now).total_seconds()
     if wait > 0:
         await asyncio.sleep(wait)
 
+    timing = TransitionTiming(
+        guild.id, system_type, "open", max((discord.utils.utcnow() - open_time).total_seconds(), 0.0)
+    )
+    transition_timings.append(timing)
     guild_id = str(guild.id)
     if guild_id not in persisted:
         persisted[guild_id] = {}
@@ -68,81 +224,22 @@ async def schedule_system_open(
         persisted[guild_id]["checkin_open"] = True
 
     save_persisted(persisted)
+    timing.mark("state_saved")
 
-    # Update the unified channel with Components V2
-    from core.components_traditional import update_unified_channel
-    await update_unified_channel(guild)
-
-    # Log if scheduled event
-    if is_scheduled_event:
-        log_channel = discord.utils.get(guild.text_channels, name=get_log_channel_name())
-        if log_channel:
-            open_ts = int(open_time.timestamp())
-            embed = embed_from_cfg(
-                "schedule_open",
-                type=system_type.capitalize(),
-                event=f"{system_type.capitalize()} Event",
-                open_ts=open_ts,
-                close_str=""
-            )
-            await log_channel.send(embed=embed)
-
-    # Send role ping to unified channel (if enabled) - with spam prevention
     # Only ping if this is a NEW opening (not already open)
-    unified_channel = discord.utils.get(guild.text_channels, name=get_unified_channel_name())
-    if unified_channel and not was_already_open:
-        roles_config = _FULL_CFG.get("roles", {})
-        now_timestamp = discord.utils.utcnow().timestamp()
-
-        # Check if we recently pinged for this guild (within 30 seconds)
-        last_ping = recent_pings.get(guild.id, 0)
-        if now_timestamp - last_ping < 30:
-            logging.info(f"Skipping ping for {system_type} in {guild.name} - recently pinged")
-        else:
-            ping_sent = False
-
-            if system_type == "registration" and roles_config.get("ping_on_registration_open", True):
-                # Ping Angels role when registration opens
-                angel_role_name = roles_config.get("angel_role", "Angels")
-                angel_role = discord.utils.get(guild.roles, name=angel_role_name)
-                if angel_role:
-                    ping_msg = await unified_channel.send(f"🎫 **Registration is now OPEN!** {angel_role.mention}")
-                    ping_sent = True
-                    # Delete ping message after 5 seconds to avoid clutter
-                    await asyncio.sleep(5)
-                    try:
-                        await ping_msg.delete()
-                    except discord.NotFound:
-                        pass
-                else:
-                    logging.warning(f"Angel role '{angel_role_name}' not found in guild {guild.name}")
-
-            elif system_type == "checkin" and roles_config.get("ping_on_checkin_open", True):
-                # Ping Registered role when check-in opens
-                registered_role_name = roles_config.get("registered_role", "Registered")
-                registered_role = discord.utils.get(guild.roles, name=registered_role_name)
-                if registered_role:
-                    ping_msg = await unified_channel.send(f"✅ **Check-in is now OPEN!** {registered_role.mention}")
-                    ping_sent = True
-                    # Delete ping message after 5 seconds to avoid clutter
-                    await asyncio.sleep(5)
-                    try:
-                        await ping_msg.delete()
-                    except discord.NotFound:
-                        pass
-                else:
-                    logging.warning(f"Registered role '{registered_role_name}' not found in guild {guild.name}")
-
-            # Update last ping time if we sent a ping
-            if ping_sent:
-                recent_pings[guild.id] = now_timestamp
+    ping_msg = None
+    if ping and not was_already_open:
+        try:
+            ping_msg = await _send_open_ping(guild, system_type)
+        except Exception as e:
+            logging.warning(f"Failed to send {system_type} open ping in {guild.name}: {e}")
+        if ping_msg:
+            timing.mark("ping_sent")
 
-                # Clean up old entries (older than 5 minutes) to prevent memory leaks
-                cutoff = now_timestamp - 300  # 5 minutes
-                recent_pings.clear()  # Simple cleanup - clear all since we only care about recent pings
-                recent_pings[guild.id] = now_timestamp
+    _spawn_background(_finish_open(guild, system_type, open_time, is_scheduled_event, ping_msg), timing)
 
     logging.info(f"Opened {system_type} for guild {guild.id}")
+    return timing
 
 
 async def schedule_system_close(
@@ -151,13 +248,20 @@ async def schedule_system_close(
         system_type: str,  # "registration" or "checkin"
         close_time: datetime,
         is_scheduled_event: bool = True
-):
-    """Schedule a system to close at a specific time."""
+) -> TransitionTiming:
+    """
+    Close a system at a specific time.
+    Returns once the state is saved; the re-render and log embed follow in the background.
+    """
     now = discord.utils.utcnow()
     wait = (close_time - now).total_seconds()
     if wait > 0:
         await asyncio.sleep(wait)
 
+    timing = TransitionTiming(
+        guild.id, system_type, "close", max((discord.utils.utcnow() - close_time).total_seconds(), 0.0)
+    )
+    transition_timings.append(timing)
     guild_id = str(guild.id)
     if guild_id not in persisted:
         persisted[guild_id] = {}
@@ -172,25 +276,12 @@ async def schedule_system_close(
         persisted[guild_id]["checkin_open"] = False
 
     save_persisted(persisted)
+    timing.mark("state_saved")
 
-    # Update the unified channel with Components V2
-    from core.components_traditional import update_unified_channel
-    await update_unified_channel(guild)
-
-    # Log if scheduled event
-    if is_scheduled_event:
-        log_channel = discord.utils.get(guild.text_channels, name=get_log_channel_name())
-        if log_channel:
-            close_ts = int(close_time.timestamp())
-            embed = embed_from_cfg(
-                "schedule_close",
-                type=system_type.capitalize(),
-                event=f"{system_type.capitalize()} Event",
-                close_ts=close_ts
-            )
-            await log_channel.send(embed=embed)
+    _spawn_background(_finish_close(guild, system_type, close_time, is_scheduled_event), timing)
 
     logging.info(f"Closed {system_type} for guild {guild.id}")
+    return timing
 
 
 async def _handle_event_schedule(bot, event, is_edit: bool):
@@ -209,13 +300,6 @@ async def _handle_event_schedule(bot, event, is_edit: bool):
         return
     scheduled_event_cache[key] = (open_time, close_time)
 
-    # Cancel any existing tasks
-    for suffix, tasks in (("open", open_tasks), ("close", close_tasks)):
-        tkey = (guild.id, event.id, suffix)
-        if tkey in tasks and not tasks[tkey].done():
-            tasks[tkey].cancel()
-            del tasks[tkey]
-
     # Persist both times
     set_schedule(guild.id, f"{etype}_open", open_time.isoformat() if open_time else None)
     set_schedule(guild.id, f"{etype}_close", close_time.isoformat() if close_time else None)
@@ -233,20 +317,18 @@ async def _handle_event_schedule(bot, event, is_edit: bool):
 
     now = discord.utils.utcnow()
 
-    # Schedule open
+    # Schedule open (replaces any pending open for this system)
+    transition_scheduler.cancel(guild.id, etype, "open")
     if open_time and open_time > now:
-        open_tasks[(guild.id, event.id, "open")] = asyncio.create_task(
-            schedule_system_open(bot, guild, etype, open_time)
-        )
+        transition_scheduler.schedule(guild.id, etype, "open", open_time)
     elif open_time and open_time <= now:
         # Fire immediately
         await schedule_system_open(bot, guild, etype, now, is_scheduled_event=False)
 
     # Schedule close
+    transition_scheduler.cancel(guild.id, etype, "close")
     if close_time and close_time > now:
-        close_tasks[(guild.id, event.id, "close")] = asyncio.create_task(
-            schedule_system_close(bot, guild, etype, close_time)
-        )
+        transition_scheduler.schedule(guild.id, etype, "close", close_time)
     elif close_time and close_time <= now:
         # Fire immediately
         await schedule_system_close(bot, guild, etype, now, is_scheduled_event=False)
@@ -344,147 +426,6 @@ def register_discord_events(bot: commands.Bot):
                     else:
                         logging.warning(f"⚠️ Failed to setup onboard system for {guild.name}")
 
-                    # ----------------------------------------
-                    # 2d. Restore Scheduled Events (if any)
-                    # ----------------------------------------
-                    from core.persistence import get_schedule
-
-                    # Check for scheduled registration times
-                    reg_open_iso = get_schedule(guild.id, "registration_open")
-                    reg_close_iso = get_schedule(guild.id, "registration_close")
-
-                    if reg_open_iso:
-                        try:
-                            reg_open_time = datetime.fromisoformat(reg_open_iso).astimezone(ZoneInfo("UTC"))
-                            now = discord.utils.utcnow()
-
-                            if reg_open_time > now:
-                                # Schedule for future
-                                key = (guild.id, "registration", "open")
-                                open_tasks[key] = asyncio.create_task(
-                                    schedule_system_open(bot, guild, "registration", reg_open_time)
-                                )
-                                logging.info(f"Restored registration open schedule for {guild.name}")
-                            elif reg_open_time <= now:
-                                # Past event - check if already processed
-                                guild_id = str(guild.id)
-                                if guild_id not in persisted:
-                                    persisted[guild_id] = {}
-
-                                current_state = persisted[guild_id].get("registration_open", False)
-                                if not current_state:
-                                    # Event hasn't been processed yet
-                                    persisted[guild_id]["registration_open"] = True
-                                    save_persisted(persisted)
-                                    logging.info(f"Applied past registration open for {guild.name}")
-                                else:
-                                    # Already processed, clear the schedule to prevent loops
-                                    set_schedule(guild.id, "registration_open", None)
-                                    logging.info(
-                                        f"Registration already open for {guild.name} - cleared schedule to prevent loops")
-                        except Exception as e:
-                            logging.error(f"Failed to restore registration open schedule: {e}")
-
-                    if reg_close_iso:
-                        try:
-                            reg_close_time = datetime.fromisoformat(reg_close_iso).astimezone(ZoneInfo("UTC"))
-                            now = discord.utils.utcnow()
-
-                            if reg_close_time > now:
-                                # Schedule for future
-                                key = (guild.id, "registration", "close")
-                                close_tasks[key] = asyncio.create_task(
-                                    schedule_system_close(bot, guild, "registration", reg_close_time)
-                                )
-                                logging.info(f"Restored registration close schedule for {guild.name}")
-                            elif reg_close_time <= now:
-                                # Past event - check if already processed
-                                guild_id = str(guild.id)
-                                if guild_id not in persisted:
-                                    persisted[guild_id] = {}
-
-                                current_state = persisted[guild_id].get("registration_open", False)
-                                if current_state:
-                                    # Event hasn't been processed yet - should be closed
-                                    persisted[guild_id]["registration_open"] = False
-                                    save_persisted(persisted)
-                                    logging.info(f"Applied past registration close for {guild.name}")
-                                else:
-                                    # Already processed, clear the schedule to prevent loops
-                                    set_schedule(guild.id, "registration_close", None)
-                                    logging.info(
-                                        f"Registration already closed for {guild.name} - cleared schedule to prevent loops")
-                        except Exception as e:
-                            logging.error(f"Failed to restore registration close schedule: {e}")
-
-                    # Check for scheduled check-in times
-                    ci_open_iso = get_schedule(guild.id, "checkin_open")
-                    ci_close_iso = get_schedule(guild.id, "checkin_close")
-
-                    if ci_open_iso:
-                        try:
-                            ci_open_time = datetime.fromisoformat(ci_open_iso).astimezone(ZoneInfo("UTC"))
-                            now = discord.utils.utcnow()
-
-                            if ci_open_time > now:
-                                # Schedule for future
-                                key = (guild.id, "checkin", "open")
-                                open_tasks[key] = asyncio.create_task(
-                                    schedule_system_open(bot, guild, "checkin", ci_open_time)
-                                )
-                                logging.info(f"Restored check-in open schedule for {guild.name}")
-                            elif ci_open_time <= now:
-                                # Past event - check if already processed
-                                guild_id = str(guild.id)
-                                if guild_id not in persisted:
-                                    persisted[guild_id] = {}
-
-                                current_state = persisted[guild_id].get("checkin_open", False)
-                                if not current_state:
-                                    # Event hasn't been processed yet
-                                    persisted[guild_id]["checkin_open"] = True
-                                    save_persisted(persisted)
-                                    logging.info(f"Applied past check-in open for {guild.name}")
-                                else:
-                                    # Already processed, clear the schedule to prevent loops
-                                    set_schedule(guild.id, "checkin_open", None)
-                                    logging.info(
-                                        f"Check-in already open for {guild.name} - cleared schedule to prevent loops")
-                        except Exception as e:
-                            logging.error(f"Failed to restore check-in open schedule: {e}")
-
-                    if ci_close_iso:
-                        try:
-                            ci_close_time = datetime.fromisoformat(ci_close_iso).astimezone(ZoneInfo("UTC"))
-                            now = discord.utils.utcnow()
-
-                            if ci_close_time > now:
-                                # Schedule for future
-                                key = (guild.id, "checkin", "close")
-                                close_tasks[key] = asyncio.create_task(
-                                    schedule_system_close(bot, guild, "checkin", ci_close_time)
-                                )
-                                logging.info(f"Restored check-in close schedule for {guild.name}")
-                            elif ci_close_time <= now:
-                                # Past event - check if already processed
-                                guild_id = str(guild.id)
-                                if guild_id not in persisted:
-                                    persisted[guild_id] = {}
-
-                                current_state = persisted[guild_id].get("checkin_open", False)
-                                if current_state:
-                                    # Event hasn't been processed yet - should be closed
-                                    persisted[guild_id]["checkin_open"] = False
-                                    save_persisted(persisted)
-                                    logging.info(f"Applied past check-in close for {guild.name}")
-                                else:
-                                    # Already processed, clear the schedule to prevent loops
-                                    set_schedule(guild.id, "checkin_close", None)
-                                    logging.info(
-                                        f"Check-in already closed for {guild.name} - cleared schedule to prevent loops")
-                        except Exception as e:
-                            logging.error(f"Failed to restore check-in close schedule: {e}")
-
                     # ----------------------------------------
                     # 2d. Process Waitlist (if any spots available)
                     # ----------------------------------------
@@ -514,6 +455,23 @@ def register_discord_events(bot: commands.Bot):
             # 4. START BACKGROUND TASKS
             # ============================================
 
+            # Start the open/close scheduler; transitions missed while offline fire right away
+            async def run_transition(guild_id: int, system_type: str, action: str, due: datetime):
+                guild = bot.get_guild(guild_id)
+                if not guild:
+                    logging.warning(f"Dropping scheduled {system_type} {action} for unknown guild {guild_id}")
+                    return
+                on_time = (discord.utils.utcnow() - due).total_seconds() < LATE_TRANSITION_SECONDS
+                if action == "open":
+                    # An open missed while offline still happens, but without pinging Angels/Registered
+                    await schedule_system_open(
+                        bot, guild, system_type, due, is_scheduled_event=on_time, ping=on_time
+                    )
+                else:
+                    await schedule_system_close(bot, guild, system_type, due, is_scheduled_event=on_time)
+
+            transition_scheduler.start(run_transition)
+
             # Start cache refresh loop
             try:
                 from integrations.sheets import cache_refresh_loop
@@ -557,12 +515,7 @@ def register_discord_events(bot: commands.Bot):
             return
 
         guild = event.guild
-        # Cancel tasks
-        for suffix, tasks in (("open", open_tasks), ("close", close_tasks)):
-            key = (guild.id, event.id, suffix)
-            if key in tasks and not tasks[key].done():
-                tasks[key].cancel()
-                del tasks[key]
+        transition_scheduler.cancel(guild.id, etype)
         scheduled_event_cache.pop((guild.id, event.id), None)
 
         # Clear persisted schedules
@@ -610,19 +563,8 @@ def register_discord_events(bot: commands.Bot):
         """Called when the bot is removed from a guild."""
         logging.info(f"Removed from guild: {old_guild.name} ({old_guild.id})")
 
-        # Cancel any scheduled tasks for this guild
-        guild_id = old_guild.id
-        for key in list(open_tasks.keys()):
-            if key[0] == guild_id:
-                if not open_tasks[key].done():
-                    open_tasks[key].cancel()
-                del open_tasks[key]
-
-        for key in list(close_tasks.keys()):
-            if key[0] == guild_id:
-                if not close_tasks[key].done():
-                    close_tasks[key].cancel()
-                del close_tasks[key]
+        # Cancel any scheduled transitions for this guild
+        transition_scheduler.cancel(old_guild.id)
 
     @bot.event
     async def on_member_join(member: discord.Member):
@@ -5,8 +5,9 @@ Monitors configured channels for image attachments and triggers batch processing
 """
 
 import asyncio
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 import logging
 
 import discord
@@ -17,6 +18,19 @@ from config import _FULL_CFG
 
 log = logging.getLogger(__name__)
 
+BatchKey = Tuple[int, str]
+
+
+@dataclass
+class _PendingBatch:
+    """Screenshots collected for a single (guild, round) pair."""
+
+    guild: Optional[discord.Guild]
+    round_name: str
+    opened_at: float
+    images: List[Dict] = field(default_factory=list)
+    timer: Optional[asyncio.Task] = None
+
 
 class ScreenshotMonitor:
     """Monitors Discord channels for screenshot submissions."""
@@ -39,10 +53,18 @@ class ScreenshotMonitor:
             "📸 Screenshot detected! Processing in {batch_window}s..."
         )
 
-        # Batch processing
+        # Batch processing - one pending batch per (guild, round)
         self.batch_window = self.settings.get("batch_window_seconds", 30)
-        self.batch_queue: List[Dict] = []
-        self.batch_timer = None
+        self.batch_max_wait = self.settings.get("batch_max_wait_seconds", 120)
+        self.batch_max_size = self.settings.get("batch_max_size", 8)
+        self.max_concurrent_batches = self.settings.get("max_concurrent_batches", 2)
+        self.pending_batches: Dict[BatchKey, _PendingBatch] = {}
+
+        # Bounded hand-off to the batch workers (applies backpressure when full)
+        self.batch_work_queue: asyncio.Queue = asyncio.Queue(
+            maxsize=self.settings.get("batch_queue_size", 32)
+        )
+        self.batch_workers: List[asyncio.Task] = []
 
         # Notification channel (lazy load)
         self.notification_channel = None
@@ -95,17 +117,20 @@ class ScreenshotMonitor:
         # Send confirmation to user
         await self._send_confirmation(message)
 
-        # Add images to batch queue
-        for attachment in image_attachments:
-            self.batch_queue.append({
+        # Add images to the batch for this guild/round
+        round_name = self._extract_round_name(message)
+        images = [
+            {
                 "url": attachment.url,
                 "discord_message_id": message.id,
                 "discord_channel_id": message.channel.id,
                 "discord_author_id": str(message.author.id),
                 "channel_name": channel_name,  # Pass channel name for classifier
-                "round_name": self._extract_round_name(message),
+                "round_name": round_name,
                 "lobby_number": self._extract_lobby_number(message)
-            })
+            }
+            for attachment in image_attachments
+        ]
 
         # Notify staff
         await self._send_notification(
@@ -115,31 +140,108 @@ class ScreenshotMonitor:
             "screenshot_detected"
         )
 
-        # Start/reset batch timer
-        await self._reset_batch_timer(message.guild)
+        await self._enqueue_images(message.guild, round_name, images)
 
-    async def _reset_batch_timer(self, guild: discord.Guild):
-        """Reset or start batch processing timer."""
-        # Cancel existing timer
-        if self.batch_timer:
-            self.batch_timer.cancel()
+    def _batch_key(self, guild: Optional[discord.Guild], round_name: str) -> BatchKey:
+        """Build the pending-batch key for a guild/round pair."""
+        return (guild.id if guild else 0, round_name)
 
-        # Start new timer
-        async def process_batch_callback():
-            log.info(f"Batch timer expired - processing {len(self.batch_queue)} images")
-            await self._process_batch(guild)
+    async def _enqueue_images(
+        self,
+        guild: Optional[discord.Guild],
+        round_name: str,
+        images: List[Dict]
+    ):
+        """Add images to their guild/round batch and flush or schedule it."""
+        loop = asyncio.get_running_loop()
+        key = self._batch_key(guild, round_name)
 
-        # Create asyncio task for delayed processing
-        self.batch_timer = asyncio.create_task(
-            asyncio.sleep(self.batch_window)
-        )
-        self.batch_timer.add_done_callback(
-            lambda t: asyncio.create_task(process_batch_callback())
-        )
+        pending = self.pending_batches.get(key)
+        if pending is None:
+            pending = _PendingBatch(guild=guild, round_name=round_name, opened_at=loop.time())
+            self.pending_batches[key] = pending
 
-    async def _process_batch(self, guild: discord.Guild):
-        """Process queued screenshots as a batch."""
-        if not self.batch_queue:
+        pending.images.extend(images)
+
+        if len(pending.images) >= self.batch_max_size:
+            log.info(
+                f"Batch {key} reached {len(pending.images)} images - flushing immediately"
+            )
+            await self._flush_batch(key)
+        else:
+            self._schedule_flush(key)
+
+    def _schedule_flush(self, key: BatchKey):
+        """
+        (Re)start the flush timer for a pending batch.
+
+        Each new screenshot extends the quiet window, but never past
+        ``batch_max_wait`` seconds after the first screenshot of the batch.
+        """
+        pending = self.pending_batches.get(key)
+        if pending is None:
+            return
+
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        deadline = min(now + self.batch_window, pending.opened_at + self.batch_max_wait)
+
+        if pending.timer:
+            pending.timer.cancel()
+
+        pending.timer = asyncio.create_task(self._flush_after(key, max(0.0, deadline - now)))
+
+    async def _flush_after(self, key: BatchKey, delay: float):
+        """Flush a pending batch once its timer expires."""
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            return
+
+        log.info(f"Batch timer expired for {key}")
+        await self._flush_batch(key)
+
+    async def _flush_batch(self, key: BatchKey):
+        """Detach a pending batch and hand it to the worker pool."""
+        pending = self.pending_batches.pop(key, None)
+        if pending is None or not pending.images:
+            return
+
+        if pending.timer and pending.timer is not asyncio.current_task():
+            pending.timer.cancel()
+        pending.timer = None
+
+        self._ensure_batch_workers()
+        await self.batch_work_queue.put(pending)
+
+    def _ensure_batch_workers(self):
+        """Start (or restart) the bounded pool of batch workers."""
+        self.batch_workers = [task for task in self.batch_workers if not task.done()]
+        while len(self.batch_workers) < self.max_concurrent_batches:
+            self.batch_workers.append(asyncio.create_task(self._batch_worker()))
+
+    async def _batch_worker(self):
+        """Process batches from the work queue until cancelled."""
+        while True:
+            pending = await self.batch_work_queue.get()
+            try:
+                log.info(
+                    f"Processing {len(pending.images)} images for round {pending.round_name}"
+                )
+                await self._process_batch(pending.guild, pending.images, pending.round_name)
+            except Exception as e:
+                log.error(f"Batch worker error: {e}", exc_info=True)
+            finally:
+                self.batch_work_queue.task_done()
+
+    async def _process_batch(
+        self,
+        guild: Optional[discord.Guild],
+        images: List[Dict],
+        round_name: str
+    ):
+        """Process a batch of queued screenshots."""
+        if not images:
             return
 
         # Get tournament ID from guild or config
@@ -149,20 +251,17 @@ class ScreenshotMonitor:
         batch_processor = get_batch_processor()
 
         await self._send_notification(
-            f"⏳ Processing {len(self.batch_queue)} screenshots...",
+            f"⏳ Processing {len(images)} screenshots...",
             "batch_processing"
         )
 
         result = await batch_processor.process_batch(
-            images=self.batch_queue,
+            images=images,
             tournament_id=tournament_id,
             guild_id=str(guild.id) if guild else "default",
-            round_name=self._detect_round_name()
+            round_name=round_name
         )
 
-        # Clear queue
-        self.batch_queue = []
-
         # Send notification with results
         if result.get("success", False):
             completed = result.get("completed", 0)
@@ -233,23 +332,6 @@ class ScreenshotMonitor:
 
         return 1  # Default to lobby 1
 
-    def _detect_round_name(self) -> str:
-        """Detect round name from batch queue."""
-        if not self.batch_queue:
-            return "UNKNOWN"
-
-        # Use most common round name in batch
-        round_names = [img.get("round_name", "UNKNOWN") for img in self.batch_queue]
-        # Filter out unknown
-        round_names = [r for r in round_names if r != "UNKNOWN"]
-
-        if round_names:
-            # Return most common
-            from collections import Counter
-            return Counter(round_names).most_common(1)[0][0]
-
-        return "UNKNOWN"
-
     async def _send_notification(
         self,
         message: str,
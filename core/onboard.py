@@ -614,9 +614,11 @@ async def setup_onboard_channel(guild: discord.Guild, client: discord.Client = N
             else:
                 logging.info(f"Onboard embed already exists in {main_channel.name} and is up to date")
 
-        # Rebuild pending submissions from review channel history
-        logging.info(f"Rebuilding pending submissions from {review_channel.name}...")
-        await rebuild_pending_submissions_from_history(review_channel)
+        # Load pending submissions from storage; seed them from history the first time
+        if OnboardManager.load_pending_submissions(guild.id) is None:
+            logging.info(f"Seeding pending submissions from {review_channel.name} history...")
+            await rebuild_pending_submissions_from_history(review_channel)
+            OnboardManager.mark_submissions_seeded(guild.id)
 
         # Register persistent views for onboard system
         if client:
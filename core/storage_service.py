@@ -103,6 +103,17 @@ class UnifiedStorageService:
                         );
                     """)
                     
+                    # Create onboard_submissions table (primary key indexes lookups by guild)
+                    cursor.execute("""
+                        CREATE TABLE IF NOT EXISTS onboard_submissions (
+                            guild_id TEXT NOT NULL,
+                            user_id TEXT NOT NULL,
+                            data JSONB,
+                            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                            PRIMARY KEY (guild_id, user_id)
+                        );
+                    """)
+                    
                     # Create indexes for better performance
                     cursor.execute("""
                         CREATE INDEX IF NOT EXISTS idx_persisted_views_updated_at 
@@ -150,6 +161,17 @@ class UnifiedStorageService:
                     );
                 """)
                 
+                # Create onboard_submissions table (primary key indexes lookups by guild)
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS onboard_submissions (
+                        guild_id TEXT NOT NULL,
+                        user_id TEXT NOT NULL,
+                        data TEXT NOT NULL,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        PRIMARY KEY (guild_id, user_id)
+                    );
+                """)
+                
                 # Create indexes for better performance
                 cursor.execute("""
                     CREATE INDEX IF NOT EXISTS idx_persisted_views_updated_at 
@@ -338,6 +360,59 @@ class UnifiedStorageService:
         
         self._execute_with_fallback("save_waitlist_data", postgres_save, sqlite_save)
     
+    # Onboard Submission Operations
+    
+    def get_onboard_submissions(self, guild_id: str) -> Dict[str, Any]:
+        """Load a guild's pending onboard submissions keyed by user ID."""
+        def postgres_get(conn):
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT user_id, data FROM onboard_submissions WHERE guild_id = %s", (guild_id,))
+                return {
+                    user_id: json.loads(data) if isinstance(data, str) else data
+                    for user_id, data in cursor.fetchall()
+                }
+        
+        def sqlite_get(conn):
+            cursor = conn.cursor()
+            cursor.execute("SELECT user_id, data FROM onboard_submissions WHERE guild_id = ?", (guild_id,))
+            return {row["user_id"]: json.loads(row["data"]) for row in cursor.fetchall()}
+        
+        return self._execute_with_fallback("get_onboard_submissions", postgres_get, sqlite_get)
+    
+    def save_onboard_submission(self, guild_id: str, user_id: str, data: Dict[str, Any]) -> None:
+        """Insert or replace one pending onboard submission."""
+        def postgres_save(conn):
+            with conn.cursor() as cursor:
+                cursor.execute("""
+                    INSERT INTO onboard_submissions (guild_id, user_id, data) 
+                    VALUES (%s, %s, %s) 
+                    ON CONFLICT (guild_id, user_id) 
+                    DO UPDATE SET data = EXCLUDED.data
+                """, (guild_id, user_id, json.dumps(data)))
+        
+        def sqlite_save(conn):
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT OR REPLACE INTO onboard_submissions (guild_id, user_id, data) 
+                VALUES (?, ?, ?)
+            """, (guild_id, user_id, json.dumps(data)))
+        
+        self._execute_with_fallback("save_onboard_submission", postgres_save, sqlite_save)
+    
+    def delete_onboard_submission(self, guild_id: str, user_id: str) -> None:
+        """Remove a resolved onboard submission."""
+        def postgres_delete(conn):
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    "DELETE FROM onboard_submissions WHERE guild_id = %s AND user_id = %s", (guild_id, user_id)
+                )
+        
+        def sqlite_delete(conn):
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM onboard_submissions WHERE guild_id = ? AND user_id = ?", (guild_id, user_id))
+        
+        self._execute_with_fallback("delete_onboard_submission", postgres_delete, sqlite_delete)
+    
     # Generic Operations
     
     def get_data(self, table: str, key: str) -> Optional[Any]:
@@ -354,7 +429,8 @@ class UnifiedStorageService:
                 row = cursor.fetchone()
                 if row:
                     data = row[0]
-                    return data if isinstance(data, dict) else json.loads(data)
+                    # psycopg2 already decodes JSONB into dicts and lists
+                    return json.loads(data) if isinstance(data, str) else data
                 return None
         
         def sqlite_get(conn):
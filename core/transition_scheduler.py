@@ -0,0 +1,234 @@
+# core/transition_scheduler.py
+"""
+Single-timer scheduler for registration/check-in open and close transitions.
+
+Transitions live in a heap ordered by due time and are persisted through the
+storage service, so one background task sleeps only until the next deadline
+and pending transitions survive restarts. Rescheduling or cancelling leaves
+the old heap entry in place; it is skipped when it reaches the top.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from datetime import UTC, datetime
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from .persistence import persisted
+from .storage_service import get_storage_service
+
+STORAGE_TABLE = "persisted_views"
+STORAGE_KEY = "scheduled_transitions"
+
+# Re-check the wall clock at least this often in case it jumps
+MAX_SLEEP_SECONDS = 3600.0
+
+TransitionKey = Tuple[int, str, str]  # (guild_id, system_type, action)
+TransitionHandler = Callable[[int, str, str, datetime], Awaitable[None]]
+
+
+class TransitionScheduler:
+    """Heap of pending open/close transitions served by one background task."""
+
+    def __init__(self, storage=None, clock: Callable[[], float] = time.time):
+        self._storage = storage
+        self._clock = clock
+        self._heap: List[Tuple[float, int, TransitionKey]] = []
+        self._entries: Dict[TransitionKey, Tuple[float, int]] = {}
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._running: set = set()
+        self._handler: Optional[TransitionHandler] = None
+        self._save_pending = False
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _get_storage(self):
+        if self._storage is None:
+            self._storage = get_storage_service()
+        return self._storage
+
+    def _save(self) -> None:
+        data = [
+            {"guild_id": key[0], "system_type": key[1], "action": key[2], "due": due}
+            for key, (due, _) in self._entries.items()
+        ]
+        try:
+            self._get_storage().set_data(STORAGE_TABLE, STORAGE_KEY, data)
+        except Exception as e:
+            logging.error(f"Failed to persist scheduled transitions: {e}")
+
+    def _save_soon(self) -> None:
+        """Coalesce saves from a burst of schedule/cancel calls into one write."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._save()
+            return
+        if not self._save_pending:
+            self._save_pending = True
+            loop.call_soon(self._flush)
+
+    def _flush(self) -> None:
+        self._save_pending = False
+        self._save()
+
+    def load(self) -> int:
+        """
+        Load pending transitions from storage.
+        On first run, seeds them from the schedules already kept in persisted data.
+        """
+        try:
+            data = self._get_storage().get_data(STORAGE_TABLE, STORAGE_KEY)
+        except Exception as e:
+            # Leave the stored list alone so a failed read can't wipe it
+            logging.error(f"Failed to load scheduled transitions: {e}")
+            return len(self._entries)
+
+        if data is None:
+            data = _schedules_from_persisted()
+            logging.info(f"Migrated {len(data)} schedules from persisted data into the transition scheduler")
+
+        for item in data:
+            self._push((int(item["guild_id"]), item["system_type"], item["action"]), float(item["due"]))
+        self._save()
+        return len(self._entries)
+
+    # ------------------------------------------------------------------
+    # Heap maintenance
+    # ------------------------------------------------------------------
+
+    def _push(self, key: TransitionKey, due: float) -> None:
+        seq = next(self._seq)
+        self._entries[key] = (due, seq)
+        heapq.heappush(self._heap, (due, seq, key))
+        # Drop superseded entries once they dominate the heap
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [(d, s, k) for k, (d, s) in self._entries.items()]
+            heapq.heapify(self._heap)
+
+    def _peek(self) -> Optional[Tuple[float, int, TransitionKey]]:
+        while self._heap:
+            due, seq, key = self._heap[0]
+            if self._entries.get(key) == (due, seq):
+                return self._heap[0]
+            heapq.heappop(self._heap)
+        return None
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def schedule(self, guild_id: int, system_type: str, action: str, when: datetime) -> None:
+        """Schedule (or reschedule) a guild's open/close transition."""
+        key = (int(guild_id), system_type, action)
+        self._push(key, when.timestamp())
+        self._save_soon()
+        self._wakeup.set()
+
+    def cancel(self, guild_id: int, system_type: Optional[str] = None, action: Optional[str] = None) -> int:
+        """Cancel matching transitions for a guild; returns how many were removed."""
+        matches = [
+            key for key in self._entries
+            if key[0] == int(guild_id)
+            and (system_type is None or key[1] == system_type)
+            and (action is None or key[2] == action)
+        ]
+        for key in matches:
+            del self._entries[key]
+        if matches:
+            self._save_soon()
+            self._wakeup.set()
+        return len(matches)
+
+    def pending(self) -> List[Tuple[TransitionKey, datetime]]:
+        """Pending transitions ordered by due time."""
+        return [
+            (key, datetime.fromtimestamp(due, UTC))
+            for key, (due, _) in sorted(self._entries.items(), key=lambda item: item[1])
+        ]
+
+    def start(self, handler: TransitionHandler) -> None:
+        """Load persisted transitions and start the timer task (idempotent)."""
+        self._handler = handler
+        if self._task and not self._task.done():
+            return
+        count = self.load()
+        logging.info(f"Transition scheduler started with {count} pending transitions")
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._save_pending:
+            self._flush()
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    # ------------------------------------------------------------------
+    # Timer loop
+    # ------------------------------------------------------------------
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            top = self._peek()
+            if top is None:
+                await self._wakeup.wait()
+                continue
+
+            delay = top[0] - self._clock()
+            if delay > 0:
+                timer = asyncio.get_running_loop().call_later(min(delay, MAX_SLEEP_SECONDS), self._wakeup.set)
+                try:
+                    await self._wakeup.wait()
+                finally:
+                    timer.cancel()
+                continue
+
+            due_now = []
+            now = self._clock()
+            while (top := self._peek()) is not None and top[0] <= now:
+                due, _, key = heapq.heappop(self._heap)
+                del self._entries[key]
+                due_now.append((key, due))
+            self._save()
+
+            for (guild_id, system_type, action), due in due_now:
+                task = asyncio.create_task(self._fire(guild_id, system_type, action, due))
+                self._running.add(task)
+                task.add_done_callback(self._running.discard)
+
+    async def _fire(self, guild_id: int, system_type: str, action: str, due: float) -> None:
+        try:
+            await self._handler(guild_id, system_type, action, datetime.fromtimestamp(due, UTC))
+        except Exception as e:
+            logging.error(f"Scheduled {system_type} {action} failed for guild {guild_id}: {e}", exc_info=True)
+
+
+def _schedules_from_persisted() -> List[Dict]:
+    """Pending transitions recorded as *_schedule entries in persisted data."""
+    data = []
+    for guild_id, guild_data in persisted.items():
+        if not str(guild_id).isdigit() or not isinstance(guild_data, dict):
+            continue
+        for system_type in ("registration", "checkin"):
+            for action in ("open", "close"):
+                iso = guild_data.get(f"{system_type}_{action}_schedule")
+                if not iso:
+                    continue
+                try:
+                    due = datetime.fromisoformat(iso).timestamp()
+                except ValueError:
+                    logging.warning(f"Ignoring invalid {system_type} {action} schedule for guild {guild_id}: {iso}")
+                    continue
+                data.append({"guild_id": int(guild_id), "system_type": system_type, "action": action, "due": due})
+    return data
+
+
+transition_scheduler = TransitionScheduler()
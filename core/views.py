@@ -14,10 +14,11 @@ from core.components_traditional import update_unified_channel
 from core.persistence import (
     get_event_mode_for_guild, )
 from helpers import (
-    RoleManager, Validators,
+    RoleManager,
     ErrorHandler, ValidationError
 )
 from helpers.embed_helpers import log_error
+from helpers.registration_ledger import registration_ledger
 from integrations.sheets import (
     find_or_register_user, get_sheet_for_guild, retry_until_successful, cache_lock, sheet_cache
 )
@@ -72,10 +73,8 @@ async def complete_registration(
     # 5) Check if user is already in waitlist (for updating their info)
     existing_waitlist_position = await WaitlistManager.get_waitlist_position(gid, discord_tag)
 
-    # 6) Validate capacity using helper
-    capacity_error = await Validators.validate_registration_capacity(
-        gid, team_name, exclude_discord_tag=discord_tag
-    )
+    # 6) Validate capacity and claim a slot; the claim is released once registration resolves
+    capacity_error = await registration_ledger.reserve(gid, discord_tag, team_name)
 
     if capacity_error:
         # Check if it's a max teams error with available teams
@@ -452,6 +451,9 @@ async def complete_registration(
             'ign': ign,
             'team_name': team_name
         }
+    finally:
+        # A completed write is counted in the cache; a failed one gives its slot back
+        registration_ledger.release(gid, discord_tag)
 
     # If return_result is True, just return the result dictionary
     if return_result:
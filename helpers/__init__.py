@@ -9,6 +9,7 @@ from .environment_helpers import EnvironmentHelper
 from .error_handler import ErrorHandler
 from .role_helpers import RoleManager
 from .schedule_helpers import ScheduleHelper
+from .registration_ledger import RegistrationLedger
 from .sheet_helpers import SheetOperations
 from .validation_helpers import Validators, ValidationError
 from .waitlist_helpers import WaitlistManager
@@ -18,6 +19,7 @@ __all__ = [
     'EmbedHelper',
     'EnvironmentHelper',
     'ErrorHandler',
+    'RegistrationLedger',
     'RoleManager',
     'ScheduleHelper',
     'SheetOperations',
@@ -2,7 +2,7 @@
 
 import logging
 from datetime import datetime, timezone
-from typing import List
+from typing import Callable, List, Optional, Tuple
 
 import discord
 
@@ -58,88 +58,113 @@ class EmbedHelper:
         return "🟩" * filled_length + "⬜" * (length - filled_length)
 
     @staticmethod
-    def build_checkin_list_lines(checked_in_users: List[tuple], mode: str) -> List[str]:
+    def render_player_line(tag: str, user_data: tuple, index: Optional[int] = None) -> str:
+        """Render one player's check-in line; index numbers the line in normal mode."""
+        status = "🟢" if str(user_data[3]).upper() == "TRUE" else "🔴"
+        if index is None:
+            return f"{status} {tag} | {user_data[1]}"
+        return f"{status} [{index:02d}] {tag} | {user_data[1]}"
+
+    @staticmethod
+    def build_checkin_list_sections(
+            checked_in_users: List[tuple],
+            mode: str,
+            render_line: Optional[Callable[[str, tuple, Optional[int]], str]] = None
+    ) -> List[Tuple[str, List[str]]]:
         """
-        Build formatted lines showing ALL registered users with check-in status.
+        Group registered users into (header, player lines) sections in display order.
         Shows ready teams first, then non-ready teams.
         """
-
-        lines = []
+        render_line = render_line or EmbedHelper.render_player_line
 
         def is_true(v):
             return str(v).upper() == "TRUE"
 
-        if mode == "doubleup":
-            # Group by team
-            teams = {}
-            for tag, user_data in checked_in_users:
-                # user_data is the full tuple (row, ign, reg, ci, team, alt, pronouns)
-                team_name = user_data[4] if len(user_data) > 4 else "No Team"
-                if not team_name:
-                    team_name = "No Team"
-
-                if team_name not in teams:
-                    teams[team_name] = []
-                teams[team_name].append((tag, user_data))
-
-            # Separate teams into ready and not ready
-            ready_teams = []
-            not_ready_teams = []
-
-            for team_name, members in teams.items():
-                # Check if team has 2+ members AND all are checked in
-                has_enough_members = len(members) >= 2
-                all_checked_in = all(is_true(member[1][3]) for member in members)
-                is_ready = has_enough_members and all_checked_in
-
-                if is_ready:
-                    ready_teams.append((team_name, members))
-                else:
-                    not_ready_teams.append((team_name, members))
-
-            # Sort each group by team name
-            ready_teams.sort(key=lambda x: x[0].lower())
-            not_ready_teams.sort(key=lambda x: x[0].lower())
-
-            # Combine ready teams first, then not ready teams
-            all_teams = ready_teams + not_ready_teams
-
-            # Display all teams in order (ready first, then not ready)
-            for team_name, members in all_teams:
-                # Check if team is ready for the checkmark
-                has_enough_members = len(members) >= 2
-                all_checked_in = all(is_true(member[1][3]) for member in members)
-                is_ready = has_enough_members and all_checked_in
-
-                team_check = "✅ " if is_ready else ""
-
+        if mode != "doubleup":
+            # Normal mode - show all registered users with check-in status
+            return [(
+                "**📋 Player Check-In Status**",
+                [render_line(tag, tpl, i) for i, (tag, tpl) in enumerate(checked_in_users, 1)]
+            )]
+
+        # Group by team
+        teams = {}
+        for tag, user_data in checked_in_users:
+            # user_data is the full tuple (row, ign, reg, ci, team, alt, pronouns)
+            team_name = user_data[4] if len(user_data) > 4 else "No Team"
+            if not team_name:
+                team_name = "No Team"
+            teams.setdefault(team_name, []).append((tag, user_data))
+
+        # Separate teams into ready and not ready
+        ready_teams = []
+        not_ready_teams = []
+
+        for team_name, members in teams.items():
+            # Check if team has 2+ members AND all are checked in
+            is_ready = len(members) >= 2 and all(is_true(member[1][3]) for member in members)
+            (ready_teams if is_ready else not_ready_teams).append((team_name, members))
+
+        # Sort each group by team name
+        ready_teams.sort(key=lambda x: x[0].lower())
+        not_ready_teams.sort(key=lambda x: x[0].lower())
+
+        sections = []
+        for teams_group, team_check in ((ready_teams, "✅ "), (not_ready_teams, "")):
+            for team_name, members in teams_group:
                 if team_name == "No Team":
                     team_display = f"{team_check}**Unassigned Players**"
                 else:
                     team_display = f"{team_check}**{team_name}**"
+                sections.append((team_display, [render_line(tag, tpl, None) for tag, tpl in members]))
 
-                lines.append(f"{team_display}")
-                lines.append("```css")
-
-                for tag, tpl in members:
-                    ign = tpl[1]
-                    is_checked_in = is_true(tpl[3])
-                    status = "🟢" if is_checked_in else "🔴"
-                    lines.append(f"{status} {tag} | {ign}")
-
-                lines.append("```")
+        return sections
 
-        else:
-            # Normal mode - show all registered users with check-in status
-            lines.append("**📋 Player Check-In Status**")
+    @staticmethod
+    def build_checkin_list_lines(checked_in_users: List[tuple], mode: str) -> List[str]:
+        """
+        Build formatted lines showing ALL registered users with check-in status.
+        Shows ready teams first, then non-ready teams.
+        """
+        lines = []
+        for header, player_lines in EmbedHelper.build_checkin_list_sections(checked_in_users, mode):
+            lines.append(header)
             lines.append("```css")
-
-            for i, (tag, tpl) in enumerate(checked_in_users, 1):
-                ign = tpl[1]
-                is_checked_in = is_true(tpl[3])
-                status = "🟢" if is_checked_in else "🔴"
-                lines.append(f"{status} [{i:02d}] {tag} | {ign}")
-
+            lines.extend(player_lines)
             lines.append("```")
-
         return lines
+
+    @staticmethod
+    def paginate_sections(sections: List[Tuple[str, List[str]]], limit: int = 4000) -> List[str]:
+        """
+        Split list sections into embed descriptions of at most ``limit`` characters.
+        A section split across pages repeats its header with "(cont.)".
+        """
+        fence_open, fence_close = "```css", "```"
+        pages: List[str] = []
+        current: List[str] = []
+        size = 0
+
+        def flush():
+            nonlocal current, size
+            if current:
+                pages.append("\n".join(current))
+            current, size = [], 0
+
+        for header, player_lines in sections:
+            block = [header, fence_open]
+            block_size = len(header) + len(fence_open) + len(fence_close) + 3
+            if size and size + block_size + (len(player_lines[0]) + 1 if player_lines else 0) > limit:
+                flush()
+            for line in player_lines:
+                if size + block_size + len(line) + 1 > limit and len(block) > 2:
+                    current.extend(block + [fence_close])
+                    flush()
+                    block = [f"{header} (cont.)", fence_open]
+                    block_size = len(block[0]) + len(fence_open) + len(fence_close) + 3
+                block.append(line)
+                block_size += len(line) + 1
+            current.extend(block + [fence_close])
+            size += block_size
+        flush()
+        return pages
@@ -10,8 +10,12 @@ from config import (
     get_onboard_main_channel, get_onboard_review_channel,
     get_onboard_approval_role, get_allowed_roles
 )
+from core.storage_service import get_storage_service
 from helpers.role_helpers import RoleManager
 
+# persisted_views key listing guilds whose pending submissions have been indexed
+SEEDED_GUILDS_KEY = "onboard_submissions_seeded"
+
 
 def utcnow() -> datetime:
     """Return a timezone-aware UTC timestamp."""
@@ -23,15 +27,30 @@ class OnboardManager:
 
     # Track pending submissions: {user_id: submission_data}
     _pending_submissions: Dict[int, Dict] = {}
+    _storage_service = None
+
+    @classmethod
+    def _get_storage_service(cls):
+        """Get the storage service instance."""
+        if cls._storage_service is None:
+            cls._storage_service = get_storage_service()
+        return cls._storage_service
 
     @classmethod
     def add_pending_submission(cls, user_id: int, submission_data: Dict) -> None:
-        """Add a user to pending submissions."""
-        cls._pending_submissions[user_id] = {
+        """Add a user to pending submissions and write it through to storage."""
+        submission = {
             **submission_data,
             'timestamp': utcnow().isoformat(),
             'user_id': user_id
         }
+        cls._pending_submissions[user_id] = submission
+        guild_id = submission.get('guild_id')
+        if guild_id is not None:
+            try:
+                cls._get_storage_service().save_onboard_submission(str(guild_id), str(user_id), submission)
+            except Exception as e:
+                logging.error(f"Failed to persist onboard submission for user {user_id}: {e}")
         logging.info(f"Added pending onboard submission for user {user_id}")
 
     @classmethod
@@ -39,9 +58,50 @@ class OnboardManager:
         """Remove and return a user's pending submission."""
         submission = cls._pending_submissions.pop(user_id, None)
         if submission:
+            guild_id = submission.get('guild_id')
+            if guild_id is not None:
+                try:
+                    cls._get_storage_service().delete_onboard_submission(str(guild_id), str(user_id))
+                except Exception as e:
+                    logging.error(f"Failed to delete persisted onboard submission for user {user_id}: {e}")
             logging.info(f"Removed pending onboard submission for user {user_id}")
         return submission
 
+    @classmethod
+    def load_pending_submissions(cls, guild_id: int) -> Optional[int]:
+        """
+        Load a guild's pending submissions from storage.
+
+        Returns:
+            Number loaded, or None if the guild's submissions were never indexed
+            and still need seeding from channel history.
+        """
+        storage = cls._get_storage_service()
+        try:
+            seeded = storage.get_data("persisted_views", SEEDED_GUILDS_KEY) or []
+            if str(guild_id) not in seeded:
+                return None
+            stored = storage.get_onboard_submissions(str(guild_id))
+        except Exception as e:
+            logging.error(f"Failed to load pending onboard submissions for guild {guild_id}: {e}")
+            return 0
+
+        for user_id, submission in stored.items():
+            cls._pending_submissions[int(user_id)] = submission
+        logging.info(f"Loaded {len(stored)} pending onboard submissions for guild {guild_id}")
+        return len(stored)
+
+    @classmethod
+    def mark_submissions_seeded(cls, guild_id: int) -> None:
+        """Record that a guild's pending submissions now live in storage."""
+        storage = cls._get_storage_service()
+        try:
+            seeded = storage.get_data("persisted_views", SEEDED_GUILDS_KEY) or []
+            if str(guild_id) not in seeded:
+                storage.set_data("persisted_views", SEEDED_GUILDS_KEY, seeded + [str(guild_id)])
+        except Exception as e:
+            logging.error(f"Failed to mark onboard submissions seeded for guild {guild_id}: {e}")
+
     @classmethod
     def has_pending_submission(cls, user_id: int) -> bool:
         """Check if user has a pending submission."""
@@ -59,7 +119,7 @@ class OnboardManager:
 
     @classmethod
     def clear_pending_submissions(cls) -> None:
-        """Clear all pending submissions (useful for bot restart)."""
+        """Clear in-memory pending submissions (stored submissions are kept)."""
         cls._pending_submissions.clear()
         logging.info("Cleared all pending onboard submissions")
 
@@ -283,15 +343,13 @@ async def setup_channel_permissions(channel: discord.TextChannel, channel_type:
 
 async def rebuild_pending_submissions_from_history(review_channel: discord.TextChannel) -> None:
     """
-    Rebuild pending submissions state from review channel message history.
-    This is useful when the bot restarts and loses in-memory state.
+    Recover pending submissions from the last 100 review channel messages.
+    Used once to seed the persisted index and by the manual refresh command;
+    submissions already pending are kept as they are.
     """
     try:
         logging.info("Rebuilding pending onboard submissions from channel history...")
 
-        # Clear existing state
-        OnboardManager.clear_pending_submissions()
-
         # Look through recent messages in review channel
         async for message in review_channel.history(limit=100):
             # Skip non-bot messages
@@ -331,11 +389,12 @@ async def rebuild_pending_submissions_from_history(review_channel: discord.TextC
                         if has_active_buttons:
                             break
 
-                    if has_active_buttons:
+                    if has_active_buttons and not OnboardManager.has_pending_submission(user_id):
                         # This is still a pending submission
                         submission_data = {
                             'message_id': message.id,
                             'channel_id': message.channel.id,
+                            'guild_id': review_channel.guild.id,
                             'timestamp': message.created_at.isoformat()
                         }
                         OnboardManager.add_pending_submission(user_id, submission_data)
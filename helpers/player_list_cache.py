@@ -0,0 +1,108 @@
+# helpers/player_list_cache.py
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import discord
+
+from .embed_helpers import EmbedHelper
+
+# Discord caps embed descriptions at 4096 characters
+PAGE_CHAR_LIMIT = 4000
+
+
+@dataclass
+class PlayerListPages:
+    """Rendered player list pages plus the counts shown in the footer."""
+
+    pages: List[str]
+    total_registered: int = 0
+    total_checked_in: int = 0
+    team_count: int = 0
+
+    def footer(self, mode: str, page: int) -> str:
+        footer_parts = [f"👤 Players: {self.total_registered}"]
+        if mode == "doubleup":
+            footer_parts.append(f"👥 Teams: {self.team_count}")
+        footer_parts.append(f"✅ Checked-In: {self.total_checked_in}")
+        if self.total_registered > 0:
+            footer_parts.append(f"📊 {self.total_checked_in / self.total_registered * 100:.0f}%")
+        if len(self.pages) > 1:
+            footer_parts.append(f"Page {page + 1}/{len(self.pages)}")
+        return " | ".join(footer_parts)
+
+    def embed(self, title: str, mode: str, page: int = 0) -> discord.Embed:
+        embed = discord.Embed(
+            title=f"{title} ({self.total_registered})",
+            description=self.pages[page] if self.pages else "No registered players found.",
+            color=discord.Color.blurple()
+        )
+        embed.set_footer(text=self.footer(mode, page))
+        return embed
+
+
+@dataclass
+class _GuildEntry:
+    mode: str
+    users: Dict[str, tuple]
+    # (line index, discord_tag, user tuple) -> rendered line
+    lines: Dict[Tuple[Optional[int], str, tuple], str] = field(default_factory=dict)
+    result: Optional[PlayerListPages] = None
+
+
+class PlayerListCache:
+    """
+    Per-guild cache of the rendered registered-player list.
+
+    Serving a list only compares the sheet cache against the snapshot the
+    pages were built from; when rows changed, only those rows are re-rendered
+    before the pages are re-laid out.
+    """
+
+    def __init__(self, page_char_limit: int = PAGE_CHAR_LIMIT):
+        self.page_char_limit = page_char_limit
+        self._entries: Dict[str, _GuildEntry] = {}
+        self.lines_rendered = 0
+
+    def get(self, guild_id: str, mode: str, users: Dict[str, tuple]) -> PlayerListPages:
+        """
+        Pages for the guild's current sheet cache users.
+        Call while holding cache_lock so users cannot change mid-render.
+        """
+        entry = self._entries.get(guild_id)
+        if entry is not None and entry.mode == mode and entry.users == users:
+            return entry.result
+
+        old_lines = entry.lines if entry is not None and entry.mode == mode else {}
+        new_lines = {}
+
+        def render_line(tag: str, user_data: tuple, index: Optional[int]) -> str:
+            key = (index, tag, user_data)
+            line = old_lines.get(key)
+            if line is None:
+                line = EmbedHelper.render_player_line(tag, user_data, index)
+                self.lines_rendered += 1
+            new_lines[key] = line
+            return line
+
+        registered = [(tag, tpl) for tag, tpl in users.items() if str(tpl[2]).upper() == "TRUE"]
+        sections = EmbedHelper.build_checkin_list_sections(registered, mode, render_line)
+
+        result = PlayerListPages(
+            pages=EmbedHelper.paginate_sections(sections, self.page_char_limit) if registered else [],
+            total_registered=len(registered),
+            total_checked_in=sum(1 for _, tpl in registered if str(tpl[3]).upper() == "TRUE"),
+            team_count=len({tpl[4] if len(tpl) > 4 and tpl[4] else "No Team" for _, tpl in registered}),
+        )
+        self._entries[guild_id] = _GuildEntry(mode=mode, users=dict(users), lines=new_lines, result=result)
+        return result
+
+    def invalidate(self, guild_id: Optional[str] = None) -> None:
+        """Drop cached pages for one guild, or for all guilds."""
+        if guild_id is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(guild_id, None)
+
+
+player_list_cache = PlayerListCache()
@@ -1,6 +1,5 @@
 """Poll notification system helpers for mass DM functionality."""
 
-import asyncio
 import logging
 import re
 import time
@@ -10,6 +9,8 @@ from typing import List, Dict, Callable, Optional, Tuple
 import discord
 
 from config import get_angel_role, get_poll_config
+from utils.dm_dispatcher import DMDispatcher, DispatchResult
+from utils.dm_tracker import dm_tracker
 
 
 logger = logging.getLogger(__name__)
@@ -123,9 +124,9 @@ class PollNotifier:
         
         # Configuration
         self.config = get_poll_config()
-        self.batch_size = self.config.get("batch_size", 10)
-        self.batch_delay = self.config.get("batch_delay", 1.0)
-        self.progress_update_interval = self.config.get("progress_update_interval", 5)
+        self.dm_concurrency = self.config.get("dm_concurrency", 8)
+        self.dm_rate_per_second = self.config.get("dm_rate_per_second", 20.0)
+        self.progress_update_interval = self.config.get("progress_update_interval", 2.0)
         
         # Get target role
         self.target_role_name = self.config.get("target_role", "Angels")
@@ -284,36 +285,12 @@ class PollNotifier:
         
         return embed
     
-    async def send_dm_to_user(self, member: discord.Member, dm_view: discord.ui.LayoutView = None, embed: discord.Embed = None, view: discord.ui.View = None) -> bool:
-        """Send DM to a single user using LayoutView. Returns True if successful."""
-        try:
-            # Prefer LayoutView if provided
-            if dm_view:
-                await member.send(view=dm_view)
-            elif embed and view:
-                # Fallback to old embed+view system
-                await member.send(embed=embed, view=view)
-            else:
-                # No content to send
-                logger.warning(f"No content provided for DM to {member}")
-                return False
-            return True
-        except discord.Forbidden:
-            logger.warning(f"Could not DM {member} (DMs disabled or bot blocked)")
-            self.failed_users.append((member, "DMs disabled"))
-            return False
-        except discord.HTTPException as e:
-            logger.warning(f"HTTP error sending DM to {member}: {e}")
-            self.failed_users.append((member, f"HTTP error: {str(e)[:50]}"))
-            return False
-        except Exception as e:
-            logger.error(f"Unexpected error sending DM to {member}: {e}")
-            self.failed_users.append((member, f"Unexpected error"))
-            return False
-    
     async def send_to_all_angels(self, progress_callback: Callable[[discord.Embed, int, int, float], None]) -> Tuple[int, int, List[Tuple[discord.Member, str]]]:
         """
         Send DMs to all Angels with progress tracking.
+
+        Delivery goes through the shared ``DMDispatcher``, so sends run
+        concurrently at the fastest pace Discord's rate limits allow.
         
         Args:
             progress_callback: Function to call with progress updates
@@ -334,49 +311,29 @@ class PollNotifier:
         
         # Create DM LayoutView (Components V2 with markdown support)
         dm_view = PollDMLayoutView(self.poll_link, self.config)
-        
-        # Process in batches
-        current = 0
-        
+
+        async def report(result: DispatchResult) -> None:
+            self.success_count = len(result.sent)
+            self.failed_count = len(result.failed)
+            progress_embed = self.create_progress_embed(result.completed, self.total_count, result.elapsed)
+            await progress_callback(progress_embed, result.completed, self.total_count, result.elapsed)
+            self.last_progress_update = result.elapsed
+
+        dispatcher = DMDispatcher(
+            concurrency=self.dm_concurrency,
+            rate_per_second=self.dm_rate_per_second,
+            progress_interval=self.progress_update_interval,
+        )
         try:
-            for i in range(0, len(members), self.batch_size):
-                batch = members[i:i + self.batch_size]
-                
-                # Send DMs concurrently within batch
-                tasks = []
-                for member in batch:
-                    task = asyncio.create_task(self.send_dm_to_user(member, dm_view=dm_view))
-                    tasks.append(task)
-                
-                # Wait for batch to complete
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-                
-                # Count results
-                for j, result in enumerate(results):
-                    current += 1
-                    if isinstance(result, bool) and result:
-                        self.success_count += 1
-                    else:
-                        self.failed_count += 1
-                
-                # Update progress if needed
-                elapsed = time.time() - self.start_time
-                if (current % self.progress_update_interval == 0 or 
-                    current == self.total_count or 
-                    elapsed - self.last_progress_update >= 2.0):
-                    
-                    progress_embed = self.create_progress_embed(current, self.total_count, elapsed)
-                    await progress_callback(progress_embed, current, self.total_count, elapsed)
-                    self.last_progress_update = elapsed
-                
-                # Rate limiting delay
-                if i + self.batch_size < len(members):  # Don't delay after last batch
-                    await asyncio.sleep(self.batch_delay)
-        
+            result = await dispatcher.dispatch(members, lambda member: dm_tracker.send(member, view=dm_view), report)
         except Exception as e:
             logger.error(f"Error during mass DM process: {e}")
             raise
-        
+
+        self.success_count = len(result.sent)
+        self.failed_count = len(result.failed)
+        self.failed_users.extend(result.failed)
+
         total_time = time.time() - self.start_time
         logger.info(f"Mass DM completed: {self.success_count} success, {self.failed_count} failed, {total_time:.1f}s total")
         
@@ -0,0 +1,84 @@
+# helpers/registration_ledger.py
+
+import asyncio
+import logging
+from typing import Dict, List, Optional
+
+from integrations.sheets import cache_lock, sheet_cache
+
+from .validation_helpers import ValidationError, Validators
+
+
+class RegistrationLedger:
+    """
+    Per-guild ledger of registration slots claimed by in-flight registrations.
+
+    A registration reserves its player (and team) slot before the sheet write
+    and releases it once the registration resolves, so concurrent registrations
+    are checked against each other without holding the global cache lock.
+    """
+
+    def __init__(self):
+        self._locks: Dict[str, asyncio.Lock] = {}
+        # guild_id -> {discord_tag: team_name or None}
+        self._pending: Dict[str, Dict[str, Optional[str]]] = {}
+
+    def guild_lock(self, guild_id: str) -> asyncio.Lock:
+        """Lock serializing slot decisions for one guild."""
+        lock = self._locks.get(guild_id)
+        if lock is None:
+            lock = self._locks[guild_id] = asyncio.Lock()
+        return lock
+
+    async def in_flight_teams(self, guild_id: str, exclude_discord_tag: Optional[str] = None) -> List[Optional[str]]:
+        """
+        Teams (None for solo) of claims not yet reflected in the cache.
+        Call while holding guild_lock so the answer stays valid.
+        """
+        pending = self._pending.get(guild_id, {})
+        async with cache_lock:
+            users = sheet_cache["users"]
+            # Claims whose write already reached the cache are counted there
+            return [
+                team for tag, team in pending.items()
+                if tag != exclude_discord_tag and not (tag in users and str(users[tag][2]).upper() == "TRUE")
+            ]
+
+    async def reserve(
+            self,
+            guild_id: str,
+            discord_tag: str,
+            team_name: Optional[str] = None
+    ) -> Optional[ValidationError]:
+        """
+        Claim a slot for discord_tag if capacity allows.
+        Returns the capacity error instead when the claim is refused.
+        """
+        async with self.guild_lock(guild_id):
+            pending_teams = await self.in_flight_teams(guild_id, exclude_discord_tag=discord_tag)
+            error = await Validators.validate_registration_capacity(
+                guild_id, team_name, exclude_discord_tag=discord_tag, pending_teams=pending_teams
+            )
+            if error is None:
+                self.hold(guild_id, discord_tag, team_name)
+            return error
+
+    def hold(self, guild_id: str, discord_tag: str, team_name: Optional[str] = None) -> None:
+        """Record a claim the caller already checked under guild_lock."""
+        self._pending.setdefault(guild_id, {})[discord_tag] = team_name
+
+    def release(self, guild_id: str, discord_tag: str) -> None:
+        """
+        Drop a claim once its registration finished or failed (no-op if already released).
+        A write that reached the cache is counted there from then on.
+        """
+        if discord_tag in self._pending.get(guild_id, {}):
+            del self._pending[guild_id][discord_tag]
+            logging.debug(f"Registration slot released for {discord_tag} in guild {guild_id}")
+
+    def pending_count(self, guild_id: str) -> int:
+        """Number of slots currently claimed by in-flight registrations."""
+        return len(self._pending.get(guild_id, {}))
+
+
+registration_ledger = RegistrationLedger()
@@ -1,7 +1,7 @@
 # helpers/validation_helpers.py
 
 import logging
-from typing import Optional
+from typing import List, Optional
 
 import discord
 
@@ -31,12 +31,16 @@ class Validators:
     async def validate_registration_capacity(
             guild_id: str,
             team_name: Optional[str] = None,
-            exclude_discord_tag: Optional[str] = None
+            exclude_discord_tag: Optional[str] = None,
+            pending_teams: Optional[List[Optional[str]]] = None
     ) -> Optional[ValidationError]:
         """
         Validate if registration is within capacity limits.
         Properly handles team limits and suggests existing teams when max teams reached.
+        pending_teams lists the teams (None for solo) of slots already reserved
+        by in-flight registrations that the cache doesn't show yet.
         """
+        pending_teams = pending_teams or []
         mode = get_event_mode_for_guild(guild_id)
         cfg = get_sheet_settings(mode)
         max_players = cfg.get("max_players", 0)
@@ -44,7 +48,7 @@ class Validators:
         # Get current registration count
         total_registered = await SheetOperations.count_by_criteria(
             guild_id, registered=True
-        )
+        ) + len(pending_teams)
 
         # Exclude current user if updating
         if exclude_discord_tag:
@@ -79,6 +83,17 @@ class Validators:
                             team_exists = True
                             team_count = team_member_counts[team_lower]["count"]
 
+            for pending_team in pending_teams:
+                if not pending_team:
+                    continue
+                team_lower = pending_team.lower()
+                if team_lower not in team_member_counts:
+                    team_member_counts[team_lower] = {"count": 0, "original": pending_team}
+                team_member_counts[team_lower]["count"] += 1
+                if team_lower == team_name.lower():
+                    team_exists = True
+                    team_count = team_member_counts[team_lower]["count"]
+
             # Exclude current user if they're already on this team
             if exclude_discord_tag:
                 user_data = await SheetOperations.get_user_data(exclude_discord_tag, guild_id)
@@ -1,5 +1,6 @@
 # helpers/waitlist_helpers.py
 
+import asyncio
 import json
 import logging
 import os
@@ -13,8 +14,10 @@ from config import embed_from_cfg, get_sheet_settings, get_log_channel_name
 from core.persistence import get_event_mode_for_guild
 from core.storage_service import get_storage_service
 from helpers.error_handler import ErrorHandler
+from helpers.registration_ledger import registration_ledger
 from helpers.role_helpers import RoleManager
-from integrations.sheets import find_or_register_user, cache_lock, sheet_cache, refresh_sheet_cache
+from integrations.sheets import register_users_batch, cache_lock, sheet_cache
+from utils.dm_dispatcher import DMDispatcher
 
 
 class WaitlistError(Exception):
@@ -365,11 +368,84 @@ class WaitlistManager:
                 raise
             raise WaitlistError(f"Failed to update waitlist entry: {e}")
 
+    @staticmethod
+    def _select_promotions(
+            waitlist: List[Dict],
+            available_spots: int,
+            mode: str,
+            team_counts: Dict[str, int],
+            max_per_team: int,
+            max_teams: int
+    ) -> List[Dict]:
+        """
+        Choose every waitlist entry that can be promoted into available_spots.
+
+        Normal mode takes the queue in order. Double-up repeats the pairing
+        priorities for each pick against the counts so far: a waitlisted pair
+        that fits an existing or new team, then an individual joining or
+        creating a team, then a solo player. team_counts maps lowercased team
+        names to their registered (or reserved) members and is updated in place.
+        """
+        if available_spots <= 0:
+            return []
+        if mode != "doubleup":
+            return waitlist[:available_spots]
+
+        def fits(team_lower: str, needed: int) -> bool:
+            if team_lower in team_counts:
+                return max_per_team - team_counts[team_lower] >= needed
+            return len(team_counts) < max_teams
+
+        remaining = list(waitlist)
+        selected = []
+        while available_spots > 0 and remaining:
+            pick = []
+
+            # Priority 1: team pairs if 2+ spots available
+            if available_spots >= 2:
+                team_groups = {}
+                for entry in remaining:
+                    if entry.get("team_name"):
+                        team_groups.setdefault(entry["team_name"].lower(), []).append(entry)
+                for team_lower, members in team_groups.items():
+                    if len(members) >= 2 and fits(team_lower, 2):
+                        pick = members[:2]
+                        break
+
+            # Priority 2: individuals joining or creating a team
+            if not pick:
+                for entry in remaining:
+                    if entry.get("team_name") and fits(entry["team_name"].lower(), 1):
+                        pick = [entry]
+                        break
+
+            # Priority 3: solo players without teams
+            if not pick:
+                for entry in remaining:
+                    if not entry.get("team_name"):
+                        pick = [entry]
+                        break
+
+            if not pick:
+                break
+
+            for entry in pick:
+                remaining.remove(entry)
+                if entry.get("team_name"):
+                    team_lower = entry["team_name"].lower()
+                    team_counts[team_lower] = team_counts.get(team_lower, 0) + 1
+            selected.extend(pick)
+            available_spots -= len(pick)
+
+        return selected
+
     @staticmethod
     async def process_waitlist(guild: discord.Guild) -> List[Dict]:
         """
         Process the waitlist with smart team pairing and priority logic.
-        Validates team existence and capacity before registering.
+        Selects everyone who fits in one pass and registers them with a single
+        batch sheet write; slots left open by failed rows are refilled by
+        another pass. Role grants and DMs then go out concurrently.
         """
         if not guild:
             raise ValueError("Guild is required")
@@ -379,8 +455,7 @@ class WaitlistManager:
 
         try:
             from helpers.sheet_helpers import SheetOperations
-            from core.views import WaitlistRegistrationDMView
-            from utils.utils import hyperlink_lolchess_profile  # Add import
+            from utils.utils import hyperlink_lolchess_profile
 
             guild_id = str(guild.id)
             mode = get_event_mode_for_guild(guild_id)
@@ -389,236 +464,147 @@ class WaitlistManager:
             max_per_team = cfg.get("max_per_team", 2)
             max_teams = max_players // max_per_team
 
-            # Keep processing while there are spots and waitlist entries
+            members = {}
+            # A round whose promotions fail or find the member gone leaves slots open; the next round refills them
             while True:
-                # Check available capacity
-                current_registered = await SheetOperations.count_by_criteria(
-                    guild_id, registered=True
-                )
-                available_spots = max_players - current_registered
-
-                print(f"[WAITLIST] Available spots: {available_spots}")
+                # Decide and claim every promotion at once so concurrent registrations can't take the same slots
+                async with registration_ledger.guild_lock(guild_id):
+                    current_registered = await SheetOperations.count_by_criteria(
+                        guild_id, registered=True
+                    )
+                    pending_teams = await registration_ledger.in_flight_teams(guild_id)
+                    available_spots = max_players - current_registered - len(pending_teams)
+
+                    print(f"[WAITLIST] Available spots: {available_spots}")
+
+                    if available_spots <= 0:
+                        print(f"[WAITLIST] At capacity, stopping")
+                        break
+
+                    all_data = WaitlistManager._load_waitlist_data()
+                    if guild_id not in all_data or not all_data[guild_id]["waitlist"]:
+                        print(f"[WAITLIST] No entries in waitlist")
+                        break
+
+                    waitlist = all_data[guild_id]["waitlist"]
+                    print(f"[WAITLIST] Processing {len(waitlist)} waitlist entries")
+
+                    # Members who left can't be promoted, so they must not take a slot
+                    present = []
+                    for entry in waitlist:
+                        member = guild.get_member(entry["member_id"])
+                        if member:
+                            members[entry["discord_tag"]] = member
+                            present.append(entry)
+                        else:
+                            logging.warning(f"Member {entry['discord_tag']} left server, removing from waitlist")
+
+                    team_counts = {}
+                    if mode == "doubleup":
+                        async with cache_lock:
+                            for tpl in sheet_cache["users"].values():
+                                if str(tpl[2]).upper() == "TRUE" and len(tpl) > 4 and tpl[4]:
+                                    team_lower = tpl[4].lower()
+                                    team_counts[team_lower] = team_counts.get(team_lower, 0) + 1
+                        for team in pending_teams:
+                            if team:
+                                team_counts[team.lower()] = team_counts.get(team.lower(), 0) + 1
 
-                if available_spots <= 0:
-                    print(f"[WAITLIST] At capacity, stopping")
-                    break
+                    to_register = WaitlistManager._select_promotions(
+                        present, available_spots, mode, team_counts, max_per_team, max_teams
+                    )
 
-                # Get current waitlist
-                all_data = WaitlistManager._load_waitlist_data()
-                if guild_id not in all_data or not all_data[guild_id]["waitlist"]:
-                    print(f"[WAITLIST] No entries in waitlist")
-                    break
+                    # Remove selected users (and anyone who left) from the waitlist FIRST
+                    remaining = [entry for entry in present if entry not in to_register]
+                    if len(remaining) != len(waitlist):
+                        all_data[guild_id]["waitlist"] = remaining
+                        WaitlistManager._save_waitlist_data(all_data)
 
-                waitlist = all_data[guild_id]["waitlist"]
-                print(f"[WAITLIST] Processing {len(waitlist)} waitlist entries")
-
-                # Track who we'll register in this iteration
-                to_register = []
-
-                # In double-up mode, apply smart prioritization
-                if mode == "doubleup":
-                    # Get current team status
-                    team_member_counts = {}
-                    async with cache_lock:
-                        for tag, tpl in sheet_cache["users"].items():
-                            if str(tpl[2]).upper() == "TRUE" and len(tpl) > 4 and tpl[4]:
-                                team_lower = tpl[4].lower()
-                                if team_lower not in team_member_counts:
-                                    team_member_counts[team_lower] = []
-                                team_member_counts[team_lower].append(tag)
-
-                    num_existing_teams = len(team_member_counts)
-
-                    # Priority 1: Check for team pairs if 2+ spots available
-                    if available_spots >= 2:
-                        print("[WAITLIST] Checking for team pairs...")
-
-                        # Group waitlist by team name
-                        team_groups = {}
-                        for entry in waitlist:
-                            team = entry.get("team_name")
-                            if team:
-                                team_lower = team.lower()
-                                if team_lower not in team_groups:
-                                    team_groups[team_lower] = []
-                                team_groups[team_lower].append(entry)
-
-                        # Look for teams with 2+ waitlisted members
-                        for team_lower, team_members in team_groups.items():
-                            if len(team_members) >= 2:
-                                # Check if this team exists or can be created
-                                team_exists = team_lower in team_member_counts
-                                current_count = len(team_member_counts.get(team_lower, []))
-
-                                if team_exists:
-                                    # Team exists - check if there's room for both
-                                    spots_in_team = max_per_team - current_count
-                                    if spots_in_team >= 2:
-                                        print(
-                                            f"[WAITLIST] Found team pair for existing team '{team_lower}' - registering both")
-                                        to_register = team_members[:2]
-                                        break
-                                else:
-                                    # Team doesn't exist - check if we can create new team
-                                    if num_existing_teams < max_teams:
-                                        print(
-                                            f"[WAITLIST] Found team pair for new team '{team_lower}' - registering both")
-                                        to_register = team_members[:2]
-                                        break
-
-                    # Priority 2: Check for individuals joining existing teams
                     if not to_register:
-                        print("[WAITLIST] Checking for individuals to join existing teams...")
+                        print("[WAITLIST] No suitable candidates found")
+                        break
 
-                        for entry in waitlist:
-                            team = entry.get("team_name")
-                            if team:
-                                team_lower = team.lower()
-
-                                # Check if team exists and has space
-                                if team_lower in team_member_counts:
-                                    current_count = len(team_member_counts[team_lower])
-                                    if current_count < max_per_team:
-                                        print(f"[WAITLIST] Found user to complete existing team '{team}'")
-                                        to_register = [entry]
-                                        break
-                                else:
-                                    # Team doesn't exist - check if we can create it
-                                    if num_existing_teams < max_teams:
-                                        print(f"[WAITLIST] Found user to create new team '{team}'")
-                                        to_register = [entry]
-                                        break
-
-                    # Priority 3: Solo players without teams (if space for new teams)
-                    if not to_register:
-                        print("[WAITLIST] Checking for solo players...")
-
-                        for entry in waitlist:
-                            if not entry.get("team_name"):
-                                # Solo player - can register if there's space
-                                print(f"[WAITLIST] Found solo player")
-                                to_register = [entry]
-                                break
-
-                else:
-                    # Normal mode - just take first in line
-                    print("[WAITLIST] Normal mode - taking first person in queue")
-                    to_register = [waitlist[0]]
-
-                # If we have no one to register, stop
-                if not to_register:
-                    print("[WAITLIST] No suitable candidates found")
-                    break
+                    for entry in to_register:
+                        registration_ledger.hold(guild_id, entry["discord_tag"], entry.get("team_name"))
 
-                # Remove selected users from waitlist FIRST
-                for user in to_register:
-                    waitlist.remove(user)
-                WaitlistManager._save_waitlist_data(all_data)
+                try:
+                    print(f"[WAITLIST] Registering {len(to_register)} users in sheet...")
+                    rows, failures = await register_users_batch(guild_id, to_register)
+                finally:
+                    for entry in to_register:
+                        registration_ledger.release(guild_id, entry["discord_tag"])
+
+                for discord_tag, reg_error in failures:
+                    print(f"[WAITLIST] Registration error: {reg_error}")
+                    await ErrorHandler.log_warning(
+                        guild,
+                        f"Failed to auto-register {discord_tag} from waitlist: {reg_error}",
+                        "Waitlist Processing"
+                    )
+
+                registered_users.extend(entry for entry in to_register if entry["discord_tag"] in rows)
+                if not failures:
+                    # Everyone selected took their slot, so nothing was left open
+                    break
 
-                # Register each selected user
-                for next_user in to_register:
-                    print(f"[WAITLIST] Processing user: {next_user['discord_tag']}")
-
-                    # Get member object
-                    member = guild.get_member(next_user["member_id"])
-                    if not member:
-                        logging.warning(f"Member {next_user['discord_tag']} left server, skipping")
-                        print(f"[WAITLIST] Member not found, skipping")
-                        continue
-
-                    try:
-                        # Register in sheet
-                        print(f"[WAITLIST] Registering user in sheet...")
-                        row = await find_or_register_user(
-                            next_user["discord_tag"],
-                            next_user["ign"],
-                            guild_id=guild_id,
-                            team_name=next_user.get("team_name"),
-                            alt_igns=next_user.get("alt_igns"),
-                            pronouns=next_user.get("pronouns")
-                        )
-
-                        # Update additional fields
-                        updates = {}
-                        if next_user.get("pronouns"):
-                            updates[cfg['pronouns_col']] = next_user["pronouns"]
-                        if next_user.get("alt_igns"):
-                            updates[cfg['alt_ign_col']] = next_user["alt_igns"]
-                        if mode == "doubleup" and next_user.get("team_name"):
-                            updates[cfg['team_col']] = next_user["team_name"]
-
-                        if updates:
-                            await SheetOperations.batch_update_cells(guild_id, updates, row)
-
-                        # Add registered role
-                        print(f"[WAITLIST] Adding registered role...")
-                        await RoleManager.add_role(member, "Registered")
-
-                        # HYPERLINK THE IGN - THIS WAS MISSING!
-                        print(f"[WAITLIST] Creating hyperlink for IGN...")
-                        await hyperlink_lolchess_profile(next_user["discord_tag"], guild_id)
-
-                        # Send DM notification
-                        print(f"[WAITLIST] Sending DM notification...")
-                        try:
-                            # Clear previous DMs first
-                            from utils.utils import clear_user_dms
-                            deleted = await clear_user_dms(member, guild.me)
-                            if deleted > 0:
-                                logging.debug(f"Cleared {deleted} previous DMs for {next_user['discord_tag']}")
-
-                            # Send new DM with channel button
-                            from core.views import WaitlistRegistrationDMView
-                            dm_embed = embed_from_cfg("waitlist_registered")
-                            dm_view = WaitlistRegistrationDMView(guild)
-                            await member.send(embed=dm_embed, view=dm_view)
-                        except discord.Forbidden:
-                            logging.debug(f"Could not DM {next_user['discord_tag']} - DMs disabled")
-                        except Exception as dm_error:
-                            logging.warning(f"Failed to DM {next_user['discord_tag']}: {dm_error}")
-
-                        # Log to bot-log channel
-                        log_channel = discord.utils.get(guild.text_channels, name=get_log_channel_name())
-                        if log_channel:
-                            try:
-                                team_info = f" for team **{next_user.get('team_name')}**" if next_user.get(
-                                    "team_name") else ""
-                                log_embed = discord.Embed(
-                                    title="✅ Waitlist Registration",
-                                    description=f"**{next_user['discord_tag']}** ({next_user['ign']}) has been automatically registered from the waitlist{team_info}.",
-                                    color=discord.Color.green(),
-                                    timestamp=utcnow()
-                                )
-                                await log_channel.send(embed=log_embed)
-                            except Exception as log_error:
-                                logging.warning(f"Failed to log waitlist registration: {log_error}")
-
-                        registered_users.append(next_user)
-                        logging.info(f"Successfully registered {next_user['discord_tag']} from waitlist")
-                        print(f"[WAITLIST] Successfully registered {next_user['discord_tag']}")
-
-                    except Exception as reg_error:
-                        print(f"[WAITLIST] Registration error: {reg_error}")
-                        await ErrorHandler.log_warning(
-                            guild,
-                            f"Failed to auto-register {next_user['discord_tag']} from waitlist: {reg_error}",
-                            "Waitlist Processing"
-                        )
-                        # Continue to next iteration
-                        continue
-
-                # Refresh cache after each registration batch
-                await refresh_sheet_cache(force=True)
-
-            # After loop ends
-            if registered_users:
-                print(f"[WAITLIST] Registered {len(registered_users)} users from waitlist")
-
-                # Update embeds after successful registrations
-                from core.components_traditional import setup_unified_channel
-                await setup_unified_channel(guild)
-            else:
+            if not registered_users:
                 print(f"[WAITLIST] No users registered from waitlist")
+                return registered_users
+
+            promoted = [members[entry["discord_tag"]] for entry in registered_users]
+
+            async def grant_role(member: discord.Member) -> None:
+                try:
+                    await RoleManager.add_role(member, "Registered")
+                except Exception as role_error:
+                    logging.warning(f"Failed to add Registered role to {member}: {role_error}")
+
+            await asyncio.gather(
+                *(grant_role(member) for member in promoted),
+                *(hyperlink_lolchess_profile(entry["discord_tag"], guild_id) for entry in registered_users)
+            )
+
+            # Notify everyone through the shared DM dispatcher
+            from core.views import WaitlistRegistrationDMView
+            from utils.dm_tracker import dm_tracker
+            from utils.utils import clear_user_dms
+
+            async def send_dm(member: discord.Member) -> None:
+                deleted = await clear_user_dms(member)
+                if deleted > 0:
+                    logging.debug(f"Cleared {deleted} previous DMs for {member}")
+                await dm_tracker.send(
+                    member, embed=embed_from_cfg("waitlist_registered"), view=WaitlistRegistrationDMView(guild)
+                )
+
+            dm_result = await DMDispatcher().dispatch(promoted, send_dm)
+            for member, reason in dm_result.failed:
+                logging.debug(f"Could not DM {member} about waitlist registration: {reason}")
+
+            # Log to bot-log channel
+            log_channel = discord.utils.get(guild.text_channels, name=get_log_channel_name())
+            if log_channel:
+                try:
+                    lines = []
+                    for entry in registered_users:
+                        team_info = f" for team **{entry.get('team_name')}**" if entry.get("team_name") else ""
+                        lines.append(f"**{entry['discord_tag']}** ({entry['ign']}){team_info}")
+                    log_embed = discord.Embed(
+                        title="✅ Waitlist Registration",
+                        description="Automatically registered from the waitlist:\n" + "\n".join(lines)[:4000],
+                        color=discord.Color.green(),
+                        timestamp=utcnow()
+                    )
+                    await log_channel.send(embed=log_embed)
+                except Exception as log_error:
+                    logging.warning(f"Failed to log waitlist registration: {log_error}")
+
+            logging.info(f"Successfully registered {len(registered_users)} users from waitlist")
+            print(f"[WAITLIST] Registered {len(registered_users)} users from waitlist")
+
+            # Update embeds after successful registrations
+            from core.components_traditional import setup_unified_channel
+            await setup_unified_channel(guild)
 
             return registered_users
 
@@ -120,14 +120,6 @@ class BatchProcessor:
 
             log.info(f"Processing batch {batch_id} with {len(images)} images")
 
-            # Process images in parallel
-            tasks = [
-                self._process_single_image(
-                    img, batch_id, guild_id, tournament_id, round_name
-                )
-                for img in images
-            ]
-
             # Limit concurrent processing
             semaphore = asyncio.Semaphore(self.max_concurrent)
 
@@ -135,8 +127,46 @@ class BatchProcessor:
                 async with semaphore:
                     return await task
 
-            limited_tasks = [limited_task(t) for t in tasks]
-            results = await asyncio.gather(*limited_tasks, return_exceptions=True)
+            # Stage 1: download and classify every image in parallel
+            prepared = await asyncio.gather(
+                *[limited_task(self._prepare_image(img)) for img in images],
+                return_exceptions=True
+            )
+
+            try:
+                # Stage 2: OCR every accepted screenshot in batched Vision requests
+                ocr_indices = [
+                    i for i, item in enumerate(prepared)
+                    if isinstance(item, dict) and item.get("success", False)
+                ]
+                ocr_results = await self._extract_batch(
+                    [prepared[i]["temp_path"] for i in ocr_indices]
+                )
+
+                # Stage 3: match, validate and store each OCR result
+                completed_tasks = [
+                    limited_task(
+                        self._complete_image(
+                            images[i],
+                            prepared[i]["classification_confidence"],
+                            ocr_result,
+                            batch_id, guild_id, tournament_id, round_name
+                        )
+                    )
+                    for i, ocr_result in zip(ocr_indices, ocr_results, strict=True)
+                ]
+                completed_results = await asyncio.gather(
+                    *completed_tasks, return_exceptions=True
+                )
+
+                # Rejected/failed images keep their stage 1 result
+                results = list(prepared)
+                for i, result in zip(ocr_indices, completed_results, strict=True):
+                    results[i] = result
+            finally:
+                for item in prepared:
+                    if isinstance(item, dict):
+                        self._cleanup_temp_file(item.get("temp_path"))
 
             # Process results
             completed = 0
@@ -256,15 +286,13 @@ class BatchProcessor:
         finally:
             db.close()
 
-    async def _process_single_image(
-        self,
-        image_data: Dict,
-        batch_id: int,
-        guild_id: str,
-        tournament_id: str,
-        round_name: str
-    ) -> Dict:
-        """Process a single screenshot through the pipeline."""
+    async def _prepare_image(self, image_data: Dict) -> Dict:
+        """
+        Download and classify a screenshot.
+
+        On success the result carries ``temp_path``; the caller owns the
+        temporary file and must clean it up.
+        """
         temp_path = None
         try:
             # Step 0: Download image from Discord URL
@@ -290,18 +318,61 @@ class BatchProcessor:
                 log.info(
                     f"Image rejected (not TFT standings): {image_data['discord_message_id']}"
                 )
+                self._cleanup_temp_file(temp_path)
                 return {
                     "success": False,
                     "reason": "not_standings",
                     "message_id": image_data["discord_message_id"]
                 }
 
-            # Step 2: OCR extraction (using Google Cloud Vision - 100% accurate!)
+            return {
+                "success": True,
+                "temp_path": temp_path,
+                "classification_confidence": classification_confidence
+            }
+
+        except Exception as e:
+            log.error(f"Image processing error: {e}", exc_info=True)
+            self._cleanup_temp_file(temp_path)
+            return {
+                "success": False,
+                "reason": "processing_error",
+                "message_id": image_data.get("discord_message_id"),
+                "error": str(e)
+            }
+
+    async def _extract_batch(self, temp_paths: List[Path]) -> List[Dict]:
+        """
+        OCR downloaded screenshots with batched Cloud Vision requests.
+
+        Returns one OCR result per path, in order; a failure to reach the
+        OCR engine is reported on every image instead of raised.
+        """
+        if not temp_paths:
+            return []
+
+        try:
+            # Google Cloud Vision - up to 16 images per request
             ocr_client = get_cloud_vision_ocr()
-            ocr_result = ocr_client.extract_from_image(
-                str(temp_path)
+            return await ocr_client.extract_from_images_async(
+                [str(path) for path in temp_paths]
             )
+        except Exception as e:
+            log.error(f"Batch OCR error: {e}", exc_info=True)
+            return [{"success": False, "error": str(e)} for _ in temp_paths]
 
+    async def _complete_image(
+        self,
+        image_data: Dict,
+        classification_confidence: float,
+        ocr_result: Dict,
+        batch_id: int,
+        guild_id: str,
+        tournament_id: str,
+        round_name: str
+    ) -> Dict:
+        """Store, match and validate one screenshot's OCR result."""
+        try:
             if not ocr_result.get("success", False):
                 return {
                     "success": False,
@@ -427,14 +498,15 @@ class BatchProcessor:
                 "message_id": image_data.get("discord_message_id"),
                 "error": str(e)
             }
-        finally:
-            # Clean up temporary file
-            if temp_path and temp_path.exists():
-                try:
-                    temp_path.unlink()
-                    log.debug(f"Cleaned up temp file: {temp_path}")
-                except Exception as e:
-                    log.warning(f"Failed to delete temp file {temp_path}: {e}")
+
+    def _cleanup_temp_file(self, temp_path: Optional[Path]):
+        """Delete a downloaded screenshot, ignoring missing files."""
+        if temp_path and temp_path.exists():
+            try:
+                temp_path.unlink()
+                log.debug(f"Cleaned up temp file: {temp_path}")
+            except Exception as e:
+                log.warning(f"Failed to delete temp file {temp_path}: {e}")
 
     async def _create_submission(
         self,
@@ -8,9 +8,11 @@ Cost: $1.50 per 1,000 images (first 1,000/month FREE)
 For 16 images/month: $0.024/month (~2.4 cents) - under free tier
 """
 
+import asyncio
 import logging
 import os
 import re
+from bisect import bisect_left, bisect_right
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -27,6 +29,15 @@ PLACEMENT_POINTS = {
     5: 4, 6: 3, 7: 2, 8: 1
 }
 
+# Vision API limit for synchronous batch_annotate_images requests
+MAX_BATCH_IMAGES = 16
+
+# Row-band tolerances: only detections within these vertical distances are
+# ever compared, so both passes sweep a y-sorted index instead of all pairs.
+MERGE_MAX_Y_GAP = 40
+MERGE_MAX_X_GAP = 500
+MATCH_MAX_Y_GAP = 100
+
 
 class CloudVisionOCR:
     """Google Cloud Vision API OCR engine for TFT screenshots."""
@@ -74,57 +85,14 @@ class CloudVisionOCR:
             Dictionary with structured data, raw results, and success status
         """
         try:
-            # Read image file
-            if not os.path.exists(image_path):
-                raise FileNotFoundError(f"Image not found: {image_path}")
-            
-            with open(image_path, 'rb') as f:
-                content = f.read()
-            
             # Create Vision API image object
-            image = vision.Image(content=content)
+            image = vision.Image(content=self._read_image(image_path))
             
             # Call Vision API for text detection
             log.info(f"Calling Cloud Vision API for: {Path(image_path).name}")
             response = self.client.text_detection(image=image)
             
-            # Check for API errors
-            if response.error.message:
-                raise Exception(f"Vision API error: {response.error.message}")
-            
-            # Parse text annotations
-            text_annotations = response.text_annotations
-            
-            # Extract bounding boxes and text
-            raw_detections = self._parse_annotations(text_annotations)
-            
-            # Merge adjacent text items for multi-word names
-            raw_detections = self._merge_adjacent_text(raw_detections)
-            
-            if not text_annotations or len(text_annotations) < 2:
-                log.warning(f"No text detected in {image_path}")
-                return {
-                    "success": False,
-                    "error": "No text detected",
-                    "structured_data": {
-                        "players": [],
-                        "player_count": 0,
-                        "expected_players": 8
-                    }
-                }
-            
-            # Structure data into TFT standings format
-            structured = self._structure_tft_data(raw_detections, image_path)
-            
-            # Calculate confidence
-            scores = self._calculate_confidence(raw_detections, structured)
-            
-            return {
-                "structured_data": structured,
-                "raw_results": raw_detections,
-                "scores": scores,
-                "success": True
-            }
+            return self._process_response(response, image_path)
             
         except google_exceptions.GoogleAPIError as e:
             log.error(f"Google API error: {e}")
@@ -138,6 +106,154 @@ class CloudVisionOCR:
                 "success": False,
                 "error": str(e)
             }
+
+    def extract_from_images(self, image_paths: List[str]) -> List[Dict]:
+        """
+        Extract TFT standings data from several screenshots.
+
+        Images are sent in ``batch_annotate_images`` requests of up to
+        MAX_BATCH_IMAGES, so a full round of lobbies costs one or two round
+        trips instead of one per screenshot.
+
+        Args:
+            image_paths: Paths to screenshot image files
+
+        Returns:
+            One result dict per path, in the same order (same shape as
+            ``extract_from_image``)
+        """
+        results: List[Dict] = []
+        for start in range(0, len(image_paths), MAX_BATCH_IMAGES):
+            results.extend(self._extract_chunk(image_paths[start:start + MAX_BATCH_IMAGES]))
+        return results
+
+    async def extract_from_images_async(self, image_paths: List[str]) -> List[Dict]:
+        """
+        Async variant of ``extract_from_images``.
+
+        Each chunk of up to MAX_BATCH_IMAGES runs in a worker thread and
+        chunks are submitted concurrently.
+        """
+        chunks = [
+            image_paths[start:start + MAX_BATCH_IMAGES]
+            for start in range(0, len(image_paths), MAX_BATCH_IMAGES)
+        ]
+        chunk_results = await asyncio.gather(
+            *(asyncio.to_thread(self._extract_chunk, chunk) for chunk in chunks)
+        )
+        return [result for chunk in chunk_results for result in chunk]
+
+    def _extract_chunk(self, image_paths: List[str]) -> List[Dict]:
+        """Run one ``batch_annotate_images`` call and map responses back to paths."""
+        results: List[Optional[Dict]] = [None] * len(image_paths)
+        requests = []
+        request_indices = []
+
+        # Unreadable files fail individually without sinking the whole request
+        for index, image_path in enumerate(image_paths):
+            try:
+                content = self._read_image(image_path)
+            except Exception as e:
+                log.error(f"OCR extraction error: {e}")
+                results[index] = {"success": False, "error": str(e)}
+                continue
+
+            requests.append(
+                vision.AnnotateImageRequest(
+                    image=vision.Image(content=content),
+                    features=[vision.Feature(type_=vision.Feature.Type.TEXT_DETECTION)]
+                )
+            )
+            request_indices.append(index)
+
+        if requests:
+            log.info(f"Calling Cloud Vision API for {len(requests)} images (batched)")
+            try:
+                batch_response = self.client.batch_annotate_images(
+                    requests=requests,
+                    timeout=self.timeout_seconds
+                )
+                responses = list(batch_response.responses)
+                if len(responses) != len(requests):
+                    raise Exception(
+                        f"Vision API returned {len(responses)} responses "
+                        f"for {len(requests)} images"
+                    )
+
+                for index, response in zip(request_indices, responses, strict=True):
+                    image_path = image_paths[index]
+                    try:
+                        results[index] = self._process_response(response, image_path)
+                    except Exception as e:
+                        log.error(f"OCR extraction error for {image_path}: {e}")
+                        results[index] = {"success": False, "error": str(e)}
+
+            except google_exceptions.GoogleAPIError as e:
+                log.error(f"Google API error: {e}")
+                for index in request_indices:
+                    results[index] = {
+                        "success": False,
+                        "error": f"Google API error: {str(e)}"
+                    }
+            except Exception as e:
+                log.error(f"OCR batch extraction error: {e}", exc_info=True)
+                for index in request_indices:
+                    results[index] = {"success": False, "error": str(e)}
+
+        return results
+
+    def _read_image(self, image_path: str) -> bytes:
+        """Read screenshot bytes from disk."""
+        if not os.path.exists(image_path):
+            raise FileNotFoundError(f"Image not found: {image_path}")
+
+        with open(image_path, 'rb') as f:
+            return f.read()
+
+    def _process_response(self, response, image_path: str) -> Dict:
+        """
+        Turn a single-image Vision API response into a result dict.
+
+        Raises:
+            Exception: If the response carries a Vision API error
+        """
+        # Check for API errors
+        if response.error.message:
+            raise Exception(f"Vision API error: {response.error.message}")
+        
+        # Parse text annotations
+        text_annotations = response.text_annotations
+        
+        # Extract bounding boxes and text
+        raw_detections = self._parse_annotations(text_annotations)
+        
+        # Merge adjacent text items for multi-word names
+        raw_detections = self._merge_adjacent_text(raw_detections)
+        
+        if not text_annotations or len(text_annotations) < 2:
+            log.warning(f"No text detected in {image_path}")
+            return {
+                "success": False,
+                "error": "No text detected",
+                "structured_data": {
+                    "players": [],
+                    "player_count": 0,
+                    "expected_players": 8
+                }
+            }
+        
+        # Structure data into TFT standings format
+        structured = self._structure_tft_data(raw_detections, image_path)
+        
+        # Calculate confidence
+        scores = self._calculate_confidence(raw_detections, structured)
+        
+        return {
+            "structured_data": structured,
+            "raw_results": raw_detections,
+            "scores": scores,
+            "success": True
+        }
     
     def _parse_annotations(self, annotations: List) -> List[Dict]:
         """
@@ -222,67 +338,63 @@ class CloudVisionOCR:
         merged = []
         used_indices = set()
 
+        # Items that can never take part in a merge: placement digits and
+        # single-letter UI elements (U, E, P, ...)
+        mergeable = []
+        for item in detections:
+            text = item["text"].strip()
+            mergeable.append(
+                not text.isdigit() and not (len(text) == 1 and text.isupper())
+            )
+
+        # Row-band index: detection indices sorted by Y, so each item only
+        # scans neighbours within MERGE_MAX_Y_GAP instead of every detection
+        by_y = sorted(range(len(detections)), key=lambda k: detections[k]["center_y"])
+        by_y_pos = [detections[k]["center_y"] for k in by_y]
+
         for i, item1 in enumerate(detections):
             if i in used_indices:
                 continue
 
             best_merge = None
             best_gap = float('inf')
+            text1 = item1["text"].strip()
 
-            # Check for items that could be merged with this one
-            for j, item2 in enumerate(detections):
-                if i == j or j in used_indices:
-                    continue
+            if mergeable[i]:
+                lo = bisect_left(by_y_pos, item1["center_y"] - MERGE_MAX_Y_GAP)
+                hi = bisect_right(by_y_pos, item1["center_y"] + MERGE_MAX_Y_GAP)
 
-                # Calculate gap between items
-                x_gap = abs(item2["center_x"] - item1["center_x"])
-                y_gap = abs(item2["center_y"] - item1["center_y"])
+                # Check neighbours in the same row band that could be merged
+                for j in by_y[lo:hi]:
+                    if i == j or j in used_indices or not mergeable[j]:
+                        continue
 
-                # MERGE CONDITIONS:
-                # 1. Items must be on same row (Y gap < 15px)
-                # 2. Items must be close horizontally (X gap < 150px)
-                # 3. Items must be in left-to-right order (item2 is to the right of item1)
-                # 4. Neither item should be a single digit (placement number)
-                text1 = item1["text"].strip()
-                text2 = item2["text"].strip()
+                    item2 = detections[j]
 
-                # Skip if either is a single digit (likely placement number)
-                if text1.isdigit() or text2.isdigit():
-                    continue
+                    # Calculate gap between items
+                    x_gap = abs(item2["center_x"] - item1["center_x"])
+                    y_gap = abs(item2["center_y"] - item1["center_y"])
 
-                # Skip if one is single digit and other is not (placement + name should not merge)
-                # This prevents "12" + "FiendFyre" → "12FiendFyre"
-                if (text1.isdigit() or text2.isdigit()) and not (text1.isdigit() and text2.isdigit()):
-                    continue
+                    # Skip if items are too far apart vertically
+                    if y_gap > MERGE_MAX_Y_GAP:
+                        continue
 
-                # Skip single-letter UI elements (U, E, P, etc.) without digits
-                if len(text1) == 1 and text1.isupper() and not text1.isdigit():
-                    continue
-                if len(text2) == 1 and text2.isupper() and not text2.isdigit():
-                    continue
+                    # Skip if items are too far apart horizontally
+                    # Bidirectional: "Baby" + "Llama" merges whichever side is scanned first
+                    if x_gap > MERGE_MAX_X_GAP:
+                        continue
 
-                # Skip if items are too far apart vertically
-                if y_gap > 40:
-                    continue
+                    # Prefer closest item with smallest total gap
+                    # If same row (Y gap < 5), prefer horizontal proximity
+                    if y_gap < 5:
+                        gap = x_gap * 0.5 + y_gap * 5.0
+                    else:
+                        gap = x_gap * 0.3 + y_gap * 3.0
 
-                # Skip if items are too far apart horizontally
-                # Increased threshold to 500px for better flexibility
-                # REMOVED strict left-to-right order - allow bidirectional merging
-                # This fixes "Baby" + "Llama" where Baby is left of Llama
-                if x_gap > 500:
-                    continue
-
-                # This is a potential merge
-                # Prefer closest item with smallest total gap
-                # If same row (Y gap < 5), prefer horizontal proximity
-                if y_gap < 5:
-                    gap = x_gap * 0.5 + y_gap * 5.0
-                else:
-                    gap = x_gap * 0.3 + y_gap * 3.0
-
-                if gap < best_gap:
-                    best_gap = gap
-                    best_merge = (j, x_gap, y_gap)
+                    # Ties go to the lowest index, matching a scan in detection order
+                    if gap < best_gap or (gap == best_gap and j < best_merge[0]):
+                        best_gap = gap
+                        best_merge = (j, x_gap, y_gap)
 
             # If we found a merge, combine text
             if best_merge:
@@ -633,7 +745,8 @@ class CloudVisionOCR:
         
         Strategy:
         1. Sort both by Y position (top to bottom)
-        2. For each placement, find closest unused name
+        2. For each placement, find closest unused name within its row band
+           (names are bisected by Y, so only nearby rows are scanned)
         3. Strict requirements: name MUST be to the RIGHT of placement and close in Y
         
         Args:
@@ -659,6 +772,8 @@ class CloudVisionOCR:
         log.info(f"DEBUG: Placements: {placements}")
         log.info(f"DEBUG: Names: {names}")
         
+        names_y = [n_y for _, n_y, _ in names_sorted]
+
         for placement_num, p_y, p_x in placements_sorted:
             best_name = None
             best_dist = float('inf')
@@ -667,11 +782,17 @@ class CloudVisionOCR:
             log.debug(
                 f"DEBUG: Placement {placement_num} at ({p_x:.0f}, {p_y:.0f})"
             )
-            
-            for idx, (name, n_y, n_x) in enumerate(names_sorted):
+
+            # Only names within the placement's row band can match
+            lo = bisect_left(names_y, p_y - MATCH_MAX_Y_GAP)
+            hi = bisect_right(names_y, p_y + MATCH_MAX_Y_GAP)
+
+            for idx in range(lo, hi):
                 if idx in used_names:
                     continue
-                
+
+                name, n_y, n_x = names_sorted[idx]
+
                 # Calculate distances
                 y_dist = abs(n_y - p_y)
                 x_dist = abs(n_x - p_x)
@@ -692,8 +813,8 @@ class CloudVisionOCR:
                 if n_x - p_x > 500:
                     continue
 
-                # REQUIREMENT: Must be on same row (within 50px vertically)
-                if y_dist > 100:
+                # REQUIREMENT: Must be on same row (within MATCH_MAX_Y_GAP vertically)
+                if y_dist > MATCH_MAX_Y_GAP:
                     continue
                 
                 # DEBUG: Show why this name is being considered
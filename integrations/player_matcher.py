@@ -2,10 +2,14 @@
 Player Matching Engine - Matches extracted names to registered tournament players.
 
 Uses exact matching, alias lookup, and fuzzy matching with character confusion handling.
+Lobbies are matched in one vectorized pass with one-to-one player assignment.
 """
 
 import re
+import string
 from typing import Dict, List, Optional, Tuple
+
+import numpy as np
 from rapidfuzz import fuzz, process
 import logging
 
@@ -28,6 +32,112 @@ CHARACTER_CONFUSIONS = {
     'm': ['rn'],
 }
 
+_NON_ALNUM = re.compile(r'[^a-zA-Z0-9]')
+
+
+def _apply_confusions(text: str) -> str:
+    """Apply CHARACTER_CONFUSIONS replacements in order (reference behaviour)."""
+    for correct_char, confused_chars in CHARACTER_CONFUSIONS.items():
+        for confused in confused_chars:
+            text = text.replace(confused, correct_char)
+    return text
+
+
+def _build_confusion_table() -> Tuple[Dict[int, str], List[Tuple[str, str]]]:
+    """
+    Collapse CHARACTER_CONFUSIONS into one ``str.translate`` table.
+
+    Normalized text is lowercase alphanumeric, so the ordered single-character
+    replacements reduce to a fixed per-character mapping. Multi-character
+    confusions ("rn" -> "m") cannot be expressed per character and are
+    returned as sequence rules applied after translation.
+    """
+    table = str.maketrans({
+        char: _apply_confusions(char)
+        for char in string.ascii_lowercase + string.digits
+    })
+    sequences = [
+        (confused, correct_char)
+        for correct_char, confused_chars in CHARACTER_CONFUSIONS.items()
+        for confused in confused_chars
+        if len(confused) > 1
+    ]
+    return table, sequences
+
+
+_CONFUSION_TABLE, _CONFUSION_SEQUENCES = _build_confusion_table()
+
+
+def _assign_one_to_one(scores: np.ndarray) -> List[Optional[int]]:
+    """
+    Maximum-weight one-to-one assignment of rows to columns (Hungarian method).
+
+    Args:
+        scores: (rows x columns) matrix of non-negative weights
+
+    Returns:
+        Assigned column index for each row, or None when the row could only
+        be given a zero-weight column (or there are more rows than columns)
+    """
+    rows, cols = scores.shape
+    if rows == 0 or cols == 0:
+        return [None] * rows
+
+    transposed = rows > cols
+    weights = scores.T if transposed else scores
+    n, m = weights.shape
+    cost = weights.max() - weights
+
+    # Potentials-based Hungarian algorithm for n <= m, 1-indexed
+    u = np.zeros(n + 1)
+    v = np.zeros(m + 1)
+    owner = np.zeros(m + 1, dtype=int)
+    way = np.zeros(m + 1, dtype=int)
+
+    for row in range(1, n + 1):
+        owner[0] = row
+        col0 = 0
+        min_to = np.full(m + 1, np.inf)
+        used = np.zeros(m + 1, dtype=bool)
+
+        while True:
+            used[col0] = True
+            row0 = owner[col0]
+            free = ~used[1:]
+            reduced = cost[row0 - 1] - u[row0] - v[1:]
+
+            improve = free & (reduced < min_to[1:])
+            min_to[1:][improve] = reduced[improve]
+            way[1:][improve] = col0
+
+            candidates = np.where(free, min_to[1:], np.inf)
+            col1 = int(np.argmin(candidates)) + 1
+            delta = candidates[col1 - 1]
+
+            u[owner[used]] += delta
+            v[used] -= delta
+            min_to[1:][free] -= delta
+
+            col0 = col1
+            if owner[col0] == 0:
+                break
+
+        while col0:
+            col1 = way[col0]
+            owner[col0] = owner[col1]
+            col0 = col1
+
+    assignment: List[Optional[int]] = [None] * rows
+    for col in range(1, m + 1):
+        if owner[col]:
+            row, column = owner[col] - 1, col - 1
+            if transposed:
+                row, column = column, row
+            if scores[row, column] > 0:
+                assignment[row] = column
+
+    return assignment
+
 
 class PlayerMatcher:
     """Matches extracted player names to registered players."""
@@ -46,10 +156,19 @@ class PlayerMatcher:
         )
 
     def _build_alias_index(self) -> Dict[str, Dict]:
-        """Build index of player aliases for fast lookup."""
+        """
+        Build index of player aliases for fast lookup.
+
+        Also builds the fuzzy-match candidate arrays (canonical names and
+        registered aliases, normalized once) used by ``_fuzzy_match`` and
+        ``match_players``.
+        """
         alias_index = {}
+        candidates = []
+        candidate_texts = []
+        player_slices = []
 
-        for player in self.player_roster:
+        for roster_index, player in enumerate(self.player_roster):
             player_id = player.get("player_id") or player.get("discord_id")
             player_name = player.get("player_name") or player.get("riot_id") or ""
 
@@ -58,7 +177,8 @@ class PlayerMatcher:
                 "player_id": player_id,
                 "player_name": player_name,
                 "type": "canonical",
-                "priority": 10
+                "priority": 10,
+                "roster_index": roster_index
             }
 
             # Add Riot IGN
@@ -68,7 +188,8 @@ class PlayerMatcher:
                     "player_id": player_id,
                     "player_name": player_name,
                     "type": "ign",
-                    "priority": 8
+                    "priority": 8,
+                    "roster_index": roster_index
                 }
 
             # Add Discord username
@@ -78,7 +199,8 @@ class PlayerMatcher:
                     "player_id": player_id,
                     "player_name": player_name,
                     "type": "discord_name",
-                    "priority": 7
+                    "priority": 7,
+                    "roster_index": roster_index
                 }
 
             # Add registered aliases (if available)
@@ -87,27 +209,42 @@ class PlayerMatcher:
                     "player_id": player_id,
                     "player_name": player_name,
                     "type": "alias",
-                    "priority": 6
+                    "priority": 6,
+                    "roster_index": roster_index
                 }
 
+            # Fuzzy candidates (normalized once): canonical name, then aliases
+            start = len(candidates)
+            candidate_names = [(player_name, "canonical")] + [
+                (alias, "alias") for alias in player.get("aliases", [])
+            ]
+            for text, candidate_type in candidate_names:
+                candidates.append({
+                    "player_id": player.get("player_id"),
+                    "player_name": player_name,
+                    "type": candidate_type
+                })
+                candidate_texts.append(self._normalize(text))
+            player_slices.append((start, len(candidates)))
+
+        # Each roster entry owns a contiguous run of candidates
+        self._candidates = candidates
+        self._candidate_texts = candidate_texts
+        self._player_slices = player_slices
+        self._player_starts = np.array([start for start, _ in player_slices], dtype=np.intp)
+
         log.info(f"Built alias index with {len(alias_index)} entries")
         return alias_index
 
     def _normalize(self, text: str) -> str:
         """Normalize text for matching."""
-        # Remove special characters
-        text = re.sub(r'[^a-zA-Z0-9]', '', text)
-
-        # Convert to lowercase
-        text = text.lower()
-
-        # Remove extra spaces
-        text = re.sub(r'\s+', '', text)
+        # Remove special characters (including whitespace) and lowercase
+        text = _NON_ALNUM.sub('', text).lower()
 
         # Handle common OCR confusions
-        for correct_char, confused_chars in CHARACTER_CONFUSIONS.items():
-            for confused in confused_chars:
-                text = text.replace(confused, correct_char)
+        text = text.translate(_CONFUSION_TABLE)
+        for confused, correct in _CONFUSION_SEQUENCES:
+            text = text.replace(confused, correct)
 
         return text
 
@@ -128,42 +265,20 @@ class PlayerMatcher:
         """
         normalized_extracted = self._normalize(extracted_name)
 
-        # Tier 1: Exact match (via normalization)
-        if normalized_extracted in self.aliases:
-            match = self.aliases[normalized_extracted]
-            log.info(f"Exact match found: '{extracted_name}' -> {match['player_name']}")
-
-            return {
-                "success": True,
-                "player_id": match["player_id"],
-                "matched_name": match["player_name"],
-                "match_method": "exact",
-                "match_type": match["type"],
-                "confidence": 1.0,
-                "original_text": extracted_name
-            }
-
-        # Tier 2: Case-insensitive exact match
-        for alias, match in self.aliases.items():
-            if alias == normalized_extracted:
-                log.info(f"Case-insensitive match: '{extracted_name}' -> {match['player_name']}")
-
-                return {
-                    "success": True,
-                    "player_id": match["player_id"],
-                    "matched_name": match["player_name"],
-                    "match_method": "case_insensitive",
-                    "match_type": match["type"],
-                    "confidence": 0.99,
-                    "original_text": extracted_name
-                }
+        # Tier 1: Exact match (via normalization - already case-insensitive)
+        exact = self._exact_match(extracted_name, normalized_extracted)
+        if exact:
+            return exact
 
-        # Tier 3: Fuzzy match
+        # Tier 2: Fuzzy match
         if fallback_to_fuzzy:
             return self._fuzzy_match(extracted_name, normalized_extracted)
 
         # No match found
-        log.warning(f"No match found for: '{extracted_name}'")
+        return self._no_match(extracted_name)
+
+    def _no_match(self, original_text: str) -> Dict:
+        log.warning(f"No match found for: '{original_text}'")
         return {
             "success": False,
             "player_id": None,
@@ -171,7 +286,24 @@ class PlayerMatcher:
             "match_method": "none",
             "match_type": None,
             "confidence": 0.0,
-            "original_text": extracted_name
+            "original_text": original_text
+        }
+
+    def _exact_match(self, original_text: str, normalized_text: str) -> Optional[Dict]:
+        """Look up a normalized name in the alias index."""
+        match = self.aliases.get(normalized_text)
+        if match is None:
+            return None
+
+        log.info(f"Exact match found: '{original_text}' -> {match['player_name']}")
+        return {
+            "success": True,
+            "player_id": match["player_id"],
+            "matched_name": match["player_name"],
+            "match_method": "exact",
+            "match_type": match["type"],
+            "confidence": 1.0,
+            "original_text": original_text
         }
 
     def _fuzzy_match(
@@ -180,81 +312,61 @@ class PlayerMatcher:
         normalized_text: str
     ) -> Dict:
         """Perform fuzzy matching against player roster."""
-        # Build list of candidate names
-        candidates = []
+        if not self._candidates:
+            return self._no_fuzzy_match(original_text)
 
-        for player in self.player_roster:
-            player_name = player.get("player_name") or player.get("riot_id") or ""
-
-            # Add canonical name
-            candidates.append({
-                "player_id": player.get("player_id"),
-                "player_name": player_name,
-                "search_text": self._normalize(player_name),
-                "type": "canonical"
-            })
-
-            # Add aliases
-            for alias in player.get("aliases", []):
-                candidates.append({
-                    "player_id": player.get("player_id"),
-                    "player_name": player_name,
-                    "search_text": self._normalize(alias),
-                    "type": "alias"
-                })
-
-        if not candidates:
-            return {
-                "success": False,
-                "player_id": None,
-                "matched_name": None,
-                "match_method": "none",
-                "confidence": 0.0,
-                "original_text": original_text
-            }
-
-        # Perform fuzzy matching
         # Use weighted ratio (partial ratio)
         result = process.extractOne(
             normalized_text,
-            [c["search_text"] for c in candidates],
+            self._candidate_texts,
             scorer=fuzz.WRatio
         )
 
         if result:
             score = result[1] / 100  # Normalize to 0-1
-            best_match = candidates[result[2]]
+            return self._fuzzy_result(original_text, self._candidates[result[2]], score)
 
-            log.info(
-                f"Fuzzy match: '{original_text}' -> {best_match['player_name']} "
-                f"(confidence: {score:.3f})"
-            )
+        return self._no_fuzzy_match(original_text)
 
-            if score >= self.threshold:
-                return {
-                    "success": True,
-                    "player_id": best_match["player_id"],
-                    "matched_name": best_match["player_name"],
-                    "match_method": "fuzzy",
-                    "match_type": best_match["type"],
-                    "confidence": score,
-                    "original_text": original_text
-                }
-            else:
-                log.warning(
-                    f"Fuzzy match below threshold: '{original_text}' -> "
-                    f"{best_match['player_name']} (score: {score:.3f}, threshold: {self.threshold})"
-                )
-                return {
-                    "success": False,
-                    "player_id": None,
-                    "matched_name": best_match["player_name"],
-                    "match_method": "fuzzy_low_confidence",
-                    "match_type": best_match["type"],
-                    "confidence": score,
-                    "original_text": original_text
-                }
+    def _fuzzy_result(
+        self,
+        original_text: str,
+        best_match: Dict,
+        score: float,
+        method: Optional[str] = None
+    ) -> Dict:
+        """Build a fuzzy match result, applying the confidence threshold."""
+        log.info(
+            f"Fuzzy match: '{original_text}' -> {best_match['player_name']} "
+            f"(confidence: {score:.3f})"
+        )
 
+        if method is None and score >= self.threshold:
+            return {
+                "success": True,
+                "player_id": best_match["player_id"],
+                "matched_name": best_match["player_name"],
+                "match_method": "fuzzy",
+                "match_type": best_match["type"],
+                "confidence": score,
+                "original_text": original_text
+            }
+
+        log.warning(
+            f"Fuzzy match not accepted: '{original_text}' -> "
+            f"{best_match['player_name']} (score: {score:.3f}, threshold: {self.threshold})"
+        )
+        return {
+            "success": False,
+            "player_id": None,
+            "matched_name": best_match["player_name"],
+            "match_method": method or "fuzzy_low_confidence",
+            "match_type": best_match["type"],
+            "confidence": score,
+            "original_text": original_text
+        }
+
+    def _no_fuzzy_match(self, original_text: str) -> Dict:
         return {
             "success": False,
             "player_id": None,
@@ -264,6 +376,76 @@ class PlayerMatcher:
             "original_text": original_text
         }
 
+    def _match_all(self, names: List[str], fallback_to_fuzzy: bool) -> List[Dict]:
+        """
+        Match a whole lobby of names with one-to-one player assignment.
+
+        Exact matches claim their players first. Remaining names are scored
+        against every candidate in one ``process.cdist`` call, collapsed to a
+        best score per player, and assigned so that the total accepted score
+        is maximal and no player is claimed twice. A name whose best player
+        was taken by a stronger match is reported as ``fuzzy_conflict``.
+        """
+        normalized = [self._normalize(name) for name in names]
+        results: List[Optional[Dict]] = [None] * len(names)
+        claimed = set()
+
+        for i, (name, norm) in enumerate(zip(names, normalized, strict=True)):
+            match = self.aliases.get(norm)
+            if match and match["roster_index"] not in claimed:
+                results[i] = self._exact_match(name, norm)
+                claimed.add(match["roster_index"])
+
+        pending = [i for i, result in enumerate(results) if result is None]
+        if not pending:
+            return results
+
+        if not fallback_to_fuzzy:
+            for i in pending:
+                results[i] = self._no_match(names[i])
+            return results
+
+        if not self._candidates:
+            for i in pending:
+                results[i] = self._no_fuzzy_match(names[i])
+            return results
+
+        # (pending names x candidates) score matrix in one vectorized call,
+        # collapsed to the best candidate score per roster player
+        candidate_scores = process.cdist(
+            [normalized[i] for i in pending],
+            self._candidate_texts,
+            scorer=fuzz.WRatio,
+            dtype=np.float64
+        ) / 100
+        player_scores = np.maximum.reduceat(candidate_scores, self._player_starts, axis=1)
+
+        # Only pairs that would be accepted take part in the assignment, and
+        # players already claimed by exact matches are unavailable
+        weights = np.where(player_scores >= self.threshold, player_scores, 0.0)
+        if claimed:
+            weights[:, sorted(claimed)] = 0.0
+
+        assignment = _assign_one_to_one(weights)
+
+        for row, i in enumerate(pending):
+            column = assignment[row]
+            method = None
+            if column is None:
+                # Report the best player anyway; it was either below the
+                # threshold or taken by a stronger match
+                column = int(np.argmax(player_scores[row]))
+                if player_scores[row, column] >= self.threshold:
+                    method = "fuzzy_conflict"
+
+            start, end = self._player_slices[column]
+            candidate = self._candidates[start + int(np.argmax(candidate_scores[row, start:end]))]
+            results[i] = self._fuzzy_result(
+                names[i], candidate, float(player_scores[row, column]), method
+            )
+
+        return results
+
     def match_players(
         self,
         extracted_players: List[Dict],
@@ -276,20 +458,19 @@ class PlayerMatcher:
             extracted_players: List of extracted player data
             fallback_to_fuzzy: Use fuzzy matching
 
+        Names are assigned one-to-one: two extracted names can never claim
+        the same roster player.
+
         Returns:
             List of match results
         """
         results = []
+        named_players = [p for p in extracted_players if p.get("name", "")]
+        match_results = self._match_all(
+            [p["name"] for p in named_players], fallback_to_fuzzy
+        )
 
-        for player_data in extracted_players:
-            extracted_name = player_data.get("name", "")
-
-            if not extracted_name:
-                continue
-
-            # Attempt match
-            match_result = self.match_player(extracted_name, fallback_to_fuzzy)
-
+        for player_data, match_result in zip(named_players, match_results, strict=True):
             # Combine with original player data
             combined = {
                 **player_data,
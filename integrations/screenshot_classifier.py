@@ -8,7 +8,7 @@ import cv2
 import numpy as np
 import pytesseract
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import Dict, Tuple, Optional
 import logging
 
 from config import _FULL_CFG
@@ -26,6 +26,14 @@ STANDINGS_KEYWORDS = [
 ]
 
 
+# Weighted contribution of each feature score to the overall confidence
+SCORE_WEIGHTS = {
+    "basic": 0.40,
+    "layout": 0.40,
+    "color": 0.20
+}
+
+
 class ScreenshotClassifier:
     """Classifies images as TFT standings screenshots or not."""
 
@@ -35,6 +43,12 @@ class ScreenshotClassifier:
         self.threshold = settings.get("classification_threshold", 0.70)
         self.skip_classification = settings.get("skip_classification", False)
         self.trusted_channels = settings.get("monitor_channels", [])
+        # Features are computed on a copy no taller than this (full-res Discord
+        # uploads are often 2560x1440; the scores are resolution independent)
+        self.analysis_height = settings.get("classification_max_height", 480)
+        self.early_exit = settings.get("classification_early_exit", True)
+        # Optional hard floor on the basic (dimension) score; 0 disables it
+        self.min_basic_score = settings.get("classification_min_basic_score", 0.0)
         
         log.info(
             f"Classifier initialized (threshold: {self.threshold}, "
@@ -65,30 +79,40 @@ class ScreenshotClassifier:
                 log.error(f"Failed to read image: {image_path}")
                 return False, 0.0, {}
 
-            # Convert to grayscale
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-
-            # Run simplified classification methods
+            image_size = img.shape[:2]
             scores = {}
 
-            # 1. Basic image validation
+            # 1. Basic image validation (dimensions only - cheapest check)
             scores["basic"] = self._basic_validation(img)
 
-            # 2. Layout structure score (simplified)
-            scores["layout"] = self._layout_analysis(gray)
-
-            # 3. Color profile score
-            scores["color"] = self._color_profile_analysis(img)
-
-            # Calculate weighted average confidence
-            weights = {
-                "basic": 0.40,
-                "layout": 0.40,
-                "color": 0.20
-            }
+            # Early exit: reject when even perfect layout/color scores could
+            # not lift the confidence to the threshold, or when the image
+            # fails the configured minimum basic score
+            if self.early_exit:
+                best_case = scores["basic"] * SCORE_WEIGHTS["basic"] + sum(
+                    weight for key, weight in SCORE_WEIGHTS.items() if key != "basic"
+                )
+                if best_case < self.threshold or scores["basic"] < self.min_basic_score:
+                    log.info(
+                        f"Classification result: False (early exit, "
+                        f"best case: {best_case:.3f})"
+                    )
+                    return False, scores["basic"] * SCORE_WEIGHTS["basic"], {
+                        "scores": scores,
+                        "weights": SCORE_WEIGHTS,
+                        "image_size": image_size,
+                        "method": "early_exit"
+                    }
+
+            # 2. Layout and color scores share one pass over a downscaled copy
+            features = self._extract_features(self._downscale(img))
+            del img
+
+            scores["layout"] = self._layout_score(features)
+            scores["color"] = self._color_score(features)
 
             overall_confidence = sum(
-                scores.get(k, 0) * weights.get(k, 0)
+                scores.get(k, 0) * SCORE_WEIGHTS.get(k, 0)
                 for k in scores.keys()
             )
 
@@ -96,8 +120,9 @@ class ScreenshotClassifier:
 
             metadata = {
                 "scores": scores,
-                "weights": weights,
-                "image_size": img.shape[:2],
+                "features": features,
+                "weights": SCORE_WEIGHTS,
+                "image_size": image_size,
                 "method": "simplified"
             }
 
@@ -112,6 +137,82 @@ class ScreenshotClassifier:
             log.error(f"Error classifying image: {e}", exc_info=True)
             return False, 0.0, {"error": str(e)}
 
+    def _downscale(self, img: np.ndarray) -> np.ndarray:
+        """
+        Shrink image to ``analysis_height`` rows (never upscales).
+
+        Halves with a Gaussian pyramid while at least twice the target, then
+        finishes with a cheap linear resize.
+        """
+        while img.shape[0] >= 2 * self.analysis_height:
+            img = cv2.pyrDown(img)
+
+        h, w = img.shape[:2]
+        if h <= self.analysis_height:
+            return img
+
+        scale = self.analysis_height / h
+        return cv2.resize(
+            img,
+            (max(1, round(w * scale)), self.analysis_height),
+            interpolation=cv2.INTER_LINEAR
+        )
+
+    def _extract_features(self, img: np.ndarray) -> Dict[str, float]:
+        """
+        Compute every layout and color feature in a single pass.
+
+        The grayscale histogram drives both the Otsu threshold and the text
+        density, and one HSV conversion provides brightness and gold ratio.
+        """
+        total_pixels = img.shape[0] * img.shape[1]
+        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+
+        # Otsu threshold straight from the histogram; pixels at or below the
+        # threshold are the dark (text) class
+        hist = np.bincount(gray.ravel(), minlength=256).astype(np.float64)
+        cumulative = np.cumsum(hist)
+        threshold = self._otsu_threshold(hist, cumulative)
+        text_density = cumulative[threshold] / total_pixels
+
+        # Edge density (text has lots of edges)
+        edges = cv2.Canny(gray, 50, 150)
+        edge_density = np.count_nonzero(edges) / total_pixels
+
+        hsv = cv2.cvtColor(img, cv2.COLOR_BGR2HSV)
+        brightness = cv2.mean(hsv)[2]
+
+        # Gold tones (TFT UI color): [20, 30] hue, [100, 200] saturation
+        gold_mask = cv2.inRange(
+            hsv,
+            np.array([20, 100, 100]),
+            np.array([30, 200, 255])
+        )
+        gold_ratio = np.count_nonzero(gold_mask) / total_pixels
+
+        return {
+            "text_density": float(text_density),
+            "edge_density": float(edge_density),
+            "brightness": float(brightness),
+            "gold_ratio": float(gold_ratio)
+        }
+
+    @staticmethod
+    def _otsu_threshold(hist: np.ndarray, cumulative: np.ndarray) -> int:
+        """Vectorized Otsu threshold over a 256-bin histogram."""
+        levels = np.arange(256, dtype=np.float64)
+        weighted = np.cumsum(hist * levels)
+        total = cumulative[-1]
+
+        background = cumulative
+        foreground = total - cumulative
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean_bg = weighted / background
+            mean_fg = (weighted[-1] - weighted) / foreground
+            between = background * foreground * (mean_bg - mean_fg) ** 2
+
+        return int(np.argmax(np.nan_to_num(between)))
+
     def _basic_validation(self, img: np.ndarray) -> float:
         """Basic image validation checks."""
         try:
@@ -139,83 +240,43 @@ class ScreenshotClassifier:
             log.debug(f"Basic validation error: {e}")
             return 0.0
 
-    def _layout_analysis(self, gray_image: np.ndarray) -> float:
-        """Simplified layout analysis for text-heavy images."""
-        try:
-            h, w = gray_image.shape
-            score = 0.0
+    def _layout_score(self, features: Dict[str, float]) -> float:
+        """Score text-heavy layout from text and edge density."""
+        score = 0.0
 
-            # Check 1: Detect text regions using simple thresholding
-            # Text-heavy images have good distribution of black/white pixels
-            _, binary = cv2.threshold(gray_image, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-            
-            # Calculate text density (percentage of dark pixels)
-            text_density = 1.0 - (np.sum(binary == 255) / (h * w))
-            
-            # TFT screenshots typically have 15-40% text density
-            if 0.10 <= text_density <= 0.50:
-                score += 0.5
-            elif 0.05 <= text_density <= 0.60:
-                score += 0.3
+        # TFT screenshots typically have 15-40% text density
+        text_density = features["text_density"]
+        if 0.10 <= text_density <= 0.50:
+            score += 0.5
+        elif 0.05 <= text_density <= 0.60:
+            score += 0.3
 
-            # Check 2: Edge density (text has lots of edges)
-            edges = cv2.Canny(gray_image, 50, 150)
-            edge_density = np.sum(edges > 0) / (h * w)
-            
-            # TFT UI has moderate edge density
-            if 0.05 <= edge_density <= 0.25:
-                score += 0.5
-            elif 0.03 <= edge_density <= 0.35:
-                score += 0.3
-
-            return float(min(score, 1.0))
-
-        except Exception as e:
-            log.debug(f"Layout analysis error: {e}")
-            return 0.0
-
-    def _color_profile_analysis(self, img: np.ndarray) -> float:
-        """Analyze color profile for TFT UI characteristics."""
-        try:
-            # Convert to HSV
-            hsv = cv2.cvtColor(img, cv2.COLOR_BGR2HSV)
-
-            # TFT UI typically has:
-            # - Dark background
-            # - Gold/ornate text
-            # - Distinct color scheme
+        # TFT UI has moderate edge density
+        edge_density = features["edge_density"]
+        if 0.05 <= edge_density <= 0.25:
+            score += 0.5
+        elif 0.03 <= edge_density <= 0.35:
+            score += 0.3
 
-            # Calculate brightness
-            brightness = np.mean(hsv[:, :, 2])
+        return float(min(score, 1.0))
 
-            score = 0.0
-
-            # TFT typically has moderate brightness (not too bright, not too dark)
-            if 50 < brightness < 180:
-                score += 0.5
-
-            # Check for gold tones (TFT UI color)
-            # HSV ranges for gold: [20, 30] hue, [100, 200] saturation
-            gold_mask = cv2.inRange(
-                hsv,
-                np.array([20, 100, 100]),
-                np.array([30, 200, 255])
-            )
-            gold_pixels = np.count_nonzero(gold_mask)
-            total_pixels = img.shape[0] * img.shape[1]
-
-            # If reasonable amount of gold tones
-            gold_ratio = gold_pixels / total_pixels
-            if 0.01 < gold_ratio < 0.15:
-                score += 0.5
+    def _color_score(self, features: Dict[str, float]) -> float:
+        """
+        Score color profile for TFT UI characteristics.
 
-            return float(score)
+        TFT UI typically has a dark background with gold/ornate text.
+        """
+        score = 0.0
 
-        except Exception as e:
-            log.debug(f"Color profile analysis error: {e}")
-            return 0.0
+        # TFT typically has moderate brightness (not too bright, not too dark)
+        if 50 < features["brightness"] < 180:
+            score += 0.5
 
+        # If reasonable amount of gold tones
+        if 0.01 < features["gold_ratio"] < 0.15:
+            score += 0.5
 
+        return float(score)
 
 
 # Singleton instance
@@ -5,7 +5,7 @@ import json
 import os
 import random
 import time
-from typing import Any, Dict, List, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 import discord
 import gspread
@@ -538,17 +538,8 @@ async def refresh_sheet_cache(bot=None, *, force: bool = False) -> Tuple[int, in
             registered_from_waitlist = await WaitlistManager.process_waitlist(guild)
 
             if registered_from_waitlist:
+                # Promotions write their rows straight into the cache, so no second refresh is needed
                 logger.info(f"[CACHE] Registered {len(registered_from_waitlist)} users from waitlist")
-
-                # Refresh cache again after waitlist processing to ensure consistency
-                logger.info("[CACHE] Refreshing cache again after waitlist processing...")
-                # Set flag to skip waitlist processing and reduce logging
-                sheet_cache["_skip_waitlist_processing"] = True
-                try:
-                    await refresh_sheet_cache(bot=bot, force=True)
-                finally:
-                    # Remove the flag
-                    del sheet_cache["_skip_waitlist_processing"]
             else:
                 logger.debug("[CACHE] No users registered from waitlist")
 
@@ -850,6 +841,96 @@ async def find_or_register_user(
         raise SheetsError(f"Failed to find or register user {discord_tag}: {e}")
 
 
+async def register_users_batch(
+        guild_id: str,
+        entries: List[Dict[str, Any]]
+) -> Tuple[Dict[str, int], List[Tuple[str, str]]]:
+    """
+    Register several users with one read of the Discord column and one batch write.
+
+    Each entry needs ``discord_tag`` and ``ign`` and may carry ``team_name``,
+    ``alt_igns`` and ``pronouns``. Users already in the cache, and any that
+    don't fit in the empty formatted rows, go through find_or_register_user.
+
+    Returns ({discord_tag: row}, [(discord_tag, error)]).
+    """
+    rows: Dict[str, int] = {}
+    failures: List[Tuple[str, str]] = []
+    if not entries:
+        return rows, failures
+
+    gid = str(guild_id)
+    mode = get_event_mode_for_guild(gid)
+    cfg, col_indexes = await SheetIntegrationHelper.get_sheet_and_column_config(gid)
+    sheet = await get_sheet_for_guild(gid, "GAL Database")
+
+    async with cache_lock:
+        known = set(sheet_cache["users"])
+    fresh = [entry for entry in entries if entry["discord_tag"] not in known]
+    individually = [entry for entry in entries if entry["discord_tag"] in known]
+
+    if fresh:
+        hline = cfg["header_line_num"]
+        discord_data = await fetch_required_columns(
+            sheet, {"discord_idx": col_indexes.get("discord_idx")}, hline, cfg.get("max_players", 9999)
+        )
+        empty_rows = [
+            hline + 1 + offset
+            for offset, value in enumerate(discord_data.get("discord_idx", []))
+            if not str(value).strip()
+        ]
+        individually.extend(fresh[len(empty_rows):])
+        placed = list(zip(fresh, empty_rows, strict=False))
+
+        columns = {
+            key: await SheetIntegrationHelper.get_column_letter(gid, key)
+            for key in ("discord_col", "ign_col", "registered_col", "checkin_col", "alt_ign_col", "pronouns_col")
+        }
+        if mode == "doubleup":
+            columns["team_col"] = await SheetIntegrationHelper.get_column_letter(gid, "team_col")
+
+        updates = []
+        for entry, row in placed:
+            values = {
+                "discord_col": entry["discord_tag"],
+                "ign_col": entry["ign"],
+                "registered_col": True,
+                "checkin_col": False,
+                "alt_ign_col": entry.get("alt_igns") or "",
+                "pronouns_col": entry.get("pronouns") or "",
+                "team_col": entry.get("team_name") or "",
+            }
+            updates.extend((f"{col}{row}", values[key]) for key, col in columns.items() if col)
+
+        if placed:
+            if await apply_sheet_updates(sheet, updates):
+                async with cache_lock:
+                    for entry, row in placed:
+                        sheet_cache["users"][entry["discord_tag"]] = (
+                            row, entry["ign"], True, False, entry.get("team_name") or "",
+                            entry.get("alt_igns") or "", entry.get("pronouns") or "", "Unranked"
+                        )
+                        rows[entry["discord_tag"]] = row
+                logger.info(f"Registered {len(placed)} users in one batch for guild {gid}")
+            else:
+                failures.extend((entry["discord_tag"], "Failed to update user data in batch") for entry, _ in placed)
+
+    for entry in individually:
+        try:
+            rows[entry["discord_tag"]] = await find_or_register_user(
+                entry["discord_tag"],
+                entry["ign"],
+                guild_id=gid,
+                team_name=entry.get("team_name"),
+                alt_igns=entry.get("alt_igns"),
+                pronouns=entry.get("pronouns")
+            )
+        except Exception as e:
+            failures.append((entry["discord_tag"], str(e)))
+
+    return rows, failures
+
+
 async def unregister_user(
         discord_tag: str,
         guild_id: str | None = None
@@ -1012,10 +1093,71 @@ async def _update_checkin_status(
         raise SheetsError(f"Failed to update check-in status for {discord_tag}: {e}")
 
 
-async def reset_registered_roles_and_sheet(guild, channel) -> int:
+# Bulk role removal during resets
+ROLE_RESET_CONCURRENCY = int(os.getenv("ROLE_RESET_CONCURRENCY", "8"))
+ROLE_RESET_PROGRESS_INTERVAL = 2.0
+
+ResetProgressCallback = Callable[[int, int], Awaitable[None]]
+
+
+async def remove_roles_in_parallel(
+    removals: List[Tuple[Any, List[Any]]],
+    reason: str,
+    on_progress: Optional[ResetProgressCallback] = None,
+    *,
+    concurrency: int = ROLE_RESET_CONCURRENCY,
+) -> Tuple[int, List[Tuple[Any, str]]]:
+    """
+    Remove roles from many members on a bounded pool of workers.
+
+    Args:
+        removals: (member, roles) pairs.
+        reason: Audit-log reason passed to ``remove_roles``.
+        on_progress: Awaited with (done, total) at most every
+            ``ROLE_RESET_PROGRESS_INTERVAL`` seconds and once at the end.
+        concurrency: Number of simultaneous ``remove_roles`` calls.
+
+    Returns:
+        (members updated, [(member, error)] for members that failed).
+    """
+    total = len(removals)
+    failures: List[Tuple[Any, str]] = []
+    done = 0
+    last_report = time.monotonic()
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def report() -> None:
+        try:
+            await on_progress(done, total)
+        except Exception as e:
+            logger.debug(f"Role reset progress update failed: {e}")
+
+    async def remove(member, roles) -> None:
+        nonlocal done, last_report
+        async with semaphore:
+            try:
+                await member.remove_roles(*roles, reason=reason)
+            except Exception as e:
+                logger.warning(f"Failed to remove roles from {member}: {e}")
+                failures.append((member, str(e)))
+        done += 1
+        if on_progress and time.monotonic() - last_report >= ROLE_RESET_PROGRESS_INTERVAL:
+            last_report = time.monotonic()
+            await report()
+
+    await asyncio.gather(*(remove(member, roles) for member, roles in removals))
+    if on_progress:
+        await report()
+    return total - len(failures), failures
+
+
+async def reset_registered_roles_and_sheet(
+    guild, channel, on_progress: Optional[ResetProgressCallback] = None
+) -> int:
     """
     Reset all registration data - clear all columns except headers.
     Also removes roles from all members to match the cleared sheet.
+    ``on_progress`` receives (done, total) while roles are being removed.
     """
     try:
         gid = str(guild.id)
@@ -1078,35 +1220,33 @@ async def reset_registered_roles_and_sheet(guild, channel) -> int:
         registered_role = RoleManager.get_role(guild, get_registered_role())
         checked_in_role = RoleManager.get_role(guild, get_checked_in_role())
 
-        roles_removed = 0
+        # Collect every member holding either role (orphaned checked-in roles included)
+        removals = {}
+        for role in (registered_role, checked_in_role):
+            if not role:
+                continue
+            for member in role.members:
+                removals.setdefault(member.id, (member, []))[1].append(role)
 
-        if registered_role:
-            for member in registered_role.members[:]:  # Use slice to avoid modification during iteration
-                try:
-                    roles_to_remove = [registered_role]
-                    if checked_in_role and checked_in_role in member.roles:
-                        roles_to_remove.append(checked_in_role)
-                    await member.remove_roles(*roles_to_remove, reason="Registration reset")
-                    roles_removed += 1
-                except Exception as e:
-                    logger.warning(f"Failed to remove roles from {member}: {e}")
+        roles_removed, failures = await remove_roles_in_parallel(
+            list(removals.values()), "Registration reset", on_progress
+        )
 
-        # Also check for any orphaned checked-in roles (shouldn't happen but be safe)
-        if checked_in_role:
-            for member in checked_in_role.members[:]:
-                if registered_role not in member.roles:  # Has checked-in but not registered
-                    try:
-                        await member.remove_roles(checked_in_role, reason="Registration reset - orphaned role")
-                        roles_removed += 1
-                    except Exception as e:
-                        logger.warning(f"Failed to remove orphaned checked-in role from {member}: {e}")
+        # The sheet rows are now blank, so nobody is left in the cache
+        async with cache_lock:
+            sheet_cache["users"] = {}
+            cache_manager.mark_refresh()
 
-        # Refresh cache (this will also sync any remaining role discrepancies)
-        await refresh_sheet_cache(force=True)
+        # Let a full refresh sync the roles that failed to come off
+        if failures:
+            await refresh_sheet_cache(force=True)
 
         # Return the number of rows that were cleared
         cleared_rows = max_players
-        logger.info(f"Reset registration for {cleared_rows} rows and removed roles from {roles_removed} members")
+        logger.info(
+            f"Reset registration for {cleared_rows} rows and removed roles from {roles_removed} members"
+            f" ({len(failures)} failed)"
+        )
 
         return cleared_rows
 
@@ -1116,10 +1256,13 @@ async def reset_registered_roles_and_sheet(guild, channel) -> int:
         raise SheetsError(f"Failed to reset registered roles and sheet: {e}")
 
 
-async def reset_checked_in_roles_and_sheet(guild, channel) -> int:
+async def reset_checked_in_roles_and_sheet(
+    guild, channel, on_progress: Optional[ResetProgressCallback] = None
+) -> int:
     """
     Reset only check-in data - set checkin column to False.
     Also removes checked-in role from all members.
+    ``on_progress`` receives (done, total) while roles are being removed.
     """
     try:
         gid = str(guild.id)
@@ -1155,21 +1298,26 @@ async def reset_checked_in_roles_and_sheet(guild, channel) -> int:
         from helpers import RoleManager
 
         checked_in_role = RoleManager.get_role(guild, get_checked_in_role())
-        roles_removed = 0
+        removals = [(member, [checked_in_role]) for member in checked_in_role.members] if checked_in_role else []
+        roles_removed, failures = await remove_roles_in_parallel(removals, "Check-in reset", on_progress)
 
-        if checked_in_role:
-            for member in checked_in_role.members[:]:  # Use slice to avoid modification during iteration
-                try:
-                    await member.remove_roles(checked_in_role, reason="Check-in reset")
-                    roles_removed += 1
-                except Exception as e:
-                    logger.warning(f"Failed to remove checked-in role from {member}: {e}")
+        # Every check-in cell is now False; registrations are untouched
+        async with cache_lock:
+            sheet_cache["users"] = {
+                tag: (*tpl[:3], False, *tpl[4:])
+                for tag, tpl in sheet_cache["users"].items()
+            }
+            cache_manager.mark_refresh()
 
-        # Refresh cache (this will also sync any remaining role discrepancies)
-        await refresh_sheet_cache(force=True)
+        # Let a full refresh sync the roles that failed to come off
+        if failures:
+            await refresh_sheet_cache(force=True)
 
         cleared_count = max_players
-        logger.info(f"Reset check-in for {cleared_count} rows and removed role from {roles_removed} members")
+        logger.info(
+            f"Reset check-in for {cleared_count} rows and removed role from {roles_removed} members"
+            f" ({len(failures)} failed)"
+        )
 
         return cleared_count
 
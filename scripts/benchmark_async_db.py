@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Benchmark for event-loop latency while heavy report queries run.
+
+Seeds ``--submissions`` lobbies into a temporary SQLite file and runs a
+broadcast ticker (the cadence the WebSocket manager pushes at) next to
+``--concurrency`` concurrent ``/placements/reports/confidence`` calls.  The
+report is served once through a blocking ``Session`` -- how the router ran
+before -- and once through the ``AsyncSession`` dependency, and the ticker's
+lateness is reported for both.
+
+Usage:
+    python scripts/benchmark_async_db.py [--submissions 50000] [--concurrency 8]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, insert  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from api.models import Base, PlacementSubmission, RoundPlacement  # noqa: E402
+from api.routers.placements import confidence_report  # noqa: E402
+
+TICK_SECONDS = 0.01
+
+
+class BlockingSession:
+    """Awaitable facade over a sync ``Session``, like a sync call inside ``async def``."""
+
+    def __init__(self, session):
+        self._session = session
+
+    async def execute(self, statement):
+        return self._session.execute(statement)
+
+
+def seed(url, submissions):
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.execute(insert(PlacementSubmission), [
+        {
+            "id": i,
+            "guild_id": "1",
+            "tournament_id": f"t{i % 4}",
+            "round_name": f"ROUND_{i % 8 + 1}",
+            "lobby_number": i % 16,
+            "discord_message_id": str(i),
+            "discord_channel_id": "1",
+            "image_url": "https://example.com/lobby.png",
+            "overall_confidence": 40 + i % 61,
+            "validation_method": ("auto", "manual", None)[i % 3],
+            "extracted_data_consensus": {},
+        }
+        for i in range(1, submissions + 1)
+    ])
+    session.execute(insert(RoundPlacement), [
+        {
+            "submission_id": i,
+            "player_id": f"p{(i * 8 + slot) % 512}",
+            "player_name": f"Player {slot}",
+            "tournament_id": f"t{i % 4}",
+            "round_name": f"ROUND_{i % 8 + 1}",
+            "round_number": i % 8 + 1,
+            "lobby_number": i % 16,
+            "placement": slot + 1,
+            "points": 8 - slot,
+            "player_match_confidence": 60 + (i + slot) % 41,
+            "manually_corrected": (i + slot) % 7 == 0,
+        }
+        for i in range(1, submissions + 1)
+        for slot in range(8)
+    ])
+    session.commit()
+    session.close()
+    engine.dispose()
+
+
+async def _ticker(stop, lateness):
+    loop = asyncio.get_running_loop()
+    expected = loop.time() + TICK_SECONDS
+    while not stop.is_set():
+        await asyncio.sleep(max(expected - loop.time(), 0))
+        lateness.append((loop.time() - expected) * 1000)
+        expected += TICK_SECONDS
+
+
+async def run(make_session, concurrency, repeat):
+    stop = asyncio.Event()
+    lateness = []
+    ticker = asyncio.create_task(_ticker(stop, lateness))
+    await asyncio.sleep(TICK_SECONDS * 5)
+
+    async def worker():
+        for _ in range(repeat):
+            async with make_session() as db:
+                await confidence_report(tournament_id=None, db=db, _user=None)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await ticker
+    lateness.sort()
+    return {
+        "reports_s": elapsed,
+        "p50": statistics.median(lateness),
+        "p99": lateness[int(len(lateness) * 0.99) - 1],
+        "max": lateness[-1],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--submissions", type=int, default=50_000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        seed(f"sqlite:///{path}", args.submissions)
+
+        sync_engine = create_engine(f"sqlite:///{path}")
+        sync_sessions = sessionmaker(bind=sync_engine)
+
+        class _Blocking:
+            async def __aenter__(self):
+                self._session = sync_sessions()
+                return BlockingSession(self._session)
+
+            async def __aexit__(self, *exc):
+                self._session.close()
+
+        async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        async_sessions = async_sessionmaker(async_engine, expire_on_commit=False)
+
+        async def bench():
+            results = {
+                "sync session": await run(_Blocking, args.concurrency, args.repeat),
+                "async session": await run(async_sessions, args.concurrency, args.repeat),
+            }
+            await async_engine.dispose()
+            return results
+
+        results = asyncio.run(bench())
+        sync_engine.dispose()
+
+    print(f"submissions: {args.submissions}  placements: {args.submissions * 8}  "
+          f"reports: {args.concurrency * args.repeat}  tick: {TICK_SECONDS * 1000:.0f}ms")
+    print(f"{'mode':>14} {'reports s':>10} {'lag p50 ms':>11} {'lag p99 ms':>11} {'lag max ms':>11}")
+    for mode, r in results.items():
+        print(f"{mode:>14} {r['reports_s']:>10.2f} {r['p50']:>11.2f} {r['p99']:>11.2f} {r['max']:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for ScreenshotClassifier feature extraction.
+
+Compares extracting features from the full-resolution image against the
+downscaled single-pass path, for the bundled standings fixtures scaled to
+common Discord upload sizes. Image decode time is reported separately since
+it is the same for both paths.
+
+Usage:
+    python scripts/benchmark_classifier.py [--repeat 10]
+"""
+
+import argparse
+import functools
+import glob
+import logging
+import os
+import sys
+import time
+import tracemalloc
+
+import cv2
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from integrations.screenshot_classifier import ScreenshotClassifier  # noqa: E402
+
+FIXTURES = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "assets", "templates", "tft_standings", "*.png"
+)
+SIZES = [(1920, 1080), (2560, 1440), (3840, 2160)]
+
+
+def _measure(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    elapsed = (time.perf_counter() - start) / repeat * 1000
+
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak / 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    classifier = ScreenshotClassifier()
+    full_res = ScreenshotClassifier()
+    full_res.analysis_height = 1 << 16  # never downscale
+
+    print(f"{'image':<28} {'full ms':>8} {'full MB':>8} {'480p ms':>8} {'480p MB':>8} {'decode ms':>10}")
+    for path in sorted(glob.glob(FIXTURES)):
+        source = cv2.imread(path)
+        for width, height in SIZES:
+            img = cv2.resize(source, (width, height), interpolation=cv2.INTER_CUBIC)
+            ok, encoded = cv2.imencode(".png", img)
+
+            def features(c, img=img):
+                return lambda: c._extract_features(c._downscale(img))
+
+            full_ms, full_mb = _measure(features(full_res), args.repeat)
+            small_ms, small_mb = _measure(features(classifier), args.repeat)
+            decode_ms, _ = _measure(functools.partial(cv2.imdecode, encoded, cv2.IMREAD_COLOR), args.repeat)
+
+            name = f"{os.path.basename(path)} {width}x{height}"
+            print(
+                f"{name:<28} {full_ms:>8.1f} {full_mb:>8.1f} "
+                f"{small_ms:>8.1f} {small_mb:>8.1f} {decode_ms:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Load test for the frontend reverse proxy against a local stub server.
+
+Starts a stub "Next.js" server on a free port serving a small asset and a
+``--bundle-mb`` JavaScript bundle, then drives the proxy route in-process
+with ``--concurrency`` concurrent clients.  The original handler (fresh
+``AsyncClient`` per request, upstream body buffered) is compared against
+``proxy_to_frontend`` (shared pooled client, bodies streamed).
+
+Usage:
+    python scripts/benchmark_frontend_proxy.py [--requests 2000] [--concurrency 50] [--bundle-mb 20]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import socket
+import sys
+import threading
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx  # noqa: E402
+import uvicorn  # noqa: E402
+from fastapi import FastAPI, Request, Response  # noqa: E402
+from fastapi.responses import StreamingResponse  # noqa: E402
+
+ASSET = b"x" * 4096
+CHUNK = 64 * 1024
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_stub(port, bundle_bytes):
+    stub = FastAPI()
+
+    @stub.get("/asset.css")
+    async def asset():
+        return Response(ASSET, media_type="text/css")
+
+    @stub.get("/bundle.js")
+    async def bundle():
+        async def body():
+            for offset in range(0, bundle_bytes, CHUNK):
+                yield b"x" * min(CHUNK, bundle_bytes - offset)
+        return StreamingResponse(body(), media_type="application/javascript",
+                                 headers={"content-length": str(bundle_bytes)})
+
+    server = uvicorn.Server(uvicorn.Config(stub, host="127.0.0.1", port=port, log_level="error"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+
+def legacy_app(frontend_url):
+    """The original handler: a new client per request and a fully buffered body."""
+    legacy = FastAPI()
+
+    @legacy.get("/{path:path}")
+    async def proxy(request: Request, path: str):
+        headers = dict(request.headers)
+        headers.pop("host", None)
+        async with httpx.AsyncClient() as client:
+            response = await client.request(method=request.method, url=f"{frontend_url}/{path}", headers=headers)
+            excluded_headers = {"content-encoding", "content-length", "transfer-encoding"}
+            filtered_headers = {k: v for k, v in response.headers.items() if k.lower() not in excluded_headers}
+            return Response(content=response.content, status_code=response.status_code, headers=filtered_headers)
+
+    return legacy
+
+
+async def _get(app, path):
+    """Call the ASGI app directly, discarding body chunks as a socket would."""
+    received = 0
+    requested = False
+    done = asyncio.Event()
+
+    async def receive():
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal received
+        if message["type"] == "http.response.body":
+            received += len(message.get("body", b""))
+            if not message.get("more_body", False):
+                done.set()
+
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": b"",
+        "root_path": "", "headers": [(b"host", b"dashboard")], "client": ("127.0.0.1", 1),
+        "server": ("127.0.0.1", 8000),
+    }
+    await app(scope, receive, send)
+    return received
+
+
+async def _load(app, path, total, concurrency):
+    queue = iter(range(total))
+
+    async def worker():
+        received = 0
+        for _ in queue:
+            received += await _get(app, path)
+        return received
+
+    start = time.perf_counter()
+    received = sum(await asyncio.gather(*(worker() for _ in range(concurrency))))
+    return time.perf_counter() - start, received
+
+
+async def _peak_memory(app, path, concurrency):
+    tracemalloc.start()
+    await asyncio.gather(*(_get(app, path) for _ in range(concurrency)))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--bundle-mb", type=int, default=20)
+    parser.add_argument("--bundle-concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    port = _free_port()
+    frontend_url = f"http://127.0.0.1:{port}"
+    os.environ["FRONTEND_URL"] = frontend_url
+    from api.main import app  # noqa: E402  (reads FRONTEND_URL at import)
+
+    bundle_bytes = args.bundle_mb * 1024 * 1024
+    server = start_stub(port, bundle_bytes)
+
+    async def bench():
+        results = {}
+        for label, target in (("per-request", legacy_app(frontend_url)), ("pooled", app)):
+            elapsed, _ = await _load(target, "/asset.css", args.requests, args.concurrency)
+            peak = await _peak_memory(target, "/bundle.js", args.bundle_concurrency)
+            results[label] = (args.requests / elapsed, peak / 1024 / 1024)
+        await app.state.frontend_client.aclose()
+        return results
+
+    results = asyncio.run(bench())
+    server.should_exit = True
+
+    print(f"asset requests: {args.requests} x{args.concurrency}  "
+          f"bundle: {args.bundle_mb}MB x{args.bundle_concurrency}")
+    print(f"{'proxy':>12} {'assets req/s':>13} {'bundle peak MB':>15}")
+    for label, (throughput, peak_mb) in results.items():
+        print(f"{label:>12} {throughput:>13.0f} {peak_mb:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for CloudVisionOCR text merging and placement matching.
+
+Times ``_merge_adjacent_text`` and ``_match_placements_to_names`` on synthetic
+end screens with a growing number of chat/sidebar words, which is where the
+old all-pairs comparison blew up.
+
+Usage:
+    python scripts/benchmark_ocr_merge.py [--repeat 20]
+"""
+
+import argparse
+import functools
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from integrations.cloud_vision_ocr import CloudVisionOCR  # noqa: E402
+
+WORDS = ["Ffoxface", "Kalimier", "mayxd", "Coralie", "gg", "wp", "nice", "hello", "chat", "xd"]
+
+
+def _detection(text, x, y, width, height=22):
+    return {
+        "text": text,
+        "center_x": x + width / 2,
+        "center_y": y + height / 2,
+        "bbox": [[x, y], [x + width, y], [x + width, y + height], [x, y + height]],
+        "confidence": 0.95,
+    }
+
+
+def build_detections(rng, words):
+    """Build ``words`` detections: 8 placement rows plus scattered noise."""
+    detections = []
+    for placement in range(1, 9):
+        y = 200 + (placement - 1) * 80
+        detections.append(_detection(str(placement), 110, y, 18))
+        detections.append(_detection(rng.choice(WORDS), 210, y, 120))
+    while len(detections) < words:
+        detections.append(
+            _detection(rng.choice(WORDS), rng.randint(0, 2500), rng.randint(0, 1400), 80)
+        )
+    detections.sort(key=lambda d: (d["center_y"], d["center_x"]))
+    return detections
+
+
+def build_match_inputs(rng, names):
+    placements = [(p, 200 + (p - 1) * 80 + 11, 119.0) for p in range(1, 9)]
+    name_rows = [(rng.choice(WORDS), rng.uniform(0, 1400), rng.uniform(0, 2500)) for _ in range(names)]
+    return placements, name_rows
+
+
+def _time(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    ocr = CloudVisionOCR.__new__(CloudVisionOCR)
+    rng = random.Random(42)
+
+    print(f"{'words':>6} {'merge ms':>10} {'match ms':>10}")
+    for words in (50, 150, 300, 600, 1200):
+        detections = build_detections(rng, words)
+        placements, names = build_match_inputs(rng, words)
+        merge_ms = _time(
+            lambda detections=detections: ocr._merge_adjacent_text([dict(d) for d in detections]), args.repeat
+        )
+        match_ms = _time(
+            functools.partial(ocr._match_placements_to_names, placements, names), args.repeat
+        )
+        print(f"{words:>6} {merge_ms:>10.2f} {match_ms:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
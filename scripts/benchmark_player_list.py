@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark for rendering the registered player list on each "View Players" click.
+
+Builds a sheet cache of ``--players`` registered users and times the original
+path -- filter every cached user and rebuild every line into one description
+-- against ``PlayerListCache`` serving unchanged pages, and re-rendering after
+one player checks in.
+
+Usage:
+    DISCORD_TOKEN=x APPLICATION_ID=1 python scripts/benchmark_player_list.py [--players 256] [--repeat 2000]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+logging.disable(logging.CRITICAL)
+
+from helpers.embed_helpers import EmbedHelper  # noqa: E402
+from helpers.player_list_cache import PlayerListCache  # noqa: E402
+
+
+def build_users(players, teams):
+    return {
+        f"player{i:04d}": (
+            i + 2, f"Summoner{i:04d}#NA1", "TRUE", "TRUE" if i % 3 else "FALSE",
+            f"Team {i % teams}" if teams else "", "", ""
+        )
+        for i in range(players)
+    }
+
+
+def legacy_render(users, mode):
+    all_registered = [(tag, tpl) for tag, tpl in users.items() if str(tpl[2]).upper() == "TRUE"]
+    lines = EmbedHelper.build_checkin_list_lines(all_registered, mode)
+    return "\n".join(lines)
+
+
+def time_per_call(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def bench_mode(mode, teams, players, repeat):
+    """Time one event mode; returns (legacy us, cached us, 1 change us, pages, legacy chars)."""
+    users = build_users(players, teams)
+    cache = PlayerListCache()
+    cache.get("1", mode, users)
+
+    legacy_us = time_per_call(lambda: legacy_render(users, mode), repeat)
+    cached_us = time_per_call(lambda: cache.get("1", mode, users), repeat)
+
+    tag = next(iter(users))
+    row, ign, reg, ci, team, alt, pronouns = users[tag]
+    states = ("TRUE", "FALSE")
+
+    def toggle_and_render():
+        nonlocal ci
+        ci = states[ci == "TRUE"]
+        users[tag] = (row, ign, reg, ci, team, alt, pronouns)
+        cache.get("1", mode, users)
+
+    changed_us = time_per_call(toggle_and_render, repeat // 10 or 1)
+    pages = len(cache.get("1", mode, users).pages)
+    return legacy_us, cached_us, changed_us, pages, len(legacy_render(users, mode))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--players", type=int, default=256)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"players: {args.players}  repeat: {args.repeat}")
+    print(f"{'mode':>9} {'legacy us':>10} {'cached us':>10} {'1 change us':>12} {'pages':>6} {'legacy chars':>13}")
+    for mode, teams in (("normal", 0), ("doubleup", args.players // 2)):
+        legacy_us, cached_us, changed_us, pages, legacy_chars = bench_mode(mode, teams, args.players, args.repeat)
+        print(f"{mode:>9} {legacy_us:>10.1f} {cached_us:>10.2f} {changed_us:>12.1f} {pages:>6} {legacy_chars:>13}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the player search endpoint at tournament-history scale.
+
+Loads ``--placements`` round placements into an in-memory SQLite database and
+times the original SequenceMatcher scan against the trigram index used by
+``/placements/players/search``.
+
+Usage:
+    python scripts/benchmark_player_search.py [--placements 100000] [--repeat 5]
+"""
+
+import argparse
+import logging
+import os
+import random
+import string
+import sys
+import time
+from difflib import SequenceMatcher
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, insert  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from api.models import (  # noqa: E402
+    Base,
+    PlacementSubmission,
+    PlayerAlias,
+    PlayerSearchTerm,
+    RoundPlacement,
+)
+from api.services.player_search import PlayerSearchIndex  # noqa: E402
+
+PLAYERS_PER_TOURNAMENT = 128
+LOBBY_SIZE = 8
+
+
+def _player_name(rng):
+    return "".join(rng.choice(string.ascii_letters + string.digits) for _ in range(rng.randint(5, 14)))
+
+
+def seed(session, placements, rng):
+    """Insert ``placements`` rows spread over tournaments of 128 players."""
+    players = [(f"p{i}", _player_name(rng)) for i in range(max(placements // 20, PLAYERS_PER_TOURNAMENT))]
+    session.execute(insert(PlayerAlias), [
+        {"player_id": pid, "discord_id": pid, "alias_name": name.lower()[:6], "alias_type": "discord"}
+        for pid, name in rng.sample(players, len(players) // 4)
+    ])
+
+    submission_rows, placement_rows = [], []
+    tournament = 0
+    while len(placement_rows) < placements:
+        roster = rng.sample(players, PLAYERS_PER_TOURNAMENT)
+        for round_number in range(1, 9):
+            for lobby in range(PLAYERS_PER_TOURNAMENT // LOBBY_SIZE):
+                submission_id = len(submission_rows) + 1
+                submission_rows.append({
+                    "id": submission_id,
+                    "guild_id": "1",
+                    "tournament_id": f"t{tournament}",
+                    "round_name": f"ROUND_{round_number}",
+                    "lobby_number": lobby + 1,
+                    "discord_message_id": str(submission_id),
+                    "discord_channel_id": "1",
+                    "image_url": "https://example.com/lobby.png",
+                    "overall_confidence": 95,
+                    "extracted_data_consensus": {},
+                })
+                for slot, (pid, name) in enumerate(roster[lobby * LOBBY_SIZE:(lobby + 1) * LOBBY_SIZE]):
+                    placement_rows.append({
+                        "submission_id": submission_id,
+                        "player_id": pid,
+                        "player_name": name,
+                        "tournament_id": f"t{tournament}",
+                        "round_name": f"ROUND_{round_number}",
+                        "round_number": round_number,
+                        "lobby_number": lobby + 1,
+                        "placement": slot + 1,
+                        "points": 8 - slot,
+                    })
+        tournament += 1
+
+    session.execute(insert(PlacementSubmission), submission_rows)
+    session.execute(insert(RoundPlacement), placement_rows[:placements])
+    session.commit()
+    return players
+
+
+def legacy_search(db, q, tournament_id=None, limit=20):
+    """The original endpoint body: load everything and scan with SequenceMatcher."""
+    search_term = q.lower()
+    placements_query = db.query(RoundPlacement).filter(RoundPlacement.player_name.isnot(None))
+    if tournament_id:
+        placements_query = placements_query.filter(RoundPlacement.tournament_id == tournament_id)
+
+    unique_players = {}
+    for placement in placements_query.all():
+        if placement.player_id and placement.player_id not in unique_players:
+            unique_players[placement.player_id] = placement.player_name
+
+    aliases_map = {}
+    for alias in db.query(PlayerAlias).all():
+        aliases_map.setdefault(alias.player_id, []).append(alias.alias_name)
+
+    matches = []
+    for player_id, player_name in unique_players.items():
+        name_similarity = SequenceMatcher(None, search_term, player_name.lower()).ratio()
+        for alias in aliases_map.get(player_id, []):
+            alias_similarity = SequenceMatcher(None, search_term, alias.lower()).ratio()
+            if alias_similarity > 0.5:
+                name_similarity = max(name_similarity, alias_similarity)
+        if name_similarity > 0.3 or search_term in player_name.lower():
+            matches.append({"id": player_id, "match_confidence": name_similarity})
+    matches.sort(key=lambda x: x["match_confidence"], reverse=True)
+    return matches[:limit]
+
+
+def _time(fn, queries, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for query in queries:
+            fn(query)
+    return (time.perf_counter() - start) / (repeat * len(queries)) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--placements", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    rng = random.Random(42)
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    start = time.perf_counter()
+    players = seed(session, args.placements, rng)
+    seed_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = PlayerSearchIndex(session)
+    index.rebuild()
+    build_s = time.perf_counter() - start
+    terms = session.query(PlayerSearchTerm).count()
+
+    # Search-as-you-type prefixes plus a typo'd full name
+    queries = []
+    for _, name in rng.sample(players, 5):
+        queries.extend([name[:2], name[:4], name[:-1] + "x"])
+
+    print(f"placements: {args.placements}  players: {len(players)}  indexed terms: {terms}")
+    print(f"seed: {seed_s:.1f}s  index rebuild: {build_s:.1f}s")
+    print(f"{'scope':>12} {'legacy ms':>10} {'indexed ms':>11}")
+    for label, tournament_id in (("all", None), ("tournament", "t0")):
+        legacy_ms = _time(lambda q, t=tournament_id: legacy_search(session, q, t), queries, 1)
+        indexed_ms = _time(lambda q, t=tournament_id: index.search(q, tournament_id=t), queries, args.repeat)
+        print(f"{label:>12} {legacy_ms:>10.1f} {indexed_ms:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Benchmark for WebSocket broadcast fan-out.
+
+Connects ``--connections`` fake sockets to a ``ConnectionManager`` and times
+``--broadcasts`` placement updates of a full round.  The original
+per-connection ``json.dumps`` to every client is compared against the
+encode-once broadcast with every client subscribed, and with a third of them
+subscribed to ``placement_update``.
+
+Usage:
+    python scripts/benchmark_websocket_broadcast.py [--connections 500] [--broadcasts 200]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.routers.websocket import ConnectionManager  # noqa: E402
+
+
+class Delivery:
+    """Frames sent across all fake sockets; ``done`` is set once the expected count arrives."""
+
+    def __init__(self):
+        self.frames = 0
+        self.expected = None
+        self.done = asyncio.Event()
+
+    def record(self):
+        self.frames += 1
+        self._check()
+
+    def expect(self, frames):
+        self.expected = frames
+        self._check()
+
+    def _check(self):
+        if self.expected is not None and self.frames >= self.expected:
+            self.done.set()
+
+
+class FakeWebSocket:
+    def __init__(self, delivery):
+        self.delivery = delivery
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, payload):
+        self.delivery.record()
+
+    async def close(self, code=1000, reason=""):
+        pass
+
+
+class LegacyConnectionManager(ConnectionManager):
+    """The original fan-out: every client gets every event, encoded per client."""
+
+    async def broadcast(self, message):
+        contexts = await self._get_all_contexts()
+        for context in contexts:
+            await self.enqueue(context, message)
+        return len(contexts)
+
+
+def placement_message(round_number):
+    return {
+        "type": "placement_update",
+        "data": {
+            "round": f"ROUND_{round_number}",
+            "lobby_updates": [
+                {"lobby": lobby, "player": f"Player {lobby}-{slot}", "player_id": f"p{lobby}_{slot}",
+                 "placement": slot, "points": 9 - slot}
+                for lobby in range(1, 17)
+                for slot in range(1, 9)
+            ],
+            "action": "refresh",
+            "timestamp": "2026-01-01T00:00:00+00:00",
+        },
+    }
+
+
+async def run(manager_cls, connections, broadcasts, subscribe_every):
+    manager = manager_cls()
+    delivery = Delivery()
+    sockets = [FakeWebSocket(delivery) for _ in range(connections)]
+    contexts = [await manager.connect(ws, f"user{i}") for i, ws in enumerate(sockets)]
+    for context in contexts[::subscribe_every]:
+        manager.subscribe(context, ["placement_update"])
+
+    messages = [placement_message(i % 8 + 1) for i in range(broadcasts)]
+    cpu = time.process_time()
+    wall = time.perf_counter()
+    queued = 0
+    for message in messages:
+        queued += await manager.broadcast(message)
+        # Let sender loops drain so queues never hit backpressure
+        await asyncio.sleep(0)
+    delivery.expect(queued)
+    await delivery.done.wait()
+    cpu = time.process_time() - cpu
+    wall = time.perf_counter() - wall
+
+    frames = delivery.frames
+    for context in contexts:
+        await manager.close(context, "benchmark done")
+    return cpu, wall, frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--connections", type=int, default=500)
+    parser.add_argument("--broadcasts", type=int, default=200)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    payload_kb = len(json.dumps(placement_message(1))) / 1024
+    print(f"connections: {args.connections}  broadcasts: {args.broadcasts}  payload: {payload_kb:.1f}KB")
+    print(f"{'broadcast':>14} {'cpu s':>8} {'wall s':>8} {'frames':>8} {'cpu ms/broadcast':>17}")
+    modes = (
+        ("per-client", LegacyConnectionManager, 3),
+        ("encode-once", ConnectionManager, 1),
+        ("+ topics 1/3", ConnectionManager, 3),
+    )
+    for label, manager_cls, subscribe_every in modes:
+        cpu, wall, frames = asyncio.run(run(manager_cls, args.connections, args.broadcasts, subscribe_every))
+        print(f"{label:>14} {cpu:>8.2f} {wall:>8.2f} {frames:>8} {cpu / args.broadcasts * 1000:>17.2f}")
+
+
+if __name__ == "__main__":
+    main()
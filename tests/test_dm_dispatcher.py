@@ -0,0 +1,117 @@
+"""Tests for the shared DM dispatcher against a fake rate-limited Discord HTTP layer."""
+
+import asyncio
+from collections import deque
+from types import SimpleNamespace
+from typing import Callable, List
+from unittest import mock
+
+import discord
+import pytest
+
+from utils.dm_dispatcher import DMDispatcher
+
+
+class VirtualClock:
+    """Event-loop time that jumps straight to the next timer instead of waiting for it."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def time(self) -> float:
+        return self.now
+
+    def select(self, real_select: Callable, timeout=None):
+        if timeout:
+            self.now += timeout
+        return real_select(0)
+
+
+@pytest.fixture
+async def clock():
+    virtual = VirtualClock()
+    loop = asyncio.get_running_loop()
+    real_select = loop._selector.select
+    with mock.patch.object(loop, "time", virtual.time), mock.patch.object(
+        loop._selector, "select", lambda timeout=None: virtual.select(real_select, timeout)
+    ):
+        yield virtual
+
+
+class FakeDiscordHTTP:
+    """Sliding-window bucket: at most ``limit`` requests per ``per`` seconds, else 429."""
+
+    def __init__(
+        self, clock: VirtualClock, limit: int, per: float, retry_after: float = 0.05, latency: float = 0.01
+    ):
+        self.clock = clock
+        self.limit = limit
+        self.per = per
+        self.retry_after = retry_after
+        self.latency = latency
+        self.window: deque = deque()
+        self.delivered: List[int] = []
+        self.rate_limited = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def send_dm(self, user_id: int) -> None:
+        now = self.clock.time()
+        while self.window and now - self.window[0] >= self.per:
+            self.window.popleft()
+        if len(self.window) >= self.limit:
+            self.rate_limited += 1
+            response = SimpleNamespace(
+                status=429, reason="Too Many Requests", headers={"Retry-After": str(self.retry_after)}
+            )
+            raise discord.HTTPException(response, {"message": "You are being rate limited.", "code": 0})
+        self.window.append(now)
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+        if user_id % 50 == 49:
+            raise discord.Forbidden(SimpleNamespace(status=403, reason="Forbidden"), "Cannot send messages to this user")
+        self.delivered.append(user_id)
+
+
+@pytest.mark.asyncio
+async def test_paced_dispatch_hits_no_rate_limits(clock) -> None:
+    http = FakeDiscordHTTP(clock, limit=20, per=0.1)  # 200 requests/second
+    dispatcher = DMDispatcher(concurrency=8, rate_per_second=180, progress_interval=0.2, clock=clock.time)
+    progress = []
+
+    async def on_progress(result) -> None:
+        progress.append(result.completed)
+        await asyncio.sleep(0.3)  # a slow progress-message edit must not stall sends
+
+    result = await dispatcher.dispatch(range(300), http.send_dm, on_progress)
+
+    assert http.rate_limited == result.rate_limited == 0
+    assert sorted(result.sent) == sorted(http.delivered)
+    assert len(result.sent) == 294
+    assert {user for user, _ in result.failed} == {u for u in range(300) if u % 50 == 49}
+    assert all(reason == "DMs disabled" for _, reason in result.failed)
+
+    # Limited by pacing, not by per-request latency or progress edits
+    assert 300 / result.elapsed > 140
+    assert 1 < http.max_in_flight <= 8
+    assert progress[-1] == 300 and len(progress) >= 2
+
+
+@pytest.mark.asyncio
+async def test_dispatch_adapts_when_limit_is_lower_than_configured(clock) -> None:
+    http = FakeDiscordHTTP(clock, limit=5, per=0.1)  # 50 requests/second
+    dispatcher = DMDispatcher(concurrency=8, rate_per_second=400, max_retries=5, clock=clock.time)
+
+    result = await dispatcher.dispatch(range(100), http.send_dm)
+
+    assert len(result.sent) + len(result.failed) == 100
+    assert all(reason == "DMs disabled" for _, reason in result.failed)
+    assert result.rate_limited == http.rate_limited > 0
+    # Backing off keeps 429s to a small fraction of the sends
+    assert http.rate_limited < 40
+    assert dispatcher.rate < 400
@@ -0,0 +1,101 @@
+"""Tests for tracked-ID DM cleanup."""
+
+import asyncio
+from types import SimpleNamespace
+
+import discord
+import pytest
+
+import utils.dm_tracker as dm_tracker_module
+from utils.dm_tracker import SentDMTracker
+
+
+class MemoryStorage:
+    def __init__(self):
+        self.tables = {}
+        self.writes = 0
+
+    def get_data(self, table, key):
+        return self.tables.get((table, key))
+
+    def set_data(self, table, key, data):
+        self.writes += 1
+        self.tables[(table, key)] = data
+
+
+class FakeDMChannel:
+    def __init__(self, missing=(), limited=()):
+        self.deleted = []
+        self.missing = set(missing)
+        self.limited = set(limited)
+        self.in_flight = 0
+        self.peak = 0
+
+    def get_partial_message(self, message_id):
+        channel = self
+
+        class Partial:
+            async def delete(self):
+                channel.in_flight += 1
+                channel.peak = max(channel.peak, channel.in_flight)
+                try:
+                    await asyncio.sleep(0.01)
+                    if message_id in channel.missing:
+                        raise discord.NotFound(SimpleNamespace(status=404, reason="Not Found"), "Unknown Message")
+                    if message_id in channel.limited:
+                        channel.limited.discard(message_id)
+                        error = discord.HTTPException(SimpleNamespace(status=429, reason="Too Many Requests"), "")
+                        error.retry_after = 0.01
+                        raise error
+                    channel.deleted.append(message_id)
+                finally:
+                    channel.in_flight -= 1
+
+        return Partial()
+
+
+def _member(user_id, channel):
+    sent = []
+
+    async def send(**kwargs):
+        sent.append(kwargs)
+        return SimpleNamespace(id=user_id * 1000 + len(sent))
+
+    return SimpleNamespace(id=user_id, dm_channel=channel, send=send)
+
+
+@pytest.mark.asyncio
+async def test_clear_deletes_exactly_tracked_messages_concurrently() -> None:
+    storage = MemoryStorage()
+    tracker = SentDMTracker(storage=storage, concurrency=3, save_delay=0.05)
+    channel = FakeDMChannel(missing={3}, limited={5})
+    for message_id in range(1, 11):
+        tracker.record(7, message_id)
+        await asyncio.sleep(0)  # sends land in separate loop turns
+    assert storage.writes == 0
+    await asyncio.sleep(0.1)
+    assert storage.writes == 1  # one debounced write for the burst
+
+    deleted = await tracker.clear(_member(7, channel))
+
+    assert deleted == 9
+    assert sorted(channel.deleted) == [1, 2, 4, 5, 6, 7, 8, 9, 10]
+    assert 1 < channel.peak <= 3
+    assert tracker.tracked(7) == []
+    assert await tracker.clear(_member(7, channel)) == 0
+
+
+@pytest.mark.asyncio
+async def test_tracked_ids_survive_restart_and_are_capped(monkeypatch) -> None:
+    monkeypatch.setattr(dm_tracker_module, "MAX_TRACKED_PER_USER", 3)
+    storage = MemoryStorage()
+    first = SentDMTracker(storage=storage)
+    member = _member(4, FakeDMChannel())
+    for _ in range(5):
+        await first.send(member, content="reminder")
+    assert storage.writes == 0
+    first.flush()
+    assert storage.writes == 1
+
+    restarted = SentDMTracker(storage=storage)
+    assert restarted.tracked(4) == [4003, 4004, 4005]
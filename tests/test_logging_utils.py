@@ -0,0 +1,70 @@
+"""Tests for lazy log sanitization."""
+
+import io
+import logging
+
+import utils.logging_utils as logging_utils
+from utils.logging_utils import SanitizingFilter, SecureLogger
+
+TOKEN = "A" * 24 + "." + "B" * 6 + "." + "C" * 27
+
+
+def _capture(name: str, with_filter: bool = False) -> io.StringIO:
+    stream = io.StringIO()
+    logger = logging.getLogger(name)
+    logger.handlers.clear()
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    sanitizing_filter = SanitizingFilter(fields=("riot_id",))
+    for _ in range(2):
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(logging.Formatter("%(message)s %(riot_id)s" if with_filter else "%(message)s"))
+        if with_filter:
+            handler.addFilter(sanitizing_filter)
+        logger.addHandler(handler)
+    return stream
+
+
+def test_disabled_level_skips_sanitization(monkeypatch) -> None:
+    calls = []
+    monkeypatch.setattr(logging_utils, "sanitize_log_message", lambda text: calls.append(text) or text)
+    _capture("tests.lazy_logging.disabled")
+
+    SecureLogger("tests.lazy_logging.disabled").debug(f"token {TOKEN}")
+
+    assert calls == []
+
+
+def test_enabled_record_is_sanitized_once_for_all_handlers(monkeypatch) -> None:
+    calls = []
+    original = logging_utils.sanitize_log_message
+    monkeypatch.setattr(logging_utils, "sanitize_log_message", lambda text: calls.append(text) or original(text))
+    stream = _capture("tests.lazy_logging.enabled")
+
+    SecureLogger("tests.lazy_logging.enabled").info("key %s", "RGAPI-" + "a" * 32)
+
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 2 and lines[0] == lines[1]
+    assert "RGAPI-" not in lines[0] and lines[0].endswith("aaaa")
+    assert len([text for text in calls if text.startswith("key")]) == 1
+
+
+def test_filter_masks_plain_logging_and_extra_fields() -> None:
+    stream = _capture("tests.lazy_logging.plain", with_filter=True)
+
+    logging.getLogger("tests.lazy_logging.plain").warning("DISCORD_TOKEN=%s", TOKEN, extra={"riot_id": TOKEN})
+
+    line = stream.getvalue().splitlines()[0]
+    assert TOKEN not in line
+    assert line.startswith("DISCORD_TOKEN=**")
+
+
+def test_filter_passes_malformed_records_to_handle_error(monkeypatch) -> None:
+    errors = []
+    stream = _capture("tests.lazy_logging.malformed", with_filter=True)
+    for handler in logging.getLogger("tests.lazy_logging.malformed").handlers:
+        monkeypatch.setattr(handler, "handleError", errors.append)
+
+    logging.getLogger("tests.lazy_logging.malformed").info("value %d", "x", extra={"riot_id": "-"})
+
+    assert len(errors) == 2 and stream.getvalue() == ""
@@ -0,0 +1,77 @@
+"""Pending onboarding submissions are written through to storage and reloaded without channel history."""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from core.storage_service import UnifiedStorageService
+from helpers.onboard_helpers import OnboardManager
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    service = UnifiedStorageService.__new__(UnifiedStorageService)
+    service._postgres_pool = None
+    service._sqlite_path = str(tmp_path / "fallback.db")
+    service._sqlite_lock = threading.Lock()
+    service._initialize_sqlite_schema()
+
+    monkeypatch.setattr(OnboardManager, "_storage_service", service)
+    monkeypatch.setattr(OnboardManager, "_pending_submissions", {})
+    return service
+
+
+def test_submissions_survive_restart(storage) -> None:
+    for user_id in (1, 2, 3):
+        OnboardManager.add_pending_submission(user_id, {"name": f"user{user_id}", "guild_id": 10})
+    OnboardManager.add_pending_submission(4, {"name": "other guild", "guild_id": 20})
+    OnboardManager.remove_pending_submission(2)
+    OnboardManager.mark_submissions_seeded(10)
+
+    OnboardManager.clear_pending_submissions()  # bot restart
+
+    assert OnboardManager.load_pending_submissions(10) == 2
+    assert sorted(OnboardManager.get_pending_submissions()) == [1, 3]
+    assert OnboardManager.get_pending_submission(3)["name"] == "user3"
+
+
+def test_unseeded_guild_asks_for_history_seed(storage) -> None:
+    OnboardManager.add_pending_submission(5, {"guild_id": 30})
+    OnboardManager.clear_pending_submissions()
+
+    assert OnboardManager.load_pending_submissions(30) is None
+
+    OnboardManager.mark_submissions_seeded(30)
+    OnboardManager.mark_submissions_seeded(30)
+    assert storage.get_data("persisted_views", "onboard_submissions_seeded") == ["30"]
+    assert OnboardManager.load_pending_submissions(30) == 1
+
+
+def test_seeded_guilds_read_from_postgres_jsonb(storage, monkeypatch) -> None:
+    # psycopg2 hands JSONB lists back already decoded
+    rows = {"onboard_submissions_seeded": [(["30"],)], "30": [("5", {"guild_id": 30})]}
+
+    class Cursor:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def execute(self, sql, params):
+            self.rows = rows.get(params[0], [])
+
+        def fetchone(self):
+            return self.rows[0] if self.rows else None
+
+        def fetchall(self):
+            return self.rows
+
+    connection = SimpleNamespace(cursor=Cursor, commit=lambda: None)
+    storage._postgres_pool = SimpleNamespace(getconn=lambda: connection, putconn=lambda conn: None)
+    monkeypatch.setattr(storage, "_get_sqlite_connection", None)  # a fallback read would fail
+
+    assert storage.get_data("persisted_views", "onboard_submissions_seeded") == ["30"]
+    assert OnboardManager.load_pending_submissions(30) == 1
+    assert OnboardManager.get_pending_submission(5) == {"guild_id": 30}
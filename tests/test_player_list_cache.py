@@ -0,0 +1,52 @@
+"""Tests for the cached, paginated player list."""
+
+from helpers.embed_helpers import EmbedHelper
+from helpers.player_list_cache import PlayerListCache
+
+
+def _users(count: int, teams: int = 0) -> dict:
+    return {
+        f"player{i:03d}": (
+            i + 2, f"Summoner{i:03d}#NA1", "TRUE", "TRUE" if i % 3 else "FALSE",
+            f"Team {i % teams}" if teams else "", "", ""
+        )
+        for i in range(count)
+    }
+
+
+def test_pages_fit_embed_limit_and_keep_every_line() -> None:
+    users = _users(256, teams=64)
+    for mode in ("normal", "doubleup"):
+        pages = PlayerListCache(page_char_limit=1500).get("1", mode, users).pages
+
+        assert len(pages) > 1
+        assert all(len(page) <= 1500 for page in pages)
+        assert all(page.count("```") % 2 == 0 for page in pages)
+        rendered = "\n".join(pages)
+        assert all(tag in rendered for tag in users)
+
+
+def test_only_changed_rows_are_re_rendered() -> None:
+    users = _users(256)
+    cache = PlayerListCache()
+
+    first = cache.get("1", "normal", users)
+    assert cache.lines_rendered == 256
+    assert cache.get("1", "normal", users) is first
+    assert cache.lines_rendered == 256
+
+    row, ign, reg, _, team, alt, pronouns = users["player009"]
+    users["player009"] = (row, ign, reg, "TRUE", team, alt, pronouns)
+    updated = cache.get("1", "normal", users)
+
+    assert cache.lines_rendered == 257
+    assert updated.total_checked_in == first.total_checked_in + 1
+    assert "🟢 [10] player009" in "\n".join(updated.pages)
+
+
+def test_single_page_matches_legacy_lines() -> None:
+    users = _users(12, teams=4)
+    registered = list(users.items())
+    for mode in ("normal", "doubleup"):
+        pages = PlayerListCache().get("1", mode, users).pages
+        assert pages == ["\n".join(EmbedHelper.build_checkin_list_lines(registered, mode))]
@@ -0,0 +1,126 @@
+"""Concurrent registration clicks must never claim more slots than the event has."""
+
+import asyncio
+import random
+from types import SimpleNamespace
+
+import pytest
+
+import core.views as views
+import helpers.sheet_helpers as sheet_helpers
+import helpers.validation_helpers as validation_helpers
+import integrations.sheets as sheets
+import utils.utils as utils
+from helpers.registration_ledger import RegistrationLedger
+from helpers.waitlist_helpers import WaitlistManager
+from integrations.sheets import cache_lock, sheet_cache
+
+GUILD_ID = "1234"
+
+
+@pytest.fixture
+def event(monkeypatch):
+    """Runs complete_registration with the sheet write and Discord calls stubbed out."""
+    settings = {"max_players": 10, "max_per_team": 2}
+    mode = {"value": "normal"}
+    for module in (validation_helpers, sheet_helpers, views):
+        monkeypatch.setattr(module, "get_event_mode_for_guild", lambda guild_id: mode["value"])
+        monkeypatch.setattr(module, "get_sheet_settings", lambda _mode: settings)
+    monkeypatch.setitem(sheet_cache, "users", {})
+
+    ledger = RegistrationLedger()
+    refused = {}
+    reserve = ledger.reserve
+
+    async def recording_reserve(guild_id, discord_tag, team_name=None):
+        error = await reserve(guild_id, discord_tag, team_name)
+        if error:
+            refused[discord_tag] = error.embed_key
+        return error
+
+    ledger.reserve = recording_reserve
+    monkeypatch.setattr(views, "registration_ledger", ledger)
+
+    failing = set()
+
+    async def sheet_write(discord_tag, ign, guild_id=None, team_name=None, **kwargs):
+        await asyncio.sleep(random.uniform(0.001, 0.02))
+        if discord_tag in failing:
+            raise RuntimeError("sheet write failed")
+        async with cache_lock:
+            _register_in_cache(discord_tag, team_name or "")
+        return len(sheet_cache["users"]) + 1
+
+    async def noop(*args, **kwargs):
+        return None
+
+    monkeypatch.setattr(views, "find_or_register_user", sheet_write)
+    monkeypatch.setattr(views, "update_unified_channel", noop)
+    monkeypatch.setattr(views.RoleManager, "add_role", staticmethod(noop))
+    monkeypatch.setattr(views.ErrorHandler, "handle_interaction_error", staticmethod(noop))
+    monkeypatch.setattr(sheets, "refresh_sheet_cache", noop)
+    monkeypatch.setattr(utils, "hyperlink_lolchess_profile", noop)
+    monkeypatch.setattr(WaitlistManager, "get_waitlist_position", staticmethod(noop))
+    monkeypatch.setattr(WaitlistManager, "remove_from_waitlist", staticmethod(noop))
+    monkeypatch.setattr(WaitlistManager, "_find_similar_team", staticmethod(noop))
+
+    async def add_to_waitlist(*args, **kwargs):
+        return 1
+
+    monkeypatch.setattr(WaitlistManager, "add_to_waitlist", staticmethod(add_to_waitlist))
+    return SimpleNamespace(settings=settings, mode=mode, ledger=ledger, refused=refused, failing=failing)
+
+
+def _register_in_cache(tag: str, team: str = "") -> None:
+    sheet_cache["users"][tag] = (len(sheet_cache["users"]) + 2, tag, True, False, team, "", "")
+
+
+async def _click(event, tag: str, team=None) -> str:
+    guild = SimpleNamespace(id=int(GUILD_ID), name="Test Guild")
+    modal = SimpleNamespace(guild=guild, member=tag)
+    interaction = SimpleNamespace(guild=guild, user=tag, client=None)
+    result = await views.complete_registration(
+        interaction, f"{tag}#NA1", "", team, "", modal, return_result=True
+    )
+    if result["success"]:
+        return "registered"
+    return event.refused.get(tag, "failed")
+
+
+@pytest.mark.asyncio
+async def test_rush_for_last_slots_never_oversubscribes(event) -> None:
+    for i in range(7):
+        _register_in_cache(f"existing{i}")
+
+    outcomes = await asyncio.gather(*(_click(event, f"user{i}") for i in range(20)))
+
+    assert outcomes.count("registered") == 3
+    assert outcomes.count("registration_full") == 17
+    assert len(sheet_cache["users"]) == 10
+    assert event.ledger.pending_count(GUILD_ID) == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_write_gives_its_slot_back(event) -> None:
+    for i in range(8):
+        _register_in_cache(f"existing{i}")
+    event.failing.add("a")
+
+    first = await asyncio.gather(_click(event, "a"), _click(event, "b"), _click(event, "c"))
+    assert first == ["failed", "registered", "registration_full"]
+    assert event.ledger.pending_count(GUILD_ID) == 0
+
+    second = await asyncio.gather(*(_click(event, f"late{i}") for i in range(5)))
+    assert second.count("registered") == 1
+    assert len(sheet_cache["users"]) == 10
+
+
+@pytest.mark.asyncio
+async def test_team_slots_are_reserved_too(event) -> None:
+    event.mode["value"] = "doubleup"
+    _register_in_cache("captain", "Team Rocket")
+
+    outcomes = await asyncio.gather(*(_click(event, f"user{i}", "team rocket") for i in range(6)))
+
+    assert outcomes.count("registered") == 1
+    assert outcomes.count("team_full") == 5
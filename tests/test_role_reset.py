@@ -0,0 +1,110 @@
+"""Tests for the bounded parallel role removal used by registration and check-in resets."""
+
+import asyncio
+import time
+
+import pytest
+
+import integrations.sheets as sheets
+from integrations.sheets import remove_roles_in_parallel
+
+
+class FakeMember:
+    in_flight = 0
+    max_in_flight = 0
+
+    def __init__(self, member_id: int, fail: bool = False):
+        self.id = member_id
+        self.fail = fail
+        self.removed = []
+
+    async def remove_roles(self, *roles, reason=None) -> None:
+        FakeMember.in_flight += 1
+        FakeMember.max_in_flight = max(FakeMember.max_in_flight, FakeMember.in_flight)
+        try:
+            await asyncio.sleep(0.02)
+            if self.fail:
+                raise RuntimeError("Missing Permissions")
+            self.removed.extend(roles)
+        finally:
+            FakeMember.in_flight -= 1
+
+    def __str__(self) -> str:
+        return f"member{self.id}"
+
+
+@pytest.mark.asyncio
+async def test_removals_run_concurrently_and_capture_failures(monkeypatch) -> None:
+    monkeypatch.setattr(sheets, "ROLE_RESET_PROGRESS_INTERVAL", 0.05)
+    members = [FakeMember(i, fail=i % 20 == 0) for i in range(100)]
+    progress = []
+
+    async def on_progress(done: int, total: int) -> None:
+        progress.append((done, total))
+
+    start = time.monotonic()
+    removed, failures = await remove_roles_in_parallel(
+        [(member, ["Registered"]) for member in members], "Registration reset", on_progress, concurrency=10
+    )
+    elapsed = time.monotonic() - start
+
+    assert removed == 95
+    assert sorted(member.id for member, _ in failures) == list(range(0, 100, 20))
+    assert all("Missing Permissions" in error for _, error in failures)
+    assert all(member.removed == ["Registered"] for member in members if not member.fail)
+
+    # 100 removals of 20ms each, ten at a time
+    assert FakeMember.max_in_flight == 10
+    assert elapsed < 0.5
+    assert progress[-1] == (100, 100) and len(progress) >= 2
+
+
+@pytest.mark.asyncio
+async def test_checkin_reset_keeps_tuple_tail_and_resyncs_failures(monkeypatch) -> None:
+    class Cell:
+        value = True
+
+    class Sheet:
+        def range(self, cell_range):
+            return [Cell() for _ in range(3)]
+
+        def update_cells(self, cells):
+            return None
+
+    async def get_sheet(gid, name):
+        return Sheet()
+
+    async def run(fn, *args):
+        return fn(*args)
+
+    async def column_letter(gid, key):
+        return "E"
+
+    refreshes = []
+
+    async def refresh(bot=None, *, force=False):
+        refreshes.append(force)
+        return 0, 0
+
+    import helpers
+
+    role = type("Role", (), {"members": [FakeMember(1), FakeMember(2, fail=True)]})()
+    monkeypatch.setattr(sheets, "get_event_mode_for_guild", lambda gid: "normal")
+    monkeypatch.setattr(sheets, "get_sheet_settings", lambda mode: {"header_line_num": 2, "max_players": 3})
+    monkeypatch.setattr(sheets, "get_sheet_for_guild", get_sheet)
+    monkeypatch.setattr(sheets, "retry_until_successful", run)
+    monkeypatch.setattr(sheets.SheetIntegrationHelper, "get_column_letter", staticmethod(column_letter))
+    monkeypatch.setattr(sheets, "refresh_sheet_cache", refresh)
+    monkeypatch.setattr(helpers.RoleManager, "get_role", staticmethod(lambda guild, name: role))
+    # Rows written by find_or_register_user / register_users_batch carry a rank as an eighth field
+    monkeypatch.setitem(sheets.sheet_cache, "users", {
+        "ranked": (3, "Ranked#NA1", True, True, "", "", "", "Diamond II"),
+        "legacy": (4, "Legacy#NA1", True, True, "", "", ""),
+    })
+
+    cleared = await sheets.reset_checked_in_roles_and_sheet(type("Guild", (), {"id": 5})(), None)
+
+    assert cleared == 3
+    assert sheets.sheet_cache["users"]["ranked"] == (3, "Ranked#NA1", True, False, "", "", "", "Diamond II")
+    assert sheets.sheet_cache["users"]["legacy"] == (4, "Legacy#NA1", True, False, "", "", "")
+    assert refreshes == [True]
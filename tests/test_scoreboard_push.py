@@ -0,0 +1,42 @@
+"""/gal updateplacements asks the API process to refresh the scoreboard."""
+
+import pytest
+from aiohttp import web
+from jose import jwt
+
+import core.commands.placement as placement_commands
+from api.auth import ALGORITHM, SECRET_KEY
+from services.dashboard_manager import get_dashboard_manager
+
+
+@pytest.fixture
+async def api_server(monkeypatch):
+    requests = []
+
+    async def refresh(request: web.Request) -> web.Response:
+        token = request.headers["Authorization"].removeprefix("Bearer ")
+        requests.append((jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM]), await request.json()))
+        return web.json_response({"id": 1, "extras": {"scoreboard_version": 7}})
+
+    app = web.Application()
+    app.router.add_post("/scoreboard/refresh", refresh)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "localhost", 0)
+    await site.start()
+    monkeypatch.setattr(get_dashboard_manager(), "api_port", runner.addresses[0][1])
+    try:
+        yield requests
+    finally:
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_push_uses_api_refresh_defaults(api_server) -> None:
+    version = await placement_commands._push_scoreboard_delta("42")
+
+    assert version == 7
+    claims, payload = api_server[0]
+    # Source, Riot fetch and replacement stay at the endpoint's defaults
+    assert payload == {"guild_id": 42, "tournament_id": "42"}
+    assert claims["read_only"] is False and claims["sub"] == "gal_bot"
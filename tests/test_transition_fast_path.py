@@ -0,0 +1,115 @@
+"""Opening registration returns after the state flip and ping; slow follow-up work runs in the background."""
+
+import asyncio
+from datetime import timedelta
+from types import SimpleNamespace
+
+import discord
+import pytest
+
+import core.components_traditional as components_traditional
+import core.discord_events as discord_events
+from config import get_log_channel_name, get_unified_channel_name
+
+
+class FakeChannel:
+    def __init__(self, name: str):
+        self.name = name
+        self.sent = []
+        self.deleted = 0
+
+    async def send(self, content=None, embed=None):
+        self.sent.append(content or embed)
+        channel = self
+
+        class Message:
+            async def delete(self):
+                channel.deleted += 1
+
+        return Message()
+
+
+@pytest.fixture
+def guild(monkeypatch):
+    saved = []
+    monkeypatch.setattr(discord_events, "persisted", {})
+    monkeypatch.setattr(discord_events, "save_persisted", lambda data: saved.append(dict(data)))
+    monkeypatch.setattr(discord_events, "set_schedule", lambda *args: None)
+    monkeypatch.setattr(discord_events, "recent_pings", {})
+    monkeypatch.setattr(discord_events, "PING_CLEANUP_DELAY", 0.05)
+
+    renders = []
+
+    async def slow_render(guild):
+        await asyncio.sleep(0.3)
+        renders.append(guild.id)
+
+    monkeypatch.setattr(components_traditional, "update_unified_channel", slow_render)
+
+    unified = FakeChannel(get_unified_channel_name())
+    log = FakeChannel(get_log_channel_name())
+    angels = SimpleNamespace(name="Angels", mention="@Angels")
+    return SimpleNamespace(
+        id=99, name="Test Guild", text_channels=[unified, log], roles=[angels],
+        unified=unified, log=log, saved=saved, renders=renders,
+    )
+
+
+@pytest.mark.asyncio
+async def test_open_returns_before_deferred_work(guild) -> None:
+    open_time = discord.utils.utcnow() - timedelta(milliseconds=10)
+
+    timing = await discord_events.schedule_system_open(None, guild, "registration", open_time)
+
+    # Users see the open (state saved, ping posted) before the re-render finishes
+    assert guild.saved[-1]["99"]["registration_open"] is True
+    assert len(guild.unified.sent) == 1 and "Registration is now OPEN" in guild.unified.sent[0]
+    assert timing.ping_sent is not None and timing.ping_sent < 0.1
+    assert guild.renders == [] and timing.background_done is None
+    assert discord_events.transition_timings[-1] is timing
+
+    await asyncio.gather(*discord_events.background_tasks)
+    assert guild.renders == [99]
+    assert len(guild.log.sent) == 1
+    assert guild.unified.deleted == 1
+    assert timing.background_done >= 0.3
+    assert timing.to_dict()["transition"] == "registration_open"
+
+
+@pytest.mark.asyncio
+async def test_ping_is_cleaned_up_when_render_fails(guild, monkeypatch) -> None:
+    async def failing_render(guild):
+        raise discord.DiscordException("render failed")
+
+    monkeypatch.setattr(components_traditional, "update_unified_channel", failing_render)
+
+    timing = await discord_events.schedule_system_open(None, guild, "registration", discord.utils.utcnow())
+    await asyncio.gather(*discord_events.background_tasks)
+
+    assert len(guild.unified.sent) == 1 and guild.unified.deleted == 1
+    assert guild.log.sent == [] and timing.background_done is not None
+
+
+@pytest.mark.asyncio
+async def test_close_defers_render_and_log(guild) -> None:
+    timing = await discord_events.schedule_system_close(None, guild, "checkin", discord.utils.utcnow())
+
+    assert guild.saved[-1]["99"]["checkin_open"] is False
+    assert timing.state_saved is not None and guild.renders == []
+
+    await asyncio.gather(*discord_events.background_tasks)
+    assert guild.renders == [99] and len(guild.log.sent) == 1
+
+
+@pytest.mark.asyncio
+async def test_overdue_open_skips_ping(guild) -> None:
+    open_time = discord.utils.utcnow() - timedelta(hours=2)
+
+    timing = await discord_events.schedule_system_open(
+        None, guild, "registration", open_time, is_scheduled_event=False, ping=False
+    )
+    await asyncio.gather(*discord_events.background_tasks)
+
+    assert guild.saved[-1]["99"]["registration_open"] is True
+    assert guild.unified.sent == [] and timing.ping_sent is None
+    assert guild.renders == [99] and guild.log.sent == []
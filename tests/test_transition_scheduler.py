@@ -0,0 +1,134 @@
+"""Tests for the heap-backed open/close transition scheduler."""
+
+import asyncio
+import time
+import tracemalloc
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+import core.transition_scheduler as transition_module
+from core.transition_scheduler import TransitionScheduler
+
+
+class MemoryStorage:
+    def __init__(self):
+        self.tables = {}
+        self.writes = 0
+
+    def get_data(self, table, key):
+        return self.tables.get((table, key))
+
+    def set_data(self, table, key, data):
+        self.writes += 1
+        self.tables[(table, key)] = data
+
+
+def _in(seconds: float) -> datetime:
+    return datetime.now(UTC) + timedelta(seconds=seconds)
+
+
+@pytest.mark.asyncio
+async def test_fires_in_due_order_with_reschedule_and_cancel() -> None:
+    fired = []
+
+    async def handler(guild_id, system_type, action, due):
+        fired.append((guild_id, system_type, action))
+
+    scheduler = TransitionScheduler(storage=MemoryStorage())
+    scheduler.start(handler)
+    scheduler.schedule(1, "registration", "close", _in(0.15))
+    scheduler.schedule(1, "registration", "open", _in(0.05))
+    scheduler.schedule(2, "checkin", "open", _in(0.10))
+    scheduler.schedule(3, "checkin", "open", _in(0.08))
+
+    scheduler.schedule(2, "checkin", "open", _in(0.20))  # rescheduled later
+    assert scheduler.cancel(3) == 1
+
+    await asyncio.sleep(0.35)
+    await scheduler.stop()
+
+    assert fired == [(1, "registration", "open"), (1, "registration", "close"), (2, "checkin", "open")]
+    assert scheduler.pending() == []
+
+
+@pytest.mark.asyncio
+async def test_pending_transitions_survive_restart() -> None:
+    storage = MemoryStorage()
+    first = TransitionScheduler(storage=storage)
+    first.start(lambda *args: asyncio.sleep(0))
+    first.schedule(1, "registration", "open", _in(-30))  # missed while the bot was down
+    first.schedule(1, "checkin", "open", _in(3600))
+    await first.stop()
+
+    fired = []
+
+    async def handler(guild_id, system_type, action, due):
+        fired.append((system_type, action, due < datetime.now(UTC)))
+
+    restarted = TransitionScheduler(storage=storage)
+    restarted.start(handler)
+    await asyncio.sleep(0.05)
+    await restarted.stop()
+
+    assert fired == [("registration", "open", True)]
+    assert [key for key, _ in restarted.pending()] == [(1, "checkin", "open")]
+
+
+@pytest.mark.asyncio
+async def test_first_run_migrates_persisted_schedules(monkeypatch) -> None:
+    open_at = _in(600).isoformat()
+    monkeypatch.setattr(transition_module, "persisted", {
+        "42": {"registration_open_schedule": open_at, "checkin_close_schedule": None},
+        "cache_refresh_seconds": 600,
+    })
+
+    scheduler = TransitionScheduler(storage=MemoryStorage())
+    assert scheduler.load() == 1
+    assert [key for key, _ in scheduler.pending()] == [(42, "registration", "open")]
+
+
+def test_failed_read_keeps_stored_transitions() -> None:
+    storage = MemoryStorage()
+    stored = [{"guild_id": 1, "system_type": "checkin", "action": "close", "due": time.time() + 60}]
+    storage.tables[(transition_module.STORAGE_TABLE, transition_module.STORAGE_KEY)] = stored
+
+    def broken_read(table, key):
+        raise TypeError("the JSON object must be str, bytes or bytearray, not list")
+
+    storage.get_data = broken_read
+    assert TransitionScheduler(storage=storage).load() == 0
+    assert storage.writes == 0
+
+    del storage.get_data
+    assert TransitionScheduler(storage=storage).load() == 1
+
+
+@pytest.mark.asyncio
+async def test_thousands_of_transitions_share_one_timer() -> None:
+    fired = []
+
+    async def handler(guild_id, system_type, action, due):
+        fired.append(guild_id)
+
+    scheduler = TransitionScheduler(storage=MemoryStorage())
+    scheduler.start(handler)
+    tasks_before = len(asyncio.all_tasks())
+
+    tracemalloc.start()
+    base = time.time()
+    for guild_id in range(5000):
+        for system_type in ("registration", "checkin"):
+            for action in ("open", "close"):
+                scheduler.schedule(guild_id, system_type, action, datetime.fromtimestamp(base + 86400 + guild_id, UTC))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    scheduler.schedule(7, "registration", "open", _in(0.05))
+    await asyncio.sleep(0.15)
+
+    assert fired == [7]
+    assert len(scheduler.pending()) == 19999
+    assert len(asyncio.all_tasks()) == tasks_before  # still just the one timer task
+    assert peak < 16 * 1024 * 1024
+    await scheduler.stop()
@@ -0,0 +1,134 @@
+"""Tests for single-pass waitlist promotion."""
+
+from types import SimpleNamespace
+
+import pytest
+
+import core.components_traditional as components_traditional
+import helpers.sheet_helpers as sheet_helpers
+import helpers.waitlist_helpers as waitlist_helpers
+import utils.dm_tracker as dm_tracker
+import utils.utils as utils
+from helpers.waitlist_helpers import WaitlistManager
+from integrations.sheets import sheet_cache
+from utils.dm_tracker import SentDMTracker
+
+GUILD_ID = "1234"
+
+
+def _entry(index: int, team=None) -> dict:
+    return {"discord_tag": f"user{index}", "member_id": index, "ign": f"Player{index}#NA1", "team_name": team}
+
+
+def test_normal_mode_takes_queue_in_order() -> None:
+    waitlist = [_entry(i) for i in range(10)]
+    selected = WaitlistManager._select_promotions(waitlist, 4, "normal", {}, 2, 16)
+    assert selected == waitlist[:4]
+
+
+def test_doubleup_selection_keeps_pairing_priorities() -> None:
+    waitlist = [
+        _entry(0, "Solo Seekers"),
+        _entry(1),
+        _entry(2, "Duo"),
+        _entry(3, "Half Full"),
+        _entry(4, "duo"),
+        _entry(5, "Full"),
+        _entry(6, "Half Full"),
+    ]
+    team_counts = {"full": 2, "half full": 1, "other": 1}
+
+    selected = WaitlistManager._select_promotions(waitlist, 5, "doubleup", team_counts, 2, 5)
+
+    # The Duo pair first, then individuals in queue order (Solo Seekers takes the last new team,
+    # user3 the open Half Full seat), then the solo player; Full and the second Half Full wait
+    assert [entry["discord_tag"] for entry in selected] == ["user2", "user4", "user0", "user3", "user1"]
+    assert team_counts == {"full": 2, "half full": 2, "other": 1, "duo": 2, "solo seekers": 1}
+
+    # With no room for another team, Solo Seekers waits too
+    selected = WaitlistManager._select_promotions(waitlist, 5, "doubleup", {"full": 2, "half full": 1, "other": 1}, 2, 4)
+    assert [entry["discord_tag"] for entry in selected] == ["user2", "user4", "user3", "user1"]
+
+
+@pytest.fixture
+def promotion(monkeypatch):
+    """Waitlist of 30 with 20 open slots; register_users_batch fails the tags in ``failing``."""
+    settings = {"max_players": 32, "max_per_team": 2}
+    for module in (waitlist_helpers, sheet_helpers):
+        monkeypatch.setattr(module, "get_event_mode_for_guild", lambda guild_id: "normal")
+        monkeypatch.setattr(module, "get_sheet_settings", lambda _mode: settings)
+    monkeypatch.setitem(sheet_cache, "users", {
+        f"existing{i}": (i + 2, f"Existing{i}", True, False, "", "", "") for i in range(12)
+    })
+
+    state = SimpleNamespace(
+        storage={GUILD_ID: {"waitlist": [_entry(i) for i in range(30)]}},
+        loads=[], saves=[], batches=[], sent=[], failing=set(), departed=set(),
+    )
+
+    def load():
+        state.loads.append(1)
+        return state.storage
+
+    async def register_batch(guild_id, entries):
+        state.batches.append([entry["discord_tag"] for entry in entries])
+        rows = {}
+        for i, entry in enumerate(entries):
+            if entry["discord_tag"] not in state.failing:
+                rows[entry["discord_tag"]] = 100 + i
+                sheet_cache["users"][entry["discord_tag"]] = (100 + i, entry["ign"], True, False, "", "", "")
+        return rows, [(tag, "sheet error") for tag in state.batches[-1] if tag not in rows]
+
+    async def noop(*args, **kwargs):
+        return 0
+
+    monkeypatch.setattr(WaitlistManager, "_load_waitlist_data", staticmethod(load))
+    monkeypatch.setattr(WaitlistManager, "_save_waitlist_data", staticmethod(lambda data: state.saves.append(data)))
+    monkeypatch.setattr(waitlist_helpers, "register_users_batch", register_batch)
+    monkeypatch.setattr(waitlist_helpers.ErrorHandler, "log_warning", staticmethod(noop))
+    monkeypatch.setattr(waitlist_helpers.RoleManager, "add_role", staticmethod(noop))
+    monkeypatch.setattr(utils, "hyperlink_lolchess_profile", noop)
+    monkeypatch.setattr(utils, "clear_user_dms", noop)
+    monkeypatch.setattr(components_traditional, "setup_unified_channel", noop)
+    state.tracker = SentDMTracker(storage=SimpleNamespace(get_data=lambda *args: None, set_data=lambda *args: None))
+    monkeypatch.setattr(dm_tracker, "dm_tracker", state.tracker)
+
+    def member(index):
+        if index in state.departed:
+            return None
+
+        async def send(**kwargs):
+            state.sent.append(index)
+            return SimpleNamespace(id=1000 + index)
+        return SimpleNamespace(id=index, send=send)
+
+    state.guild = SimpleNamespace(id=int(GUILD_ID), me=None, text_channels=[], get_member=member)
+    return state
+
+
+@pytest.mark.asyncio
+async def test_process_waitlist_loads_once_and_writes_one_batch(promotion) -> None:
+    promoted = await WaitlistManager.process_waitlist(promotion.guild)
+
+    assert [entry["discord_tag"] for entry in promoted] == [f"user{i}" for i in range(20)]
+    assert len(promotion.loads) == 1 and len(promotion.saves) == 1
+    assert promotion.batches == [[f"user{i}" for i in range(20)]]
+    remaining = [entry["discord_tag"] for entry in promotion.storage[GUILD_ID]["waitlist"]]
+    assert remaining == [f"user{i}" for i in range(20, 30)]
+    assert sorted(promotion.sent) == list(range(20))
+    assert promotion.tracker.tracked(3) == [1003]
+
+
+@pytest.mark.asyncio
+async def test_slots_left_by_departed_and_failed_members_are_refilled(promotion) -> None:
+    promotion.departed = {3}
+    promotion.failing = {"user5"}
+
+    promoted = await WaitlistManager.process_waitlist(promotion.guild)
+
+    # user3 left before selection, so user20 made the first pass; user21 takes user5's slot
+    first_pass = [f"user{i}" for i in range(21) if i != 3]
+    assert promotion.batches == [first_pass, ["user21"]]
+    assert [entry["discord_tag"] for entry in promoted] == [tag for tag in first_pass if tag != "user5"] + ["user21"]
+    remaining = [entry["discord_tag"] for entry in promotion.storage[GUILD_ID]["waitlist"]]
+    assert remaining == [f"user{i}" for i in range(22, 30)]
@@ -11,7 +11,7 @@ from .utils import (
 
 from .logging_utils import (
     mask_token, mask_discord_tokens, mask_api_keys, 
-    sanitize_log_message, SecureLogger
+    sanitize_log_message, SanitizedMessage, SanitizingFilter, SecureLogger
 )
 
 from .feature_flags import (
@@ -30,6 +30,8 @@ __all__ = [
     'mask_discord_tokens', 
     'mask_api_keys',
     'sanitize_log_message',
+    'SanitizedMessage',
+    'SanitizingFilter',
     'SecureLogger',
     'deployment_stage',
     'rollout_flags_snapshot',
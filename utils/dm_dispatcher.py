@@ -0,0 +1,193 @@
+# utils/dm_dispatcher.py
+"""
+Shared dispatcher for bulk direct messages.
+
+Sends run on a bounded pool of workers that draw from one adaptive pacer:
+requests are spaced at the current rate, every 429 pauses all workers for
+its ``retry_after`` and halves the rate, and successes raise it back towards
+the configured ceiling. Progress is reported from its own task so a slow
+progress-message edit never holds up sends.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Iterable, List, Optional, Tuple
+
+import discord
+
+# Opening a DM channel and posting the message are two requests each, both
+# counted against Discord's 50 requests/second global limit.
+DEFAULT_CONCURRENCY = 8
+DEFAULT_RATE_PER_SECOND = 20.0
+MIN_RATE_PER_SECOND = 1.0
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_PROGRESS_INTERVAL = 2.0
+
+# Sends per second regained for each successful send after a slowdown
+RATE_RECOVERY_STEP = 0.1
+
+# Failure reason for recipients who have DMs closed (discord.Forbidden)
+DMS_DISABLED = "DMs disabled"
+
+
+@dataclass
+class DispatchResult:
+    """Outcome of a bulk DM run; ``sent`` and ``failed`` keep the recipients themselves."""
+
+    total: int
+    sent: List[Any] = field(default_factory=list)
+    failed: List[Tuple[Any, str]] = field(default_factory=list)
+    rate_limited: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def completed(self) -> int:
+        return len(self.sent) + len(self.failed)
+
+
+ProgressCallback = Callable[[DispatchResult], Awaitable[None]]
+
+
+def _retry_after(exc: discord.HTTPException) -> float:
+    retry_after = getattr(exc, "retry_after", None)
+    if retry_after is None:
+        headers = getattr(exc.response, "headers", None) or {}
+        try:
+            retry_after = float(headers.get("Retry-After", 1.0))
+        except (TypeError, ValueError):
+            retry_after = 1.0
+    return max(float(retry_after), 0.0)
+
+
+class DMDispatcher:
+    """Send one message per recipient as fast as Discord's rate limits allow."""
+
+    def __init__(
+        self,
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        rate_per_second: float = DEFAULT_RATE_PER_SECOND,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        progress_interval: float = DEFAULT_PROGRESS_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.concurrency = max(1, concurrency)
+        self.max_rate = max(MIN_RATE_PER_SECOND, rate_per_second)
+        self.max_retries = max_retries
+        self.progress_interval = progress_interval
+        self._clock = clock
+
+        self.rate = self.max_rate
+        self._next_slot = 0.0
+        self._generation = 0
+        self._pacer_lock = asyncio.Lock()
+
+    async def _acquire(self) -> int:
+        """Wait for this worker's slot under the shared pacing schedule; returns the pacing generation."""
+        async with self._pacer_lock:
+            now = self._clock()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + 1.0 / self.rate
+            generation = self._generation
+        if slot > now:
+            await asyncio.sleep(slot - now)
+        return generation
+
+    def _on_rate_limited(self, generation: int, retry_after: float) -> None:
+        self._next_slot = max(self._next_slot, self._clock() + retry_after)
+        # Requests scheduled before the last slowdown don't slow us down again
+        if generation == self._generation:
+            self.rate = max(MIN_RATE_PER_SECOND, self.rate / 2)
+            self._generation += 1
+
+    def _on_success(self) -> None:
+        if self.rate < self.max_rate:
+            self.rate = min(self.max_rate, self.rate + RATE_RECOVERY_STEP)
+
+    async def _deliver(self, recipient: Any, send: Callable[[Any], Awaitable[Any]], result: DispatchResult) -> None:
+        for attempt in range(self.max_retries + 1):
+            generation = await self._acquire()
+            try:
+                await send(recipient)
+            except discord.Forbidden:
+                result.failed.append((recipient, DMS_DISABLED))
+                return
+            except discord.HTTPException as e:
+                if e.status == 429 and attempt < self.max_retries:
+                    result.rate_limited += 1
+                    self._on_rate_limited(generation, _retry_after(e))
+                    continue
+                result.failed.append((recipient, f"HTTP error: {str(e)[:50]}"))
+                return
+            except Exception as e:
+                logging.error(f"Unexpected error sending DM to {recipient}: {e}")
+                result.failed.append((recipient, "Unexpected error"))
+                return
+            else:
+                self._on_success()
+                result.sent.append(recipient)
+                return
+
+    async def _report_progress(self, on_progress: ProgressCallback, result: DispatchResult, started: float) -> None:
+        while True:
+            await asyncio.sleep(self.progress_interval)
+            result.elapsed = self._clock() - started
+            try:
+                await on_progress(result)
+            except Exception as e:
+                logging.warning(f"DM progress update failed: {e}")
+
+    async def dispatch(
+        self,
+        recipients: Iterable[Any],
+        send: Callable[[Any], Awaitable[Any]],
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> DispatchResult:
+        """
+        Call ``send(recipient)`` for every recipient.
+
+        Args:
+            recipients: Members (or any objects ``send`` understands).
+            send: Coroutine performing the Discord request(s) for one recipient.
+            on_progress: Awaited every ``progress_interval`` seconds and once at the end.
+
+        Returns:
+            DispatchResult with sent/failed recipients and the number of 429s absorbed.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        for recipient in recipients:
+            queue.put_nowait(recipient)
+        result = DispatchResult(total=queue.qsize())
+        started = self._clock()
+
+        async def worker() -> None:
+            while not queue.empty():
+                await self._deliver(queue.get_nowait(), send, result)
+
+        reporter = None
+        if on_progress:
+            reporter = asyncio.create_task(self._report_progress(on_progress, result, started))
+        try:
+            await asyncio.gather(*(worker() for _ in range(min(self.concurrency, result.total) or 1)))
+        finally:
+            if reporter:
+                reporter.cancel()
+                await asyncio.gather(reporter, return_exceptions=True)
+
+        result.elapsed = self._clock() - started
+        if on_progress:
+            try:
+                await on_progress(result)
+            except Exception as e:
+                logging.warning(f"DM progress update failed: {e}")
+
+        logging.info(
+            f"DM dispatch finished: {len(result.sent)} sent, {len(result.failed)} failed, "
+            f"{result.rate_limited} rate limited, {result.elapsed:.1f}s"
+        )
+        return result
+
+
+__all__ = ["DMDispatcher", "DispatchResult", "DMS_DISABLED"]
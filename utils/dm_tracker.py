@@ -0,0 +1,147 @@
+# utils/dm_tracker.py
+"""
+Tracks the event DMs the bot sends so they can be cleaned up later.
+
+Message IDs are recorded per user as DMs go out and persisted through the
+storage service (every change within SAVE_DELAY_SECONDS shares one write).
+Cleanup deletes exactly the tracked messages, concurrently under one
+process-wide bound, instead of paging each user's DM history.
+"""
+
+import asyncio
+import logging
+from typing import Dict, List, Optional
+
+import discord
+
+from core.storage_service import get_storage_service
+from utils.dm_dispatcher import DEFAULT_MAX_RETRIES, _retry_after
+
+STORAGE_TABLE = "persisted_views"
+STORAGE_KEY = "sent_dm_ids"
+
+# Older IDs are forgotten past this many tracked DMs per user
+MAX_TRACKED_PER_USER = 50
+
+# Deletes in flight across all users; message deletes share a per-route bucket
+DM_DELETE_CONCURRENCY = 5
+
+# Changes are written at most this long after the first unsaved one
+SAVE_DELAY_SECONDS = 1.0
+
+
+class SentDMTracker:
+    """Per-user record of bot DM message IDs, persisted across restarts."""
+
+    def __init__(
+        self,
+        storage=None,
+        concurrency: int = DM_DELETE_CONCURRENCY,
+        save_delay: float = SAVE_DELAY_SECONDS,
+    ):
+        self._storage = storage
+        self._ids: Optional[Dict[str, List[int]]] = None
+        self._save_delay = save_delay
+        self._save_handle: Optional[asyncio.TimerHandle] = None
+        self._delete_slots = asyncio.Semaphore(max(1, concurrency))
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _get_storage(self):
+        if self._storage is None:
+            self._storage = get_storage_service()
+        return self._storage
+
+    def _tracked(self) -> Dict[str, List[int]]:
+        if self._ids is None:
+            try:
+                self._ids = self._get_storage().get_data(STORAGE_TABLE, STORAGE_KEY) or {}
+            except Exception as e:
+                logging.error(f"Failed to load tracked DM IDs: {e}")
+                self._ids = {}
+        return self._ids
+
+    def _save(self) -> None:
+        try:
+            self._get_storage().set_data(STORAGE_TABLE, STORAGE_KEY, self._tracked())
+        except Exception as e:
+            logging.error(f"Failed to persist tracked DM IDs: {e}")
+
+    def _save_soon(self) -> None:
+        """Schedule one write for every change made within the save delay."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._save()
+            return
+        if self._save_handle is None:
+            self._save_handle = loop.call_later(self._save_delay, self.flush)
+
+    def flush(self) -> None:
+        """Write pending changes now, e.g. before shutdown."""
+        if self._save_handle is None:
+            return
+        self._save_handle.cancel()
+        self._save_handle = None
+        self._save()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def record(self, user_id: int, message_id: int) -> None:
+        """Remember a DM sent to user_id."""
+        ids = self._tracked().setdefault(str(user_id), [])
+        ids.append(message_id)
+        del ids[:-MAX_TRACKED_PER_USER]
+        self._save_soon()
+
+    def tracked(self, user_id: int) -> List[int]:
+        """Message IDs currently tracked for user_id."""
+        return list(self._tracked().get(str(user_id), []))
+
+    async def send(self, member: discord.abc.User, **kwargs) -> discord.Message:
+        """Send a DM and track it for later cleanup."""
+        message = await member.send(**kwargs)
+        self.record(member.id, message.id)
+        return message
+
+    async def _delete(self, channel: discord.DMChannel, message_id: int) -> bool:
+        for attempt in range(DEFAULT_MAX_RETRIES + 1):
+            async with self._delete_slots:
+                try:
+                    await channel.get_partial_message(message_id).delete()
+                    return True
+                except (discord.NotFound, discord.Forbidden):
+                    # Already deleted, or no longer deletable
+                    return False
+                except discord.HTTPException as e:
+                    if e.status != 429 or attempt == DEFAULT_MAX_RETRIES:
+                        logging.warning(f"Failed to delete DM message {message_id}: {e}")
+                        return False
+                    wait = _retry_after(e)
+            await asyncio.sleep(wait)
+        return False
+
+    async def clear(self, member: discord.abc.User) -> int:
+        """Delete every tracked DM for member; returns how many were deleted."""
+        message_ids = self._tracked().pop(str(member.id), None)
+        if not message_ids:
+            return 0
+        self._save_soon()
+
+        try:
+            channel = member.dm_channel or await member.create_dm()
+        except discord.HTTPException as e:
+            logging.debug(f"Cannot access DM channel for {member}: {e}")
+            return 0
+
+        results = await asyncio.gather(*(self._delete(channel, message_id) for message_id in message_ids))
+        return sum(results)
+
+
+dm_tracker = SentDMTracker()
+
+__all__ = ["SentDMTracker", "dm_tracker"]
@@ -4,6 +4,17 @@ Logging utilities for secure token handling and log sanitization.
 
 import logging
 import re
+from typing import Any, Iterable, Tuple
+
+# Discord bot tokens are typically 59 characters long and follow a pattern
+# Format: [A-Za-z0-9_-]{24}\.[A-Za-z0-9_-]{6}\.[A-Za-z0-9_-]{27}
+_DISCORD_TOKEN_RE = re.compile(r'([A-Za-z0-9_-]{24})\.([A-Za-z0-9_-]{6})\.([A-Za-z0-9_-]{27})')
+# Riot API keys (RGAPI- followed by alphanumeric)
+_RIOT_KEY_RE = re.compile(r'(RGAPI-[a-f0-9]{32})')
+# Generic long alphanumeric strings that might be keys
+_GENERIC_KEY_RE = re.compile(r'([a-zA-Z0-9_-]{32,})')
+# Environment variable values if they appear in logs
+_ENV_VAR_RE = re.compile(r'(DISCORD_TOKEN|RIOT_API_KEY|DATABASE_URL)=([^\s]+)')
 
 
 def mask_token(token: str, mask_char: str = "*", show_last: int = 4) -> str:
@@ -38,15 +49,11 @@ def mask_discord_tokens(text: str) -> str:
     if not text:
         return text
     
-    # Discord bot tokens are typically 59 characters long and follow a pattern
-    # Format: [A-Za-z0-9_-]{24}\.[A-Za-z0-9_-]{6}\.[A-Za-z0-9_-]{27}
-    token_pattern = r'([A-Za-z0-9_-]{24})\.([A-Za-z0-9_-]{6})\.([A-Za-z0-9_-]{27})'
-    
     def mask_token_match(match):
         full_token = match.group(0)
         return mask_token(full_token)
     
-    return re.sub(token_pattern, mask_token_match, text)
+    return _DISCORD_TOKEN_RE.sub(mask_token_match, text)
 
 
 def mask_api_keys(text: str) -> str:
@@ -62,13 +69,8 @@ def mask_api_keys(text: str) -> str:
     if not text:
         return text
     
-    # Riot API keys (RGAPI- followed by alphanumeric)
-    riot_pattern = r'(RGAPI-[a-f0-9]{32})'
-    text = re.sub(riot_pattern, lambda m: mask_token(m.group(1)), text)
-    
-    # Generic long alphanumeric strings that might be keys
-    generic_pattern = r'([a-zA-Z0-9_-]{32,})'
-    text = re.sub(generic_pattern, lambda m: mask_token(m.group(1)), text)
+    text = _RIOT_KEY_RE.sub(lambda m: mask_token(m.group(1)), text)
+    text = _GENERIC_KEY_RE.sub(lambda m: mask_token(m.group(1)), text)
     
     return mask_discord_tokens(text)
 
@@ -90,23 +92,80 @@ def sanitize_log_message(message: str) -> str:
     sanitized = mask_api_keys(message)
     
     # Mask environment variable values if they appear in logs
-    env_var_pattern = r'(DISCORD_TOKEN|RIOT_API_KEY|DATABASE_URL)=([^\s]+)'
-    sanitized = re.sub(env_var_pattern, r'\1=' + mask_token(r'\2'), sanitized)
+    sanitized = _ENV_VAR_RE.sub(r'\1=' + mask_token(r'\2'), sanitized)
     
     return sanitized
 
 
+class SanitizedMessage:
+    """
+    Log message that is %-formatted and sanitized only when a handler renders it.
+    The result is cached, so a record sent to several handlers is sanitized once.
+    """
+
+    __slots__ = ("message", "args", "_rendered")
+
+    def __init__(self, message: Any, args: Tuple[Any, ...] = ()):
+        self.message = message
+        self.args = args
+        self._rendered = None
+
+    def __str__(self) -> str:
+        if self._rendered is None:
+            text = str(self.message)
+            if self.args:
+                text = text % self.args
+            self._rendered = sanitize_log_message(text)
+        return self._rendered
+
+
+class SanitizingFilter(logging.Filter):
+    """
+    Opt-in handler filter that also sanitizes plain ``logging`` records and any
+    ``extra`` string fields named in ``fields``. SecureLogger messages need no
+    filter; they are sanitized when formatted. A record that cannot be rendered
+    is passed through unchanged so the handler reports it as usual.
+    """
+
+    def __init__(self, fields: Iterable[str] = ()):
+        super().__init__()
+        self.fields = tuple(fields)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if getattr(record, "_sanitized", False):
+            return True
+        try:
+            if isinstance(record.msg, SanitizedMessage):
+                message = str(record.msg)
+            else:
+                message = sanitize_log_message(record.getMessage())
+            extras = {
+                name: sanitize_log_message(value)
+                for name in self.fields
+                if isinstance(value := getattr(record, name, None), str)
+            }
+        except Exception:
+            return True
+        record.msg = message
+        record.args = None
+        for name, value in extras.items():
+            setattr(record, name, value)
+        record._sanitized = True
+        return True
+
+
 class SecureLogger:
-    """A logger wrapper that automatically sanitizes messages."""
+    """A logger wrapper that sanitizes messages lazily, only for enabled levels."""
     
     def __init__(self, logger_name: str = __name__):
-        import logging
         self.logger = logging.getLogger(logger_name)
     
     def _sanitize_and_log(self, level: int, message: str, *args, **kwargs):
-        """Sanitize message and log it."""
-        sanitized_message = sanitize_log_message(str(message))
-        self.logger.log(level, sanitized_message, *args, **kwargs)
+        """Log message; sanitization is deferred until a handler formats it."""
+        if not self.logger.isEnabledFor(level):
+            return
+        kwargs.setdefault("stacklevel", 3)
+        self.logger.log(level, SanitizedMessage(message, args), **kwargs)
     
     def debug(self, message: str, *args, **kwargs):
         """Log debug message with sanitization."""
@@ -13,6 +13,8 @@ from config import (
     get_sheet_settings
 )
 from core.persistence import get_event_mode_for_guild
+from utils.dm_dispatcher import DMS_DISABLED, DMDispatcher
+from utils.dm_tracker import dm_tracker
 
 
 class UtilsError(Exception):
@@ -61,36 +63,16 @@ def resolve_member(guild: discord.Guild, discord_tag: str) -> discord.Member | N
     return None
 
 
-async def clear_user_dms(member: discord.Member, bot_user: discord.User) -> int:
+async def clear_user_dms(member: discord.Member) -> int:
     """
-    Clear all previous DMs sent by the bot to a user.
+    Clear the event DMs the bot previously sent to a user.
+    Deletes the tracked message IDs concurrently; DM history is not paged.
     """
-    deleted_count = 0
-
     try:
-        dm_channel = await member.create_dm()
-
-        # Delete all bot messages in the DM channel
-        async for message in dm_channel.history(limit=100):
-            if message.author.id == bot_user.id:
-                try:
-                    await message.delete()
-                    deleted_count += 1
-                except discord.Forbidden:
-                    # Can't delete this message, skip it
-                    pass
-                except discord.NotFound:
-                    # Message already deleted
-                    pass
-                except Exception as e:
-                    logging.warning(f"Failed to delete DM message: {e}")
-
-    except discord.Forbidden:
-        logging.debug(f"Cannot access DM channel for {member}")
+        return await dm_tracker.clear(member)
     except Exception as e:
         logging.error(f"Error clearing DMs for {member}: {e}")
-
-    return deleted_count
+        return 0
 
 
 async def send_reminder_dms(
@@ -103,6 +85,9 @@ async def send_reminder_dms(
     """
     Send DM reminders to registered but not checked-in users.
     Clears previous DMs before sending new ones.
+
+    Recipients are resolved up front and delivered through the shared
+    ``DMDispatcher``, so reminders go out concurrently within rate limits.
     """
     if not guild or not dm_embed or not view_cls:
         raise ValueError("Guild, embed, and view class are required")
@@ -110,12 +95,10 @@ async def send_reminder_dms(
     try:
         from integrations.sheets import sheet_cache, cache_lock
 
-        dmmed: List[str] = []
-        failed_dms = 0
-
         async with cache_lock:
             cache_snapshot = dict(sheet_cache["users"])
 
+        targets: List[tuple[discord.Member, str]] = []
         for discord_tag, user_tuple in cache_snapshot.items():
             try:
                 # Check if user is registered but not checked in
@@ -138,32 +121,32 @@ async def send_reminder_dms(
                     # User not in server anymore, skip without logging
                     continue
 
-                try:
-                    # Clear previous DMs
-                    deleted = await clear_user_dms(member, client.user)
-                    if deleted > 0:
-                        logging.debug(f"Cleared {deleted} previous DMs for {discord_tag}")
-
-                    # Send new DM
-                    view = view_cls(guild)
-                    await member.send(embed=dm_embed, view=view)
-                    dmmed.append(f"{member} (`{discord_tag}`)")
-
-                except discord.Forbidden:
-                    logging.debug(f"Cannot DM {discord_tag} - DMs disabled or blocked")
-                    failed_dms += 1
-                except discord.HTTPException as e:
-                    logging.warning(f"Failed to DM {discord_tag}: {e}")
-                    failed_dms += 1
-                except Exception as e:
-                    logging.error(f"Unexpected error DMing {discord_tag}: {e}")
-                    failed_dms += 1
+                targets.append((member, discord_tag))
 
             except Exception as e:
                 logging.error(f"Error processing reminder for {discord_tag}: {e}")
                 continue
 
-        logging.info(f"Sent {len(dmmed)} reminder DMs, {failed_dms} failed")
+        async def send(target: tuple[discord.Member, str]) -> None:
+            member, discord_tag = target
+            # Clear previous DMs
+            deleted = await clear_user_dms(member)
+            if deleted > 0:
+                logging.debug(f"Cleared {deleted} previous DMs for {discord_tag}")
+
+            # Send new DM
+            view = view_cls(guild)
+            await dm_tracker.send(member, embed=dm_embed, view=view)
+
+        result = await DMDispatcher().dispatch(targets, send)
+        for (_member, discord_tag), reason in result.failed:
+            if reason == DMS_DISABLED:
+                logging.debug(f"Cannot DM {discord_tag} - DMs disabled or blocked")
+            else:
+                logging.warning(f"Failed to DM {discord_tag}: {reason}")
+
+        dmmed = [f"{member} (`{discord_tag}`)" for member, discord_tag in result.sent]
+        logging.info(f"Sent {len(dmmed)} reminder DMs, {len(result.failed)} failed")
         return dmmed
 
     except Exception as e: